@@ -0,0 +1,9 @@
+cd %~dp0
+cd ..
+
+set lists=%1
+set batch-size=%2
+
+echo Benchmarking the creation of "%lists%" lists with batches of "%batch-size%" lists
+
+pipenv run .\src\benchmarks\benchmark_batch_create.py %lists% %batch-size%
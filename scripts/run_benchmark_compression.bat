@@ -0,0 +1,9 @@
+cd %~dp0
+cd ..
+
+set requests=%1
+set page_size=%2
+
+echo Benchmarking the compression settings with "%requests%" List requests with pages of "%page_size%" lists
+
+pipenv run .\src\benchmarks\benchmark_compression.py %requests% %page_size%
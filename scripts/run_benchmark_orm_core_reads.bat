@@ -0,0 +1,9 @@
+cd %~dp0
+cd ..
+
+set seconds=%1
+set page_size=%2
+
+echo Benchmarking ORM and Core reads for "%seconds%" seconds per case with pages of "%page_size%" lists
+
+pipenv run .\src\benchmarks\benchmark_orm_core_reads.py %seconds% %page_size%
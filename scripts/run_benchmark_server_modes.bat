@@ -0,0 +1,9 @@
+cd %~dp0
+cd ..
+
+set requests=%1
+set concurrency=%2
+
+echo Benchmarking server modes with "%requests%" requests and "%concurrency%" concurrent requests
+
+pipenv run .\src\benchmarks\benchmark_server_modes.py %requests% %concurrency%
@@ -0,0 +1,10 @@
+cd %~dp0
+cd ..
+
+set seconds=%1
+set readers=%2
+set writers=%3
+
+echo Benchmarking SQLite tuning for "%seconds%" seconds with "%readers%" readers and "%writers%" writers
+
+pipenv run .\src\benchmarks\benchmark_sqlite_tuning.py %seconds% %readers% %writers%
@@ -0,0 +1,6 @@
+cd %~dp0
+cd ..
+
+echo Running the load generator with arguments "%*"
+
+pipenv run .\src\proto_client\load_generator.py %*
@@ -0,0 +1,6 @@
+cd %~dp0
+cd ..
+
+echo Creating lists with names "%*"
+
+pipenv run .\src\proto_client\stub_batch_create_lists.py %*
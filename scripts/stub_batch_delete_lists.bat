@@ -0,0 +1,6 @@
+cd %~dp0
+cd ..
+
+echo Deleting lists with ids "%*"
+
+pipenv run .\src\proto_client\stub_batch_delete_lists.py %*
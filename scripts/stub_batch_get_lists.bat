@@ -0,0 +1,6 @@
+cd %~dp0
+cd ..
+
+echo Fetching lists with ids "%*"
+
+pipenv run .\src\proto_client\stub_batch_get_lists.py %*
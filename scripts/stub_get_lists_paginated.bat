@@ -3,7 +3,8 @@ cd ..
 
 set page-number=%1
 set page-size=%2
+set page-token=%3
 
-echo Fetching lists with page-number "%page-number%" and page-size "%page-size%"
+echo Fetching lists with page-number "%page-number%", page-size "%page-size%" and page-token "%page-token%"
 
-pipenv run .\src\proto_client\stub_get_lists_paginated.py %page-number% %page-size%
+pipenv run .\src\proto_client\stub_get_lists_paginated.py %page-number% %page-size% %page-token%
@@ -0,0 +1,8 @@
+cd %~dp0
+cd ..
+
+set file-path=%1
+
+echo Importing lists of file "%file-path%"
+
+pipenv run .\src\proto_client\stub_import_lists.py %file-path%
@@ -0,0 +1,6 @@
+cd %~dp0
+cd ..
+
+echo Running Session operations "%*"
+
+pipenv run .\src\proto_client\stub_session.py %*
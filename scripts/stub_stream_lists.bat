@@ -0,0 +1,8 @@
+cd %~dp0
+cd ..
+
+set after-id=%1
+
+echo Streaming lists after id "%after-id%"
+
+pipenv run .\src\proto_client\stub_stream_lists.py %after-id%
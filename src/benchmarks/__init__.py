@@ -0,0 +1,11 @@
+"""
+Python package with benchmarks of the gRPC server and database layers
+
+Modules:
+    benchmark_server_modes: compare the thread pool and asyncio gRPC servers under concurrent load
+    benchmark_batch_create: compare creating lists with BatchCreate against looping Create
+    benchmark_sqlite_tuning: compare the SQLite default pragmas against the tuned pragmas and connections pool
+    benchmark_orm_core_reads: compare reading the TodoLists as ORM instances against the Core statements
+    benchmark_compression: compare the bytes on the wire against the CPU cost of the compression settings
+    helpers: functions shared by the benchmarks
+"""
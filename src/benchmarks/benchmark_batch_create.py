@@ -0,0 +1,98 @@
+"""
+This module benchmarks creating lists with the TodoLists.BatchCreate gRPC against looping TodoLists.Create.
+
+Examples:
+        This module can be executed as a script, it runs `run_grpc_server.py` in a new process, creates the same
+        number of lists invoking the .Create Stub once per list, and the .BatchCreate Stub in batches,
+        and prints the lists created per second with each method.
+        It expects two optional positional arguments to define the number of lists and the batch size.
+
+            $ python benchmark_batch_create.py 2000 1000
+
+        The lists created by the benchmark are deleted after it.
+
+Attributes:
+    benchmark_batch_create.create_in_loop (function): Create lists invoking the Create stub once per list
+    benchmark_batch_create.create_in_batches (function): Create lists invoking the BatchCreate stub
+"""
+import os
+import sys
+import time
+import uuid
+from typing import List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import proto.v1.todolists_pb2 as todolists_pb2  # pylint: disable=wrong-import-position
+import proto.v1.todolists_pb2_grpc as todolists_pb2_grpc  # pylint: disable=wrong-import-position
+from benchmarks.helpers import run_grpc_server_process  # pylint: disable=wrong-import-position
+
+_DEFAULT_LISTS = 2000
+_DEFAULT_BATCH_SIZE = 1000
+_RESULT_ROW_TEMPLATE = '{:<14} {:>8} {:>10} {:>12}'
+
+
+def create_in_loop(stub: todolists_pb2_grpc.TodoListsStub, names: List[str]) -> List[int]:
+    """
+    Create the lists invoking the TodoLists.Create stub once per name
+
+    :param stub: Stub used to invoke the gRPC methods
+    :param names: Names of the lists to create
+    :return: New lists ids
+    """
+    return [stub.Create(todolists_pb2.CreateListRequest(name=name)).id for name in names]
+
+
+def create_in_batches(stub: todolists_pb2_grpc.TodoListsStub, names: List[str], batch_size: int) -> List[int]:
+    """
+    Create the lists invoking the TodoLists.BatchCreate stub with `batch_size` names per call
+
+    :param stub: Stub used to invoke the gRPC methods
+    :param names: Names of the lists to create
+    :param batch_size: Number of names per BatchCreate call
+    :return: New lists ids
+    """
+    new_ids = []
+    for batch_start in range(0, len(names), batch_size):
+        batch = names[batch_start:batch_start + batch_size]
+        reply = stub.BatchCreate(todolists_pb2.BatchCreateListsRequest(names=batch))
+        new_ids.extend(_result.id for _result in reply.results if _result.created)
+    return new_ids
+
+
+def main():
+    """
+    Main when executed as script
+    :return:
+    """
+    lists = int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_LISTS
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else _DEFAULT_BATCH_SIZE
+    print('Benchmarking the creation of {} lists, BatchCreate with {} lists per call'.format(lists, batch_size))
+
+    with run_grpc_server_process() as _channel:
+        stub = todolists_pb2_grpc.TodoListsStub(_channel)
+        names_prefix = 'benchmark-{}'.format(uuid.uuid4().hex)
+        new_ids = []
+        try:
+            start = time.perf_counter()
+            new_ids.extend(create_in_loop(stub, ['{}-loop-{}'.format(names_prefix, i) for i in range(lists)]))
+            loop_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            new_ids.extend(create_in_batches(stub, ['{}-batch-{}'.format(names_prefix, i) for i in range(lists)],
+                                             batch_size))
+            batch_elapsed = time.perf_counter() - start
+        finally:
+            for list_id in new_ids:
+                stub.Delete(todolists_pb2.DeleteListRequest(id=list_id))
+
+    print(_RESULT_ROW_TEMPLATE.format('method', 'lists', 'seconds', 'lists/s'))
+    print(_RESULT_ROW_TEMPLATE.format('Create loop', lists, '{:.2f}'.format(loop_elapsed),
+                                      '{:.1f}'.format(lists / loop_elapsed)))
+    print(_RESULT_ROW_TEMPLATE.format('BatchCreate', lists, '{:.2f}'.format(batch_elapsed),
+                                      '{:.1f}'.format(lists / batch_elapsed)))
+    print('BatchCreate is {:.1f}x faster'.format(loop_elapsed / batch_elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+"""
+This module benchmarks the compression settings of the gRPC messages, the bytes on the wire against the CPU cost.
+
+Examples:
+        This module can be executed as a script, for each compression setting, `none`, `deflate` and `gzip`,
+        it runs a gRPC server in the same process, with an in memory storage, and invokes the todolists.TodoLists.List
+        Stub with a client channel that has the same compression policy.
+        It prints the bytes of each reply, serialized and on the wire, and the CPU time and latency of each RPC.
+        It expects two optional positional arguments to define the number of requests and the page size.
+
+            $ python benchmark_compression.py 2000 50
+
+        The names of the lists are text, the kind of content that gRPC compresses well.
+        The CPU time is measured for the whole process, so it is the cost of the client and the server together.
+
+        gRPC does not expose the bytes sent by a channel, the bytes on the wire are computed compressing each reply
+        with zlib and the same parameters as gRPC, the replies that are not made smaller by the compression,
+        or are smaller than the min size of the policy, are sent uncompressed.
+
+Attributes:
+    benchmark_compression.create_names (function): Create text-like names for the lists
+    benchmark_compression.wire_size (function): Get the bytes on the wire of a reply with a compression setting
+    benchmark_compression.run_requests (function): Invoke the List stub and measure the bytes, CPU and latency
+    benchmark_compression.benchmark_compression (function): Benchmark the List stub with a compression setting
+"""
+import os
+import sys
+import time
+import zlib
+from typing import Dict, List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import proto.v1.todolists_pb2 as todolists_pb2  # pylint: disable=wrong-import-position
+import proto.v1.todolists_pb2_grpc as todolists_pb2_grpc  # pylint: disable=wrong-import-position
+from config.compression import CompressionPolicy  # pylint: disable=wrong-import-position
+from config.config import (  # pylint: disable=wrong-import-position
+    GRPC_SERVER_PORT, GRPC_COMPRESSION_MIN_SIZE, NO_COMPRESSION, DEFLATE_COMPRESSION, GZIP_COMPRESSION
+)
+from database.memory_storage import MemoryStorage  # pylint: disable=wrong-import-position
+from proto_client.helpers import create_secured_client_channel, get_todo_lists_stub  # pylint: disable=wrong-import-position
+from proto_server.todolists_server import create_secured_server  # pylint: disable=wrong-import-position
+
+_DEFAULT_REQUESTS = 2000
+_DEFAULT_PAGE_SIZE = 50
+_SEEDED_PAGES = 20
+_WARM_UP_REQUESTS = 50
+# Length-prefixed message header of gRPC, compressed flag and message length
+_MESSAGE_HEADER_SIZE = 5
+# Window bits of zlib used by gRPC, the gzip window bits add the gzip header and trailer
+_WINDOW_BITS = {DEFLATE_COMPRESSION: 15, GZIP_COMPRESSION: 15 | 16}
+_WORDS = ('groceries', 'weekend', 'project', 'review', 'release', 'planning', 'meeting', 'notes', 'books', 'travel',
+          'garden', 'repairs', 'birthday', 'shopping', 'workout', 'budget')
+_RESULT_ROW_TEMPLATE = '{:<9} {:>11} {:>11} {:>7} {:>12} {:>9} {:>10}'
+
+
+def create_names(count: int) -> List[str]:
+    """
+    Create unique text-like names, of around 100 characters
+
+    :param count: Number of names
+    :return: Names of the lists
+    """
+    return ['{} {}'.format(' '.join(_WORDS[(number + offset) % len(_WORDS)] for offset in range(0, 48, 4)), number)
+            for number in range(count)]
+
+
+def wire_size(message_bytes: bytes, compression: str, min_size: int) -> int:
+    """
+    Get the bytes of a message on the wire, compressed as gRPC does
+
+    :param message_bytes: Serialized message
+    :param compression: `NO_COMPRESSION`, `DEFLATE_COMPRESSION` or `GZIP_COMPRESSION`
+    :param min_size: Messages smaller than this number of bytes are sent uncompressed
+    :return: Number of bytes of the message and its header
+    """
+    size = len(message_bytes)
+    if compression != NO_COMPRESSION and size >= min_size:
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, _WINDOW_BITS[compression])
+        size = min(size, len(compressor.compress(message_bytes) + compressor.flush()))
+    return size + _MESSAGE_HEADER_SIZE
+
+
+def run_requests(stub: todolists_pb2_grpc.TodoListsStub, requests: int, page_size: int,
+                 compression: str, min_size: int) -> Dict[str, float]:
+    """
+    Invoke the TodoLists.List stub `requests` times, requesting the seeded pages round robin
+
+    :param stub: Stub used to invoke the gRPC methods
+    :param requests: Number of requests
+    :param page_size: Number of lists of each reply
+    :param compression: Compression setting of the server, used to compute the bytes on the wire
+    :param min_size: Messages smaller than this number of bytes are sent uncompressed
+    :return: Serialized and wire bytes per reply, CPU milliseconds per request and mean latency in milliseconds
+    """
+    page_requests = [todolists_pb2.ListTodoListsRequest(page_number=_page, page_size=page_size, skip_count=True)
+                     for _page in range(1, _SEEDED_PAGES + 1)]
+    serialized_bytes = sent_bytes = 0
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    for request_number in range(requests):
+        reply_bytes = stub.List(page_requests[request_number % _SEEDED_PAGES]).SerializeToString()
+        serialized_bytes += len(reply_bytes)
+        sent_bytes += wire_size(reply_bytes, compression, min_size)
+    elapsed = time.perf_counter() - start
+    cpu_elapsed = time.process_time() - cpu_start
+    return {
+        'serialized': serialized_bytes / requests,
+        'wire': sent_bytes / requests,
+        'cpu': cpu_elapsed * 1000 / requests,
+        'latency': elapsed * 1000 / requests,
+    }
+
+
+def benchmark_compression(compression: str, requests: int, page_size: int, min_size: int) -> Dict[str, float]:
+    """
+    Run a gRPC server and a client channel with a compression setting, and invoke the TodoLists.List stub
+
+    :param compression: `NO_COMPRESSION`, `DEFLATE_COMPRESSION` or `GZIP_COMPRESSION`
+    :param requests: Number of requests
+    :param page_size: Number of lists of each reply
+    :param min_size: Messages smaller than this number of bytes are sent uncompressed
+    :return: Serialized and wire bytes per reply, CPU milliseconds per request and mean latency in milliseconds
+    """
+    storage = MemoryStorage()
+    policy = CompressionPolicy(compression=compression, min_size=min_size)
+    server = create_secured_server(GRPC_SERVER_PORT, storage=storage, compression_policy=policy)
+    server.start()
+    try:
+        storage.new_todo_list_entries(create_names(page_size * _SEEDED_PAGES))
+        with create_secured_client_channel('localhost:{}'.format(GRPC_SERVER_PORT),
+                                           compression_policy=policy) as _channel:
+            stub = get_todo_lists_stub(_channel)
+            run_requests(stub, _WARM_UP_REQUESTS, page_size, compression, min_size)
+            result = run_requests(stub, requests, page_size, compression, min_size)
+            _channel.close()
+    finally:
+        server.stop(None)
+    return result
+
+
+def main():
+    """
+    Main when executed as script
+    :return:
+    """
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_REQUESTS
+    page_size = int(sys.argv[2]) if len(sys.argv) > 2 else _DEFAULT_PAGE_SIZE
+    print('Benchmarking {} List requests with pages of {} lists, compression min size {} bytes'.format(
+        requests, page_size, GRPC_COMPRESSION_MIN_SIZE))
+
+    results = {_compression: benchmark_compression(_compression, requests, page_size, GRPC_COMPRESSION_MIN_SIZE)
+               for _compression in (NO_COMPRESSION, DEFLATE_COMPRESSION, GZIP_COMPRESSION)}
+
+    print(_RESULT_ROW_TEMPLATE.format('setting', 'bytes/reply', 'wire bytes', 'ratio', 'cpu ms/req', 'cpu +%',
+                                      'latency ms'))
+    base_cpu = results[NO_COMPRESSION]['cpu']
+    for compression, result in results.items():
+        print(_RESULT_ROW_TEMPLATE.format(compression, '{:.0f}'.format(result['serialized']),
+                                          '{:.0f}'.format(result['wire']),
+                                          '{:.2f}'.format(result['wire'] / result['serialized']),
+                                          '{:.3f}'.format(result['cpu']),
+                                          '{:+.1f}'.format((result['cpu'] / base_cpu - 1) * 100),
+                                          '{:.3f}'.format(result['latency'])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+This module micro-benchmarks the DB read path, comparing reading the TodoLists as ORM instances, as the server
+did before, against the Core statements of `TodoListDBHandler` that return `(id, name)` records.
+Both paths convert the entries into `todolists_pb2.TodoList` messages, as the gRPC methods do.
+
+Examples:
+        This module can be executed as a script, it runs in the same process without a gRPC server, for a number
+        of seconds it reads pages of TodoLists, and single TodoLists by id, with each path,
+        then it prints the rows per second of each one.
+        It expects two optional positional arguments to define the seconds of each case and the page size.
+
+            $ python benchmark_orm_core_reads.py 5 100
+
+        The TodoLists cache is not used, so every read goes to the DB.
+        The lists created by the benchmark are deleted after it.
+
+Attributes:
+    benchmark_orm_core_reads.orm_read_page (function): Read a page of TodoLists with the ORM
+    benchmark_orm_core_reads.orm_read_list (function): Read a TodoList by id with the ORM
+    benchmark_orm_core_reads.core_read_page (function): Read a page of TodoLists with the Core statements
+    benchmark_orm_core_reads.core_read_list (function): Read a TodoList by id with the Core statements
+    benchmark_orm_core_reads.measure_rows_per_second (function): Run a read function for some seconds
+"""
+import os
+import sys
+import time
+import uuid
+from typing import Callable, List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import proto.v1.todolists_pb2 as todolists_pb2  # pylint: disable=wrong-import-position
+from database.todo_lists_db_handler import TodoListDBHandler  # pylint: disable=wrong-import-position
+from database.tables.todo_lists import TodoList  # pylint: disable=wrong-import-position
+from proto_server.todolists_server import TodoLists  # pylint: disable=wrong-import-position
+
+_SEEDED_LISTS = 2000
+_DEFAULT_SECONDS = 5
+_DEFAULT_PAGE_SIZE = 100
+_RESULT_ROW_TEMPLATE = '{:<12} {:>14} {:>14} {:>9}'
+
+
+def orm_read_page(last_id: int, page_size: int) -> List[todolists_pb2.TodoList]:
+    """
+    Read a page of TodoLists as ORM instances, in a new session, and convert them into messages
+
+    :param last_id: Only the TodoLists with a bigger `id` are read
+    :param page_size: Number of TodoLists to read
+    :return: TodoList messages
+    """
+    try:
+        session = TodoListDBHandler.session_maker()
+        db_lists = session.query(TodoList).filter(TodoList.id > last_id).order_by(TodoList.id).limit(page_size).all()
+        return [todolists_pb2.TodoList(id=_list.id, name=_list.name) for _list in db_lists]
+    finally:
+        TodoListDBHandler.session_maker.remove()
+
+
+def orm_read_list(list_id: int) -> List[todolists_pb2.TodoList]:
+    """
+    Read a TodoList as an ORM instance, in a new session, and convert it into a message
+
+    :param list_id: ID of the list to read
+    :return: TodoList message in a list
+    """
+    try:
+        session = TodoListDBHandler.session_maker()
+        todo_list = session.query(TodoList).get(list_id)
+        return [todolists_pb2.TodoList(id=todo_list.id, name=todo_list.name)]
+    finally:
+        TodoListDBHandler.session_maker.remove()
+
+
+def core_read_page(last_id: int, page_size: int) -> List[todolists_pb2.TodoList]:
+    """
+    Read a page of TodoLists as records, with the Core statements, and convert them into messages
+
+    :param last_id: Only the TodoLists with a bigger `id` are read
+    :param page_size: Number of TodoLists to read
+    :return: TodoList messages
+    """
+    return TodoLists.create_todo_list_messages(TodoListDBHandler.get_lists_after(last_id=last_id, limit=page_size))
+
+
+def core_read_list(list_id: int) -> List[todolists_pb2.TodoList]:
+    """
+    Read a TodoList as a record, with the Core statements without the cache, and convert it into a message
+
+    :param list_id: ID of the list to read
+    :return: TodoList message in a list
+    """
+    # pylint: disable=protected-access
+    return TodoLists.create_todo_list_messages([TodoListDBHandler._select_todo_list(list_id)])
+
+
+def measure_rows_per_second(read: Callable[[int], List[todolists_pb2.TodoList]], list_ids: List[int],
+                            seconds: float) -> float:
+    """
+    Call `read` with the ids of `list_ids`, round robin, during `seconds`
+
+    :param read: Read function, it receives a TodoList id and returns the messages read
+    :param list_ids: Ids of existing lists
+    :param seconds: Duration of the measure
+    :return: Rows read per second
+    """
+    rows = calls = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        rows += len(read(list_ids[calls % len(list_ids)]))
+        calls += 1
+    return rows / (time.perf_counter() - start)
+
+
+def main():
+    """
+    Main when executed as script
+    :return:
+    """
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_SECONDS
+    page_size = int(sys.argv[2]) if len(sys.argv) > 2 else _DEFAULT_PAGE_SIZE
+    TodoListDBHandler.setup()
+    names_prefix = 'benchmark-{}'.format(uuid.uuid4().hex)
+    list_ids = TodoListDBHandler.new_todo_list_entries(['{}-{}'.format(names_prefix, i) for i in range(_SEEDED_LISTS)])
+    # The pages start before the seeded lists, so all the pages are full
+    page_ids = [_id - 1 for _id in list_ids[:_SEEDED_LISTS - page_size]]
+    cases = (
+        ('page', lambda _id: orm_read_page(_id, page_size), lambda _id: core_read_page(_id, page_size), page_ids),
+        ('single', orm_read_list, core_read_list, list_ids),
+    )
+    try:
+        print('Benchmarking ORM and Core reads for {} seconds per case with pages of {} lists'.format(
+            seconds, page_size))
+        print(_RESULT_ROW_TEMPLATE.format('read', 'orm rows/s', 'core rows/s', 'speedup'))
+        for case_name, orm_read, core_read, ids in cases:
+            orm_rows_per_second = measure_rows_per_second(orm_read, ids, seconds)
+            core_rows_per_second = measure_rows_per_second(core_read, ids, seconds)
+            print(_RESULT_ROW_TEMPLATE.format(case_name, '{:.1f}'.format(orm_rows_per_second),
+                                              '{:.1f}'.format(core_rows_per_second),
+                                              '{:.2f}x'.format(core_rows_per_second / orm_rows_per_second)))
+    finally:
+        TodoListDBHandler.delete_todo_lists(list_ids)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+"""
+This module benchmarks the thread pool and the asyncio gRPC servers under concurrent load.
+
+Examples:
+        This module can be executed as a script, for each server mode it runs `run_grpc_server.py` in a new process,
+        invokes the todolists.TodoLists.Get Stub with a fixed number of concurrent requests and prints the throughput
+        and latencies of both servers.
+        It expects two optional positional arguments to define the number of requests and the concurrency.
+
+            $ python benchmark_server_modes.py 5000 200
+
+        The lists used by the benchmark are created before the load and deleted after it.
+
+Attributes:
+    benchmark_server_modes.percentile (function): Get a percentile from sorted values
+    benchmark_server_modes.run_load (function): Invoke the Get stub concurrently and measure its latencies
+    benchmark_server_modes.benchmark_server_mode (function): Run the server in a mode and benchmark it
+"""
+import os
+import sys
+import threading
+import time
+import uuid
+from typing import Dict, List
+import grpc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import proto.v1.todolists_pb2 as todolists_pb2  # pylint: disable=wrong-import-position
+import proto.v1.todolists_pb2_grpc as todolists_pb2_grpc  # pylint: disable=wrong-import-position
+from config.config import THREAD_POOL_SERVER_MODE, ASYNCIO_SERVER_MODE  # pylint: disable=wrong-import-position
+from benchmarks.helpers import run_grpc_server_process  # pylint: disable=wrong-import-position
+
+_SEEDED_LISTS = 100
+_DEFAULT_REQUESTS = 5000
+_DEFAULT_CONCURRENCY = 200
+_RESULT_ROW_TEMPLATE = '{:<12} {:>9} {:>7} {:>10} {:>8} {:>8} {:>8} {:>8}'
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """
+    Get the nearest-rank percentile of a sorted list of values
+
+    :param sorted_values: Values sorted ascending
+    :param percent: Percentile to get, from 0 to 100
+    :return: Value in that percentile, 0 if there are no values
+    """
+    if not sorted_values:
+        return 0.0
+    index = int(round(percent / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def run_load(stub: todolists_pb2_grpc.TodoListsStub,
+             list_ids: List[int],
+             requests: int,
+             concurrency: int) -> Dict[str, float]:
+    """
+    Invoke the TodoLists.Get stub `requests` times keeping `concurrency` requests in flight
+
+    :param stub: Stub used to invoke the gRPC methods
+    :param list_ids: Ids of existing lists, requested round robin
+    :param requests: Total number of requests
+    :param concurrency: Number of requests in flight at the same time
+    :return: Requests, errors, throughput in requests per second and latencies in milliseconds
+    """
+    in_flight = threading.Semaphore(concurrency)
+    latencies = []
+    errors = []
+
+    def _on_done(start: float, future: grpc.Future):
+        latencies.append((time.perf_counter() - start) * 1000)
+        if future.exception() is not None:
+            errors.append(future.exception())
+        in_flight.release()
+
+    load_start = time.perf_counter()
+    for request_number in range(requests):
+        in_flight.acquire()
+        request = todolists_pb2.GetListRequest(id=list_ids[request_number % len(list_ids)])
+        start = time.perf_counter()
+        stub.Get.future(request).add_done_callback(lambda _future, _start=start: _on_done(_start, _future))
+    # Wait for the requests still in flight
+    for _ in range(concurrency):
+        in_flight.acquire()
+    elapsed = time.perf_counter() - load_start
+
+    latencies.sort()
+    return {
+        'requests': requests,
+        'errors': len(errors),
+        'throughput': requests / elapsed,
+        'p50': percentile(latencies, 50),
+        'p90': percentile(latencies, 90),
+        'p99': percentile(latencies, 99),
+        'max': latencies[-1] if latencies else 0.0,
+    }
+
+
+def benchmark_server_mode(server_mode: str, requests: int, concurrency: int) -> Dict[str, float]:
+    """
+    Run `run_grpc_server.py` in a new process with the `server_mode` and benchmark it with `run_load`
+
+    :param server_mode: `THREAD_POOL_SERVER_MODE` or `ASYNCIO_SERVER_MODE`
+    :param requests: Total number of requests
+    :param concurrency: Number of requests in flight at the same time
+    :return: Results of `run_load`
+    """
+    with run_grpc_server_process(server_mode) as _channel:
+        stub = todolists_pb2_grpc.TodoListsStub(_channel)
+        names_prefix = 'benchmark-{}'.format(uuid.uuid4().hex)
+        list_ids = [stub.Create(todolists_pb2.CreateListRequest(name='{}-{}'.format(names_prefix, i))).id
+                    for i in range(_SEEDED_LISTS)]
+        try:
+            return run_load(stub, list_ids, requests, concurrency)
+        finally:
+            for list_id in list_ids:
+                stub.Delete(todolists_pb2.DeleteListRequest(id=list_id))
+
+
+def main():
+    """
+    Main when executed as script
+    :return:
+    """
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_REQUESTS
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else _DEFAULT_CONCURRENCY
+    print('Benchmarking TodoLists.Get with {} requests and {} concurrent requests'.format(requests, concurrency))
+    print(_RESULT_ROW_TEMPLATE.format('mode', 'requests', 'errors', 'req/s', 'p50 ms', 'p90 ms', 'p99 ms', 'max ms'))
+    for server_mode in (THREAD_POOL_SERVER_MODE, ASYNCIO_SERVER_MODE):
+        results = benchmark_server_mode(server_mode, requests, concurrency)
+        print(_RESULT_ROW_TEMPLATE.format(server_mode, results['requests'], results['errors'],
+                                          '{:.1f}'.format(results['throughput']),
+                                          '{:.2f}'.format(results['p50']), '{:.2f}'.format(results['p90']),
+                                          '{:.2f}'.format(results['p99']), '{:.2f}'.format(results['max'])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""
+This module benchmarks the SQLite tuning, comparing the SQLite default pragmas without connections pool
+against the configured pragmas and connections pool, under concurrent reads and writes.
+
+Examples:
+        This module can be executed as a script, for each profile it runs `run_grpc_server.py` in a new process,
+        and for a number of seconds some threads invoke the todolists.TodoLists.Create Stub while other threads
+        invoke the todolists.TodoLists.Get Stub, then it prints the reads and writes per second of each profile.
+        It expects three optional positional arguments to define the seconds, the readers and the writers threads.
+
+            $ python benchmark_sqlite_tuning.py 10 8 4
+
+        The TodoLists cache is disabled in the server, so every Get reads the DB.
+        The lists created by the benchmark are deleted after it.
+
+Attributes:
+    benchmark_sqlite_tuning.run_mixed_load (function): Invoke the Get and Create stubs concurrently for some seconds
+    benchmark_sqlite_tuning.benchmark_profile (function): Run the server with a profile and benchmark it
+"""
+import os
+import sys
+import threading
+import time
+import uuid
+from typing import Dict, List
+import grpc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import proto.v1.todolists_pb2 as todolists_pb2  # pylint: disable=wrong-import-position
+import proto.v1.todolists_pb2_grpc as todolists_pb2_grpc  # pylint: disable=wrong-import-position
+from benchmarks.helpers import run_grpc_server_process  # pylint: disable=wrong-import-position
+
+_SEEDED_LISTS = 1000
+_DEFAULT_SECONDS = 10
+_DEFAULT_READERS = 8
+_DEFAULT_WRITERS = 4
+_RESULT_ROW_TEMPLATE = '{:<16} {:>10} {:>10} {:>8}'
+
+# SQLite defaults, and a new connection for each DB session, as the server did before the tuning
+_SQLITE_DEFAULTS_PROFILE = {
+    'SQLITE_JOURNAL_MODE': 'DELETE',
+    'SQLITE_SYNCHRONOUS': 'FULL',
+    'SQLITE_CACHE_SIZE': '-2000',
+    'SQLITE_MMAP_SIZE': '0',
+    'SQLITE_TEMP_STORE': 'DEFAULT',
+    'DB_POOL_SIZE': '0',
+}
+# Pragmas and connections pool from the current environment, or the defaults in database.config
+_TUNED_PROFILE = {}
+_PROFILES = (('sqlite defaults', _SQLITE_DEFAULTS_PROFILE), ('tuned', _TUNED_PROFILE))
+
+
+def run_mixed_load(stub: todolists_pb2_grpc.TodoListsStub, list_ids: List[int], seconds: float,
+                   readers: int, writers: int) -> Dict[str, float]:
+    """
+    Invoke the TodoLists.Get stub from `readers` threads and the TodoLists.Create stub from `writers` threads
+    during `seconds`
+
+    :param stub: Stub used to invoke the gRPC methods
+    :param list_ids: Ids of existing lists, requested round robin by the readers
+    :param seconds: Duration of the load
+    :param readers: Number of threads invoking Get
+    :param writers: Number of threads invoking Create
+    :return: Reads and writes per second, errors, and the ids of the created lists
+    """
+    names_prefix = 'benchmark-{}'.format(uuid.uuid4().hex)
+    deadline = time.perf_counter() + seconds
+    results = {'reads': 0, 'writes': 0, 'errors': 0, 'created_ids': []}
+    results_lock = threading.Lock()
+
+    def _read(reader: int):
+        reads = errors = 0
+        while time.perf_counter() < deadline:
+            try:
+                stub.Get(todolists_pb2.GetListRequest(id=list_ids[(reader + reads) % len(list_ids)]))
+                reads += 1
+            except grpc.RpcError:
+                errors += 1
+        with results_lock:
+            results['reads'] += reads
+            results['errors'] += errors
+
+    def _write(writer: int):
+        created_ids = []
+        errors = 0
+        while time.perf_counter() < deadline:
+            name = '{}-writer-{}-{}'.format(names_prefix, writer, len(created_ids) + errors)
+            try:
+                created_ids.append(stub.Create(todolists_pb2.CreateListRequest(name=name)).id)
+            except grpc.RpcError:
+                errors += 1
+        with results_lock:
+            results['writes'] += len(created_ids)
+            results['errors'] += errors
+            results['created_ids'].extend(created_ids)
+
+    threads = [threading.Thread(target=_read, args=(_reader,)) for _reader in range(readers)]
+    threads += [threading.Thread(target=_write, args=(_writer,)) for _writer in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    results['reads_per_second'] = results['reads'] / seconds
+    results['writes_per_second'] = results['writes'] / seconds
+    return results
+
+
+def benchmark_profile(profile: Dict[str, str], seconds: float, readers: int, writers: int) -> Dict[str, float]:
+    """
+    Run `run_grpc_server.py` in a new process with the `profile` environment variables
+    and benchmark it with `run_mixed_load`
+
+    :param profile: Environment variables that configure the SQLite pragmas and the connections pool
+    :param seconds: Duration of the load
+    :param readers: Number of threads invoking Get
+    :param writers: Number of threads invoking Create
+    :return: Results of `run_mixed_load`
+    """
+    with run_grpc_server_process(server_env=dict(profile, TODO_LISTS_CACHE_SIZE='0')) as _channel:
+        stub = todolists_pb2_grpc.TodoListsStub(_channel)
+        names_prefix = 'benchmark-{}'.format(uuid.uuid4().hex)
+        seeded = stub.BatchCreate(todolists_pb2.BatchCreateListsRequest(
+            names=['{}-{}'.format(names_prefix, i) for i in range(_SEEDED_LISTS)]))
+        list_ids = [_result.id for _result in seeded.results]
+        results = {'created_ids': []}
+        try:
+            results = run_mixed_load(stub, list_ids, seconds, readers, writers)
+            return results
+        finally:
+            stub.BatchDelete(todolists_pb2.BatchDeleteListsRequest(ids=list_ids + results['created_ids']))
+
+
+def main():
+    """
+    Main when executed as script
+    :return:
+    """
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_SECONDS
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else _DEFAULT_READERS
+    writers = int(sys.argv[3]) if len(sys.argv) > 3 else _DEFAULT_WRITERS
+    print('Benchmarking SQLite tuning for {} seconds with {} readers and {} writers'.format(seconds, readers, writers))
+    print(_RESULT_ROW_TEMPLATE.format('profile', 'reads/s', 'writes/s', 'errors'))
+    for profile_name, profile in _PROFILES:
+        results = benchmark_profile(profile, seconds, readers, writers)
+        print(_RESULT_ROW_TEMPLATE.format(profile_name, '{:.1f}'.format(results['reads_per_second']),
+                                          '{:.1f}'.format(results['writes_per_second']), results['errors']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Helper functions shared by benchmarks
+
+Attributes:
+    helpers.run_grpc_server_process (func): Run the gRPC server in a new process and connect a channel to it
+"""
+from contextlib import _GeneratorContextManager
+import contextlib
+import os
+import subprocess
+import sys
+from typing import Dict
+import grpc
+
+from config.config import GRPC_SERVER_PORT, THREAD_POOL_SERVER_MODE
+from proto_client.helpers import create_secured_client_channel
+
+_RUN_SERVER_SCRIPT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'run_grpc_server.py'))
+_SERVER_READY_TIMEOUT = 10
+
+
+@contextlib.contextmanager
+def run_grpc_server_process(server_mode: str = THREAD_POOL_SERVER_MODE,
+                            server_env: Dict[str, str] = None) -> _GeneratorContextManager:
+    """
+    Run `run_grpc_server.py` in a new process and create a secured channel connected to it.
+
+    The server runs in its own process, so the load generated by the benchmark does not compete with it for the GIL.
+    The server is stopped when the `with` statement finishes.
+
+    Example:
+        $ with run_grpc_server_process('asyncio') as _channel:
+        $   ...
+
+    :param server_mode: `THREAD_POOL_SERVER_MODE` or `ASYNCIO_SERVER_MODE`
+    :param server_env: Environment variables to set in the server process, to change its config. Default None
+    :return:
+    """
+    process_env = dict(os.environ, **(server_env or {}), GRPC_SERVER_MODE=server_mode)
+    server_process = subprocess.Popen([sys.executable, _RUN_SERVER_SCRIPT], env=process_env,
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        with create_secured_client_channel('localhost:{}'.format(GRPC_SERVER_PORT)) as _channel:
+            grpc.channel_ready_future(_channel).result(timeout=_SERVER_READY_TIMEOUT)
+            try:
+                yield _channel
+            finally:
+                _channel.close()
+    finally:
+        server_process.terminate()
+        server_process.wait()
@@ -0,0 +1,127 @@
+"""
+This module contains the compression policy of the gRPC messages, the servers and the clients apply the same policy,
+built from the config, to the messages that they send.
+
+The policy defines the compression algorithm of each gRPC method, by default only the methods that send big messages,
+e.g. the pages of `List`, are compressed with `GRPC_COMPRESSION`, and the `GRPC_COMPRESSION_METHODS` pairs override
+the algorithm of any method. The messages smaller than `GRPC_COMPRESSION_MIN_SIZE` bytes are sent uncompressed,
+for them the CPU of the compression costs more than the bytes that it saves.
+
+The compressed messages are decompressed by gRPC, the receiver does not need the same policy to read them.
+
+The servers apply the policy with the interceptors of `proto_server.compression`, and the client channels with the
+client interceptor of `proto_client.compression`.
+
+Examples:
+        Select the compression of a message.
+
+            $ compression = COMPRESSION_POLICY.message_compression('/todolists.TodoLists/List', response)
+
+Classes:
+    CompressionPolicy: Compression algorithm of each gRPC method, and min size of the compressed messages
+
+Attributes:
+    DEFAULT_COMPRESSED_METHODS (Tuple[str]): gRPC methods compressed by default, they send big messages
+    compression.parse_compression (function): Parse the name of a compression algorithm
+    compression.parse_method_compressions (function): Parse the per-method compression settings
+    COMPRESSION_POLICY (CompressionPolicy): Policy built from the config, used by default by the interceptors
+"""
+from typing import Any, Dict
+
+import grpc
+
+from config.config import (
+    GRPC_COMPRESSION, GRPC_COMPRESSION_MIN_SIZE, GRPC_COMPRESSION_METHODS,
+    NO_COMPRESSION, DEFLATE_COMPRESSION, GZIP_COMPRESSION
+)
+
+DEFAULT_COMPRESSED_METHODS = ('List', 'StreamLists', 'BatchCreate', 'BatchGet', 'BatchDelete', 'ImportLists')
+
+_ALGORITHMS = {
+    NO_COMPRESSION: grpc.Compression.NoCompression,
+    DEFLATE_COMPRESSION: grpc.Compression.Deflate,
+    GZIP_COMPRESSION: grpc.Compression.Gzip,
+}
+
+
+def parse_compression(name: str) -> grpc.Compression:
+    """
+    :param name: `GZIP_COMPRESSION`, `DEFLATE_COMPRESSION` or `NO_COMPRESSION`, not case sensitive
+    :return: gRPC compression algorithm
+    :raise ValueError: If the name is unknown
+    """
+    try:
+        return _ALGORITHMS[name.strip().lower()]
+    except KeyError:
+        raise ValueError('Unknown compression "{}", expected one of {}'.format(name, ', '.join(_ALGORITHMS))) from None
+
+
+def parse_method_compressions(method_compressions: str) -> Dict[str, grpc.Compression]:
+    """
+    Parse the per-method compression settings, `method=compression` pairs separated by commas
+
+        $ parse_method_compressions('Get=gzip,StreamLists=none')
+
+    :param method_compressions: Per-method compression settings
+    :return: Compression algorithm of each gRPC method name
+    :raise ValueError: If a pair does not have a method name and a known compression
+    """
+    compressions = {}
+    for pair in filter(None, (_pair.strip() for _pair in method_compressions.split(','))):
+        method, _, name = pair.partition('=')
+        if not method.strip() or not name.strip():
+            raise ValueError('Invalid method compression "{}", expected `method=compression`'.format(pair))
+        compressions[method.strip()] = parse_compression(name)
+    return compressions
+
+
+class CompressionPolicy:
+    """
+    Compression algorithm of each gRPC method, and min size of the compressed messages
+    """
+
+    def __init__(self,
+                 compression: str = GRPC_COMPRESSION,
+                 min_size: int = GRPC_COMPRESSION_MIN_SIZE,
+                 method_compressions: str = GRPC_COMPRESSION_METHODS):
+        """
+        :param compression: Algorithm of the `DEFAULT_COMPRESSED_METHODS`, see `parse_compression`.
+            Default `GRPC_COMPRESSION`
+        :param min_size: Messages smaller than this number of bytes are sent uncompressed.
+            Default `GRPC_COMPRESSION_MIN_SIZE`
+        :param method_compressions: Per-method settings that override the defaults, see `parse_method_compressions`.
+            Default `GRPC_COMPRESSION_METHODS`
+        :raise ValueError: If a compression is unknown
+        """
+        self.min_size = min_size
+        algorithm = parse_compression(compression)
+        self._methods = dict.fromkeys(DEFAULT_COMPRESSED_METHODS, algorithm)
+        self._methods.update(parse_method_compressions(method_compressions))
+
+    def method_compression(self, method: str) -> grpc.Compression:
+        """
+        :param method: gRPC method name, e.g. `List` or `/todolists.TodoLists/List`
+        :return: Compression algorithm of the method
+        """
+        return self._methods.get(method.rpartition('/')[2], grpc.Compression.NoCompression)
+
+    def compress_message(self, message: Any) -> bool:
+        """
+        :param message: Message of a compressed method
+        :return: If the message is big enough to be compressed
+        """
+        return message.ByteSize() >= self.min_size
+
+    def message_compression(self, method: str, message: Any) -> grpc.Compression:
+        """
+        :param method: gRPC method name
+        :param message: Message to send
+        :return: Compression algorithm of the message
+        """
+        compression = self.method_compression(method)
+        if compression == grpc.Compression.NoCompression or not self.compress_message(message):
+            return grpc.Compression.NoCompression
+        return compression
+
+
+COMPRESSION_POLICY = CompressionPolicy()
@@ -4,6 +4,68 @@ Config variables for the gRPC server and clients/stubs
 Attributes:
     GRPC_SERVER_PORT (int): Port used to run the gRPC server and invoke the stubs
     MAX_PAGE_SIZE (int): Define the max number of items per page when listing resources.
+    MAX_BATCH_SIZE (int): Max number of names or ids of a BatchCreate, BatchGet or BatchDelete request, the bigger
+     batches are rejected with `INVALID_ARGUMENT`.
+    STREAM_LISTS_CHUNK_SIZE (int): Number of TodoLists read from the DB at once when streaming them.
+    IMPORT_LISTS_CHUNK_SIZE (int): Number of imported TodoLists inserted in each DB transaction by ImportLists.
+    IMPORT_LISTS_MAX_ERRORS (int): Max number of errors returned in the ImportLists summary.
+    SESSION_MAX_IN_FLIGHT (int): Max number of operations of a Session stream that are running or waiting
+     to be sent, the next requests of the stream are not read until one of them is sent
+    TODO_LISTS_CACHE_SIZE (int): Max number of TodoLists kept in the in-process cache used by Get, 0 disables it.
+    TODO_LISTS_CACHE_TTL (float): Seconds that a TodoList is kept in the cache, bounds how stale it can be.
+    THREAD_POOL_SERVER_MODE (str): Name of the server mode that runs the gRPC methods in a thread pool.
+    ASYNCIO_SERVER_MODE (str): Name of the server mode that runs the gRPC methods as coroutines with grpc.aio.
+    GRPC_SERVER_MODE (str): Server mode used by `run_grpc_server.py`, `THREAD_POOL_SERVER_MODE` or
+     `ASYNCIO_SERVER_MODE`
+    GRPC_SERVER_MAX_WORKERS (int): Number of threads used by the `THREAD_POOL_SERVER_MODE` server
+    GRPC_SERVER_MAX_STREAM_WORKERS (int): Number of threads of the streaming RPCs of the `THREAD_POOL_SERVER_MODE`
+     server when `ADMISSION_CONTROL` is set, the streams do not hold the threads of the unary RPCs
+    ASYNC_DB_MAX_WORKERS (int): Number of threads used by the `ASYNCIO_SERVER_MODE` server to run DB queries
+    GRPC_SERVER_PREFORK (bool): If set, `run_grpc_server.py` runs `GRPC_SERVER_WORKER_PROCESSES` server processes
+     listening to the same port, supervised by the parent process
+    GRPC_SERVER_WORKER_PROCESSES (int): Number of server processes of the pre-fork mode, by default the CPU count
+    GRPC_SERVER_GRACE_PERIOD (float): Seconds that a stopping server waits for the in-flight RPCs to finish
+    ADMISSION_CONTROL (bool): If set, the servers limit the concurrent unary RPCs with an adaptive limit,
+     queue the RPCs over the limit in a bounded queue and reject the rest with `RESOURCE_EXHAUSTED`
+    ADMISSION_INITIAL_LIMIT (int): Concurrency limit of the unary RPCs when the server starts
+    ADMISSION_MIN_LIMIT (int): Min concurrency limit, the limit is never decreased below it
+    ADMISSION_MAX_LIMIT (int): Max concurrency limit, the limit is never increased above it
+    ADMISSION_TARGET_LATENCY (float): Seconds that an admitted RPC is expected to take, the limit is decreased
+     when an RPC takes longer, and increased while the RPCs are faster and the limit is in use
+    ADMISSION_BACKOFF_RATIO (float): Ratio by which the limit is multiplied when it is decreased
+    ADMISSION_QUEUE_SIZE (int): Max number of RPCs waiting for the limit, the next RPCs are rejected
+    ADMISSION_MAX_QUEUE_WAIT (float): Max seconds that an RPC waits in the queue, less if its deadline is sooner
+    RATE_LIMIT (bool): If set, the servers limit the RPCs of each client with token buckets, and reject the RPCs
+     of a client over its limit with `RESOURCE_EXHAUSTED`
+    RATE_LIMIT_READ_RATE (float): Tokens per second added to the read budget of each client
+    RATE_LIMIT_READ_BURST (float): Max tokens of the read budget of each client
+    RATE_LIMIT_WRITE_RATE (float): Tokens per second added to the write budget of each client
+    RATE_LIMIT_WRITE_BURST (float): Max tokens of the write budget of each client
+    RATE_LIMIT_METHOD_COSTS (str): Per-method tokens of each item, 1 by default, `method=tokens` pairs separated
+     by commas
+    RATE_LIMIT_CLIENT_METADATA (str): Metadata key that identifies the clients, empty to identify them by
+     their TLS certificate, or by their address without a certificate
+    RATE_LIMIT_MAX_CLIENTS (int): Max number of clients whose budgets are kept, the least recently seen ones are
+     forgotten
+    LOG_LEVEL (str): Log level of the gRPC server, per-request logs are only written at `DEBUG` level
+    LOG_LEVELS (str): Per-module log levels that override `LOG_LEVEL`, `logger=LEVEL` pairs separated by commas
+    TEXT_LOG_FORMAT (str): Name of the log format that writes each record as a line of text
+    JSON_LOG_FORMAT (str): Name of the log format that writes each record as a JSON object
+    LOG_FORMAT (str): Log format of the gRPC server, `TEXT_LOG_FORMAT` or `JSON_LOG_FORMAT`
+    LOG_REQUESTS_SAMPLE_RATE (float): Fraction of the per-request logs that are written, from 0 to 1
+    METRICS_PORT (int): Port of the HTTP server that exposes the metrics of the gRPC server, 0 disables it.
+     In pre-fork mode each worker process uses the next ports, `METRICS_PORT + 1`, `METRICS_PORT + 2`...
+    NO_COMPRESSION (str): Name of the compression setting that sends the messages uncompressed
+    DEFLATE_COMPRESSION (str): Name of the compression algorithm deflate
+    GZIP_COMPRESSION (str): Name of the compression algorithm gzip
+    GRPC_COMPRESSION (str): Compression algorithm of the gRPC methods that are compressed, used by the servers and
+     the clients, `GZIP_COMPRESSION`, `DEFLATE_COMPRESSION` or `NO_COMPRESSION`
+    GRPC_COMPRESSION_MIN_SIZE (int): Messages smaller than this number of bytes are sent uncompressed
+    GRPC_COMPRESSION_METHODS (str): Per-method compression settings that override the defaults,
+     `method=compression` pairs separated by commas
+    GRPC_CLIENT_CHANNEL_POOL_SIZE (int): Number of channels, each one with its own connection, that the client
+     channel pool opens to each address, the calls are sent round robin over them
+    ASYNC_CLIENT_MAX_CONCURRENCY (int): Max number of RPCs in flight of each bulk operation of the asyncio client
     TESTING_ENVIRONMENT (str): Name of testing environment.
     ENVIRONMENT (str): Define the running environment, if it's `TESTING_ENVIRONMENT` Test DB PATH will be assigned
 """
@@ -11,6 +73,60 @@ import os
 
 GRPC_SERVER_PORT = int(os.environ.get('GRPC_SERVER_PORT', 50051))
 MAX_PAGE_SIZE = int(os.environ.get('MAX_PAGE_SIZE', 50))
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', 10000))
+STREAM_LISTS_CHUNK_SIZE = int(os.environ.get('STREAM_LISTS_CHUNK_SIZE', 1000))
+IMPORT_LISTS_CHUNK_SIZE = int(os.environ.get('IMPORT_LISTS_CHUNK_SIZE', 2000))
+IMPORT_LISTS_MAX_ERRORS = int(os.environ.get('IMPORT_LISTS_MAX_ERRORS', 100))
+SESSION_MAX_IN_FLIGHT = int(os.environ.get('SESSION_MAX_IN_FLIGHT', 32))
+TODO_LISTS_CACHE_SIZE = int(os.environ.get('TODO_LISTS_CACHE_SIZE', 1024))
+TODO_LISTS_CACHE_TTL = float(os.environ.get('TODO_LISTS_CACHE_TTL', 30))
+
+THREAD_POOL_SERVER_MODE = 'thread_pool'
+ASYNCIO_SERVER_MODE = 'asyncio'
+GRPC_SERVER_MODE = os.environ.get('GRPC_SERVER_MODE', THREAD_POOL_SERVER_MODE)
+GRPC_SERVER_MAX_WORKERS = int(os.environ.get('GRPC_SERVER_MAX_WORKERS', 10))
+GRPC_SERVER_MAX_STREAM_WORKERS = int(os.environ.get('GRPC_SERVER_MAX_STREAM_WORKERS', 10))
+ASYNC_DB_MAX_WORKERS = int(os.environ.get('ASYNC_DB_MAX_WORKERS', 10))
+GRPC_SERVER_PREFORK = os.environ.get('GRPC_SERVER_PREFORK', '').lower() in ('1', 'true', 'yes')
+GRPC_SERVER_WORKER_PROCESSES = int(os.environ.get('GRPC_SERVER_WORKER_PROCESSES', os.cpu_count() or 1))
+GRPC_SERVER_GRACE_PERIOD = float(os.environ.get('GRPC_SERVER_GRACE_PERIOD', 5))
+
+ADMISSION_CONTROL = os.environ.get('ADMISSION_CONTROL', 'false').lower() in ('1', 'true', 'yes')
+ADMISSION_INITIAL_LIMIT = int(os.environ.get('ADMISSION_INITIAL_LIMIT', 20))
+ADMISSION_MIN_LIMIT = int(os.environ.get('ADMISSION_MIN_LIMIT', 2))
+ADMISSION_MAX_LIMIT = int(os.environ.get('ADMISSION_MAX_LIMIT', 500))
+ADMISSION_TARGET_LATENCY = float(os.environ.get('ADMISSION_TARGET_LATENCY', 0.25))
+ADMISSION_BACKOFF_RATIO = float(os.environ.get('ADMISSION_BACKOFF_RATIO', 0.9))
+ADMISSION_QUEUE_SIZE = int(os.environ.get('ADMISSION_QUEUE_SIZE', 100))
+ADMISSION_MAX_QUEUE_WAIT = float(os.environ.get('ADMISSION_MAX_QUEUE_WAIT', 1))
+
+RATE_LIMIT = os.environ.get('RATE_LIMIT', '').lower() in ('1', 'true', 'yes')
+RATE_LIMIT_READ_RATE = float(os.environ.get('RATE_LIMIT_READ_RATE', 500))
+RATE_LIMIT_READ_BURST = float(os.environ.get('RATE_LIMIT_READ_BURST', 1000))
+RATE_LIMIT_WRITE_RATE = float(os.environ.get('RATE_LIMIT_WRITE_RATE', 100))
+RATE_LIMIT_WRITE_BURST = float(os.environ.get('RATE_LIMIT_WRITE_BURST', 200))
+RATE_LIMIT_METHOD_COSTS = os.environ.get('RATE_LIMIT_METHOD_COSTS', '')
+RATE_LIMIT_CLIENT_METADATA = os.environ.get('RATE_LIMIT_CLIENT_METADATA', '')
+RATE_LIMIT_MAX_CLIENTS = int(os.environ.get('RATE_LIMIT_MAX_CLIENTS', 10000))
+
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
+LOG_LEVELS = os.environ.get('LOG_LEVELS', '')
+TEXT_LOG_FORMAT = 'text'
+JSON_LOG_FORMAT = 'json'
+LOG_FORMAT = os.environ.get('LOG_FORMAT', TEXT_LOG_FORMAT)
+LOG_REQUESTS_SAMPLE_RATE = float(os.environ.get('LOG_REQUESTS_SAMPLE_RATE', 1))
+
+METRICS_PORT = int(os.environ.get('METRICS_PORT', 9095))
+
+NO_COMPRESSION = 'none'
+DEFLATE_COMPRESSION = 'deflate'
+GZIP_COMPRESSION = 'gzip'
+GRPC_COMPRESSION = os.environ.get('GRPC_COMPRESSION', GZIP_COMPRESSION)
+GRPC_COMPRESSION_MIN_SIZE = int(os.environ.get('GRPC_COMPRESSION_MIN_SIZE', 1024))
+GRPC_COMPRESSION_METHODS = os.environ.get('GRPC_COMPRESSION_METHODS', '')
+
+GRPC_CLIENT_CHANNEL_POOL_SIZE = int(os.environ.get('GRPC_CLIENT_CHANNEL_POOL_SIZE', 4))
+ASYNC_CLIENT_MAX_CONCURRENCY = int(os.environ.get('ASYNC_CLIENT_MAX_CONCURRENCY', 256))
 
 TESTING_ENVIRONMENT = 'testing'
 ENVIRONMENT = os.environ.get('ENVIRONMENT', 'development')
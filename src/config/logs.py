@@ -0,0 +1,182 @@
+"""
+Logging configuration for the gRPC server
+
+The log records are put in a queue by the threads that log them, and a background thread formats and writes them
+to stdout, this way the request threads never wait for stdout.
+
+The per-request logs are written with the DEBUG level by the loggers returned by `get_request_logger`,
+they are discarded without being formatted at INFO level, and can be sampled at DEBUG level.
+
+Examples:
+        Configure the logging once when the server starts, and get a logger per module.
+
+            $ from config.logs import setup_logging, get_request_logger
+            $ setup_logging()
+            $ logger = logging.getLogger(__name__)
+            $ request_logger = get_request_logger(__name__)
+
+Classes:
+    SamplingFilter(logging.Filter): Let pass a random sample of the log records
+    JsonFormatter(logging.Formatter): Format the log records as JSON objects
+
+Attributes:
+    logs.parse_log_levels (function): Parse the per-module log levels defined by `LOG_LEVELS`
+    logs.get_request_logger (function): Get the logger for the per-request logs of a module
+    logs.setup_logging (function): Send the log records to a queue and start the thread that writes them
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from typing import Dict
+
+from config.config import (
+    LOG_LEVEL, LOG_LEVELS, LOG_FORMAT, JSON_LOG_FORMAT, LOG_REQUESTS_SAMPLE_RATE
+)
+
+_TEXT_LOG_FORMAT = '%(asctime)s %(levelname)s %(name)s [%(process)d:%(threadName)s] %(message)s'
+_REQUEST_LOGGER_SUFFIX = 'requests'
+
+
+class SamplingFilter(logging.Filter):  # pylint: disable=too-few-public-methods
+    """
+    Log filter that let pass a random sample of the log records
+
+    Attributes:
+        SamplingFilter.rate (float): Fraction of the log records that pass the filter, from 0 to 1
+    """
+
+    def __init__(self, rate: float):
+        """
+        :param rate: Fraction of the log records that pass the filter, from 0 to 1
+        """
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        :param record: Log record to filter
+        :return: True if the record must be logged
+        """
+        return self.rate >= 1 or random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Log formatter that writes each record as a JSON object in a single line
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        :param record: Log record to format
+        :return: JSON object with the time, level, logger, process, thread and message of the record
+        """
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'process': record.process,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves the formatting of the records to the thread of the QueueListener
+
+    The records never leave the process, so they can be put in the queue as they are. The arguments of the log calls
+    are formatted later, so only immutable values must be logged.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        :param record: Log record to put in the queue
+        :return: The same record
+        """
+        return record
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """
+    Queue listener that can be stopped more than once, it is stopped when the process exits
+    even if it was already stopped
+    """
+
+    def stop(self) -> None:
+        """
+        Write the pending records and stop the listener thread, if it is running
+        :return:
+        """
+        if self._thread is not None:
+            super().stop()
+
+
+def parse_log_levels(log_levels: str) -> Dict[str, str]:
+    """
+    Parse the per-module log levels, `logger=LEVEL` pairs separated by commas
+
+        $ parse_log_levels('database=WARNING,proto_server.todolists_server=DEBUG')
+
+    :param log_levels: Per-module log levels
+    :return: Level name of each logger name
+    :raise ValueError: If a pair does not have a logger name and a level
+    """
+    levels = {}
+    for pair in filter(None, (_pair.strip() for _pair in log_levels.split(','))):
+        name, _, level = pair.partition('=')
+        if not name.strip() or not level.strip():
+            raise ValueError('Invalid log level "{}", expected `logger=LEVEL`'.format(pair))
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def get_request_logger(name: str) -> logging.Logger:
+    """
+    Get the logger for the per-request logs of a module, its records are sampled with `LOG_REQUESTS_SAMPLE_RATE`
+
+    It is a child of the module logger, so the module log level also applies to it.
+
+    :param name: Module name
+    :return: Logger `<name>.requests`
+    """
+    logger = logging.getLogger('{}.{}'.format(name, _REQUEST_LOGGER_SUFFIX))
+    if LOG_REQUESTS_SAMPLE_RATE < 1 and not logger.filters:
+        logger.addFilter(SamplingFilter(LOG_REQUESTS_SAMPLE_RATE))
+    return logger
+
+
+def setup_logging(level: str = LOG_LEVEL, log_levels: str = LOG_LEVELS,
+                  log_format: str = LOG_FORMAT) -> logging.handlers.QueueListener:
+    """
+    Configure the root logger to put the records in a queue, and start the thread that writes them to stdout.
+    The thread is stopped, after writing the pending records, when the process exits.
+
+    :param level: Root log level. Default `LOG_LEVEL`
+    :param log_levels: Per-module log levels, see `parse_log_levels`. Default `LOG_LEVELS`
+    :param log_format: `TEXT_LOG_FORMAT` or `JSON_LOG_FORMAT`. Default `LOG_FORMAT`
+    :return: Started QueueListener
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if log_format == JSON_LOG_FORMAT:
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(_TEXT_LOG_FORMAT))
+
+    root_logger = logging.getLogger()
+    root_logger.handlers = [_QueueHandler(log_queue)]
+    root_logger.setLevel(level.upper())
+    for name, module_level in parse_log_levels(log_levels).items():
+        logging.getLogger(name).setLevel(module_level)
+
+    listener = _QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
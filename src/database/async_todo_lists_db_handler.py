@@ -0,0 +1,164 @@
+"""
+This module contains the asyncio version of the class to interact with the TodoLists storage.
+
+Sqlalchemy and the sqlite3 driver only provide blocking calls, so each method of a blocking storage backend,
+e.g. `TodoListDBHandler`, is executed in a bounded thread pool and awaited, this way the event loop is never
+blocked by the DB. The methods of the non-blocking backends, e.g. `MemoryStorage`, are called directly.
+
+The blocking calls are run with the guard of the DB reads of the coroutine, see `database.query_guard`,
+or with a new guard. When the coroutine is cancelled, e.g. the client cancelled the RPC, the guard is cancelled,
+so the read that is still running in the thread pool is interrupted instead of keeping the DB connection busy.
+
+Classes:
+    AsyncTodoListDBHandler
+"""
+import asyncio
+from concurrent import futures
+from functools import partial
+from typing import Any, Callable, List, Optional
+from config.config import ASYNC_DB_MAX_WORKERS
+from database.query_guard import QueryGuard, current_query_guard, guarded_queries
+from database.storage import StorageBackend, TodoListRecord
+from database.todo_lists_db_handler import TodoListDBHandler
+
+
+def _run_guarded(guard: QueryGuard, func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a storage function with the guard of its DB reads, in a thread of the pool
+
+    :param guard: Guard of the reads
+    :param func: Storage function to run
+    :return: The result of the function
+    """
+    with guarded_queries(guard):
+        return func(*args, **kwargs)
+
+
+class AsyncTodoListDBHandler:
+    """
+    TodoLists storage Handler to be awaited from coroutines
+
+    Attributes:
+        AsyncTodoListDBHandler.executor (concurrent.futures.ThreadPoolExecutor): Thread pool that runs the DB calls,
+         its size is defined by `ASYNC_DB_MAX_WORKERS`
+        AsyncTodoListDBHandler.storage (database.storage.StorageBackend): Storage backend of the TodoLists
+    """
+
+    executor = futures.ThreadPoolExecutor(max_workers=ASYNC_DB_MAX_WORKERS, thread_name_prefix='async-db')
+
+    def __init__(self, storage: StorageBackend = None):
+        """
+        Constructor of the handler
+
+        :param storage: Storage backend of the TodoLists. Default the SQLite storage, `TodoListDBHandler`
+        """
+        self.storage = storage if storage is not None else TodoListDBHandler()
+
+    async def _run_in_executor(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking storage function in the `executor` and wait for its result,
+        if the storage is not blocking the function is called directly
+
+        :param func: Storage function to run
+        :return: The result of the function
+        :raise QueryAborted: If a DB read of the function was stopped by its guard
+        """
+        if not self.storage.blocking:
+            return func(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        guard = current_query_guard() or QueryGuard()
+        try:
+            return await loop.run_in_executor(self.executor, partial(_run_guarded, guard, func, *args, **kwargs))
+        except asyncio.CancelledError:
+            guard.cancel()
+            raise
+
+    async def new_todo_list_entry(self, name: str) -> int:
+        """
+        Create a new todoList entry in the database
+
+        :param name: New list name
+
+        :return: New todoList ID
+
+        :raise IntegrityError: If List with `name` already exist in the DB
+        """
+        return await self._run_in_executor(self.storage.new_todo_list_entry, name=name)
+
+    async def new_todo_list_entries(self, names: List[str]) -> List[Optional[int]]:
+        """
+        Create many todoList entries in the database in a single transaction,
+        see `TodoListDBHandler.new_todo_list_entries`
+
+        :param names: New lists names
+
+        :return: New todoList ID for each name in `names`, None if the name was skipped because it already exist
+        """
+        return await self._run_in_executor(self.storage.new_todo_list_entries, names=names)
+
+    async def get_lists_paginated(self, page_number: int = 1, page_size: int = 10,
+                                  include_next: bool = False) -> List[TodoListRecord]:
+        """
+        Return TodoLists entries from the DB paginated, see `TodoListDBHandler.get_lists_paginated`
+
+        :param page_number: Page number to return. Default 1
+        :param page_size: Number of items per page. Default 10
+        :param include_next: Return also the first entry of the next page. Default False
+        :return: TodoLists entries in that page
+        """
+        return await self._run_in_executor(self.storage.get_lists_paginated,
+                                           page_number=page_number, page_size=page_size, include_next=include_next)
+
+    async def get_lists_after(self, last_id: int = 0, limit: int = 10) -> List[TodoListRecord]:
+        """
+        Return TodoLists entries from the DB with keyset pagination, see `TodoListDBHandler.get_lists_after`
+
+        :param last_id: Last `id` of the previous page, 0 for the first page. Default 0
+        :param limit: Max number of entries to return. Default 10
+        :return: TodoLists entries after `last_id` ordered by `id`
+        """
+        return await self._run_in_executor(self.storage.get_lists_after, last_id=last_id, limit=limit)
+
+    async def get_todo_list(self, list_id: int) -> TodoListRecord:
+        """
+        Fetch a TodoList from the DB
+
+        :param list_id: ID of list to fetch
+        :return: TodoList
+        :raise NoResultFound: If list with that ID does not exist
+        """
+        return await self._run_in_executor(self.storage.get_todo_list, list_id=list_id)
+
+    async def get_todo_lists(self, list_ids: List[int]) -> List[Optional[TodoListRecord]]:
+        """
+        Fetch many TodoLists from the DB, see `TodoListDBHandler.get_todo_lists`
+
+        :param list_ids: IDs of the lists to fetch
+        :return: TodoList for each ID in `list_ids`, None if the list with that ID does not exist
+        """
+        return await self._run_in_executor(self.storage.get_todo_lists, list_ids=list_ids)
+
+    async def delete_todo_list(self, list_id: int) -> None:
+        """
+        Delete a TodoList from the DB
+
+        :param list_id: ID of list to delete
+        :return:
+        :raise NoResultFound: If list with that ID does not exist
+        """
+        await self._run_in_executor(self.storage.delete_todo_list, list_id=list_id)
+
+    async def delete_todo_lists(self, list_ids: List[int]) -> List[int]:
+        """
+        Delete many TodoLists from the DB in a single transaction, see `TodoListDBHandler.delete_todo_lists`
+
+        :param list_ids: IDs of the lists to delete
+        :return: IDs of the deleted lists, in the order of `list_ids` without repeated IDs
+        """
+        return await self._run_in_executor(self.storage.delete_todo_lists, list_ids=list_ids)
+
+    async def get_lists_db_count(self) -> int:
+        """
+        :return: count of TodoLists in the DB
+        """
+        return await self._run_in_executor(self.storage.get_lists_db_count)
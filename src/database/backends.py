@@ -0,0 +1,35 @@
+"""
+This module selects the storage backend of the gRPC servers.
+
+Examples:
+        The backend is selected with the `STORAGE_BACKEND` environment variable, `sqlite` (default) or `memory`,
+        with `WRITE_COALESCING` the `sqlite` storage commits the concurrent writes together.
+
+            $ from database.backends import create_storage_backend
+            $ storage = create_storage_backend()
+            $ storage.setup()
+
+Attributes:
+    backends.create_storage_backend (function): Create the storage backend selected by its name
+"""
+from database.config import STORAGE_BACKEND, SQLITE_STORAGE_BACKEND, MEMORY_STORAGE_BACKEND, WRITE_COALESCING
+from database.memory_storage import MemoryStorage
+from database.storage import StorageBackend
+from database.todo_lists_db_handler import TodoListDBHandler, GroupCommitTodoListDBHandler
+
+
+def create_storage_backend(backend: str = STORAGE_BACKEND, write_coalescing: bool = WRITE_COALESCING) -> StorageBackend:
+    """
+    Create the storage backend, it is not set up until its `setup` method is called
+
+    :param backend: `SQLITE_STORAGE_BACKEND` or `MEMORY_STORAGE_BACKEND`. Default `STORAGE_BACKEND`
+    :param write_coalescing: If the SQLite storage commits the concurrent writes together. Default `WRITE_COALESCING`
+    :return: Storage backend
+    :raise ValueError: If the backend name is unknown
+    """
+    if backend == SQLITE_STORAGE_BACKEND:
+        return GroupCommitTodoListDBHandler() if write_coalescing else TodoListDBHandler()
+    if backend == MEMORY_STORAGE_BACKEND:
+        return MemoryStorage()
+    raise ValueError('Unknown storage backend "{}", expected "{}" or "{}"'.format(
+        backend, SQLITE_STORAGE_BACKEND, MEMORY_STORAGE_BACKEND))
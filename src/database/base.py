@@ -0,0 +1,13 @@
+"""
+This module contains the sqlalchemy DeclarativeMeta class to be used as base class when defining the DB tables
+as classes and be able to use the ORM.
+
+It has no dependencies on the tables nor on the Database handler, so the tables can extend it and
+`database.database` can import the tables without an import cycle.
+
+Attributes:
+    Base (sqlalchemy.ext.declarative.api.DeclarativeMeta): Base Class to declare DB tables and generate an ORM
+"""
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
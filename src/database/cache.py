@@ -0,0 +1,118 @@
+"""
+This module contains the in-process cache used in front of the DB reads.
+
+Classes:
+    LruTtlCache
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class LruTtlCache:  # pylint: disable=too-many-instance-attributes
+    """
+    Thread safe cache bounded to `max_size` entries, the least recently used entry is evicted when it is full,
+    and the entries expire `ttl` seconds after being stored.
+
+    `None` can be stored as a value, this way the cache can remember that a key does not exist in the DB.
+
+    To avoid storing a value read before an invalidation, the readers take a `token` before reading the DB
+    and pass it to `put`, if any key was invalidated in the meantime the value is not stored.
+
+    Attributes:
+        LruTtlCache.hits (int): Number of `get` calls that found the key
+        LruTtlCache.misses (int): Number of `get` calls that did not find the key, or found it expired
+    """
+
+    def __init__(self, max_size: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Constructor of the cache
+
+        :param max_size: Max number of entries, 0 disables the cache
+        :param ttl: Seconds that an entry is valid after being stored
+        :param clock: Function that returns the current time in seconds. Default time.monotonic
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._invalidations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get the value stored for `key`, and mark it as the most recently used entry
+
+        :param key: Key of the entry
+        :param default: Returned if the key is not in the cache or its entry expired. Default None
+        :return: Stored value or `default`
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def token(self) -> int:
+        """
+        :return: Token to pass to `put`, it changes every time that a key is invalidated
+        """
+        return self._invalidations
+
+    def put(self, key: Hashable, value: Any, token: int = None) -> None:
+        """
+        Store a value for `key`, evicting the least recently used entry if the cache is full
+
+        :param key: Key of the entry
+        :param value: Value to store
+        :param token: Value returned by `token` before reading `value`,
+         if a key was invalidated since then the value is not stored. Default None, always store it
+        :return:
+        """
+        if self.max_size < 1:
+            return
+        with self._lock:
+            if token is not None and token != self._invalidations:
+                return
+            self._entries[key] = (value, self._clock() + self.ttl)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """
+        Remove the entries of `keys` from the cache
+
+        :param keys: Keys of the entries to remove
+        :return:
+        """
+        with self._lock:
+            self._invalidations += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all the entries and reset the counters
+        :return:
+        """
+        with self._lock:
+            self._invalidations += 1
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: Number of `hits`, `misses` and stored entries `size`
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
@@ -4,6 +4,37 @@ Database Config variables.
 Attributes:
     SQL_LITE_DATABASE_PATH (str): Sql lite database path.
     TEST_SQL_LITE_DATABASE_PATH (str): Sql lite database path used for testing, assigned in the BaseTestClass setUp
+    SQLITE_JOURNAL_MODE (str): Journal mode, with `WAL` the readers are not blocked by the writer
+    SQLITE_SYNCHRONOUS (str): How often SQLite waits for the writes to reach the disk,
+     with `NORMAL` in `WAL` mode the DB can not be corrupted, but the last commits can be lost on a power failure
+    SQLITE_CACHE_SIZE (int): Page cache size of each connection, negative values are in KiB
+    SQLITE_MMAP_SIZE (int): Max bytes of the DB file read with memory mapped I/O, 0 disables it
+    SQLITE_BUSY_TIMEOUT (int): Milliseconds that a connection waits for a lock before failing
+    SQLITE_TEMP_STORE (str): Where the temporary tables and indices are stored, `DEFAULT`, `FILE` or `MEMORY`
+    SQLITE_PRAGMAS (List[Tuple[str, str]]): Pragmas applied to each new DB connection,
+     the pragmas configured with an empty value are not applied
+    DB_POOL_SIZE (int): Number of DB connections kept open, by default one per server thread.
+     0 opens a new connection for each session
+    DB_POOL_MAX_OVERFLOW (int): Number of DB connections that can be opened when all the pool connections are in use
+    SQLITE_STORAGE_BACKEND (str): Name of the storage backend that keeps the TodoLists in the SQLite DB
+    MEMORY_STORAGE_BACKEND (str): Name of the storage backend that keeps the TodoLists in the process memory
+    STORAGE_BACKEND (str): Storage backend used by the gRPC servers, `SQLITE_STORAGE_BACKEND` or
+     `MEMORY_STORAGE_BACKEND`
+    MEMORY_STORAGE_LOCK_STRIPES (int): Number of locks of the memory storage, the writes of different lists
+     take different locks
+    WRITE_COALESCING (bool): If the SQLite storage commits the concurrent Create and Delete writes together,
+     in batches executed by a writer thread
+    WRITE_BATCH_WINDOW (float): Seconds that the writer thread waits for more writes after the first write of a batch
+    WRITE_BATCH_MAX_SIZE (int): Max number of writes committed together
+    SET_NAME_INDEX (str): Name of the exact index of the TodoLists names, a hash set
+    BLOOM_NAME_INDEX (str): Name of the index of the TodoLists names that uses a Bloom filter
+    NAME_INDEX (str): In-memory index of the TodoLists names of the SQLite storage, used to reject the repeated
+     names without a DB write, `SET_NAME_INDEX`, `BLOOM_NAME_INDEX`, or empty to not use an index
+    NAME_INDEX_BLOOM_CAPACITY (int): Number of names expected by the Bloom filter index,
+     it is bigger if there are more lists in the DB when it is loaded
+    NAME_INDEX_BLOOM_ERROR_RATE (float): Probability that the Bloom filter index finds a name that does not exist
+    DB_QUERY_CHECK_INTERVAL (int): Number of SQLite virtual machine instructions between the checks of the deadline
+     and the cancellation of the RPC of a running read, see `database.query_guard`. 0 only checks before the reads
 """
 import os
 import config.config as config
@@ -18,3 +49,41 @@ TEST_SQL_LITE_DATABASE_PATH = 'sqlite:///{}'.format(os.path.abspath(os.path.join
 
 SQL_LITE_DATABASE_PATH = TEST_SQL_LITE_DATABASE_PATH if config.ENVIRONMENT == config.TESTING_ENVIRONMENT\
     else SQL_LITE_DATABASE_PATH
+
+SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+SQLITE_CACHE_SIZE = os.environ.get('SQLITE_CACHE_SIZE', '-65536')
+SQLITE_MMAP_SIZE = os.environ.get('SQLITE_MMAP_SIZE', '268435456')
+SQLITE_BUSY_TIMEOUT = os.environ.get('SQLITE_BUSY_TIMEOUT', '5000')
+SQLITE_TEMP_STORE = os.environ.get('SQLITE_TEMP_STORE', 'MEMORY')
+
+SQLITE_PRAGMAS = [
+    (_pragma, _value) for _pragma, _value in (
+        ('journal_mode', SQLITE_JOURNAL_MODE),
+        ('synchronous', SQLITE_SYNCHRONOUS),
+        ('cache_size', SQLITE_CACHE_SIZE),
+        ('mmap_size', SQLITE_MMAP_SIZE),
+        ('busy_timeout', SQLITE_BUSY_TIMEOUT),
+        ('temp_store', SQLITE_TEMP_STORE),
+    ) if _value
+]
+
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', max(config.GRPC_SERVER_MAX_WORKERS, config.ASYNC_DB_MAX_WORKERS)))
+DB_POOL_MAX_OVERFLOW = int(os.environ.get('DB_POOL_MAX_OVERFLOW', 10))
+
+SQLITE_STORAGE_BACKEND = 'sqlite'
+MEMORY_STORAGE_BACKEND = 'memory'
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', SQLITE_STORAGE_BACKEND)
+MEMORY_STORAGE_LOCK_STRIPES = int(os.environ.get('MEMORY_STORAGE_LOCK_STRIPES', 16))
+
+WRITE_COALESCING = os.environ.get('WRITE_COALESCING', '').lower() in ('1', 'true', 'yes')
+WRITE_BATCH_WINDOW = float(os.environ.get('WRITE_BATCH_WINDOW', 0.002))
+WRITE_BATCH_MAX_SIZE = int(os.environ.get('WRITE_BATCH_MAX_SIZE', 128))
+
+SET_NAME_INDEX = 'set'
+BLOOM_NAME_INDEX = 'bloom'
+NAME_INDEX = os.environ.get('NAME_INDEX', SET_NAME_INDEX)
+NAME_INDEX_BLOOM_CAPACITY = int(os.environ.get('NAME_INDEX_BLOOM_CAPACITY', 1000000))
+NAME_INDEX_BLOOM_ERROR_RATE = float(os.environ.get('NAME_INDEX_BLOOM_ERROR_RATE', 0.01))
+
+DB_QUERY_CHECK_INTERVAL = int(os.environ.get('DB_QUERY_CHECK_INTERVAL', 1000))
@@ -1,24 +1,67 @@
 """
-This module contains the Database handler and the sqlalchemy DeclarativeMeta class to be used
-as base class when defining the DB tables as classes and be able to use the ORM.
+This module contains the Database handler of the DB tables declared with `database.base.Base`.
 
 Attributes:
-    Base (sqlalchemy.ext.declarative.api.DeclarativeMeta): Base Class to declare DB tables and generate an ORM
+    Base (sqlalchemy.ext.declarative.api.DeclarativeMeta): Base Class to declare DB tables, see `database.base`
+    logger (logging.Logger): Logger of the module
+    database.create_db_engine (function): Create the DB engine with the configured pragmas and connections pool
 
 Classes:
     Database
 """
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
+import logging
+import re
+from sqlalchemy import create_engine, event, func, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlalchemy.exc import OperationalError
+from database.base import Base
+from database.tables.todo_lists import TodoList
+from database.tables.todo_lists_count import TodoListsCount, TODO_LISTS_COUNT_TRIGGERS
 import database.config as config
 
 
-Base = declarative_base()
+logger = logging.getLogger(__name__)
 
-# Import not at the top of the file because the file needs the Base attribute declared before
-from database.tables.todo_lists import TodoList  # pylint: disable=wrong-import-position
+_PRAGMA_VALUE_PATTERN = re.compile(r'^-?\w+$')
+
+
+def create_db_engine(database_path: str = config.SQL_LITE_DATABASE_PATH) -> Engine:
+    """
+    Create the DB engine, the `SQLITE_PRAGMAS` are applied to each new connection.
+
+    If `DB_POOL_SIZE` is bigger than 0 the connections are kept open in a pool, shared by the server threads,
+    so the pragmas are only applied once per connection.
+
+    :param database_path: SQLite database URL. Default `SQL_LITE_DATABASE_PATH`
+    :return: sqlalchemy Engine
+    :raise ValueError: If a pragma value is not a word or a number
+    """
+    pragma_statements = []
+    for pragma, value in config.SQLITE_PRAGMAS:
+        if not _PRAGMA_VALUE_PATTERN.match(value):
+            raise ValueError('Invalid value "{}" for SQLite pragma "{}"'.format(value, pragma))
+        pragma_statements.append('PRAGMA {}={}'.format(pragma, value))
+
+    if config.DB_POOL_SIZE > 0:
+        # The pooled connections are used by different threads, one at a time
+        engine = create_engine(database_path, poolclass=QueuePool, pool_size=config.DB_POOL_SIZE,
+                               max_overflow=config.DB_POOL_MAX_OVERFLOW,
+                               connect_args={'check_same_thread': False})
+    else:
+        engine = create_engine(database_path, poolclass=NullPool)
+
+    def _apply_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma_statement in pragma_statements:
+                cursor.execute(pragma_statement)
+        finally:
+            cursor.close()
+
+    event.listen(engine, 'connect', _apply_pragmas)
+    return engine
 
 
 class Database:
@@ -30,7 +73,7 @@ class Database:
             Database.session_maker (sqlalchemy.orm.scoping.scoped_session): Scoped session manager
     """
 
-    db_engine = create_engine(config.SQL_LITE_DATABASE_PATH)
+    db_engine = create_db_engine()
     session_maker = scoped_session(sessionmaker(bind=db_engine, autocommit=False))
 
     @classmethod
@@ -38,15 +81,33 @@ class Database:
         """
         Create all DB tables added to the declarative_base Base
         """
-        print("Creating DB tables")
+        logger.info('Creating DB tables')
         Base.metadata.create_all(cls.db_engine)
+        cls._init_todo_lists_count()
+
+    @classmethod
+    def _init_todo_lists_count(cls):
+        """
+        Create the triggers that maintain the TodoListsCount table,
+        if the count entry does not exist yet it is created counting the TodoLists already in the DB
+        """
+        try:
+            session = cls.session_maker()
+            for trigger in TODO_LISTS_COUNT_TRIGGERS:
+                session.execute(text(trigger))
+            if not session.query(TodoListsCount).first():
+                session.add(TodoListsCount(count=session.query(func.count(TodoList.id)).scalar()))
+            session.commit()
+        finally:
+            cls.session_maker.remove()
 
     @classmethod
     def drop_all(cls):
         """
         Drop all tables, used for testing
         """
-        try:
-            TodoList.__table__.drop(cls.db_engine)  # pylint: disable=no-member
-        except OperationalError:
-            print('Looks like DB table do not exits')
+        for table in (TodoList.__table__, TodoListsCount.__table__):  # pylint: disable=no-member
+            try:
+                table.drop(cls.db_engine)
+            except OperationalError:
+                logger.warning('Looks like DB table %s do not exits', table.name)
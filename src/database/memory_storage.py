@@ -0,0 +1,255 @@
+"""
+This module contains the storage backend that keeps the TodoLists in the process memory.
+
+It does not do any I/O, so it can be used by stateless cache-tier deployments, and as a baseline to measure
+how much of the latency of each RPC is spent in the SQLite storage. The lists are lost when the process exits,
+and each process has its own lists, so it should not be used with the pre-fork mode.
+
+The lists are kept in lock stripes, each stripe has a lock, the lists of some IDs, by `id % stripes`,
+and the IDs of some names, by the hash of the name. Writes of different lists usually take different locks,
+and the single entry reads do not take any lock, dict reads are atomic. A sorted index of the IDs, with its own lock,
+serves the pagination.
+
+Classes:
+    MemoryStorage(StorageBackend)
+"""
+import bisect
+import itertools
+import threading
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm.exc import NoResultFound
+
+from config.config import MAX_PAGE_SIZE
+from config.logs import get_request_logger
+from database.config import MEMORY_STORAGE_BACKEND, MEMORY_STORAGE_LOCK_STRIPES
+from database.storage import StorageBackend, TodoListRecord, duplicate_name_error
+from metrics.db_metrics import timed_db_operation
+
+request_logger = get_request_logger(__name__)
+
+
+class _Stripe:  # pylint: disable=too-few-public-methods
+    """
+    Lock and the entries that it protects
+    """
+
+    def __init__(self):
+        """
+        Constructor of an empty stripe
+        """
+        self.lock = threading.Lock()
+        self.lists: Dict[int, TodoListRecord] = {}
+        self.ids_by_name: Dict[str, int] = {}
+
+
+class MemoryStorage(StorageBackend):
+    """
+    Lock striped in-memory storage of the TodoLists, with a hash index of the names and a sorted index of the IDs
+    """
+
+    blocking = False
+
+    def __init__(self, lock_stripes: int = MEMORY_STORAGE_LOCK_STRIPES):
+        """
+        Constructor of an empty storage
+
+        :param lock_stripes: Number of locks. Default `MEMORY_STORAGE_LOCK_STRIPES`
+        """
+        self._stripes = [_Stripe() for _ in range(max(1, lock_stripes))]
+        # next() of itertools.count is atomic
+        self._ids = itertools.count(1)
+        self._sorted_ids: List[int] = []
+        self._index_lock = threading.Lock()
+
+    def _id_stripe(self, list_id: int) -> _Stripe:
+        """
+        :param list_id: TodoList ID
+        :return: Stripe of the list
+        """
+        return self._stripes[list_id % len(self._stripes)]
+
+    def _name_stripe(self, name: str) -> _Stripe:
+        """
+        :param name: TodoList name
+        :return: Stripe of the name index entry
+        """
+        return self._stripes[hash(name) % len(self._stripes)]
+
+    def setup(self) -> None:
+        """
+        Nothing to prepare, the storage is ready when it is created
+        :return:
+        """
+
+    def _insert(self, name: str) -> Optional[int]:
+        """
+        Reserve the name, and insert a new list with it
+
+        :param name: New list name
+        :return: New list ID, None if the name already exist
+        """
+        name_stripe = self._name_stripe(name)
+        with name_stripe.lock:
+            if name in name_stripe.ids_by_name:
+                return None
+            new_id = next(self._ids)
+            name_stripe.ids_by_name[name] = new_id
+        id_stripe = self._id_stripe(new_id)
+        with id_stripe.lock:
+            id_stripe.lists[new_id] = TodoListRecord(id=new_id, name=name)
+        with self._index_lock:
+            # The IDs are increasing, so it is usually an append
+            bisect.insort(self._sorted_ids, new_id)
+        return new_id
+
+    def _delete(self, list_id: int) -> bool:
+        """
+        Delete a list and its index entries
+
+        :param list_id: ID of the list to delete
+        :return: True if the list existed
+        """
+        id_stripe = self._id_stripe(list_id)
+        with id_stripe.lock:
+            todo_list = id_stripe.lists.pop(list_id, None)
+        if todo_list is None:
+            return False
+        with self._index_lock:
+            index = bisect.bisect_left(self._sorted_ids, list_id)
+            if index < len(self._sorted_ids) and self._sorted_ids[index] == list_id:
+                del self._sorted_ids[index]
+        name_stripe = self._name_stripe(todo_list.name)
+        with name_stripe.lock:
+            name_stripe.ids_by_name.pop(todo_list.name, None)
+        return True
+
+    def _get(self, list_id: int) -> Optional[TodoListRecord]:
+        """
+        :param list_id: TodoList ID
+        :return: TodoList, None if it does not exist
+        """
+        return self._id_stripe(list_id).lists.get(list_id)
+
+    @timed_db_operation('new_todo_list_entry', backend=MEMORY_STORAGE_BACKEND)
+    def new_todo_list_entry(self, name: str) -> int:
+        """
+        Create a new todoList entry
+
+        :param name: New list name
+        :return: New todoList ID
+        :raise IntegrityError: If List with `name` already exist
+        """
+        new_id = self._insert(name)
+        if new_id is None:
+            request_logger.debug('TodoList name must be unique. List with name "%s" already exist', name)
+            raise duplicate_name_error(name)
+        return new_id
+
+    @timed_db_operation('new_todo_list_entries', backend=MEMORY_STORAGE_BACKEND)
+    def new_todo_list_entries(self, names: List[str]) -> List[Optional[int]]:
+        """
+        Create many todoList entries, the names that already exist, or are repeated in `names`, are skipped.
+        Unlike the SQLite storage the batch is not atomic, other threads can read the first lists of the batch
+        before the last ones are created.
+
+        :param names: New lists names
+        :return: New todoList ID for each name in `names`, None if the name was skipped because it already exist
+        """
+        return [self._insert(_name) for _name in names]
+
+    @timed_db_operation('get_lists_paginated', backend=MEMORY_STORAGE_BACKEND)
+    def get_lists_paginated(self, page_number: int = 1, page_size: int = 10,
+                            include_next: bool = False) -> List[TodoListRecord]:
+        """
+        Return TodoLists entries ordered by `id` and paginated, see `TodoListDBHandler.get_lists_paginated`
+
+        :param page_number: Page number to return. Default 1
+        :param page_size: Number of items per page. Default 10
+        :param include_next: Return also the first entry of the next page. Default False
+        :return: TodoLists entries in that page
+        """
+        page_number = page_number if page_number > 0 else 1
+        page_size = page_size if page_size < MAX_PAGE_SIZE else MAX_PAGE_SIZE
+        last_entry = page_number * page_size
+        with self._index_lock:
+            page_ids = self._sorted_ids[last_entry - page_size:last_entry + 1 if include_next else last_entry]
+        # A list can be deleted after reading the index
+        return [_list for _list in map(self._get, page_ids) if _list is not None]
+
+    @timed_db_operation('get_lists_after', backend=MEMORY_STORAGE_BACKEND)
+    def get_lists_after(self, last_id: int = 0, limit: int = 10) -> List[TodoListRecord]:
+        """
+        Return TodoLists entries with keyset pagination, the sorted index is searched with bisect
+
+        :param last_id: Last `id` of the previous page, 0 for the first page. Default 0
+        :param limit: Max number of entries to return. Default 10
+        :return: TodoLists entries after `last_id` ordered by `id`
+        """
+        todo_lists = []
+        while len(todo_lists) < limit:
+            with self._index_lock:
+                start = bisect.bisect_right(self._sorted_ids, last_id)
+                page_ids = self._sorted_ids[start:start + limit - len(todo_lists)]
+            if not page_ids:
+                break
+            # A list can be deleted after reading the index, the next IDs are read to fill the page
+            todo_lists.extend(_list for _list in map(self._get, page_ids) if _list is not None)
+            last_id = page_ids[-1]
+        return todo_lists
+
+    @timed_db_operation('get_todo_list', backend=MEMORY_STORAGE_BACKEND)
+    def get_todo_list(self, list_id: int) -> TodoListRecord:
+        """
+        Fetch a TodoList
+
+        :param list_id: ID of list to fetch
+        :return: TodoList
+        :raise NoResultFound: If list with that ID does not exist
+        """
+        todo_list = self._get(list_id)
+        if todo_list is None:
+            request_logger.debug('TodoList with id "%s" does not exist', list_id)
+            raise NoResultFound()
+        return todo_list
+
+    @timed_db_operation('get_todo_lists', backend=MEMORY_STORAGE_BACKEND)
+    def get_todo_lists(self, list_ids: List[int]) -> List[Optional[TodoListRecord]]:
+        """
+        Fetch many TodoLists
+
+        :param list_ids: IDs of the lists to fetch
+        :return: TodoList for each ID in `list_ids`, None if the list with that ID does not exist
+        """
+        return [self._get(_id) for _id in list_ids]
+
+    @timed_db_operation('delete_todo_list', backend=MEMORY_STORAGE_BACKEND)
+    def delete_todo_list(self, list_id: int) -> None:
+        """
+        Delete a TodoList
+
+        :param list_id: ID of list to delete
+        :return:
+        :raise NoResultFound: If list with that ID does not exist
+        """
+        if not self._delete(list_id):
+            request_logger.debug('TodoList with id "%s" does not exist', list_id)
+            raise NoResultFound()
+
+    @timed_db_operation('delete_todo_lists', backend=MEMORY_STORAGE_BACKEND)
+    def delete_todo_lists(self, list_ids: List[int]) -> List[int]:
+        """
+        Delete many TodoLists, the IDs that do not exist are skipped
+
+        :param list_ids: IDs of the lists to delete
+        :return: IDs of the deleted lists, in the order of `list_ids` without repeated IDs
+        """
+        # dict keeps the insertion order, and removes the repeated IDs
+        return [_id for _id in dict.fromkeys(list_ids) if self._delete(_id)]
+
+    @timed_db_operation('get_lists_db_count', backend=MEMORY_STORAGE_BACKEND)
+    def get_lists_db_count(self) -> int:
+        """
+        :return: count of TodoLists
+        """
+        return len(self._sorted_ids)
@@ -0,0 +1,171 @@
+"""
+This module contains the in-memory indexes of the TodoLists names, used to reject the repeated names
+before starting a DB write.
+
+The indexes answer if a name may exist. A name that is not in the index goes to the DB insert, where the unique
+constraint is still checked, and a name that is in the index is confirmed with a read of the DB, so a stale
+index, e.g. of another process of the pre-fork mode, never rejects a new name.
+
+Classes:
+    NameSetIndex: Exact index, a hash set of the names
+    BloomNameIndex: Bloom filter of the names, it uses a fixed memory for huge tables
+
+Attributes:
+    name_index.create_name_index (function): Create the index selected by its name
+"""
+import hashlib
+import math
+import threading
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from database.config import (
+    NAME_INDEX, SET_NAME_INDEX, BLOOM_NAME_INDEX, NAME_INDEX_BLOOM_CAPACITY, NAME_INDEX_BLOOM_ERROR_RATE
+)
+
+
+class NameSetIndex:
+    """
+    Hash set of the TodoLists names, the names are removed when their list is deleted
+    """
+
+    def __init__(self):
+        """
+        Constructor of an empty index
+        """
+        self._names = set()
+        self._load_lock = threading.Lock()
+
+    def load(self, names: Iterable[str], _count: int = 0) -> None:
+        """
+        Replace the indexed names
+
+        :param names: Names of all the existing TodoLists
+        :param _count: Number of names, not needed by the set
+        :return:
+        """
+        with self._load_lock:
+            self._names = set(names)
+
+    def add(self, name: str) -> None:
+        """
+        :param name: Name of a new TodoList
+        :return:
+        """
+        self._names.add(name)
+
+    def discard(self, name: str) -> None:
+        """
+        :param name: Name of a deleted TodoList
+        :return:
+        """
+        self._names.discard(name)
+
+    def __contains__(self, name: str) -> bool:
+        """
+        :param name: TodoList name
+        :return: If a TodoList with that name may exist
+        """
+        return name in self._names
+
+
+class BloomNameIndex:
+    """
+    Bloom filter of the TodoLists names, a name that was added is always found, and a name that was not added
+    is found with a probability of `error_rate`, while the number of names is under the capacity.
+
+    The names can not be removed, the deleted names are found until the filter is loaded again.
+    Concurrent adds can lose a bit, that only makes the DB insert find the repeated name.
+    """
+
+    def __init__(self, capacity: int = NAME_INDEX_BLOOM_CAPACITY, error_rate: float = NAME_INDEX_BLOOM_ERROR_RATE):
+        """
+        Constructor of an empty filter
+
+        :param capacity: Number of names expected. Default `NAME_INDEX_BLOOM_CAPACITY`
+        :param error_rate: Probability of finding a name that was not added. Default `NAME_INDEX_BLOOM_ERROR_RATE`
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # Number of bits, number of hashes, and bits, replaced together when the filter is loaded
+        self._filter = self._new_filter(capacity, error_rate)
+        self._load_lock = threading.Lock()
+
+    @staticmethod
+    def _new_filter(capacity: int, error_rate: float) -> Tuple[int, int, bytearray]:
+        """
+        :param capacity: Number of names expected
+        :param error_rate: Probability of finding a name that was not added
+        :return: Number of bits, number of hash functions, and empty bits of the optimal filter
+        """
+        bits_count = max(8, int(math.ceil(-max(1, capacity) * math.log(error_rate) / math.log(2) ** 2)))
+        hashes_count = max(1, int(round(bits_count / max(1, capacity) * math.log(2))))
+        return bits_count, hashes_count, bytearray((bits_count + 7) // 8)
+
+    @staticmethod
+    def _positions(name: str, bits_count: int, hashes_count: int) -> Iterator[int]:
+        """
+        :param name: TodoList name
+        :param bits_count: Number of bits of the filter
+        :param hashes_count: Number of hash functions of the filter
+        :return: Bits of the name, from two 64 bits hashes combined as `h1 + i * h2`
+        """
+        digest = hashlib.blake2b(name.encode(), digest_size=16).digest()
+        first_hash = int.from_bytes(digest[:8], 'little')
+        second_hash = int.from_bytes(digest[8:], 'little') | 1
+        return ((first_hash + i * second_hash) % bits_count for i in range(hashes_count))
+
+    def load(self, names: Iterable[str], count: int = 0) -> None:
+        """
+        Replace the filter, it is resized if `count` is bigger than its capacity
+
+        :param names: Names of all the existing TodoLists
+        :param count: Number of names, to size the filter. Default 0
+        :return:
+        """
+        with self._load_lock:
+            self._filter = self._new_filter(max(self.capacity, 2 * count), self.error_rate)
+            for name in names:
+                self.add(name)
+
+    def add(self, name: str) -> None:
+        """
+        :param name: Name of a new TodoList
+        :return:
+        """
+        bits_count, hashes_count, bits = self._filter
+        for position in self._positions(name, bits_count, hashes_count):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def discard(self, name: str) -> None:
+        """
+        The names can not be removed from a Bloom filter
+
+        :param name: Name of a deleted TodoList
+        :return:
+        """
+
+    def __contains__(self, name: str) -> bool:
+        """
+        :param name: TodoList name
+        :return: If a TodoList with that name may exist
+        """
+        bits_count, hashes_count, bits = self._filter
+        return all(bits[_position >> 3] & (1 << (_position & 7))
+                   for _position in self._positions(name, bits_count, hashes_count))
+
+
+def create_name_index(kind: str = NAME_INDEX) -> Optional[Union[NameSetIndex, BloomNameIndex]]:
+    """
+    Create the names index
+
+    :param kind: `SET_NAME_INDEX`, `BLOOM_NAME_INDEX`, or empty to not use an index. Default `NAME_INDEX`
+    :return: Names index, None if `kind` is empty
+    :raise ValueError: If the index name is unknown
+    """
+    if not kind:
+        return None
+    if kind == SET_NAME_INDEX:
+        return NameSetIndex()
+    if kind == BLOOM_NAME_INDEX:
+        return BloomNameIndex()
+    raise ValueError('Unknown name index "{}", expected "{}" or "{}"'.format(kind, SET_NAME_INDEX, BLOOM_NAME_INDEX))
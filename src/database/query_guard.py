@@ -0,0 +1,129 @@
+"""
+This module contains the guard that stops the DB reads of the RPCs that were cancelled or whose deadline expired.
+
+The servicers set the guard of the RPC with `guarded_queries`, the SQLite storage checks it before each read,
+and while the read runs, with the SQLite progress handler, so a long read is interrupted as soon as nobody is
+waiting for its result, and the connection is free for the next RPC.
+
+The guard is kept in a context variable, it is seen by the storage calls made in the same thread, and by the
+calls run in other threads with the copied context, e.g. `AsyncTodoListDBHandler`.
+
+Examples:
+        Guard the reads of a gRPC method.
+
+            $ with guarded_queries(QueryGuard.for_rpc(context)):
+            $     todo_lists = storage.get_lists_after(last_id=last_id, limit=limit)
+
+Classes:
+    QueryAborted(Exception): Raised when a DB read is stopped by its guard
+    QueryGuard: Deadline and cancellation of the RPC that runs the DB reads
+
+Attributes:
+    DEADLINE_EXCEEDED_REASON (str): Reason of the reads stopped because the deadline of the RPC expired
+    CANCELLED_REASON (str): Reason of the reads stopped because the RPC was cancelled
+    query_guard.guarded_queries (function): Context manager that sets the guard of the DB reads
+    query_guard.current_query_guard (function): Get the guard of the DB reads
+"""
+import contextlib
+import math
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional
+
+DEADLINE_EXCEEDED_REASON = 'deadline_exceeded'
+CANCELLED_REASON = 'cancelled'
+
+_QUERY_GUARD = ContextVar('query_guard', default=None)
+
+
+class QueryAborted(Exception):
+    """
+    Raised when a DB read is stopped, before or while it runs, because its RPC was cancelled or its deadline expired
+    """
+
+    def __init__(self, reason: str):
+        """
+        :param reason: `DEADLINE_EXCEEDED_REASON` or `CANCELLED_REASON`
+        """
+        super().__init__(reason)
+        self.reason = reason
+
+
+class QueryGuard:
+    """
+    Deadline and cancellation of the RPC that runs the DB reads
+
+    Attributes:
+        QueryGuard.deadline (float): `time.monotonic` time when the deadline expires, `math.inf` without deadline
+        QueryGuard.is_active (Callable[[], bool]): Returns False when the RPC is not active anymore, can be None
+        QueryGuard.cancelled (bool): If the reads were cancelled with `cancel`
+    """
+
+    def __init__(self, time_remaining: float = math.inf, is_active: Callable[[], bool] = None):
+        """
+        :param time_remaining: Seconds until the deadline of the RPC. Default without deadline
+        :param is_active: Returns False when the RPC was cancelled, e.g. `grpc.ServicerContext.is_active`
+        """
+        self.deadline = time.monotonic() + time_remaining
+        self.is_active = is_active
+        self.cancelled = False
+
+    @classmethod
+    def for_rpc(cls, context: Any) -> 'QueryGuard':
+        """
+        Create the guard of a gRPC method. The asyncio ServicerContext does not have `time_remaining` and
+        `is_active`, its reads are only stopped with `cancel`
+
+        :param context: ServicerContext of the RPC
+        :return: Guard with the deadline and the cancellation of the RPC
+        """
+        time_remaining = getattr(context, 'time_remaining', None)
+        return cls(time_remaining() if time_remaining is not None else math.inf, getattr(context, 'is_active', None))
+
+    def cancel(self) -> None:
+        """
+        Stop the reads of the guard, e.g. when the coroutine that waits for them is cancelled
+        :return:
+        """
+        self.cancelled = True
+
+    def abort_reason(self) -> Optional[str]:
+        """
+        :return: `CANCELLED_REASON` or `DEADLINE_EXCEEDED_REASON` if the reads must be stopped, None otherwise
+        """
+        if self.cancelled or (self.is_active is not None and not self.is_active()):
+            return CANCELLED_REASON
+        if time.monotonic() >= self.deadline:
+            return DEADLINE_EXCEEDED_REASON
+        return None
+
+    def check(self) -> None:
+        """
+        :return:
+        :raise QueryAborted: If the reads must be stopped
+        """
+        reason = self.abort_reason()
+        if reason is not None:
+            raise QueryAborted(reason)
+
+
+@contextlib.contextmanager
+def guarded_queries(guard: QueryGuard) -> Iterator[QueryGuard]:
+    """
+    Set the guard of the DB reads run inside the `with` block
+
+    :param guard: Guard of the reads
+    :return: The guard
+    """
+    token = _QUERY_GUARD.set(guard)
+    try:
+        yield guard
+    finally:
+        _QUERY_GUARD.reset(token)
+
+
+def current_query_guard() -> Optional[QueryGuard]:
+    """
+    :return: Guard of the DB reads, None if the reads are not guarded
+    """
+    return _QUERY_GUARD.get()
@@ -0,0 +1,159 @@
+"""
+This module contains the interface of the storage backends of the TodoLists.
+
+The gRPC servicers only use the storage through this interface, so the SQLite DB can be replaced by another storage,
+see `database.backends.create_storage_backend`.
+
+All the backends raise the same exceptions, `IntegrityError` when a list name already exists, and `NoResultFound`
+when a list ID does not exist, and return the lists as `TodoListRecord` tuples, that the servers convert
+straight into protobuf messages.
+
+Classes:
+    TodoListRecord(NamedTuple): TodoList entry returned by the storages
+    StorageBackend(abc.ABC): Interface of the TodoLists storages
+
+Attributes:
+    storage.duplicate_name_error (function): Create the exception raised when a list name already exists
+"""
+import abc
+from typing import Iterator, List, NamedTuple, Optional
+
+from sqlalchemy.exc import IntegrityError
+
+
+class TodoListRecord(NamedTuple):
+    """
+    Immutable TodoList entry, with the `id` and `name` columns of the `TodoList` table
+    """
+    id: int
+    name: str
+
+
+def duplicate_name_error(name: str) -> IntegrityError:
+    """
+    Create the exception raised when a list name already exists, without inserting the list in the DB
+
+    :param name: Repeated list name
+    :return: IntegrityError like the one raised by the unique constraint of the DB
+    """
+    return IntegrityError('INSERT INTO "todo-lists"', {'name': name},
+                          ValueError('UNIQUE constraint failed: todo-lists.name'))
+
+
+class StorageBackend(abc.ABC):
+    """
+    Interface of the TodoLists storages
+
+    Attributes:
+        StorageBackend.blocking (bool): If the methods wait for I/O, the asyncio server runs them in a thread pool
+    """
+
+    blocking = True
+
+    @abc.abstractmethod
+    def setup(self) -> None:
+        """
+        Prepare the storage to be used, e.g. create the DB tables if they do not exist
+        :return:
+        """
+
+    @abc.abstractmethod
+    def new_todo_list_entry(self, name: str) -> int:
+        """
+        Create a new todoList entry
+
+        :param name: New list name
+        :return: New todoList ID
+        :raise IntegrityError: If List with `name` already exist
+        """
+
+    @abc.abstractmethod
+    def new_todo_list_entries(self, names: List[str]) -> List[Optional[int]]:
+        """
+        Create many todoList entries, the names that already exist, or are repeated in `names`, are skipped
+
+        :param names: New lists names
+        :return: New todoList ID for each name in `names`, None if the name was skipped because it already exist
+        """
+
+    @abc.abstractmethod
+    def get_lists_paginated(self, page_number: int = 1, page_size: int = 10,
+                            include_next: bool = False) -> List[TodoListRecord]:
+        """
+        Return TodoLists entries ordered by `id` and paginated, see `TodoListDBHandler.get_lists_paginated`
+
+        :param page_number: Page number to return. Default 1
+        :param page_size: Number of items per page. Default 10
+        :param include_next: Return also the first entry of the next page. Default False
+        :return: TodoLists entries in that page
+        """
+
+    @abc.abstractmethod
+    def get_lists_after(self, last_id: int = 0, limit: int = 10) -> List[TodoListRecord]:
+        """
+        Return TodoLists entries with keyset pagination
+
+        :param last_id: Last `id` of the previous page, 0 for the first page. Default 0
+        :param limit: Max number of entries to return. Default 10
+        :return: TodoLists entries after `last_id` ordered by `id`
+        """
+
+    def iter_lists(self, after_id: int = 0, chunk_size: int = 1000) -> Iterator[TodoListRecord]:
+        """
+        Iterate over all the TodoLists entries ordered by `id`, reading them in chunks with `get_lists_after`
+
+        :param after_id: Only entries with an `id` bigger than `after_id` are returned. Default 0
+        :param chunk_size: Number of entries read at once. Default 1000
+        :return: Iterator of TodoLists entries
+        """
+        last_id = after_id
+        while True:
+            chunk = self.get_lists_after(last_id=last_id, limit=chunk_size)
+            yield from chunk
+            if len(chunk) < chunk_size:
+                return
+            last_id = chunk[-1].id
+
+    @abc.abstractmethod
+    def get_todo_list(self, list_id: int) -> TodoListRecord:
+        """
+        Fetch a TodoList
+
+        :param list_id: ID of list to fetch
+        :return: TodoList
+        :raise NoResultFound: If list with that ID does not exist
+        """
+
+    @abc.abstractmethod
+    def get_todo_lists(self, list_ids: List[int]) -> List[Optional[TodoListRecord]]:
+        """
+        Fetch many TodoLists
+
+        :param list_ids: IDs of the lists to fetch
+        :return: TodoList for each ID in `list_ids`, None if the list with that ID does not exist
+        """
+
+    @abc.abstractmethod
+    def delete_todo_list(self, list_id: int) -> None:
+        """
+        Delete a TodoList
+
+        :param list_id: ID of list to delete
+        :return:
+        :raise NoResultFound: If list with that ID does not exist
+        """
+
+    @abc.abstractmethod
+    def delete_todo_lists(self, list_ids: List[int]) -> List[int]:
+        """
+        Delete many TodoLists, the IDs that do not exist are skipped
+
+        :param list_ids: IDs of the lists to delete
+        :return: IDs of the deleted lists, in the order of `list_ids` without repeated IDs
+        """
+
+    @abc.abstractmethod
+    def get_lists_db_count(self) -> int:
+        """
+        :return: count of TodoLists
+        """
@@ -1,15 +1,15 @@
 """
-TodoList DB Table definition, extending src.database.database.Base, this way
+TodoList DB Table definition, extending src.database.base.Base, this way
 it will be automatically created when src.database.database.Database.create_db_tables is executed.
 
 Classes:
-    TodoList(db.Base)
+    TodoList(Base)
 """
 from sqlalchemy import Column, Integer, String
-import database.database as db
+from database.base import Base
 
 
-class TodoList(db.Base):  # pylint: disable=too-few-public-methods
+class TodoList(Base):  # pylint: disable=too-few-public-methods
     """
     TodoList DB Table definition
 
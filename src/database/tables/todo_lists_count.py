@@ -0,0 +1,55 @@
+"""
+TodoListsCount DB Table definition, extending src.database.base.Base, this way
+it will be automatically created when src.database.database.Database.create_db_tables is executed.
+
+The table has a single row with the number of entries in the TodoList table, kept up to date by DB triggers
+in the same transaction that inserts or deletes the TodoLists, so the count is read without a full table scan.
+
+Classes:
+    TodoListsCount(Base)
+
+Attributes:
+    TODO_LISTS_COUNT_ROW_ID (int): ID of the row that holds the count
+    TODO_LISTS_COUNT_TRIGGERS (List[str]): DDL statements to create the triggers that maintain the count
+"""
+from sqlalchemy import Column, Integer
+from database.base import Base
+
+TODO_LISTS_COUNT_ROW_ID = 1
+
+TODO_LISTS_COUNT_TRIGGERS = [
+    'CREATE TRIGGER IF NOT EXISTS "todo-lists-count-insert" AFTER INSERT ON "todo-lists" '
+    'BEGIN UPDATE "todo-lists-count" SET count = count + 1 WHERE id = {0}; END'.format(TODO_LISTS_COUNT_ROW_ID),
+    'CREATE TRIGGER IF NOT EXISTS "todo-lists-count-delete" AFTER DELETE ON "todo-lists" '
+    'BEGIN UPDATE "todo-lists-count" SET count = count - 1 WHERE id = {0}; END'.format(TODO_LISTS_COUNT_ROW_ID),
+]
+
+
+class TodoListsCount(Base):  # pylint: disable=too-few-public-methods
+    """
+    TodoListsCount DB Table definition
+
+    Attributes:
+        TodoListsCount.__tablename__ (str): DB Table name
+        TodoListsCount.id (sqlalchemy.Column): ID primary_key column
+        TodoListsCount.count (sqlalchemy.Column): Number of entries in the TodoList table
+    """
+    __tablename__ = 'todo-lists-count'
+    id = Column(Integer, primary_key=True, default=TODO_LISTS_COUNT_ROW_ID)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __init__(self, count: int):
+        """
+        Constructor to create the count entry
+
+        :param count: Current number of TodoLists
+        """
+        self.count = count
+
+    def __repr__(self):
+        """
+        String representation of the count
+
+        :return:
+        """
+        return '{}'.format(self.count)
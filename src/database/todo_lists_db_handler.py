@@ -2,22 +2,191 @@
 This module contains the class to interact with the TodoList DB table.
 
 Classes:
-    TodoListDBHandler(Database)
+    TodoListDBHandler(Database, StorageBackend)
+    GroupCommitTodoListDBHandler(TodoListDBHandler)
+
+Attributes:
+    request_logger (logging.Logger): Logger of the per-request logs, written at DEBUG level
 """
-from typing import List
-from sqlalchemy.exc import IntegrityError
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import bindparam, func, select, text
+from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm.exc import NoResultFound
-from config.config import MAX_PAGE_SIZE
+from config.config import MAX_PAGE_SIZE, TODO_LISTS_CACHE_SIZE, TODO_LISTS_CACHE_TTL
+from config.logs import get_request_logger
+from database.cache import LruTtlCache
+from database.config import DB_QUERY_CHECK_INTERVAL
 from database.database import Database
+from database.name_index import create_name_index
+from database.query_guard import QueryAborted, QueryGuard, current_query_guard
+from database.storage import StorageBackend, TodoListRecord, duplicate_name_error
 from database.tables.todo_lists import TodoList
+from database.tables.todo_lists_count import TodoListsCount, TODO_LISTS_COUNT_ROW_ID
+from database.write_coalescer import WriteCoalescer, CREATE_OPERATION, DELETE_OPERATION
+from metrics.db_metrics import (
+    CACHE_HITS, CACHE_MISSES, CACHE_SIZE, DB_QUERIES_ABORTED, NAME_INDEX_LOOKUPS, timed_db_operation
+)
+
+# SQLite limits the number of parameters per statement, `IN (...)` queries are executed in chunks of this size
+_SQL_PARAMETERS_CHUNK_SIZE = 500
+
+# Core statements of the read path, they select `(id, name)` rows without building ORM instances.
+# They are compiled once, on their first execution, and then taken from `_COMPILED_STATEMENTS_CACHE`
+_TODO_LISTS_TABLE = TodoList.__table__  # pylint: disable=no-member
+_SELECT_TODO_LISTS = select([_TODO_LISTS_TABLE.c.id, _TODO_LISTS_TABLE.c.name])
+_SELECT_TODO_LIST_BY_ID = _SELECT_TODO_LISTS.where(_TODO_LISTS_TABLE.c.id == bindparam('list_id'))
+_SELECT_TODO_LIST_BY_NAME = _SELECT_TODO_LISTS.where(_TODO_LISTS_TABLE.c.name == bindparam('name'))
+_SELECT_TODO_LISTS_BY_IDS = _SELECT_TODO_LISTS.where(
+    _TODO_LISTS_TABLE.c.id.in_(bindparam('list_ids', expanding=True)))
+_SELECT_TODO_LISTS_PAGE = _SELECT_TODO_LISTS.order_by(_TODO_LISTS_TABLE.c.id).limit(
+    bindparam('limit')).offset(bindparam('offset'))
+_SELECT_TODO_LISTS_AFTER = _SELECT_TODO_LISTS.where(_TODO_LISTS_TABLE.c.id > bindparam('last_id')).order_by(
+    _TODO_LISTS_TABLE.c.id).limit(bindparam('limit'))
+# Core statements of the write batches of the write coalescer
+_INSERT_TODO_LIST = _TODO_LISTS_TABLE.insert().values(name=bindparam('name'))
+_DELETE_TODO_LIST = _TODO_LISTS_TABLE.delete().where(_TODO_LISTS_TABLE.c.id == bindparam('list_id'))
+_COMPILED_STATEMENTS_CACHE = {}
+request_logger = get_request_logger(__name__)
+# Returned by the cache when a TodoList ID is not cached, `None` is cached for the IDs that do not exist
+_NOT_CACHED = object()
+# Number of names read at once when the names index is loaded
+_NAME_INDEX_LOAD_CHUNK_SIZE = 10000
 
 
-class TodoListDBHandler(Database):
+class TodoListDBHandler(Database, StorageBackend):
     """
-    TodoList DB table Handler
+    TodoList DB table Handler, the SQLite storage backend
+
+    The methods are classmethods, so they can be called from the class, or from an instance used as `StorageBackend`.
+
+    The writes use the ORM, the reads use SQLAlchemy Core statements, compiled once, that return
+    `TodoListRecord` tuples, without the identity map and the instrumentation of the ORM instances.
+
+    Attributes:
+        TodoListDBHandler.cache (database.cache.LruTtlCache): Read-through cache of `get_todo_list`,
+         it also remembers the IDs that do not exist. Its size and TTL are defined by `TODO_LISTS_CACHE_SIZE`
+         and `TODO_LISTS_CACHE_TTL`. Its hits, misses and size are exported as metrics
+        TodoListDBHandler.name_index (database.name_index.NameSetIndex): Index of the names that may exist,
+         loaded by `setup`, the repeated names found in it are rejected without a DB write.
+         Its kind is defined by `NAME_INDEX`, None if it is not used
     """
 
+    # The classmethods implement the instance methods of StorageBackend
+    # pylint: disable=arguments-differ
+
+    cache = LruTtlCache(max_size=TODO_LISTS_CACHE_SIZE, ttl=TODO_LISTS_CACHE_TTL)
+    name_index = create_name_index()
+
+    @classmethod
+    def setup(cls) -> None:
+        """
+        Create the DB tables if they do not exist, and load the names index
+        :return:
+        """
+        cls.create_db_tables()
+        if cls.name_index is not None:
+            cls.name_index.load((_list.name for _list in cls.iter_lists(chunk_size=_NAME_INDEX_LOAD_CHUNK_SIZE)),
+                                cls.get_lists_db_count())
+
+    @classmethod
+    def _update_name_index(cls, added_names: Iterable[str] = (), removed_names: Iterable[str] = ()) -> None:
+        """
+        Add the names of the created lists to the names index, and remove the names of the deleted lists
+
+        :param added_names: Names of the created lists, or of the repeated names found by the DB
+        :param removed_names: Names of the deleted lists
+        :return:
+        """
+        if cls.name_index is None:
+            return
+        for name in added_names:
+            cls.name_index.add(name)
+        for name in removed_names:
+            cls.name_index.discard(name)
+
+    @classmethod
+    def reject_indexed_name(cls, name: str) -> None:
+        """
+        Reject a repeated name before starting a DB write.
+        If the name is in the names index it is confirmed with a read of the DB, without taking the write lock,
+        a name that does not exist anymore is removed from the index.
+
+        :param name: Name of the list to create
+        :return:
+        :raise IntegrityError: If List with `name` already exist in the DB
+        """
+        if cls.name_index is None:
+            return
+        if name not in cls.name_index:
+            NAME_INDEX_LOOKUPS.labels('new').inc()
+            return
+        if cls._select_records(_SELECT_TODO_LIST_BY_NAME, name=name):
+            NAME_INDEX_LOOKUPS.labels('duplicate').inc()
+            request_logger.debug('TodoList name must be unique. List with name "%s" already exist', name)
+            raise duplicate_name_error(name)
+        NAME_INDEX_LOOKUPS.labels('stale').inc()
+        cls.name_index.discard(name)
+
+    @classmethod
+    def _select_records(cls, statement, **params) -> List[TodoListRecord]:
+        """
+        Execute a read statement of the TodoList table, in a pooled connection without an ORM session.
+        The statement is compiled only the first time, then it is taken from `_COMPILED_STATEMENTS_CACHE`
+
+        If the reads are guarded, see `database.query_guard`, the read is not started when the RPC was cancelled
+        or its deadline expired, and it is interrupted when that happens while it runs.
+
+        :param statement: Core statement that selects the `id` and `name` columns
+        :param params: Values of the statement bind parameters
+        :return: TodoLists entries, in the order of the statement
+        :raise QueryAborted: If the read was stopped by its guard
+        """
+        guard = current_query_guard()
+        if guard is None:
+            with cls.db_engine.connect() as connection:
+                result = connection.execution_options(compiled_cache=_COMPILED_STATEMENTS_CACHE).execute(
+                    statement, **params)
+                return [TodoListRecord(*_row) for _row in result]
+        try:
+            guard.check()
+            with cls.db_engine.connect() as connection:
+                return cls._select_guarded_records(connection, guard, statement, params)
+        except QueryAborted as ex:
+            DB_QUERIES_ABORTED.labels(ex.reason).inc()
+            request_logger.debug('DB read stopped, %s', ex.reason)
+            raise
+
+    @staticmethod
+    def _select_guarded_records(connection, guard: QueryGuard, statement, params: dict) -> List[TodoListRecord]:
+        """
+        Execute a read statement with the SQLite progress handler, that interrupts it when its guard must stop it.
+        The handler is removed after the read, the connection goes back to the pool
+
+        :param connection: Pooled DB connection
+        :param guard: Guard of the read
+        :param statement: Core statement that selects the `id` and `name` columns
+        :param params: Values of the statement bind parameters
+        :return: TodoLists entries, in the order of the statement
+        :raise QueryAborted: If the read was interrupted by its guard
+        """
+        dbapi_connection = connection.connection
+        if DB_QUERY_CHECK_INTERVAL > 0:
+            dbapi_connection.set_progress_handler(lambda: guard.abort_reason() is not None, DB_QUERY_CHECK_INTERVAL)
+        try:
+            result = connection.execution_options(compiled_cache=_COMPILED_STATEMENTS_CACHE).execute(
+                statement, **params)
+            return [TodoListRecord(*_row) for _row in result]
+        except OperationalError as ex:
+            reason = guard.abort_reason()
+            if reason is None:
+                raise
+            raise QueryAborted(reason) from ex
+        finally:
+            if DB_QUERY_CHECK_INTERVAL > 0:
+                dbapi_connection.set_progress_handler(None, 0)
+
     @classmethod
+    @timed_db_operation('new_todo_list_entry')
     def new_todo_list_entry(cls, name: str) -> int:
         """
         Create a new todoList entry in the database
@@ -28,21 +197,118 @@ class TodoListDBHandler(Database):
 
         :raise IntegrityError: If List with `name` already exist in the DB
         """
+        cls.reject_indexed_name(name)
         try:
             session = cls.session_maker()
             new_todo_list = TodoList(name=name)
             session.add(new_todo_list)
             session.commit()
             new_id = new_todo_list.id
+            # The ID could be cached as not found
+            cls.cache.invalidate(new_id)
+            cls._update_name_index(added_names=(name,))
             return new_id
         except IntegrityError as ex:
-            print('TodoList name must be unique. List with name "{}" already exist'.format(name))
+            request_logger.debug('TodoList name must be unique. List with name "%s" already exist', name)
+            # The name was created by another process, the next duplicate is found in the index
+            cls._update_name_index(added_names=(name,))
             raise ex
         finally:
             cls.session_maker.remove()
 
     @classmethod
-    def get_lists_paginated(cls, page_number: int = 1, page_size: int = 10) -> List[TodoList]:
+    @timed_db_operation('new_todo_list_entries')
+    def new_todo_list_entries(cls, names: List[str]) -> List[Optional[int]]:
+        """
+        Create many todoList entries in the database in a single transaction
+
+        The names that already exist in the DB, or are repeated in `names`, are skipped without failing the batch.
+        The write lock is taken when the transaction begins, so no other writer can insert the same names
+        between the check of the existing names and the insert of the new ones, that are inserted
+        with a single executemany.
+
+        :param names: New lists names
+
+        :return: New todoList ID for each name in `names`, None if the name was skipped because it already exist
+        """
+        try:
+            session = cls.session_maker()
+            session.execute(text('BEGIN IMMEDIATE'))
+
+            existing_names = set()
+            for chunk_start in range(0, len(names), _SQL_PARAMETERS_CHUNK_SIZE):
+                chunk = names[chunk_start:chunk_start + _SQL_PARAMETERS_CHUNK_SIZE]
+                existing_names.update(_name for _name, in session.query(TodoList.name).filter(TodoList.name.in_(chunk)))
+            # dict keeps the insertion order, and removes the names repeated in the batch
+            new_names = list(dict.fromkeys(_name for _name in names if _name not in existing_names))
+
+            last_id_before_insert = session.query(func.max(TodoList.id)).scalar() or 0
+            if new_names:
+                session.execute(TodoList.__table__.insert(),  # pylint: disable=no-member
+                                [{'name': _name} for _name in new_names])
+            new_ids = dict(session.query(TodoList.name, TodoList.id).filter(TodoList.id > last_id_before_insert))
+            session.commit()
+            # The IDs could be cached as not found
+            cls.cache.invalidate(*new_ids.values())
+            cls._update_name_index(added_names=new_ids)
+
+            # Only the first occurrence of a repeated name gets the new ID
+            return [new_ids.pop(_name, None) for _name in names]
+        finally:
+            cls.session_maker.remove()
+
+    @classmethod
+    @timed_db_operation('write_batch')
+    def execute_write_batch(cls, operations: Sequence[Tuple[str, Any]]) -> List[Any]:
+        """
+        Execute many Create and Delete writes in a single transaction, used by the `WriteCoalescer`
+
+        The writes are executed in order, each one with its own statement, a write that fails only rolls back
+        its statement, so the other writes of the batch are committed together with a single commit.
+
+        :param operations: `(CREATE_OPERATION, name)` or `(DELETE_OPERATION, list_id)` of each write
+        :return: For each write, the new list ID of a create, None for a delete,
+         or the exception of the write that failed, `IntegrityError` or `NoResultFound`
+        """
+        results = []
+        created_names = []
+        deleted_names = []
+        with cls.db_engine.connect() as connection:
+            connection = connection.execution_options(compiled_cache=_COMPILED_STATEMENTS_CACHE)
+            with connection.begin():
+                connection.execute(text('BEGIN IMMEDIATE'))
+                for operation, argument in operations:
+                    if operation == CREATE_OPERATION:
+                        try:
+                            results.append(connection.execute(_INSERT_TODO_LIST, name=argument).inserted_primary_key[0])
+                        except IntegrityError as ex:
+                            request_logger.debug('TodoList name must be unique. List with name "%s" already exist',
+                                                 argument)
+                            results.append(ex)
+                        created_names.append(argument)
+                    elif operation == DELETE_OPERATION:
+                        todo_lists = connection.execute(_SELECT_TODO_LIST_BY_ID, list_id=argument).fetchall()
+                        if todo_lists and connection.execute(_DELETE_TODO_LIST, list_id=argument).rowcount:
+                            deleted_names.append(todo_lists[0].name)
+                            results.append(None)
+                        else:
+                            request_logger.debug('TodoList with id "%s" does not exist', argument)
+                            results.append(NoResultFound())
+                    else:
+                        results.append(ValueError('Unknown write operation "{}"'.format(operation)))
+        # The created IDs could be cached as not found
+        cls.cache.invalidate(*(_argument if _operation == DELETE_OPERATION else _result
+                               for (_operation, _argument), _result in zip(operations, results)
+                               if not isinstance(_result, Exception)))
+        # A name deleted and created again in the batch is in the index
+        cls._update_name_index(removed_names=deleted_names)
+        cls._update_name_index(added_names=created_names)
+        return results
+
+    @classmethod
+    @timed_db_operation('get_lists_paginated')
+    def get_lists_paginated(cls, page_number: int = 1, page_size: int = 10,
+                            include_next: bool = False) -> List[TodoListRecord]:
         """
         Return TodoLists entries from the DB paginated.
 
@@ -51,42 +317,112 @@ class TodoListDBHandler(Database):
 
         If a negative `page_number` is received it will be set to 1.
 
+        If `include_next` is True the first entry of the next page is also returned, if it exists,
+         this way the caller knows if there is a next page without counting the TodoLists.
+
         :param page_number: Page number to return. Default 1
         :param page_size: Number of items per page. Default 10
+        :param include_next: Return also the first entry of the next page. Default False
         :return: TodoLists entries in that page
         """
-        try:
-            session = cls.session_maker()
+        page_number = page_number if page_number > 0 else 1
+        page_size = page_size if page_size < MAX_PAGE_SIZE else MAX_PAGE_SIZE
 
-            page_number = page_number if page_number > 0 else 1
-            page_size = page_size if page_size < MAX_PAGE_SIZE else MAX_PAGE_SIZE
+        _first_entry = (page_number - 1) * page_size
 
-            _last_entry = page_number * page_size
+        _limit = page_size + 1 if include_next else page_size
 
-            return session.query(TodoList).slice(_last_entry - page_size, _last_entry).all()
-        finally:
-            cls.session_maker.remove()
+        return cls._select_records(_SELECT_TODO_LISTS_PAGE, offset=_first_entry, limit=_limit)
 
     @classmethod
-    def get_todo_list(cls, list_id: int) -> TodoList:
+    @timed_db_operation('get_lists_after')
+    def get_lists_after(cls, last_id: int = 0, limit: int = 10) -> List[TodoListRecord]:
+        """
+        Return TodoLists entries from the DB with keyset pagination, `WHERE id > last_id ORDER BY id LIMIT limit`.
+
+        The query seeks the primary key index, so it takes the same time for any page,
+        unlike `get_lists_paginated` where the DB must skip all the rows before the page.
+
+        :param last_id: Last `id` of the previous page, 0 for the first page. Default 0
+        :param limit: Max number of entries to return. Default 10
+        :return: TodoLists entries after `last_id` ordered by `id`
         """
-        Fetch a TodoList from the DB
+        return cls._select_records(_SELECT_TODO_LISTS_AFTER, last_id=last_id, limit=limit)
+
+    @classmethod
+    def iter_lists(cls, after_id: int = 0, chunk_size: int = 1000) -> Iterator[TodoListRecord]:
+        """
+        Iterate over all the TodoLists entries ordered by `id`, reading them from the DB in chunks.
+
+        Each chunk is read with `get_lists_after` in its own short transaction, so only one chunk is kept
+        in memory and writers are not blocked while the entries are consumed, no matter how big the table is.
+
+        :param after_id: Only entries with an `id` bigger than `after_id` are returned. Default 0
+        :param chunk_size: Number of entries read from the DB at once. Default 1000
+        :return: Iterator of TodoLists entries
+        """
+        last_id = after_id
+        while True:
+            chunk = cls.get_lists_after(last_id=last_id, limit=chunk_size)
+            yield from chunk
+            if len(chunk) < chunk_size:
+                return
+            last_id = chunk[-1].id
+
+    @classmethod
+    def get_todo_list(cls, list_id: int) -> TodoListRecord:
+        """
+        Fetch a TodoList from the cache, or from the DB if it is not cached
+
+        The TodoList, or that it does not exist, is stored in the cache.
 
         :param list_id: ID of list to fetch
         :return: TodoList
         :raise NoResultFound: If list with that ID does not exist
         """
-        try:
-            session = cls.session_maker()
-            todo_list = session.query(TodoList).get(list_id)
-            if not todo_list:
-                print('TodoList with id "{}" does not exist'.format(list_id))
-                raise NoResultFound()
-            return todo_list
-        finally:
-            cls.session_maker.remove()
+        todo_list = cls.cache.get(list_id, _NOT_CACHED)
+        if todo_list is _NOT_CACHED:
+            cache_token = cls.cache.token()
+            todo_list = cls._select_todo_list(list_id)
+            cls.cache.put(list_id, todo_list, cache_token)
+        if not todo_list:
+            request_logger.debug('TodoList with id "%s" does not exist', list_id)
+            raise NoResultFound()
+        return todo_list
+
+    @classmethod
+    @timed_db_operation('get_todo_list')
+    def _select_todo_list(cls, list_id: int) -> Optional[TodoListRecord]:
+        """
+        Fetch a TodoList from the DB, without the cache
+
+        :param list_id: ID of list to fetch
+        :return: TodoList, None if list with that ID does not exist
+        """
+        todo_lists = cls._select_records(_SELECT_TODO_LIST_BY_ID, list_id=list_id)
+        return todo_lists[0] if todo_lists else None
+
+    @classmethod
+    @timed_db_operation('get_todo_lists')
+    def get_todo_lists(cls, list_ids: List[int]) -> List[Optional[TodoListRecord]]:
+        """
+        Fetch many TodoLists from the DB with `WHERE id IN (...)` queries,
+        executed in chunks to stay under the SQLite parameters limit
+
+        :param list_ids: IDs of the lists to fetch
+        :return: TodoList for each ID in `list_ids`, None if the list with that ID does not exist
+        """
+        # dict keeps the insertion order, and removes the repeated IDs
+        unique_ids = list(dict.fromkeys(list_ids))
+        todo_lists = {}
+        for chunk_start in range(0, len(unique_ids), _SQL_PARAMETERS_CHUNK_SIZE):
+            chunk = unique_ids[chunk_start:chunk_start + _SQL_PARAMETERS_CHUNK_SIZE]
+            todo_lists.update((_list.id, _list) for _list in cls._select_records(_SELECT_TODO_LISTS_BY_IDS,
+                                                                                 list_ids=chunk))
+        return [todo_lists.get(_id) for _id in list_ids]
 
     @classmethod
+    @timed_db_operation('delete_todo_list')
     def delete_todo_list(cls, list_id: int) -> None:
         """
         Delete a TodoList from the DB
@@ -97,21 +433,111 @@ class TodoListDBHandler(Database):
         """
         try:
             session = cls.session_maker()
-            todo_list = session.query(TodoList).filter(TodoList.id == list_id).delete()
-            if not todo_list:
-                print('TodoList with id "{}" does not exist'.format(list_id))
+            if cls.name_index is None:
+                deleted = session.query(TodoList).filter(TodoList.id == list_id).delete()
+                removed_names = ()
+            else:
+                # The row is read once, its name is removed from the names index after the delete
+                todo_list = session.query(TodoList).filter(TodoList.id == list_id).first()
+                if todo_list is not None:
+                    session.delete(todo_list)
+                deleted = todo_list is not None
+                removed_names = (todo_list.name,) if deleted else ()
+            if not deleted:
+                request_logger.debug('TodoList with id "%s" does not exist', list_id)
                 raise NoResultFound()
             session.commit()
+            cls.cache.invalidate(list_id)
+            cls._update_name_index(removed_names=removed_names)
         finally:
             cls.session_maker.remove()
 
     @classmethod
+    @timed_db_operation('delete_todo_lists')
+    def delete_todo_lists(cls, list_ids: List[int]) -> List[int]:
+        """
+        Delete many TodoLists from the DB in a single transaction
+
+        The lists are deleted with `DELETE ... WHERE id IN (...)` statements, executed in chunks to stay under the
+        SQLite parameters limit, and committed once. The IDs that do not exist are skipped without failing the batch.
+
+        :param list_ids: IDs of the lists to delete
+        :return: IDs of the deleted lists, in the order of `list_ids` without repeated IDs
+        """
+        try:
+            session = cls.session_maker()
+            session.execute(text('BEGIN IMMEDIATE'))
+            # dict keeps the insertion order, and removes the repeated IDs
+            unique_ids = list(dict.fromkeys(list_ids))
+            # Names of the existing IDs, to remove them from the names index
+            existing_ids = {}
+            for chunk_start in range(0, len(unique_ids), _SQL_PARAMETERS_CHUNK_SIZE):
+                chunk = unique_ids[chunk_start:chunk_start + _SQL_PARAMETERS_CHUNK_SIZE]
+                existing_ids.update(session.query(TodoList.id, TodoList.name).filter(TodoList.id.in_(chunk)))
+                session.query(TodoList).filter(TodoList.id.in_(chunk)).delete(synchronize_session=False)
+            session.commit()
+            cls.cache.invalidate(*existing_ids)
+            cls._update_name_index(removed_names=existing_ids.values())
+            return [_id for _id in unique_ids if _id in existing_ids]
+        finally:
+            cls.session_maker.remove()
+
+    @classmethod
+    @timed_db_operation('get_lists_db_count')
     def get_lists_db_count(cls) -> int:
         """
+        Read the count maintained in the TodoListsCount table, it does not scan the TodoList table
+
         :return: count of TodoLists in the DB
         """
         try:
             session = cls.session_maker()
-            return session.query(TodoList).count()
+            return session.query(TodoListsCount.count).filter(TodoListsCount.id == TODO_LISTS_COUNT_ROW_ID).scalar()
         finally:
             cls.session_maker.remove()
+
+
+# The cache counts its hits and misses, the metrics read them when they are rendered
+CACHE_HITS.set_function(lambda: TodoListDBHandler.cache.hits)
+CACHE_MISSES.set_function(lambda: TodoListDBHandler.cache.misses)
+CACHE_SIZE.set_function(lambda: TodoListDBHandler.cache.stats()['size'])
+
+
+class GroupCommitTodoListDBHandler(TodoListDBHandler):
+    """
+    SQLite storage backend that commits the concurrent Create and Delete writes together
+
+    `new_todo_list_entry` and `delete_todo_list` queue the write in the `write_coalescer`, and wait for its result,
+    the other methods are the ones of `TodoListDBHandler`.
+
+    Attributes:
+        GroupCommitTodoListDBHandler.write_coalescer (database.write_coalescer.WriteCoalescer): Writes queue,
+         its batches are defined by `WRITE_BATCH_WINDOW` and `WRITE_BATCH_MAX_SIZE`
+    """
+
+    write_coalescer = WriteCoalescer(TodoListDBHandler.execute_write_batch)
+
+    @classmethod
+    def new_todo_list_entry(cls, name: str) -> int:
+        """
+        Create a new todoList entry in the database, in the next write batch
+
+        :param name: New list name
+
+        :return: New todoList ID
+
+        :raise IntegrityError: If List with `name` already exist in the DB
+        """
+        cls.reject_indexed_name(name)
+        return cls.write_coalescer.submit(CREATE_OPERATION, name).result()
+
+    @classmethod
+    def delete_todo_list(cls, list_id: int) -> None:
+        """
+        Delete a TodoList from the DB, in the next write batch
+
+        :param list_id: ID of list to delete
+        :return:
+        :raise NoResultFound: If list with that ID does not exist
+        """
+        cls.write_coalescer.submit(DELETE_OPERATION, list_id).result()
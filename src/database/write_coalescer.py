@@ -0,0 +1,160 @@
+"""
+This module contains the write coalescer, that commits the writes of many threads together.
+
+SQLite allows a single writer, so when each write commits its own transaction the concurrent writers take turns
+on the write lock and wait for the disk once per write. The coalescer queues the writes, and a writer thread
+takes the writes that arrive within a short window, or up to a max number of writes, and executes them
+in a single transaction, with a single commit. Each caller waits on its own future, that is completed
+with the result of its write, or with its exception, e.g. `IntegrityError` for a repeated name.
+
+Examples:
+        The coalescer receives the function that executes a batch of writes in one transaction.
+
+            $ coalescer = WriteCoalescer(TodoListDBHandler.execute_write_batch)
+            $ new_id = coalescer.submit(CREATE_OPERATION, 'name').result()
+
+Classes:
+    WriteCoalescer
+
+Attributes:
+    CREATE_OPERATION (str): Write that creates a TodoList, its argument is the list name
+    DELETE_OPERATION (str): Write that deletes a TodoList, its argument is the list ID
+    logger (logging.Logger): Logger of the module
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent import futures
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from database.config import WRITE_BATCH_WINDOW, WRITE_BATCH_MAX_SIZE
+from metrics.db_metrics import DB_WRITE_BATCH_SIZE
+
+CREATE_OPERATION = 'create'
+DELETE_OPERATION = 'delete'
+
+logger = logging.getLogger(__name__)
+# Queued by `close` to stop the writer thread
+_STOP = object()
+
+
+class WriteCoalescer:  # pylint: disable=too-many-instance-attributes
+    """
+    Queue of writes executed in batches by a writer thread, started on the first write
+
+    The function that executes a batch receives the `(operation, argument)` of each write, and returns the result
+    of each write, or the exception of the writes that failed without failing the batch.
+    If the function raises, all the writes of the batch fail with that exception.
+    """
+
+    def __init__(self, execute_batch: Callable[[Sequence[Tuple[str, Any]]], List[Any]],
+                 window: float = WRITE_BATCH_WINDOW, max_batch_size: int = WRITE_BATCH_MAX_SIZE):
+        """
+        Constructor of the coalescer
+
+        :param execute_batch: Function that executes a batch of writes in a single transaction
+        :param window: Seconds that the writer waits for more writes after the first write of a batch.
+         Default `WRITE_BATCH_WINDOW`
+        :param max_batch_size: Max number of writes of a batch. Default `WRITE_BATCH_MAX_SIZE`
+        """
+        self.window = window
+        self.max_batch_size = max(1, max_batch_size)
+        self._execute_batch = execute_batch
+        self._queue = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._batches = 0
+        self._writes = 0
+        self._max_batch = 0
+
+    def submit(self, operation: str, argument: Any) -> futures.Future:
+        """
+        Queue a write, it is executed in the next batch
+
+        :param operation: `CREATE_OPERATION` or `DELETE_OPERATION`
+        :param argument: Argument of the write
+        :return: Future completed with the result of the write, or its exception
+        """
+        if self._thread is None:
+            self._start()
+        future = futures.Future()
+        self._queue.put((operation, argument, future))
+        return future
+
+    def stats(self) -> Dict[str, float]:
+        """
+        :return: Number of batches and writes executed, and the mean and max writes per batch
+        """
+        return {'batches': self._batches, 'writes': self._writes, 'max_batch_size': self._max_batch,
+                'mean_batch_size': self._writes / self._batches if self._batches else 0.0}
+
+    def close(self) -> None:
+        """
+        Execute the queued writes, and stop the writer thread
+        :return:
+        """
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _start(self) -> None:
+        """
+        Start the writer thread if it is not running
+        :return:
+        """
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='write-coalescer', daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        """
+        Loop of the writer thread, collect a batch of writes and execute it, until `_STOP` is received
+        :return:
+        """
+        stopped = False
+        while not stopped:
+            write = self._queue.get()
+            if write is _STOP:
+                return
+            batch = [write]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                try:
+                    write = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if write is _STOP:
+                    stopped = True
+                    break
+                batch.append(write)
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: List[Tuple[str, Any, futures.Future]]) -> None:
+        """
+        Execute a batch of writes and complete their futures
+
+        :param batch: `(operation, argument, future)` of each write
+        :return:
+        """
+        self._batches += 1
+        self._writes += len(batch)
+        self._max_batch = max(self._max_batch, len(batch))
+        DB_WRITE_BATCH_SIZE.labels().observe(len(batch))
+        try:
+            results = self._execute_batch([(_operation, _argument) for _operation, _argument, _ in batch])
+        except Exception as ex:  # pylint: disable=broad-except
+            # The writer thread must keep running, and the callers must not wait forever
+            logger.exception('Write batch of %s writes failed', len(batch))
+            for _, _, future in batch:
+                future.set_exception(ex)
+            return
+        for (_, _, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
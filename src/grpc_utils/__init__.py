@@ -0,0 +1,6 @@
+"""
+Python package with the gRPC helpers shared by the server, the clients and the metrics, it does not depend on them
+
+Modules:
+    interceptors: module with the helpers shared by the interceptors that wrap the servicer methods
+"""
@@ -0,0 +1,83 @@
+"""
+This module contains the helpers shared by the gRPC server interceptors that wrap the servicer methods, e.g. to record
+their metrics, compress their responses, or limit their RPCs.
+
+The interceptors create the wrapped method handler of each gRPC method once, with the first RPC of the method,
+and reuse it for the next RPCs while the servicer returns the same handler. The wrapped servicer methods keep the
+thread pool of the servicer method, set in its `experimental_thread_pool` attribute, where a thread pool gRPC server
+runs the RPCs of the method instead of its own thread pool.
+
+Examples:
+        Wrap the method handlers of an interceptor.
+
+            $ handlers = MethodHandlersCache(lambda handler, full_method: wrap_rpc_method_handler(handler, wrap))
+            $ wrapped = handlers.wrap(continuation(handler_call_details), handler_call_details.method)
+
+Classes:
+    MethodHandlersCache: Wrapped method handler of each gRPC method
+
+Attributes:
+    interceptors.wrap_rpc_method_handler (function): Create a method handler that runs a wrapped servicer method
+"""
+from typing import Callable, Dict, Optional, Tuple
+
+import grpc
+
+# Attribute of a servicer method with the thread pool where the thread pool servers run it
+_THREAD_POOL_ATTRIBUTE = 'experimental_thread_pool'
+# Attribute of the method handler with the behavior and function to create the handler, by streaming type
+_HANDLER_TYPES = {
+    (False, False): ('unary_unary', grpc.unary_unary_rpc_method_handler),
+    (False, True): ('unary_stream', grpc.unary_stream_rpc_method_handler),
+    (True, False): ('stream_unary', grpc.stream_unary_rpc_method_handler),
+    (True, True): ('stream_stream', grpc.stream_stream_rpc_method_handler),
+}
+
+
+def wrap_rpc_method_handler(handler: grpc.RpcMethodHandler,
+                            wrap_behavior: Callable[[Callable], Callable]) -> grpc.RpcMethodHandler:
+    """
+    Create a method handler with the streaming types and the serializers of `handler`, that runs its servicer method
+    wrapped by `wrap_behavior`, in the thread pool of the wrapped servicer method if it has one
+
+    :param handler: Method handler of the gRPC method
+    :param wrap_behavior: Function that receives the servicer method and returns the wrapped servicer method
+    :return: Method handler of the wrapped servicer method
+    """
+    attribute, create_handler = _HANDLER_TYPES[(handler.request_streaming, handler.response_streaming)]
+    behavior = getattr(handler, attribute)
+    wrapped_behavior = wrap_behavior(behavior)
+    if hasattr(behavior, _THREAD_POOL_ATTRIBUTE) and not hasattr(wrapped_behavior, _THREAD_POOL_ATTRIBUTE):
+        setattr(wrapped_behavior, _THREAD_POOL_ATTRIBUTE, getattr(behavior, _THREAD_POOL_ATTRIBUTE))
+    return create_handler(wrapped_behavior,
+                          request_deserializer=handler.request_deserializer,
+                          response_serializer=handler.response_serializer)
+
+
+class MethodHandlersCache:  # pylint: disable=too-few-public-methods
+    """
+    Wrapped method handler of each gRPC method, created by the first RPC of the method
+    """
+
+    def __init__(self, wrap_handler: Callable[[grpc.RpcMethodHandler, str], grpc.RpcMethodHandler]):
+        """
+        :param wrap_handler: Function that receives the method handler and the name of a gRPC method,
+            and returns the wrapped method handler, or the same handler if the method is not wrapped
+        """
+        self._wrap_handler = wrap_handler
+        self._handlers: Dict[str, Tuple[grpc.RpcMethodHandler, grpc.RpcMethodHandler]] = {}
+
+    def wrap(self, handler: Optional[grpc.RpcMethodHandler], full_method: str) -> Optional[grpc.RpcMethodHandler]:
+        """
+        :param handler: Method handler of the RPC, None if the method is not implemented
+        :param full_method: gRPC method name, e.g. `/todolists.TodoLists/Get`
+        :return: Wrapped method handler of the RPC, None if the method is not implemented
+        """
+        if handler is None:
+            return None
+        cached = self._handlers.get(full_method)
+        if cached is not None and cached[0] is handler:
+            return cached[1]
+        wrapped = self._wrap_handler(handler, full_method)
+        self._handlers[full_method] = (handler, wrapped)
+        return wrapped
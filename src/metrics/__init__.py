@@ -0,0 +1,12 @@
+"""
+Python package with the metrics of the gRPC server, exposed in the Prometheus text format
+
+Modules:
+    registry: metric types and the registry that renders them
+    interceptors: gRPC server interceptors that record the latency, status codes and message sizes of the RPCs
+    db_metrics: time spent in the DB by operation
+    admission_metrics: concurrency limit, queue depth and rejected RPCs of the admission control
+    rate_limit_metrics: RPCs rejected by the per-client rate limits
+    session_metrics: latency and status codes of the operations of the Session streams
+    exporter: HTTP server that exposes the metrics to be scraped
+"""
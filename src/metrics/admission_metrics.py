@@ -0,0 +1,23 @@
+"""
+This module contains the metrics of the admission control of the gRPC servers, see `proto_server.admission`.
+
+Attributes:
+    ADMISSION_LIMIT (metrics.registry.Gauge): Current concurrency limit of the unary RPCs
+    ADMISSION_IN_FLIGHT (metrics.registry.Gauge): Number of admitted unary RPCs running
+    ADMISSION_QUEUE_DEPTH (metrics.registry.Gauge): Number of unary RPCs waiting for the limit
+    ADMISSION_QUEUE_SECONDS (metrics.registry.Histogram): Time that the admitted RPCs waited in the queue
+    ADMISSION_SHED (metrics.registry.Counter): Number of RPCs rejected by the admission control, by reason
+"""
+from metrics.registry import Counter, Gauge, Histogram
+
+ADMISSION_LIMIT = Gauge('todolists_admission_limit', 'Concurrency limit of the unary RPCs of the admission control.')
+ADMISSION_IN_FLIGHT = Gauge('todolists_admission_in_flight', 'Number of unary RPCs admitted and running.')
+ADMISSION_QUEUE_DEPTH = Gauge('todolists_admission_queue_depth',
+                              'Number of unary RPCs waiting in the admission queue.')
+ADMISSION_QUEUE_SECONDS = Histogram('todolists_admission_queue_seconds',
+                                    'Time that the admitted RPCs waited in the admission queue, in seconds.')
+ADMISSION_SHED = Counter('todolists_admission_shed_total',
+                         'Number of RPCs rejected by the admission control, `queue_full` if the queue was full, '
+                         '`queue_timeout` if they waited too long in the queue, and `deadline_expired` if their '
+                         'deadline expired before they started.',
+                         ['reason'])
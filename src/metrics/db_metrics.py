@@ -0,0 +1,73 @@
+"""
+This module contains the metrics of the time spent in the DB.
+
+Examples:
+        Decorate the storage backend methods, the time of each call is recorded with the backend and operation names,
+        so the time of the SQLite storage is not mixed with the time of the in-memory storage.
+
+            $ @classmethod
+            $ @timed_db_operation('get_todo_list')
+            $ def _select_todo_list(cls, list_id): ...
+            $
+            $ @timed_db_operation('get_todo_list', backend=MEMORY_STORAGE_BACKEND)
+            $ def get_todo_list(self, list_id): ...
+
+Attributes:
+    DB_QUERY_SECONDS (metrics.registry.Histogram): Time spent in the storage backend by backend and operation
+    DB_WRITE_BATCH_SIZE (metrics.registry.Histogram): Number of writes committed together by the write coalescer
+    NAME_INDEX_LOOKUPS (metrics.registry.Counter): Lookups of the created names in the names index, by result
+    DB_QUERIES_ABORTED (metrics.registry.Counter): DB reads stopped because their RPC was cancelled
+     or its deadline expired, by reason
+    CACHE_HITS (metrics.registry.Counter): Lookups of the TodoLists cache that found the list
+    CACHE_MISSES (metrics.registry.Counter): Lookups of the TodoLists cache that did not find the list
+    CACHE_SIZE (metrics.registry.Gauge): Number of entries of the TodoLists cache
+    db_metrics.timed_db_operation (function): Decorator that records the time of the calls in `DB_QUERY_SECONDS`
+"""
+import functools
+import time
+from typing import Callable
+
+from metrics.registry import Counter, Gauge, Histogram
+
+DB_QUERY_SECONDS = Histogram('todolists_db_query_seconds',
+                             'Time spent executing storage operations, in seconds, by backend, `sqlite` or `memory`.',
+                             ['backend', 'operation'])
+DB_WRITE_BATCH_SIZE = Histogram('todolists_db_write_batch_size',
+                                'Number of writes committed in a single transaction by the write coalescer.',
+                                buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256))
+NAME_INDEX_LOOKUPS = Counter('todolists_name_index_lookups_total',
+                             'Lookups of the names of the created lists in the names index, `new` if the name was '
+                             'not indexed, `duplicate` if it was rejected, and `stale` if it was indexed but did not '
+                             'exist.',
+                             ['result'])
+DB_QUERIES_ABORTED = Counter('todolists_db_queries_aborted_total',
+                             'DB reads stopped before or while they run, `cancelled` if their RPC was cancelled, '
+                             'and `deadline_exceeded` if the deadline of their RPC expired.',
+                             ['reason'])
+CACHE_HITS = Counter('todolists_cache_hits_total', 'Number of lookups of the TodoLists cache that found the list.')
+CACHE_MISSES = Counter('todolists_cache_misses_total',
+                       'Number of lookups of the TodoLists cache that did not find the list, or found it expired.')
+CACHE_SIZE = Gauge('todolists_cache_size', 'Number of entries of the TodoLists cache.')
+
+
+def timed_db_operation(operation: str, backend: str = 'sqlite') -> Callable[[Callable], Callable]:
+    """
+    Decorator that records the time of the calls to the decorated function in `DB_QUERY_SECONDS`,
+    including the calls that raise an exception
+
+    :param operation: Value of the `operation` label
+    :param backend: Value of the `backend` label, the name of the storage backend. Default `sqlite`
+    :return: Decorator
+    """
+    histogram = DB_QUERY_SECONDS.labels(backend, operation)
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
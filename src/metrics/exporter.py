@@ -0,0 +1,83 @@
+"""
+This module contains the HTTP server that exposes the metrics to be scraped by Prometheus.
+
+Examples:
+        Start the HTTP server in a background thread, the metrics are served at `/metrics`.
+
+            $ from metrics.exporter import start_metrics_server
+            $ metrics_server = start_metrics_server(9095)
+            $ # curl http://localhost:9095/metrics
+            $ metrics_server.shutdown()
+
+Attributes:
+    exporter.start_metrics_server (function): Serve the metrics over HTTP from a background thread
+    exporter.logger (logging.Logger): Logger of the module
+"""
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from metrics.registry import Registry, REGISTRY
+
+_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+_METRICS_PATH = '/metrics'
+
+logger = logging.getLogger(__name__)
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP request handler that renders the registry of its server
+    """
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Reply the metrics in the Prometheus text format, or 404 if the path is not `/metrics`
+        :return:
+        """
+        if self.path.split('?', 1)[0] != _METRICS_PATH:
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', _CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:  # pylint: disable=redefined-builtin
+        """
+        Write the access logs of the scrapes at DEBUG level
+        :return:
+        """
+        logger.debug(format, *args)
+
+
+class _MetricsHTTPServer(ThreadingHTTPServer):
+    """
+    HTTP server of the metrics of a registry
+    """
+    daemon_threads = True
+
+    def __init__(self, address, registry: Registry):
+        """
+        :param address: Host and port to listen to
+        :param registry: Registry of the metrics to serve
+        """
+        self.registry = registry
+        super().__init__(address, _MetricsRequestHandler)
+
+
+def start_metrics_server(port: int, host: str = 'localhost', registry: Registry = REGISTRY) -> ThreadingHTTPServer:
+    """
+    Serve the metrics in the Prometheus text format at `http://<host>:<port>/metrics` from a daemon thread
+
+    :param port: Port to listen to, 0 picks a free port
+    :param host: Address to listen to. Default localhost
+    :param registry: Registry of the metrics to serve. Default `REGISTRY`
+    :return: Started HTTP server, `shutdown` stops it
+    """
+    server = _MetricsHTTPServer((host, port), registry)
+    threading.Thread(target=server.serve_forever, name='metrics-exporter', daemon=True).start()
+    logger.info('Serving metrics on http://%s:%s%s', host, server.server_port, _METRICS_PATH)
+    return server
@@ -0,0 +1,374 @@
+"""
+This module contains the gRPC server interceptors that record the metrics of the RPCs.
+
+For each gRPC method they record the latency, the number of RPCs by status code, the number of RPCs in flight
+and the size of the request and response messages. The status code is read from the calls to `abort`,
+`abort_with_status` and `set_code` of the servicer context, an exception that does not abort the RPC counts
+as `UNKNOWN` and a cancelled RPC as `CANCELLED`.
+
+Examples:
+        Pass the interceptor when the server is created.
+
+            $ server = grpc.server(ThreadPoolExecutor(), interceptors=[MetricsInterceptor()])
+            $ aio_server = grpc.aio.server(interceptors=(AsyncMetricsInterceptor(),))
+
+Classes:
+    MetricsInterceptor(grpc.ServerInterceptor): Record the metrics of the RPCs of the thread pool servers
+    AsyncMetricsInterceptor(grpc.aio.ServerInterceptor): Record the metrics of the RPCs of the asyncio servers
+
+Attributes:
+    GRPC_SERVER_HANDLED (metrics.registry.Counter): Number of completed RPCs by method and status code
+    GRPC_SERVER_HANDLING_SECONDS (metrics.registry.Histogram): Latency of the RPCs by method
+    GRPC_SERVER_IN_FLIGHT (metrics.registry.Gauge): Number of RPCs in flight by method
+    GRPC_SERVER_MSG_RECEIVED_BYTES (metrics.registry.Histogram): Size of the request messages by method
+    GRPC_SERVER_MSG_SENT_BYTES (metrics.registry.Histogram): Size of the response messages by method
+"""
+import asyncio
+import functools
+import inspect
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Tuple
+
+import grpc
+from grpc import aio
+
+from grpc_utils.interceptors import MethodHandlersCache, wrap_rpc_method_handler
+from metrics.registry import Counter, Gauge, Histogram, BYTES_BUCKETS
+
+_METHOD_LABELS = ('grpc_service', 'grpc_method')
+
+GRPC_SERVER_HANDLED = Counter('grpc_server_handled_total', 'Number of RPCs completed on the server.',
+                              _METHOD_LABELS + ('grpc_code',))
+GRPC_SERVER_HANDLING_SECONDS = Histogram('grpc_server_handling_seconds',
+                                         'Latency of the RPCs handled by the server, in seconds.', _METHOD_LABELS)
+GRPC_SERVER_IN_FLIGHT = Gauge('grpc_server_in_flight_requests', 'Number of RPCs in flight on the server.',
+                              _METHOD_LABELS)
+GRPC_SERVER_MSG_RECEIVED_BYTES = Histogram('grpc_server_msg_received_bytes',
+                                           'Size of the messages received by the server, in bytes.',
+                                           _METHOD_LABELS, buckets=BYTES_BUCKETS)
+GRPC_SERVER_MSG_SENT_BYTES = Histogram('grpc_server_msg_sent_bytes',
+                                       'Size of the messages sent by the server, in bytes.',
+                                       _METHOD_LABELS, buckets=BYTES_BUCKETS)
+
+class _MethodMetrics:
+    """
+    Child metrics of a gRPC method, they are looked up once per method instead of once per RPC
+    """
+
+    def __init__(self, full_method: str):
+        """
+        :param full_method: gRPC method name, e.g. `/todolists.TodoLists/Get`
+        """
+        service, _, method = full_method.lstrip('/').rpartition('/')
+        self._labels = (service, method)
+        self._handling_seconds = GRPC_SERVER_HANDLING_SECONDS.labels(service, method)
+        self._in_flight = GRPC_SERVER_IN_FLIGHT.labels(service, method)
+        self._received_bytes = GRPC_SERVER_MSG_RECEIVED_BYTES.labels(service, method)
+        self._sent_bytes = GRPC_SERVER_MSG_SENT_BYTES.labels(service, method)
+
+    def started(self) -> float:
+        """
+        :return: Start time of the RPC, to pass to `handled`
+        """
+        self._in_flight.inc()
+        return time.perf_counter()
+
+    def handled(self, start: float, code: grpc.StatusCode) -> None:
+        """
+        :param start: Value returned by `started`
+        :param code: Status code of the RPC
+        :return:
+        """
+        self._handling_seconds.observe(time.perf_counter() - start)
+        self._in_flight.dec()
+        GRPC_SERVER_HANDLED.labels(*self._labels, code.name).inc()
+
+    def received(self, message: Any) -> Any:
+        """
+        :param message: Request message
+        :return: The same message
+        """
+        self._received_bytes.observe(message.ByteSize())
+        return message
+
+    def sent(self, message: Any) -> Any:
+        """
+        :param message: Response message
+        :return: The same message
+        """
+        if message is not None:
+            self._sent_bytes.observe(message.ByteSize())
+        return message
+
+
+class _StatusCodeProxy:
+    """
+    Proxy of the servicer context that remembers the status code set by the servicer
+    """
+
+    def __init__(self, context: grpc.ServicerContext):
+        """
+        :param context: Servicer context of the RPC
+        """
+        self._context = context
+        self.code = grpc.StatusCode.OK
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        :param name: Attribute of the servicer context
+        :return: Attribute of the proxied servicer context
+        """
+        return getattr(self._context, name)
+
+    def set_code(self, code: grpc.StatusCode) -> None:
+        """
+        :param code: Status code of the RPC
+        :return:
+        """
+        self.code = code
+        self._context.set_code(code)
+
+    def abort_with_status(self, status: grpc.Status) -> None:
+        """
+        :param status: Status of the RPC
+        :raise Exception: Always, to finish the RPC
+        """
+        self.code = status.code
+        self._context.abort_with_status(status)
+
+
+class _StatusCodeContext(_StatusCodeProxy):
+    """
+    Proxy of the servicer context of a thread pool server that remembers the status code set by the servicer
+    """
+
+    def abort(self, code: grpc.StatusCode, details: str) -> None:
+        """
+        :param code: Status code of the RPC
+        :param details: Error description
+        :raise Exception: Always, to finish the RPC
+        """
+        self.code = code
+        self._context.abort(code, details)
+
+
+class _AsyncStatusCodeContext(_StatusCodeProxy):
+    """
+    Proxy of the servicer context of an asyncio server that remembers the status code set by the servicer,
+    and records the size of the messages read and written with the context
+    """
+
+    def __init__(self, context: aio.ServicerContext, method_metrics: _MethodMetrics):
+        """
+        :param context: Servicer context of the RPC
+        :param method_metrics: Metrics of the gRPC method
+        """
+        super().__init__(context)
+        self._method_metrics = method_metrics
+
+    async def abort(self, code: grpc.StatusCode, details: str = '', trailing_metadata: Tuple = ()) -> None:
+        """
+        :param code: Status code of the RPC
+        :param details: Error description. Default empty
+        :param trailing_metadata: Metadata sent with the status. Default empty
+        :raise AbortError: Always, to finish the RPC
+        """
+        self.code = code
+        await self._context.abort(code, details, trailing_metadata)
+
+    async def read(self) -> Any:
+        """
+        :return: Next request message, or `grpc.aio.EOF`
+        """
+        message = await self._context.read()
+        return message if message is aio.EOF else self._method_metrics.received(message)
+
+    async def write(self, message: Any) -> None:
+        """
+        :param message: Response message to send
+        :return:
+        """
+        await self._context.write(self._method_metrics.sent(message))
+
+
+def _error_code(error: BaseException, context: _StatusCodeProxy) -> grpc.StatusCode:
+    """
+    :param error: Exception raised by the servicer
+    :param context: Servicer context proxy of the RPC
+    :return: Status code of the RPC finished by `error`
+    """
+    if isinstance(error, (GeneratorExit, asyncio.CancelledError)):
+        return grpc.StatusCode.CANCELLED
+    return context.code if context.code != grpc.StatusCode.OK else grpc.StatusCode.UNKNOWN
+
+
+def _observe_requests(request_iterator: Iterator[Any], method_metrics: _MethodMetrics) -> Iterator[Any]:
+    """
+    :param request_iterator: Request messages of a request streaming RPC
+    :param method_metrics: Metrics of the gRPC method
+    :return: The same request messages
+    """
+    for request in request_iterator:
+        yield method_metrics.received(request)
+
+
+async def _observe_async_requests(request_iterator: AsyncIterator[Any],
+                                  method_metrics: _MethodMetrics) -> AsyncIterator[Any]:
+    """
+    :param request_iterator: Request messages of a request streaming RPC
+    :param method_metrics: Metrics of the gRPC method
+    :return: The same request messages
+    """
+    async for request in request_iterator:
+        yield method_metrics.received(request)
+
+
+def _wrap_behavior(behavior: Callable, method_metrics: _MethodMetrics,
+                   request_streaming: bool, response_streaming: bool) -> Callable:
+    """
+    :param behavior: Servicer method of a thread pool server
+    :param method_metrics: Metrics of the gRPC method
+    :param request_streaming: If the RPC receives a stream of messages
+    :param response_streaming: If the RPC sends a stream of messages
+    :return: Servicer method that records the metrics of its RPCs
+    """
+    def _requests(request_or_iterator: Any) -> Any:
+        if request_streaming:
+            return _observe_requests(request_or_iterator, method_metrics)
+        return method_metrics.received(request_or_iterator)
+
+    if response_streaming:
+        def _stream_behavior(request_or_iterator: Any, context: grpc.ServicerContext) -> Iterator[Any]:
+            context = _StatusCodeContext(context)
+            start = method_metrics.started()
+            code = grpc.StatusCode.OK
+            try:
+                for response in behavior(_requests(request_or_iterator), context):
+                    yield method_metrics.sent(response)
+                code = context.code
+            except BaseException as ex:
+                code = _error_code(ex, context)
+                raise
+            finally:
+                method_metrics.handled(start, code)
+        return _stream_behavior
+
+    def _unary_behavior(request_or_iterator: Any, context: grpc.ServicerContext) -> Any:
+        context = _StatusCodeContext(context)
+        start = method_metrics.started()
+        code = grpc.StatusCode.OK
+        try:
+            response = method_metrics.sent(behavior(_requests(request_or_iterator), context))
+            code = context.code
+            return response
+        except BaseException as ex:
+            code = _error_code(ex, context)
+            raise
+        finally:
+            method_metrics.handled(start, code)
+    return _unary_behavior
+
+
+def _wrap_async_behavior(behavior: Callable, method_metrics: _MethodMetrics,
+                         request_streaming: bool, response_streaming: bool) -> Callable:
+    """
+    :param behavior: Servicer method of an asyncio server, a coroutine or async generator function
+    :param method_metrics: Metrics of the gRPC method
+    :param request_streaming: If the RPC receives a stream of messages
+    :param response_streaming: If the RPC sends a stream of messages
+    :return: Servicer method that records the metrics of its RPCs
+    """
+    def _requests(request_or_iterator: Any) -> Any:
+        if request_or_iterator is None:
+            # The servicer reads the requests with `context.read`
+            return None
+        if request_streaming:
+            return _observe_async_requests(request_or_iterator, method_metrics)
+        return method_metrics.received(request_or_iterator)
+
+    if response_streaming and inspect.isasyncgenfunction(behavior):
+        async def _stream_behavior(request_or_iterator: Any, context: aio.ServicerContext) -> AsyncIterator[Any]:
+            context = _AsyncStatusCodeContext(context, method_metrics)
+            start = method_metrics.started()
+            code = grpc.StatusCode.OK
+            try:
+                async for response in behavior(_requests(request_or_iterator), context):
+                    yield method_metrics.sent(response)
+                code = context.code
+            except BaseException as ex:
+                code = _error_code(ex, context)
+                raise
+            finally:
+                method_metrics.handled(start, code)
+        return _stream_behavior
+
+    async def _coroutine_behavior(request_or_iterator: Any, context: aio.ServicerContext) -> Any:
+        context = _AsyncStatusCodeContext(context, method_metrics)
+        start = method_metrics.started()
+        code = grpc.StatusCode.OK
+        try:
+            response = await behavior(_requests(request_or_iterator), context)
+            code = context.code
+            # The response streaming coroutines write the responses with `context.write`
+            return response if response_streaming else method_metrics.sent(response)
+        except BaseException as ex:
+            code = _error_code(ex, context)
+            raise
+        finally:
+            method_metrics.handled(start, code)
+    return _coroutine_behavior
+
+
+def _wrap_handler(wrap_behavior: Callable, handler: grpc.RpcMethodHandler, full_method: str) -> grpc.RpcMethodHandler:
+    """
+    :param wrap_behavior: `_wrap_behavior` or `_wrap_async_behavior`
+    :param handler: Method handler of the RPC
+    :param full_method: gRPC method name
+    :return: Method handler that records the metrics of the RPC
+    """
+    method_metrics = _MethodMetrics(full_method)
+    return wrap_rpc_method_handler(handler, lambda behavior: wrap_behavior(
+        behavior, method_metrics, handler.request_streaming, handler.response_streaming))
+
+
+class MetricsInterceptor(grpc.ServerInterceptor):  # pylint: disable=too-few-public-methods
+    """
+    Server interceptor that records the metrics of the RPCs of a thread pool gRPC server
+    """
+
+    def __init__(self):  # pylint: disable=super-init-not-called
+        """
+        Constructor of the interceptor
+        """
+        self._handlers = MethodHandlersCache(functools.partial(_wrap_handler, _wrap_behavior))
+
+    def intercept_service(self, continuation: Callable[[grpc.HandlerCallDetails], grpc.RpcMethodHandler],
+                          handler_call_details: grpc.HandlerCallDetails) -> grpc.RpcMethodHandler:
+        """
+        :param continuation: Function that returns the method handler of the RPC
+        :param handler_call_details: Method name and metadata of the RPC
+        :return: Method handler that records the metrics of the RPC
+        """
+        return self._handlers.wrap(continuation(handler_call_details), handler_call_details.method)
+
+
+class AsyncMetricsInterceptor(aio.ServerInterceptor):  # pylint: disable=too-few-public-methods
+    """
+    Server interceptor that records the metrics of the RPCs of an asyncio gRPC server
+    """
+
+    def __init__(self):
+        """
+        Constructor of the interceptor
+        """
+        self._handlers = MethodHandlersCache(functools.partial(_wrap_handler, _wrap_async_behavior))
+
+    async def intercept_service(self,
+                                continuation: Callable[[grpc.HandlerCallDetails], Awaitable[grpc.RpcMethodHandler]],
+                                handler_call_details: grpc.HandlerCallDetails) -> grpc.RpcMethodHandler:
+        """
+        :param continuation: Coroutine function that returns the method handler of the RPC
+        :param handler_call_details: Method name and metadata of the RPC
+        :return: Method handler that records the metrics of the RPC
+        """
+        return self._handlers.wrap(await continuation(handler_call_details), handler_call_details.method)
@@ -0,0 +1,15 @@
+"""
+This module contains the metrics of the per-client rate limits of the gRPC servers, see `proto_server.rate_limit`.
+
+Attributes:
+    RATE_LIMITED (metrics.registry.Counter): Number of RPCs rejected because their client was over its limit, by budget
+    RATE_LIMIT_CLIENTS (metrics.registry.Gauge): Number of clients whose budgets are kept, by budget
+"""
+from metrics.registry import Counter, Gauge
+
+RATE_LIMITED = Counter('todolists_rate_limited_total',
+                       'Number of RPCs rejected because their client was over its rate limit, by budget, `read` or '
+                       '`write`.',
+                       ['budget'])
+RATE_LIMIT_CLIENTS = Gauge('todolists_rate_limit_clients', 'Number of clients whose rate limit budgets are kept.',
+                           ['budget'])
@@ -0,0 +1,347 @@
+"""
+This module contains the metric types and the registry that renders them in the Prometheus text format.
+
+Each metric has a fixed set of label names, the value of each combination of labels is a child metric
+that is created the first time it is requested with `labels`. Get the children once and keep them,
+when possible, to avoid looking them up on the hot path.
+
+Examples:
+        Define the metrics at module level, they are registered in the default `REGISTRY`.
+
+            $ from metrics.registry import Counter, Histogram
+            $ REQUESTS = Counter('requests_total', 'Number of requests', ['method'])
+            $ REQUESTS.labels('Get').inc()
+            $ LATENCY = Histogram('latency_seconds', 'Latency of the requests', ['method'])
+            $ with LATENCY.labels('Get').time():
+            $   ...
+
+        The value of a Counter or a Gauge can be read from a function when the metrics are rendered,
+        for the values that are already counted elsewhere, without any cost on the hot path.
+
+            $ CACHE_HITS = Counter('cache_hits_total', 'Number of cache hits')
+            $ CACHE_HITS.set_function(lambda: cache.hits)
+
+Classes:
+    Counter: Value that only increases
+    Gauge: Value that can increase and decrease
+    Histogram: Distribution of observed values in buckets
+    Registry: Collection of metrics rendered in the Prometheus text format
+
+Attributes:
+    REGISTRY (Registry): Default registry of the metrics
+    LATENCY_BUCKETS (Tuple[float]): Default histogram buckets, in seconds
+    BYTES_BUCKETS (Tuple[float]): Histogram buckets for message sizes, in bytes
+"""
+import abc
+import bisect
+import contextlib
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+BYTES_BUCKETS = (16, 64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+def _format_value(value: float) -> str:
+    """
+    :param value: Sample value
+    :return: Value in the Prometheus text format
+    """
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+    """
+    :param label_names: Names of the labels
+    :param label_values: Values of the labels
+    :return: Labels in the Prometheus text format, empty string if there are no labels
+    """
+    if not label_names:
+        return ''
+    labels = ('{}="{}"'.format(_name, str(_value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"'))
+              for _name, _value in zip(label_names, label_values))
+    return '{{{}}}'.format(','.join(labels))
+
+
+class _Metric(abc.ABC):
+    """
+    Base class of the metrics, it keeps the children of each combination of label values
+    """
+    metric_type = ''
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (), registry: 'Registry' = None):
+        """
+        Constructor of the metric, it is registered in `registry`
+
+        :param name: Metric name
+        :param documentation: Metric description
+        :param label_names: Names of the labels. Default no labels
+        :param registry: Registry where the metric is registered. Default `REGISTRY`
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._children = {}
+        self._lock = threading.Lock()
+        (registry if registry is not None else REGISTRY).register(self)
+
+    @abc.abstractmethod
+    def _new_child(self):
+        """
+        :return: New child metric
+        """
+
+    def labels(self, *label_values: str):
+        """
+        Get the child metric of the label values, it is created if it does not exist
+
+        :param label_values: One value for each label name
+        :return: Child metric
+        :raise ValueError: If the number of values is not the number of label names
+        """
+        if len(label_values) != len(self.label_names):
+            raise ValueError('Metric "{}" expects the labels {}'.format(self.name, self.label_names))
+        child = self._children.get(label_values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(label_values, self._new_child())
+        return child
+
+    @abc.abstractmethod
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        """
+        :return: Name suffix, formatted labels and value of each sample of the metric
+        """
+
+    def render(self) -> List[str]:
+        """
+        :return: Lines of the metric in the Prometheus text format
+        """
+        lines = ['# HELP {} {}'.format(self.name, self.documentation),
+                 '# TYPE {} {}'.format(self.name, self.metric_type)]
+        lines.extend('{}{}{} {}'.format(self.name, _suffix, _labels, _format_value(_value))
+                     for _suffix, _labels, _value in self.samples())
+        return lines
+
+
+class _ValueChild:
+    """
+    Child of a Counter or a Gauge
+    """
+
+    def __init__(self):
+        """
+        Constructor of the child, its value starts at 0
+        """
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        :param amount: Amount to add to the value. Default 1
+        :return:
+        """
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        """
+        :param amount: Amount to subtract from the value. Default 1
+        :return:
+        """
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        """
+        :param value: New value
+        :return:
+        """
+        with self._lock:
+            self.value = value
+
+
+class _FunctionChild:  # pylint: disable=too-few-public-methods
+    """
+    Child of a Counter or a Gauge whose value is returned by a function
+    """
+
+    def __init__(self, function: Callable[[], float]):
+        """
+        :param function: Returns the current value
+        """
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        """
+        :return: Current value, returned by the function
+        """
+        return self._function()
+
+
+class Counter(_Metric):
+    """
+    Metric with a value that only increases, e.g. the number of requests
+    """
+    metric_type = 'counter'
+
+    def _new_child(self) -> _ValueChild:
+        """
+        :return: New child counter
+        """
+        return _ValueChild()
+
+    def set_function(self, function: Callable[[], float], *label_values: str) -> None:
+        """
+        Read the value of the child of the label values from a function, called when the metric is rendered
+
+        :param function: Returns the current value
+        :param label_values: One value for each label name
+        :return:
+        :raise ValueError: If the number of values is not the number of label names
+        """
+        if len(label_values) != len(self.label_names):
+            raise ValueError('Metric "{}" expects the labels {}'.format(self.name, self.label_names))
+        with self._lock:
+            self._children[label_values] = _FunctionChild(function)
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        """
+        :return: A sample for each child
+        """
+        for label_values, child in list(self._children.items()):
+            yield '', _format_labels(self.label_names, label_values), child.value
+
+
+class Gauge(Counter):
+    """
+    Metric with a value that can increase and decrease, e.g. the number of requests in flight
+    """
+    metric_type = 'gauge'
+
+
+class _HistogramChild:
+    """
+    Child of a Histogram
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        """
+        :param buckets: Upper bounds of the buckets, sorted
+        """
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Add a value to the bucket of the smallest upper bound that is bigger or equal than the value
+
+        :param value: Observed value
+        :return:
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.sum += value
+
+    @contextlib.contextmanager
+    def time(self) -> Iterator[None]:
+        """
+        Observe the seconds that the `with` statement takes
+        :return:
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Histogram(_Metric):
+    """
+    Metric with the distribution of the observed values, e.g. the latency of the requests
+    """
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),  # pylint: disable=too-many-arguments
+                 buckets: Sequence[float] = LATENCY_BUCKETS, registry: 'Registry' = None):
+        """
+        Constructor of the histogram, it is registered in `registry`
+
+        :param name: Metric name
+        :param documentation: Metric description
+        :param label_names: Names of the labels. Default no labels
+        :param buckets: Upper bounds of the buckets. Default `LATENCY_BUCKETS`
+        :param registry: Registry where the metric is registered. Default `REGISTRY`
+        """
+        self.buckets = tuple(sorted(float(_bucket) for _bucket in buckets))
+        super().__init__(name, documentation, label_names, registry)
+
+    def _new_child(self) -> _HistogramChild:
+        """
+        :return: New child histogram
+        """
+        return _HistogramChild(self.buckets)
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        """
+        :return: The cumulative count of each bucket, the sum and the count of each child
+        """
+        label_names = self.label_names + ('le',)
+        for label_values, child in list(self._children.items()):
+            with child._lock:  # pylint: disable=protected-access
+                bucket_counts = list(child.bucket_counts)
+                values_sum = child.sum
+            cumulative_count = 0
+            for upper_bound, bucket_count in zip(self.buckets + (math.inf,), bucket_counts):
+                cumulative_count += bucket_count
+                yield '_bucket', _format_labels(label_names, label_values + (_format_value(upper_bound),)), \
+                    cumulative_count
+            labels = _format_labels(self.label_names, label_values)
+            yield '_sum', labels, values_sum
+            yield '_count', labels, cumulative_count
+
+
+class Registry:
+    """
+    Collection of metrics rendered in the Prometheus text format
+    """
+
+    def __init__(self):
+        """
+        Constructor of an empty registry
+        """
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> None:
+        """
+        :param metric: Metric to add to the registry
+        :return:
+        :raise ValueError: If a metric with the same name is already registered
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError('Metric "{}" is already registered'.format(metric.name))
+            self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """
+        :return: All the metrics in the Prometheus text format
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
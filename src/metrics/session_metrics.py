@@ -0,0 +1,38 @@
+"""
+This module contains the metrics of the operations of the `TodoLists.Session` streams. The operations run the unary
+gRPC methods inside the stream, not as RPCs, so they are not recorded by the metrics of the server interceptors,
+only the whole Session stream is.
+
+Attributes:
+    SESSION_OPERATIONS_HANDLED (metrics.registry.Counter): Number of completed Session operations by operation
+     and status code
+    SESSION_OPERATION_SECONDS (metrics.registry.Histogram): Latency of the Session operations by operation
+    session_metrics.observe_session_operation (function): Record a completed Session operation
+"""
+import time
+
+import grpc
+
+from metrics.registry import Counter, Histogram
+
+SESSION_OPERATIONS_HANDLED = Counter('todolists_session_operations_handled_total',
+                                     'Number of Session operations completed on the server, by operation, `create`, '
+                                     '`get`, `delete` or `list`, and status code.',
+                                     ['operation', 'grpc_code'])
+SESSION_OPERATION_SECONDS = Histogram('todolists_session_operation_seconds',
+                                      'Latency of the Session operations, in seconds, including the time waiting '
+                                      'for the admission control.',
+                                      ['operation'])
+
+
+def observe_session_operation(operation: str, code: grpc.StatusCode, start: float) -> None:
+    """
+    Record a completed Session operation
+
+    :param operation: Name of the operation, the `SessionRequest.operation` field
+    :param code: Status code of the operation, `OK` if it did not fail
+    :param start: `time.perf_counter()` when the operation started
+    :return:
+    """
+    SESSION_OPERATION_SECONDS.labels(operation).observe(time.perf_counter() - start)
+    SESSION_OPERATIONS_HANDLED.labels(operation, code.name).inc()
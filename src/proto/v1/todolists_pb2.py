@@ -18,7 +18,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   package='todolists',
   syntax='proto3',
   serialized_options=None,
-  serialized_pb=b'\n\x18proto/v1/todolists.proto\x12\ttodolists\"\x07\n\x05\x45mpty\"\x1f\n\x11\x44\x65leteListRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\x1c\n\x0eGetListRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"$\n\x08TodoList\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"!\n\x11\x43reateListRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"+\n\x0f\x43reateListReply\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\">\n\x14ListTodoListsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x13\n\x0bpage_number\x18\x02 \x01(\x05\"f\n\x12ListTodoListsReply\x12\'\n\ntodo_lists\x18\x01 \x03(\x0b\x32\x13.todolists.TodoList\x12\x18\n\x10next_page_number\x18\x02 \x01(\t\x12\r\n\x05\x63ount\x18\x03 \x01(\x05\x32\x88\x02\n\tTodoLists\x12\x42\n\x06\x43reate\x12\x1c.todolists.CreateListRequest\x1a\x1a.todolists.CreateListReply\x12\x35\n\x03Get\x12\x19.todolists.GetListRequest\x1a\x13.todolists.TodoList\x12\x38\n\x06\x44\x65lete\x12\x1c.todolists.DeleteListRequest\x1a\x10.todolists.Empty\x12\x46\n\x04List\x12\x1f.todolists.ListTodoListsRequest\x1a\x1d.todolists.ListTodoListsReplyb\x06proto3'
+  serialized_pb=b'\n\x18proto/v1/todolists.proto\x12\ttodolists\"\x07\n\x05\x45mpty\"\x1f\n\x11\x44\x65leteListRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\x1c\n\x0eGetListRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"$\n\x08TodoList\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"!\n\x11\x43reateListRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"+\n\x0f\x43reateListReply\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"f\n\x14ListTodoListsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x13\n\x0bpage_number\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12\x12\n\nskip_count\x18\x04 \x01(\x08\"\x7f\n\x12ListTodoListsReply\x12\'\n\ntodo_lists\x18\x01 \x03(\x0b\x32\x13.todolists.TodoList\x12\x18\n\x10next_page_number\x18\x02 \x01(\t\x12\r\n\x05\x63ount\x18\x03 \x01(\x05\x12\x17\n\x0fnext_page_token\x18\x04 \x01(\t\"&\n\x12StreamListsRequest\x12\x10\n\x08\x61\x66ter_id\x18\x01 \x01(\x05\"(\n\x17\x42\x61tchCreateListsRequest\x12\r\n\x05names\x18\x01 \x03(\t\"Q\n\x15\x42\x61tchCreateListResult\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07\x63reated\x18\x03 \x01(\x08\x12\r\n\x05\x65rror\x18\x04 \x01(\t\"J\n\x15\x42\x61tchCreateListsReply\x12\x31\n\x07results\x18\x01 \x03(\x0b\x32 .todolists.BatchCreateListResult\"#\n\x14\x42\x61tchGetListsRequest\x12\x0b\n\x03ids\x18\x01 \x03(\x05\"R\n\x12\x42\x61tchGetListsReply\x12\'\n\ntodo_lists\x18\x01 \x03(\x0b\x32\x13.todolists.TodoList\x12\x13\n\x0bmissing_ids\x18\x02 \x03(\x05\"&\n\x17\x42\x61tchDeleteListsRequest\x12\x0b\n\x03ids\x18\x01 \x03(\x05\"C\n\x15\x42\x61tchDeleteListsReply\x12\x13\n\x0b\x64\x65leted_ids\x18\x01 \x03(\x05\x12\x15\n\rnot_found_ids\x18\x02 \x03(\x05\"#\n\x12ImportListsRequest\x12\r\n\x05names\x18\x01 \x03(\t\"=\n\x0fImportListError\x12\r\n\x05index\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\t\"d\n\x10ImportListsReply\x12\x10\n\x08inserted\x18\x01 \x01(\x03\x12\x12\n\nduplicates\x18\x02 \x01(\x03\x12*\n\x06\x65rrors\x18\x03 \x03(\x0b\x32\x1a.todolists.ImportListError\"\xf0\x01\n\x0eSessionRequest\x12\x16\n\x0e\x63orrelation_id\x18\x01 \x01(\x03\x12.\n\x06\x63reate\x18\x02 \x01(\x0b\x32\x1c.todolists.CreateListRequestH\x00\x12(\n\x03get\x18\x03 \x01(\x0b\x32\x19.todolists.GetListRequestH\x00\x12.\n\x06\x64\x65lete\x18\x04 \x01(\x0b\x32\x1c.todolists.DeleteListRequestH\x00\x12/\n\x04list\x18\x05 \x01(\x0b\x32\x1f.todolists.ListTodoListsRequestH\x00\x42\x0b\n\toperation\"-\n\x0cSessionError\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\"\xff\x01\n\x0cSessionReply\x12\x16\n\x0e\x63orrelation_id\x18\x01 \x01(\x03\x12,\n\x06\x63reate\x18\x02 \x01(\x0b\x32\x1a.todolists.CreateListReplyH\x00\x12\"\n\x03get\x18\x03 \x01(\x0b\x32\x13.todolists.TodoListH\x00\x12\"\n\x06\x64\x65lete\x18\x04 \x01(\x0b\x32\x10.todolists.EmptyH\x00\x12-\n\x04list\x18\x05 \x01(\x0b\x32\x1d.todolists.ListTodoListsReplyH\x00\x12(\n\x05\x65rror\x18\x06 \x01(\x0b\x32\x17.todolists.SessionErrorH\x00\x42\x08\n\x06result2\xd3\x05\n\tTodoLists\x12\x42\n\x06\x43reate\x12\x1c.todolists.CreateListRequest\x1a\x1a.todolists.CreateListReply\x12\x35\n\x03Get\x12\x19.todolists.GetListRequest\x1a\x13.todolists.TodoList\x12\x38\n\x06\x44\x65lete\x12\x1c.todolists.DeleteListRequest\x1a\x10.todolists.Empty\x12\x46\n\x04List\x12\x1f.todolists.ListTodoListsRequest\x1a\x1d.todolists.ListTodoListsReply\x12\x43\n\x0bStreamLists\x12\x1d.todolists.StreamListsRequest\x1a\x13.todolists.TodoList0\x01\x12S\n\x0b\x42\x61tchCreate\x12\".todolists.BatchCreateListsRequest\x1a .todolists.BatchCreateListsReply\x12J\n\x08\x42\x61tchGet\x12\x1f.todolists.BatchGetListsRequest\x1a\x1d.todolists.BatchGetListsReply\x12S\n\x0b\x42\x61tchDelete\x12\".todolists.BatchDeleteListsRequest\x1a .todolists.BatchDeleteListsReply\x12K\n\x0bImportLists\x12\x1d.todolists.ImportListsRequest\x1a\x1b.todolists.ImportListsReply(\x01\x12\x41\n\x07Session\x12\x19.todolists.SessionRequest\x1a\x17.todolists.SessionReply(\x01\x30\x01\x62\x06proto3'
 )
 
 
@@ -238,6 +238,20 @@ _LISTTODOLISTSREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='page_token', full_name='todolists.ListTodoListsRequest.page_token', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='skip_count', full_name='todolists.ListTodoListsRequest.skip_count', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -251,7 +265,7 @@ _LISTTODOLISTSREQUEST = _descriptor.Descriptor(
   oneofs=[
   ],
   serialized_start=229,
-  serialized_end=291,
+  serialized_end=331,
 )
 
 
@@ -283,6 +297,476 @@ _LISTTODOLISTSREPLY = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='next_page_token', full_name='todolists.ListTodoListsReply.next_page_token', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=333,
+  serialized_end=460,
+)
+
+
+_STREAMLISTSREQUEST = _descriptor.Descriptor(
+  name='StreamListsRequest',
+  full_name='todolists.StreamListsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='after_id', full_name='todolists.StreamListsRequest.after_id', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=462,
+  serialized_end=500,
+)
+
+
+_BATCHCREATELISTSREQUEST = _descriptor.Descriptor(
+  name='BatchCreateListsRequest',
+  full_name='todolists.BatchCreateListsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='names', full_name='todolists.BatchCreateListsRequest.names', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=502,
+  serialized_end=542,
+)
+
+
+_BATCHCREATELISTRESULT = _descriptor.Descriptor(
+  name='BatchCreateListResult',
+  full_name='todolists.BatchCreateListResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='id', full_name='todolists.BatchCreateListResult.id', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='todolists.BatchCreateListResult.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='created', full_name='todolists.BatchCreateListResult.created', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='todolists.BatchCreateListResult.error', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=544,
+  serialized_end=625,
+)
+
+
+_BATCHCREATELISTSREPLY = _descriptor.Descriptor(
+  name='BatchCreateListsReply',
+  full_name='todolists.BatchCreateListsReply',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='results', full_name='todolists.BatchCreateListsReply.results', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=627,
+  serialized_end=701,
+)
+
+
+_BATCHGETLISTSREQUEST = _descriptor.Descriptor(
+  name='BatchGetListsRequest',
+  full_name='todolists.BatchGetListsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='ids', full_name='todolists.BatchGetListsRequest.ids', index=0,
+      number=1, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=703,
+  serialized_end=738,
+)
+
+
+_BATCHGETLISTSREPLY = _descriptor.Descriptor(
+  name='BatchGetListsReply',
+  full_name='todolists.BatchGetListsReply',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='todo_lists', full_name='todolists.BatchGetListsReply.todo_lists', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='missing_ids', full_name='todolists.BatchGetListsReply.missing_ids', index=1,
+      number=2, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=740,
+  serialized_end=822,
+)
+
+
+_BATCHDELETELISTSREQUEST = _descriptor.Descriptor(
+  name='BatchDeleteListsRequest',
+  full_name='todolists.BatchDeleteListsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='ids', full_name='todolists.BatchDeleteListsRequest.ids', index=0,
+      number=1, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=824,
+  serialized_end=862,
+)
+
+
+_BATCHDELETELISTSREPLY = _descriptor.Descriptor(
+  name='BatchDeleteListsReply',
+  full_name='todolists.BatchDeleteListsReply',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='deleted_ids', full_name='todolists.BatchDeleteListsReply.deleted_ids', index=0,
+      number=1, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='not_found_ids', full_name='todolists.BatchDeleteListsReply.not_found_ids', index=1,
+      number=2, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=864,
+  serialized_end=931,
+)
+
+
+_IMPORTLISTSREQUEST = _descriptor.Descriptor(
+  name='ImportListsRequest',
+  full_name='todolists.ImportListsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='names', full_name='todolists.ImportListsRequest.names', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=933,
+  serialized_end=968,
+)
+
+
+_IMPORTLISTERROR = _descriptor.Descriptor(
+  name='ImportListError',
+  full_name='todolists.ImportListError',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='index', full_name='todolists.ImportListError.index', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='todolists.ImportListError.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='todolists.ImportListError.error', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=970,
+  serialized_end=1031,
+)
+
+
+_IMPORTLISTSREPLY = _descriptor.Descriptor(
+  name='ImportListsReply',
+  full_name='todolists.ImportListsReply',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='inserted', full_name='todolists.ImportListsReply.inserted', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='duplicates', full_name='todolists.ImportListsReply.duplicates', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='errors', full_name='todolists.ImportListsReply.errors', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1033,
+  serialized_end=1133,
+)
+
+
+_SESSIONREQUEST = _descriptor.Descriptor(
+  name='SessionRequest',
+  full_name='todolists.SessionRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='correlation_id', full_name='todolists.SessionRequest.correlation_id', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='create', full_name='todolists.SessionRequest.create', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='get', full_name='todolists.SessionRequest.get', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='delete', full_name='todolists.SessionRequest.delete', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='list', full_name='todolists.SessionRequest.list', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -294,12 +778,161 @@ _LISTTODOLISTSREPLY = _descriptor.Descriptor(
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
+    _descriptor.OneofDescriptor(
+      name='operation', full_name='todolists.SessionRequest.operation',
+      index=0, containing_type=None, fields=[]),
   ],
-  serialized_start=293,
-  serialized_end=395,
+  serialized_start=1136,
+  serialized_end=1376,
+)
+
+
+_SESSIONERROR = _descriptor.Descriptor(
+  name='SessionError',
+  full_name='todolists.SessionError',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='code', full_name='todolists.SessionError.code', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='message', full_name='todolists.SessionError.message', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1378,
+  serialized_end=1423,
+)
+
+
+_SESSIONREPLY = _descriptor.Descriptor(
+  name='SessionReply',
+  full_name='todolists.SessionReply',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='correlation_id', full_name='todolists.SessionReply.correlation_id', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='create', full_name='todolists.SessionReply.create', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='get', full_name='todolists.SessionReply.get', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='delete', full_name='todolists.SessionReply.delete', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='list', full_name='todolists.SessionReply.list', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='todolists.SessionReply.error', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='result', full_name='todolists.SessionReply.result',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=1426,
+  serialized_end=1681,
 )
 
 _LISTTODOLISTSREPLY.fields_by_name['todo_lists'].message_type = _TODOLIST
+_BATCHCREATELISTSREPLY.fields_by_name['results'].message_type = _BATCHCREATELISTRESULT
+_BATCHGETLISTSREPLY.fields_by_name['todo_lists'].message_type = _TODOLIST
+_IMPORTLISTSREPLY.fields_by_name['errors'].message_type = _IMPORTLISTERROR
+_SESSIONREQUEST.fields_by_name['create'].message_type = _CREATELISTREQUEST
+_SESSIONREQUEST.fields_by_name['get'].message_type = _GETLISTREQUEST
+_SESSIONREQUEST.fields_by_name['delete'].message_type = _DELETELISTREQUEST
+_SESSIONREQUEST.fields_by_name['list'].message_type = _LISTTODOLISTSREQUEST
+_SESSIONREQUEST.oneofs_by_name['operation'].fields.append(
+  _SESSIONREQUEST.fields_by_name['create'])
+_SESSIONREQUEST.fields_by_name['create'].containing_oneof = _SESSIONREQUEST.oneofs_by_name['operation']
+_SESSIONREQUEST.oneofs_by_name['operation'].fields.append(
+  _SESSIONREQUEST.fields_by_name['get'])
+_SESSIONREQUEST.fields_by_name['get'].containing_oneof = _SESSIONREQUEST.oneofs_by_name['operation']
+_SESSIONREQUEST.oneofs_by_name['operation'].fields.append(
+  _SESSIONREQUEST.fields_by_name['delete'])
+_SESSIONREQUEST.fields_by_name['delete'].containing_oneof = _SESSIONREQUEST.oneofs_by_name['operation']
+_SESSIONREQUEST.oneofs_by_name['operation'].fields.append(
+  _SESSIONREQUEST.fields_by_name['list'])
+_SESSIONREQUEST.fields_by_name['list'].containing_oneof = _SESSIONREQUEST.oneofs_by_name['operation']
+_SESSIONREPLY.fields_by_name['create'].message_type = _CREATELISTREPLY
+_SESSIONREPLY.fields_by_name['get'].message_type = _TODOLIST
+_SESSIONREPLY.fields_by_name['delete'].message_type = _EMPTY
+_SESSIONREPLY.fields_by_name['list'].message_type = _LISTTODOLISTSREPLY
+_SESSIONREPLY.fields_by_name['error'].message_type = _SESSIONERROR
+_SESSIONREPLY.oneofs_by_name['result'].fields.append(
+  _SESSIONREPLY.fields_by_name['create'])
+_SESSIONREPLY.fields_by_name['create'].containing_oneof = _SESSIONREPLY.oneofs_by_name['result']
+_SESSIONREPLY.oneofs_by_name['result'].fields.append(
+  _SESSIONREPLY.fields_by_name['get'])
+_SESSIONREPLY.fields_by_name['get'].containing_oneof = _SESSIONREPLY.oneofs_by_name['result']
+_SESSIONREPLY.oneofs_by_name['result'].fields.append(
+  _SESSIONREPLY.fields_by_name['delete'])
+_SESSIONREPLY.fields_by_name['delete'].containing_oneof = _SESSIONREPLY.oneofs_by_name['result']
+_SESSIONREPLY.oneofs_by_name['result'].fields.append(
+  _SESSIONREPLY.fields_by_name['list'])
+_SESSIONREPLY.fields_by_name['list'].containing_oneof = _SESSIONREPLY.oneofs_by_name['result']
+_SESSIONREPLY.oneofs_by_name['result'].fields.append(
+  _SESSIONREPLY.fields_by_name['error'])
+_SESSIONREPLY.fields_by_name['error'].containing_oneof = _SESSIONREPLY.oneofs_by_name['result']
 DESCRIPTOR.message_types_by_name['Empty'] = _EMPTY
 DESCRIPTOR.message_types_by_name['DeleteListRequest'] = _DELETELISTREQUEST
 DESCRIPTOR.message_types_by_name['GetListRequest'] = _GETLISTREQUEST
@@ -308,6 +941,20 @@ DESCRIPTOR.message_types_by_name['CreateListRequest'] = _CREATELISTREQUEST
 DESCRIPTOR.message_types_by_name['CreateListReply'] = _CREATELISTREPLY
 DESCRIPTOR.message_types_by_name['ListTodoListsRequest'] = _LISTTODOLISTSREQUEST
 DESCRIPTOR.message_types_by_name['ListTodoListsReply'] = _LISTTODOLISTSREPLY
+DESCRIPTOR.message_types_by_name['StreamListsRequest'] = _STREAMLISTSREQUEST
+DESCRIPTOR.message_types_by_name['BatchCreateListsRequest'] = _BATCHCREATELISTSREQUEST
+DESCRIPTOR.message_types_by_name['BatchCreateListResult'] = _BATCHCREATELISTRESULT
+DESCRIPTOR.message_types_by_name['BatchCreateListsReply'] = _BATCHCREATELISTSREPLY
+DESCRIPTOR.message_types_by_name['BatchGetListsRequest'] = _BATCHGETLISTSREQUEST
+DESCRIPTOR.message_types_by_name['BatchGetListsReply'] = _BATCHGETLISTSREPLY
+DESCRIPTOR.message_types_by_name['BatchDeleteListsRequest'] = _BATCHDELETELISTSREQUEST
+DESCRIPTOR.message_types_by_name['BatchDeleteListsReply'] = _BATCHDELETELISTSREPLY
+DESCRIPTOR.message_types_by_name['ImportListsRequest'] = _IMPORTLISTSREQUEST
+DESCRIPTOR.message_types_by_name['ImportListError'] = _IMPORTLISTERROR
+DESCRIPTOR.message_types_by_name['ImportListsReply'] = _IMPORTLISTSREPLY
+DESCRIPTOR.message_types_by_name['SessionRequest'] = _SESSIONREQUEST
+DESCRIPTOR.message_types_by_name['SessionError'] = _SESSIONERROR
+DESCRIPTOR.message_types_by_name['SessionReply'] = _SESSIONREPLY
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 Empty = _reflection.GeneratedProtocolMessageType('Empty', (_message.Message,), {
@@ -366,6 +1013,104 @@ ListTodoListsReply = _reflection.GeneratedProtocolMessageType('ListTodoListsRepl
   })
 _sym_db.RegisterMessage(ListTodoListsReply)
 
+StreamListsRequest = _reflection.GeneratedProtocolMessageType('StreamListsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _STREAMLISTSREQUEST,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.StreamListsRequest)
+  })
+_sym_db.RegisterMessage(StreamListsRequest)
+
+BatchCreateListsRequest = _reflection.GeneratedProtocolMessageType('BatchCreateListsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _BATCHCREATELISTSREQUEST,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.BatchCreateListsRequest)
+  })
+_sym_db.RegisterMessage(BatchCreateListsRequest)
+
+BatchCreateListResult = _reflection.GeneratedProtocolMessageType('BatchCreateListResult', (_message.Message,), {
+  'DESCRIPTOR' : _BATCHCREATELISTRESULT,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.BatchCreateListResult)
+  })
+_sym_db.RegisterMessage(BatchCreateListResult)
+
+BatchCreateListsReply = _reflection.GeneratedProtocolMessageType('BatchCreateListsReply', (_message.Message,), {
+  'DESCRIPTOR' : _BATCHCREATELISTSREPLY,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.BatchCreateListsReply)
+  })
+_sym_db.RegisterMessage(BatchCreateListsReply)
+
+BatchGetListsRequest = _reflection.GeneratedProtocolMessageType('BatchGetListsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _BATCHGETLISTSREQUEST,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.BatchGetListsRequest)
+  })
+_sym_db.RegisterMessage(BatchGetListsRequest)
+
+BatchGetListsReply = _reflection.GeneratedProtocolMessageType('BatchGetListsReply', (_message.Message,), {
+  'DESCRIPTOR' : _BATCHGETLISTSREPLY,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.BatchGetListsReply)
+  })
+_sym_db.RegisterMessage(BatchGetListsReply)
+
+BatchDeleteListsRequest = _reflection.GeneratedProtocolMessageType('BatchDeleteListsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _BATCHDELETELISTSREQUEST,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.BatchDeleteListsRequest)
+  })
+_sym_db.RegisterMessage(BatchDeleteListsRequest)
+
+BatchDeleteListsReply = _reflection.GeneratedProtocolMessageType('BatchDeleteListsReply', (_message.Message,), {
+  'DESCRIPTOR' : _BATCHDELETELISTSREPLY,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.BatchDeleteListsReply)
+  })
+_sym_db.RegisterMessage(BatchDeleteListsReply)
+
+ImportListsRequest = _reflection.GeneratedProtocolMessageType('ImportListsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _IMPORTLISTSREQUEST,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.ImportListsRequest)
+  })
+_sym_db.RegisterMessage(ImportListsRequest)
+
+ImportListError = _reflection.GeneratedProtocolMessageType('ImportListError', (_message.Message,), {
+  'DESCRIPTOR' : _IMPORTLISTERROR,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.ImportListError)
+  })
+_sym_db.RegisterMessage(ImportListError)
+
+ImportListsReply = _reflection.GeneratedProtocolMessageType('ImportListsReply', (_message.Message,), {
+  'DESCRIPTOR' : _IMPORTLISTSREPLY,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.ImportListsReply)
+  })
+_sym_db.RegisterMessage(ImportListsReply)
+
+SessionRequest = _reflection.GeneratedProtocolMessageType('SessionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONREQUEST,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.SessionRequest)
+  })
+_sym_db.RegisterMessage(SessionRequest)
+
+SessionError = _reflection.GeneratedProtocolMessageType('SessionError', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONERROR,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.SessionError)
+  })
+_sym_db.RegisterMessage(SessionError)
+
+SessionReply = _reflection.GeneratedProtocolMessageType('SessionReply', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONREPLY,
+  '__module__' : 'proto.v1.todolists_pb2'
+  # @@protoc_insertion_point(class_scope:todolists.SessionReply)
+  })
+_sym_db.RegisterMessage(SessionReply)
+
 
 
 _TODOLISTS = _descriptor.ServiceDescriptor(
@@ -374,8 +1119,8 @@ _TODOLISTS = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   serialized_options=None,
-  serialized_start=398,
-  serialized_end=662,
+  serialized_start=1684,
+  serialized_end=2407,
   methods=[
   _descriptor.MethodDescriptor(
     name='Create',
@@ -413,6 +1158,60 @@ _TODOLISTS = _descriptor.ServiceDescriptor(
     output_type=_LISTTODOLISTSREPLY,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='StreamLists',
+    full_name='todolists.TodoLists.StreamLists',
+    index=4,
+    containing_service=None,
+    input_type=_STREAMLISTSREQUEST,
+    output_type=_TODOLIST,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='BatchCreate',
+    full_name='todolists.TodoLists.BatchCreate',
+    index=5,
+    containing_service=None,
+    input_type=_BATCHCREATELISTSREQUEST,
+    output_type=_BATCHCREATELISTSREPLY,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='BatchGet',
+    full_name='todolists.TodoLists.BatchGet',
+    index=6,
+    containing_service=None,
+    input_type=_BATCHGETLISTSREQUEST,
+    output_type=_BATCHGETLISTSREPLY,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='BatchDelete',
+    full_name='todolists.TodoLists.BatchDelete',
+    index=7,
+    containing_service=None,
+    input_type=_BATCHDELETELISTSREQUEST,
+    output_type=_BATCHDELETELISTSREPLY,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ImportLists',
+    full_name='todolists.TodoLists.ImportLists',
+    index=8,
+    containing_service=None,
+    input_type=_IMPORTLISTSREQUEST,
+    output_type=_IMPORTLISTSREPLY,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Session',
+    full_name='todolists.TodoLists.Session',
+    index=9,
+    containing_service=None,
+    input_type=_SESSIONREQUEST,
+    output_type=_SESSIONREPLY,
+    serialized_options=None,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_TODOLISTS)
 
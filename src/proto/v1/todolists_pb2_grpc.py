@@ -34,6 +34,36 @@ class TodoListsStub(object):
                 request_serializer=proto_dot_v1_dot_todolists__pb2.ListTodoListsRequest.SerializeToString,
                 response_deserializer=proto_dot_v1_dot_todolists__pb2.ListTodoListsReply.FromString,
                 )
+        self.StreamLists = channel.unary_stream(
+                '/todolists.TodoLists/StreamLists',
+                request_serializer=proto_dot_v1_dot_todolists__pb2.StreamListsRequest.SerializeToString,
+                response_deserializer=proto_dot_v1_dot_todolists__pb2.TodoList.FromString,
+                )
+        self.BatchCreate = channel.unary_unary(
+                '/todolists.TodoLists/BatchCreate',
+                request_serializer=proto_dot_v1_dot_todolists__pb2.BatchCreateListsRequest.SerializeToString,
+                response_deserializer=proto_dot_v1_dot_todolists__pb2.BatchCreateListsReply.FromString,
+                )
+        self.BatchGet = channel.unary_unary(
+                '/todolists.TodoLists/BatchGet',
+                request_serializer=proto_dot_v1_dot_todolists__pb2.BatchGetListsRequest.SerializeToString,
+                response_deserializer=proto_dot_v1_dot_todolists__pb2.BatchGetListsReply.FromString,
+                )
+        self.BatchDelete = channel.unary_unary(
+                '/todolists.TodoLists/BatchDelete',
+                request_serializer=proto_dot_v1_dot_todolists__pb2.BatchDeleteListsRequest.SerializeToString,
+                response_deserializer=proto_dot_v1_dot_todolists__pb2.BatchDeleteListsReply.FromString,
+                )
+        self.ImportLists = channel.stream_unary(
+                '/todolists.TodoLists/ImportLists',
+                request_serializer=proto_dot_v1_dot_todolists__pb2.ImportListsRequest.SerializeToString,
+                response_deserializer=proto_dot_v1_dot_todolists__pb2.ImportListsReply.FromString,
+                )
+        self.Session = channel.stream_stream(
+                '/todolists.TodoLists/Session',
+                request_serializer=proto_dot_v1_dot_todolists__pb2.SessionRequest.SerializeToString,
+                response_deserializer=proto_dot_v1_dot_todolists__pb2.SessionReply.FromString,
+                )
 
 
 class TodoListsServicer(object):
@@ -68,6 +98,48 @@ class TodoListsServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamLists(self, request, context):
+        """Stream all the TodoLists ordered by id
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchCreate(self, request, context):
+        """Create many lists in a single transaction
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchGet(self, request, context):
+        """Get many lists in a single request
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchDelete(self, request, context):
+        """Delete many lists in a single transaction
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ImportLists(self, request_iterator, context):
+        """Import the lists streamed by the client, inserted in chunks of transactions
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Session(self, request_iterator, context):
+        """Run a stream of Create, Get, Delete and List operations, their results are streamed as they complete
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_TodoListsServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -91,6 +163,36 @@ def add_TodoListsServicer_to_server(servicer, server):
                     request_deserializer=proto_dot_v1_dot_todolists__pb2.ListTodoListsRequest.FromString,
                     response_serializer=proto_dot_v1_dot_todolists__pb2.ListTodoListsReply.SerializeToString,
             ),
+            'StreamLists': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamLists,
+                    request_deserializer=proto_dot_v1_dot_todolists__pb2.StreamListsRequest.FromString,
+                    response_serializer=proto_dot_v1_dot_todolists__pb2.TodoList.SerializeToString,
+            ),
+            'BatchCreate': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchCreate,
+                    request_deserializer=proto_dot_v1_dot_todolists__pb2.BatchCreateListsRequest.FromString,
+                    response_serializer=proto_dot_v1_dot_todolists__pb2.BatchCreateListsReply.SerializeToString,
+            ),
+            'BatchGet': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGet,
+                    request_deserializer=proto_dot_v1_dot_todolists__pb2.BatchGetListsRequest.FromString,
+                    response_serializer=proto_dot_v1_dot_todolists__pb2.BatchGetListsReply.SerializeToString,
+            ),
+            'BatchDelete': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchDelete,
+                    request_deserializer=proto_dot_v1_dot_todolists__pb2.BatchDeleteListsRequest.FromString,
+                    response_serializer=proto_dot_v1_dot_todolists__pb2.BatchDeleteListsReply.SerializeToString,
+            ),
+            'ImportLists': grpc.stream_unary_rpc_method_handler(
+                    servicer.ImportLists,
+                    request_deserializer=proto_dot_v1_dot_todolists__pb2.ImportListsRequest.FromString,
+                    response_serializer=proto_dot_v1_dot_todolists__pb2.ImportListsReply.SerializeToString,
+            ),
+            'Session': grpc.stream_stream_rpc_method_handler(
+                    servicer.Session,
+                    request_deserializer=proto_dot_v1_dot_todolists__pb2.SessionRequest.FromString,
+                    response_serializer=proto_dot_v1_dot_todolists__pb2.SessionReply.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'todolists.TodoLists', rpc_method_handlers)
@@ -165,3 +267,99 @@ class TodoLists(object):
             proto_dot_v1_dot_todolists__pb2.ListTodoListsReply.FromString,
             options, channel_credentials,
             call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def StreamLists(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/todolists.TodoLists/StreamLists',
+            proto_dot_v1_dot_todolists__pb2.StreamListsRequest.SerializeToString,
+            proto_dot_v1_dot_todolists__pb2.TodoList.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def BatchCreate(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/todolists.TodoLists/BatchCreate',
+            proto_dot_v1_dot_todolists__pb2.BatchCreateListsRequest.SerializeToString,
+            proto_dot_v1_dot_todolists__pb2.BatchCreateListsReply.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def BatchGet(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/todolists.TodoLists/BatchGet',
+            proto_dot_v1_dot_todolists__pb2.BatchGetListsRequest.SerializeToString,
+            proto_dot_v1_dot_todolists__pb2.BatchGetListsReply.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def BatchDelete(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/todolists.TodoLists/BatchDelete',
+            proto_dot_v1_dot_todolists__pb2.BatchDeleteListsRequest.SerializeToString,
+            proto_dot_v1_dot_todolists__pb2.BatchDeleteListsReply.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ImportLists(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/todolists.TodoLists/ImportLists',
+            proto_dot_v1_dot_todolists__pb2.ImportListsRequest.SerializeToString,
+            proto_dot_v1_dot_todolists__pb2.ImportListsReply.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Session(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/todolists.TodoLists/Session',
+            proto_dot_v1_dot_todolists__pb2.SessionRequest.SerializeToString,
+            proto_dot_v1_dot_todolists__pb2.SessionReply.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
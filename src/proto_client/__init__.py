@@ -3,6 +3,17 @@ Python package with the gRPC client stubs
 
 Modules:
     stub_create_list: used to invoke the gRPC todolists.TodoLists.Create Stub
+    stub_batch_create_lists: used to invoke the gRPC todolists.TodoLists.BatchCreate Stub
     stub_get_list: used to invoke the gRPC todolists.TodoLists.Get Stub
+    stub_batch_get_lists: used to invoke the gRPC todolists.TodoLists.BatchGet Stub
     stub_delete_list: used to invoke the gRPC todolists.TodoLists.Delete Stub
+    stub_batch_delete_lists: used to invoke the gRPC todolists.TodoLists.BatchDelete Stub
+    stub_get_lists_paginated: used to invoke the gRPC todolists.TodoLists.List Stub
+    stub_stream_lists: used to invoke the gRPC todolists.TodoLists.StreamLists Stub
+    stub_import_lists: used to invoke the gRPC todolists.TodoLists.ImportLists Stub
+    stub_session: used to invoke the gRPC todolists.TodoLists.Session Stub
+    helpers: used to create the secured channels, and the process-wide channel pool with the cached stubs
+    compression: module with the client interceptor that compresses the requests with the compression policy
+    aio_client: asyncio client of the todolists.TodoLists Service, with concurrent bulk operations
+    load_generator: used to invoke a mix of the todolists.TodoLists Stubs under load and report their latencies
 """
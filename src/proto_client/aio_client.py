@@ -0,0 +1,251 @@
+"""
+This module is an asyncio client of the gRPC todolists.TodoLists Service, built with grpc.aio
+
+A single event loop keeps thousands of RPCs in flight without a thread per RPC, the bulk operations send the RPCs
+of many items concurrently, bounded by `max_concurrency`, and collect the replies and the errors of each item.
+
+Examples:
+        The client is used as an async context manager, the channels are closed when it exits.
+
+            $ from proto_client.aio_client import AsyncTodoListsClient
+            $ async with AsyncTodoListsClient('localhost:50051') as client:
+            $     todo_list = await client.get_list(10)
+            $     created = await client.create_many(['list1', 'list2', 'list3'])
+            $     print(created.results, created.errors)
+
+Classes:
+    BulkResult(NamedTuple): Replies and errors of a bulk operation
+    AsyncTodoListsClient: asyncio client of the todolists.TodoLists Service
+"""
+import asyncio
+import itertools
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import grpc
+from grpc import aio
+
+from config.compression import COMPRESSION_POLICY, CompressionPolicy
+from config.config import GRPC_CLIENT_CHANNEL_POOL_SIZE, ASYNC_CLIENT_MAX_CONCURRENCY
+from proto_client.helpers import create_channel_credentials
+import proto.v1.todolists_pb2 as todolists_pb2
+import proto.v1.todolists_pb2_grpc as todolists_pb2_grpc
+
+# Each channel has its own connection, instead of sharing the connection of the other channels
+_CHANNEL_OPTIONS = (('grpc.use_local_subchannel_pool', 1),)
+
+
+class BulkResult(NamedTuple):
+    """
+    Outcome of a bulk operation
+
+    Attributes:
+        results: Reply of each item, in the order of the items, None for the items that failed
+        errors: gRPC error of each item that failed, by the index of the item
+    """
+    results: List[Any]
+    errors: Dict[int, grpc.RpcError]
+
+
+class AsyncTodoListsClient:  # pylint: disable=too-many-instance-attributes
+    """
+    asyncio client of the todolists.TodoLists Service.
+
+    The client opens `channels` secured channels to the server, each one with its own connection, the first time that
+    it is used, and sends the RPCs round robin over them. It must be used from a single event loop.
+
+    The single operations raise the `grpc.aio.AioRpcError` of the failed RPCs, while the bulk operations never raise
+    them, the errors are returned in the `BulkResult` of the operation.
+    """
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 addr: str,
+                 channels: int = GRPC_CLIENT_CHANNEL_POOL_SIZE,
+                 max_concurrency: int = ASYNC_CLIENT_MAX_CONCURRENCY,
+                 timeout: Optional[float] = None,
+                 options: Sequence[Tuple[str, Any]] = (),
+                 compression_policy: CompressionPolicy = COMPRESSION_POLICY):
+        """
+        Constructor of the client, the channels are opened when the first RPC is sent
+
+        :param addr: Server address, e.g. `localhost:50051`
+        :param channels: Number of channels. Default `GRPC_CLIENT_CHANNEL_POOL_SIZE`
+        :param max_concurrency: Max number of RPCs in flight of each bulk operation. Default
+            `ASYNC_CLIENT_MAX_CONCURRENCY`
+        :param timeout: Seconds that each RPC waits for its reply, None to wait without limit. Default None
+        :param options: Extra gRPC channel arguments of the channels. Default empty
+        :param compression_policy: Compression of the requests. Default `COMPRESSION_POLICY`
+        """
+        self.addr = addr
+        self.channels_count = max(1, channels)
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.options = _CHANNEL_OPTIONS + tuple(options)
+        self.compression_policy = compression_policy
+        self._channels: List[aio.Channel] = []
+        self._stubs: List[todolists_pb2_grpc.TodoListsStub] = []
+        self._next_stub = itertools.count()
+
+    async def __aenter__(self) -> 'AsyncTodoListsClient':
+        """
+        :return: The client
+        """
+        return self
+
+    async def __aexit__(self, *_exc_info) -> None:
+        """
+        Close the channels when the `async with` block exits
+        :return:
+        """
+        await self.close()
+
+    def _get_stub(self) -> todolists_pb2_grpc.TodoListsStub:
+        """
+        Get the stub of the next channel, round robin. The channels are opened the first time
+
+        :return: TodoListsStub of a grpc.aio channel
+        """
+        if not self._stubs:
+            self._channels = [aio.secure_channel(self.addr, create_channel_credentials(), options=self.options)
+                              for _ in range(self.channels_count)]
+            self._stubs = [todolists_pb2_grpc.TodoListsStub(_channel) for _channel in self._channels]
+        return self._stubs[next(self._next_stub) % len(self._stubs)]
+
+    async def close(self) -> None:
+        """
+        Close the channels, the client opens new channels if it is used again
+        :return:
+        """
+        channels, self._channels, self._stubs = self._channels, [], []
+        await asyncio.gather(*(_channel.close() for _channel in channels))
+
+    async def _call(self, method: str, request: Any) -> Any:
+        """
+        Send an unary RPC with the next stub, compressing the request as defined by the compression policy
+
+        The grpc.aio client interceptors can not set the compression of the calls, so it is set on each call.
+
+        :param method: gRPC method name, e.g. `Get`
+        :param request: Request message
+        :return: Reply of the RPC
+        """
+        return await getattr(self._get_stub(), method)(
+            request, timeout=self.timeout, compression=self.compression_policy.message_compression(method, request))
+
+    async def create_list(self, name: str) -> todolists_pb2.CreateListReply:
+        """
+        Invoke the TodoLists.Create gRPC to create a new List with the defined name
+
+        :param name: name for the new list
+        :return: CreateListReply
+
+        :raise AioRpcError:
+            If the gRPC server is UNAVAILABLE
+            If a list with that name already exist in the database
+        """
+        return await self._call('Create', todolists_pb2.CreateListRequest(name=name))
+
+    async def get_list(self, list_id: int) -> todolists_pb2.TodoList:
+        """
+        Invoke the TodoLists.Get gRPC to get a List by `id`
+
+        :param list_id: `id` of List to fetch
+        :return: TodoList
+
+        :raise AioRpcError:
+            If the gRPC server is UNAVAILABLE
+            If a list with `list_id` do not exist in the DB
+        """
+        return await self._call('Get', todolists_pb2.GetListRequest(id=list_id))
+
+    async def delete_list(self, list_id: int) -> todolists_pb2.Empty:
+        """
+        Invoke the TodoLists.Delete gRPC to delete a List by `id`
+
+        :param list_id: `id` of List to delete
+        :return: Empty
+
+        :raise AioRpcError:
+            If the gRPC server is UNAVAILABLE
+            If a list with `list_id` do not exist in the DB
+        """
+        return await self._call('Delete', todolists_pb2.DeleteListRequest(id=list_id))
+
+    async def get_lists_paginated(self,
+                                  page_number: int,
+                                  page_size: int,
+                                  page_token: str = '',
+                                  skip_count: bool = False) -> todolists_pb2.ListTodoListsReply:
+        """
+        Invoke the TodoLists.List gRPC to get the TodoLists paginated, same as
+        `proto_client.stub_get_lists_paginated.get_lists_paginated`
+
+        :param page_number: desired page number
+        :param page_size: desired page size
+        :param page_token: `next_page_token` of a previous reply. Default empty
+        :param skip_count: Do not count the TodoLists. Default False
+        :return: ListTodoListsReply
+
+        :raise AioRpcError:
+            If the gRPC server is UNAVAILABLE
+            If the `page_token` is not valid
+        """
+        request = todolists_pb2.ListTodoListsRequest(page_number=page_number, page_size=page_size,
+                                                     page_token=page_token, skip_count=skip_count)
+        return await self._call('List', request)
+
+    async def _fan_out(self, call: Callable[[Any], Awaitable[Any]], items: Iterable[Any]) -> BulkResult:
+        """
+        Call `call` with each item, with up to `max_concurrency` calls in flight
+
+        The calls are made by `max_concurrency` workers that take the next item when their call finishes,
+        instead of a task per item, so the memory used does not grow with the number of items.
+
+        :param call: Coroutine function that sends the RPC of an item
+        :param items: Items of the bulk operation
+        :return: BulkResult with the reply or the error of each item
+        """
+        items = list(items)
+        results = [None] * len(items)
+        errors = {}
+        # The workers share the iterator, it is only advanced between awaits
+        pending_items = iter(enumerate(items))
+
+        async def worker() -> None:
+            for index, item in pending_items:
+                try:
+                    results[index] = await call(item)
+                except grpc.RpcError as ex:
+                    errors[index] = ex
+
+        await asyncio.gather(*(worker() for _ in range(min(self.max_concurrency, len(items)))))
+        return BulkResult(results, errors)
+
+    async def create_many(self, names: Iterable[str]) -> BulkResult:
+        """
+        Create a List for each name, each one with its own TodoLists.Create RPC
+
+        Unlike the TodoLists.BatchCreate gRPC, each list is created in its own DB transaction,
+        so the RPCs can be spread over many connections and server processes.
+
+        :param names: names for the new lists
+        :return: BulkResult with the CreateListReply of each name
+        """
+        return await self._fan_out(self.create_list, names)
+
+    async def get_many(self, list_ids: Iterable[int]) -> BulkResult:
+        """
+        Get the List of each `id`, each one with its own TodoLists.Get RPC
+
+        :param list_ids: `id` of Lists to fetch
+        :return: BulkResult with the TodoList of each `id`, the `id` that do not exist fail with NOT_FOUND
+        """
+        return await self._fan_out(self.get_list, list_ids)
+
+    async def delete_many(self, list_ids: Iterable[int]) -> BulkResult:
+        """
+        Delete the List of each `id`, each one with its own TodoLists.Delete RPC
+
+        :param list_ids: `id` of Lists to delete
+        :return: BulkResult with the Empty reply of each `id`, the `id` that do not exist fail with NOT_FOUND
+        """
+        return await self._fan_out(self.delete_list, list_ids)
@@ -0,0 +1,100 @@
+"""
+This module contains the gRPC client interceptor that compresses the requests with the compression policy of
+`config.compression`.
+
+Examples:
+        Intercept the channel of the stubs.
+
+            $ channel = grpc.intercept_channel(channel, CompressionClientInterceptor())
+
+Classes:
+    CompressionClientInterceptor: Compress the requests of the client channels
+"""
+import collections
+from typing import Any, Callable, Iterator
+
+import grpc
+
+from config.compression import COMPRESSION_POLICY, CompressionPolicy
+
+
+class _ClientCallDetails(collections.namedtuple('_ClientCallDetails', ('method', 'timeout', 'metadata', 'credentials',
+                                                                       'wait_for_ready', 'compression')),
+                         grpc.ClientCallDetails):
+    """
+    Details of a client call, with the compression selected by the policy
+    """
+
+
+class CompressionClientInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor,
+                                   grpc.StreamUnaryClientInterceptor, grpc.StreamStreamClientInterceptor):
+    """
+    Client interceptor that compresses the requests of a channel.
+
+    The single requests are compressed if they are big enough, the streams of requests are compressed
+    with the algorithm of the method. The compression passed to a call is not changed.
+    """
+
+    def __init__(self, policy: CompressionPolicy = COMPRESSION_POLICY):  # pylint: disable=super-init-not-called
+        """
+        :param policy: Compression policy. Default `COMPRESSION_POLICY`
+        """
+        self._policy = policy
+
+    @staticmethod
+    def _with_compression(client_call_details: grpc.ClientCallDetails,
+                          compression: grpc.Compression) -> grpc.ClientCallDetails:
+        """
+        :param client_call_details: Details of the call
+        :param compression: Compression algorithm selected by the policy
+        :return: Details of the call with the compression, if the call did not set one
+        """
+        if client_call_details.compression is not None:
+            return client_call_details
+        return _ClientCallDetails(client_call_details.method, client_call_details.timeout,
+                                  client_call_details.metadata, client_call_details.credentials,
+                                  client_call_details.wait_for_ready, compression)
+
+    def intercept_unary_unary(self, continuation: Callable, client_call_details: grpc.ClientCallDetails,
+                              request: Any) -> Any:
+        """
+        :param continuation: Function that invokes the RPC
+        :param client_call_details: Details of the call
+        :param request: Request message
+        :return: Call of the RPC
+        """
+        compression = self._policy.message_compression(client_call_details.method, request)
+        return continuation(self._with_compression(client_call_details, compression), request)
+
+    def intercept_unary_stream(self, continuation: Callable, client_call_details: grpc.ClientCallDetails,
+                               request: Any) -> Any:
+        """
+        :param continuation: Function that invokes the RPC
+        :param client_call_details: Details of the call
+        :param request: Request message
+        :return: Call of the RPC
+        """
+        compression = self._policy.message_compression(client_call_details.method, request)
+        return continuation(self._with_compression(client_call_details, compression), request)
+
+    def intercept_stream_unary(self, continuation: Callable, client_call_details: grpc.ClientCallDetails,
+                               request_iterator: Iterator[Any]) -> Any:
+        """
+        :param continuation: Function that invokes the RPC
+        :param client_call_details: Details of the call
+        :param request_iterator: Request messages
+        :return: Call of the RPC
+        """
+        compression = self._policy.method_compression(client_call_details.method)
+        return continuation(self._with_compression(client_call_details, compression), request_iterator)
+
+    def intercept_stream_stream(self, continuation: Callable, client_call_details: grpc.ClientCallDetails,
+                                request_iterator: Iterator[Any]) -> Any:
+        """
+        :param continuation: Function that invokes the RPC
+        :param client_call_details: Details of the call
+        :param request_iterator: Request messages
+        :return: Call of the RPC
+        """
+        compression = self._policy.method_compression(client_call_details.method)
+        return continuation(self._with_compression(client_call_details, compression), request_iterator)
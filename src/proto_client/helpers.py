@@ -1,13 +1,45 @@
 """Helper functions shared by stubs
 
+Examples:
+        The services that invoke the stubs many times use the process-wide channel pool,
+        the connections are opened once and reused by all the calls.
+
+            $ from proto_client.helpers import get_pooled_stub
+            $ get_pooled_stub('localhost:50051').Get(todolists_pb2.GetListRequest(id=10))
+
+Classes:
+    ChannelPool: Pool of secured channels by address, with cached stubs
+
 Attributes:
+    CHANNEL_POOL (ChannelPool): Process-wide channel pool, closed at exit
     helpers.get_input (func): Function to request user input with a message
+    helpers.create_channel_credentials (func): Create the ssl credentials of the channels, only once
     helpers.create_secured_client_channel (func): Create a secured channel with ssl credentials
+    helpers.get_todo_lists_stub (func): Get the cached TodoLists stub of a channel
+    helpers.get_pooled_stub (func): Get a TodoLists stub of a channel of the process-wide pool
 """
 from contextlib import _GeneratorContextManager
+import atexit
 import contextlib
+import functools
+import itertools
+import os
+import threading
+import weakref
+from typing import Any, Dict, List, Sequence, Tuple
 import grpc
+from config.compression import COMPRESSION_POLICY, CompressionPolicy
+from config.config import GRPC_CLIENT_CHANNEL_POOL_SIZE
 from config.credentials import ROOT_CERTIFICATE
+from proto_client.compression import CompressionClientInterceptor
+import proto.v1.todolists_pb2_grpc as todolists_pb2_grpc
+
+# Each channel of the pool has its own connection, instead of sharing the connection of the other channels
+_POOL_CHANNEL_OPTIONS = (('grpc.use_local_subchannel_pool', 1),)
+
+_stubs_by_channel = weakref.WeakKeyDictionary()
+_stubs_lock = threading.Lock()
+_channel_pools = weakref.WeakSet()
 
 
 def get_input(message: str) -> str:
@@ -20,8 +52,21 @@ def get_input(message: str) -> str:
     return input(message)
 
 
+@functools.lru_cache(maxsize=None)
+def create_channel_credentials() -> grpc.ChannelCredentials:
+    """
+    Create the channel ssl credentials with the ROOT_CERTIFICATE, they are created once and shared by the channels
+
+    :return: gRPC ChannelCredentials
+    """
+    return grpc.ssl_channel_credentials(ROOT_CERTIFICATE)
+
+
 @contextlib.contextmanager
-def create_secured_client_channel(addr: str) -> _GeneratorContextManager:
+def create_secured_client_channel(addr: str,
+                                  options: Sequence[Tuple[str, Any]] = None,
+                                  compression_policy: CompressionPolicy = COMPRESSION_POLICY
+                                  ) -> _GeneratorContextManager:
     """
     Create a secured client channel using the SSL ROOT_CERTIFICATE
 
@@ -33,9 +78,142 @@ def create_secured_client_channel(addr: str) -> _GeneratorContextManager:
         $   ...
 
     :param addr: Channel address
+    :param options: gRPC channel arguments, e.g. `[('grpc.use_local_subchannel_pool', 1)]`. Default None
+    :param compression_policy: Compression of the requests. Default `COMPRESSION_POLICY`
     :return:
     """
     # Channel credential will be valid for the entire channel
-    channel_credential = grpc.ssl_channel_credentials(ROOT_CERTIFICATE)
-    channel = grpc.secure_channel(addr, channel_credential)
-    yield channel
+    channel = grpc.secure_channel(addr, create_channel_credentials(), options=options)
+    yield grpc.intercept_channel(channel, CompressionClientInterceptor(compression_policy))
+
+
+def get_todo_lists_stub(channel: grpc.Channel) -> todolists_pb2_grpc.TodoListsStub:
+    """
+    Get the TodoLists stub of a channel, it is created once per channel and forgotten with the channel
+
+    :param channel: gRPC channel used to invoke the Stub
+    :return: TodoListsStub
+    """
+    stub = _stubs_by_channel.get(channel)
+    if stub is None:
+        with _stubs_lock:
+            stub = _stubs_by_channel.setdefault(channel, todolists_pb2_grpc.TodoListsStub(channel))
+    return stub
+
+
+class ChannelPool:
+    """
+    Pool of secured channels by address.
+
+    The first time that an address is requested `size` channels are opened to it, each one with its own
+    connection, and they start connecting without waiting for the first call. Then the channels, and their cached
+    stubs, are handed out round robin, so the concurrent calls are spread over the connections.
+
+    The pool can be used from many threads. After a fork, the child process opens its own channels,
+    the channels of the parent are not used or closed by the child.
+    """
+
+    def __init__(self, size: int = GRPC_CLIENT_CHANNEL_POOL_SIZE, options: Sequence[Tuple[str, Any]] = (),
+                 compression_policy: CompressionPolicy = COMPRESSION_POLICY):
+        """
+        Constructor of an empty pool
+
+        :param size: Number of channels per address. Default `GRPC_CLIENT_CHANNEL_POOL_SIZE`
+        :param options: Extra gRPC channel arguments of the channels. Default empty
+        :param compression_policy: Compression of the requests. Default `COMPRESSION_POLICY`
+        """
+        self.size = max(1, size)
+        self.options = _POOL_CHANNEL_OPTIONS + tuple(options)
+        self._interceptor = CompressionClientInterceptor(compression_policy)
+        self._channels: Dict[str, Tuple[List[grpc.Channel], itertools.count]] = {}
+        self._lock = threading.Lock()
+        _channel_pools.add(self)
+
+    def _open_channels(self, addr: str) -> Tuple[List[grpc.Channel], itertools.count]:
+        """
+        Open the channels of an address, if they are not open yet
+
+        :param addr: Channels address
+        :return: Channels of the address, and the counter used to hand them out round robin
+        """
+        with self._lock:
+            address_channels = self._channels.get(addr)
+            if address_channels is None:
+                channels = []
+                for _ in range(self.size):
+                    channel = grpc.intercept_channel(
+                        grpc.secure_channel(addr, create_channel_credentials(), options=self.options),
+                        self._interceptor)
+                    # Start connecting, the future is cancelled when the channel is closed
+                    grpc.channel_ready_future(channel)
+                    channels.append(channel)
+                address_channels = self._channels[addr] = (channels, itertools.count())
+            return address_channels
+
+    def get_channel(self, addr: str) -> grpc.Channel:
+        """
+        Get the next channel of an address, round robin
+
+        :param addr: Channel address
+        :return: Pooled gRPC channel, it must not be closed by the caller
+        """
+        address_channels = self._channels.get(addr) or self._open_channels(addr)
+        channels, counter = address_channels
+        # next() of itertools.count is atomic
+        return channels[next(counter) % len(channels)]
+
+    def get_stub(self, addr: str) -> todolists_pb2_grpc.TodoListsStub:
+        """
+        Get the cached TodoLists stub of the next channel of an address
+
+        :param addr: Channel address
+        :return: TodoListsStub
+        """
+        return get_todo_lists_stub(self.get_channel(addr))
+
+    def close(self) -> None:
+        """
+        Close all the channels, the pool opens new channels if it is used again
+        :return:
+        """
+        with self._lock:
+            channels, self._channels = self._channels, {}
+        for address_channels, _ in channels.values():
+            for channel in address_channels:
+                channel.close()
+
+    def _forget_channels(self) -> None:
+        """
+        Forget the channels without closing them, used in the child process after a fork
+        :return:
+        """
+        self._lock = threading.Lock()
+        self._channels = {}
+
+
+def _reset_pools_after_fork() -> None:
+    """
+    Forget the channels of the parent process in all the pools of the child process
+    :return:
+    """
+    global _stubs_lock  # pylint: disable=global-statement,invalid-name
+    _stubs_lock = threading.Lock()
+    for pool in list(_channel_pools):
+        pool._forget_channels()  # pylint: disable=protected-access
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+CHANNEL_POOL = ChannelPool()
+atexit.register(CHANNEL_POOL.close)
+
+
+def get_pooled_stub(addr: str) -> todolists_pb2_grpc.TodoListsStub:
+    """
+    Get a TodoLists stub of a channel of the process-wide `CHANNEL_POOL`
+
+    :param addr: Server address, e.g. `localhost:50051`
+    :return: TodoListsStub
+    """
+    return CHANNEL_POOL.get_stub(addr)
@@ -0,0 +1,369 @@
+"""
+This module is a load generator for the gRPC todolists.TodoLists Service, used for capacity planning.
+
+It invokes a weighted mix of the Create, Get, Delete and List stubs against a running server, spread round robin
+over many channels, each channel with its own connection. The load is generated in one of two ways:
+
+* Closed loop: `concurrency` requests are kept in flight, a new request is sent when one finishes.
+* Fixed rate: `rate` requests per second are sent, no matter how long the server takes to reply. The latency
+  is measured from the time that the request was scheduled, so a server that falls behind is not hidden by
+  the client waiting for it (coordinated omission). `concurrency` bounds the requests in flight.
+
+The Get and Delete stubs use the ids of the lists created by the load generator, the lists left when
+the load finishes are deleted. A Delete without lists to delete is sent as a Create.
+
+Examples:
+        This module can be executed as a script, it prints the latency percentiles, throughput and error rate
+        of each operation as a table, and optionally writes them to a JSON file to compare runs.
+
+            $ python load_generator.py --duration 30 --concurrency 64 --channels 4
+            $ python load_generator.py --duration 30 --rate 500 --mix get=8,create=1,delete=1 --json results.json
+
+        The module can also be imported to run the load with already created channels.
+
+            $ from proto_client.load_generator import LoadGenerator, parse_mix
+            $ load_generator = LoadGenerator([grpc_channel], parse_mix('get=8,create=1,delete=1'))
+            $ load_generator.seed(100)
+            $ results = load_generator.run(duration=10, concurrency=32)
+            $ load_generator.cleanup()
+
+Classes:
+    LoadGenerator: Invoke a mix of stubs in closed loop or at a fixed rate and collect their latencies
+
+Attributes:
+    load_generator.OPERATIONS (Tuple[str]): Names of the operations of the mix
+    load_generator.parse_mix (function): Parse the weights of the operations
+    load_generator.percentile (function): Get a percentile from sorted values
+    load_generator.format_results (function): Format the results of a load as a table
+"""
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import grpc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import proto.v1.todolists_pb2 as todolists_pb2  # pylint: disable=wrong-import-position
+import proto.v1.todolists_pb2_grpc as todolists_pb2_grpc  # pylint: disable=wrong-import-position
+from config.config import GRPC_SERVER_PORT  # pylint: disable=wrong-import-position
+from proto_client.helpers import ChannelPool, get_todo_lists_stub  # pylint: disable=wrong-import-position
+
+OPERATIONS = ('create', 'get', 'delete', 'list')
+_DEFAULT_MIX = 'get=7,list=1,create=1,delete=1'
+_DEFAULT_DURATION = 10
+_DEFAULT_CONCURRENCY = 16
+_DEFAULT_SEED_LISTS = 100
+_LIST_PAGE_SIZE = 10
+_BATCH_SIZE = 500
+_PERCENTILES = (('p50', 50), ('p90', 90), ('p99', 99), ('p999', 99.9))
+_RESULT_ROW_TEMPLATE = '{:<8} {:>9} {:>7} {:>8} {:>10} {:>8} {:>8} {:>8} {:>8} {:>8}'
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """
+    Parse the weights of the operations, `operation=weight` pairs separated by commas
+
+        $ parse_mix('get=8,create=1,delete=1')
+
+    :param mix: Weights of the operations
+    :return: Weight of each operation, the operations without weight are not included
+    :raise ValueError: If an operation is unknown, a weight is not a positive number, or there are no operations
+    """
+    weights = {}
+    for pair in filter(None, (_pair.strip() for _pair in mix.split(','))):
+        operation, _, weight = pair.partition('=')
+        operation = operation.strip().lower()
+        if operation not in OPERATIONS:
+            raise ValueError('Unknown operation "{}", expected one of {}'.format(operation, ', '.join(OPERATIONS)))
+        weights[operation] = float(weight) if weight.strip() else 1.0
+        if weights[operation] < 0:
+            raise ValueError('The weight of "{}" must be a positive number'.format(operation))
+    weights = {_operation: _weight for _operation, _weight in weights.items() if _weight > 0}
+    if not weights:
+        raise ValueError('The mix "{}" does not have any operation'.format(mix))
+    return weights
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """
+    Get the nearest-rank percentile of a sorted list of values
+
+    :param sorted_values: Values sorted ascending
+    :param percent: Percentile to get, from 0 to 100
+    :return: Value in that percentile, 0 if there are no values
+    """
+    if not sorted_values:
+        return 0.0
+    index = int(round(percent / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def _summarize(latencies: List[float], codes: Counter, elapsed: float) -> Dict[str, Any]:
+    """
+    :param latencies: Latencies of the requests, in milliseconds
+    :param codes: Number of requests by status code name
+    :param elapsed: Seconds that the load took
+    :return: Requests, errors, error rate, throughput in requests per second, latencies in milliseconds
+     and number of requests by status code
+    """
+    latencies = sorted(latencies)
+    requests = len(latencies)
+    errors = requests - codes.get(grpc.StatusCode.OK.name, 0)
+    summary = {
+        'requests': requests,
+        'errors': errors,
+        'error_rate': errors / requests if requests else 0.0,
+        'throughput': requests / elapsed if elapsed else 0.0,
+    }
+    summary.update((_name, percentile(latencies, _percent)) for _name, _percent in _PERCENTILES)
+    summary['max'] = latencies[-1] if latencies else 0.0
+    summary['codes'] = dict(codes)
+    return summary
+
+
+class LoadGenerator:  # pylint: disable=too-many-instance-attributes
+    """
+    Invoke a weighted mix of the todolists.TodoLists stubs and collect the latency and status code of each request
+    """
+
+    def __init__(self, channels: Sequence[grpc.Channel], mix: Dict[str, float], random_seed: int = None):
+        """
+        Constructor of the load generator
+
+        :param channels: gRPC channels used round robin to invoke the stubs
+        :param mix: Weight of each operation, see `parse_mix`
+        :param random_seed: Seed of the random choice of the operations and ids. Default None, random seed
+        """
+        self._stubs = [get_todo_lists_stub(_channel) for _channel in channels]
+        self._operations = list(mix)
+        self._cumulative_weights = list(itertools.accumulate(mix.values()))
+        self._random = random.Random(random_seed)
+        self._names_prefix = 'load-generator-{}'.format(uuid.uuid4().hex)
+        self._names_counter = itertools.count()
+        # Ids of the lists created by the load generator that were not deleted
+        self._list_ids: List[int] = []
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, List[float]] = {}
+        self._codes: Dict[str, Counter] = {}
+
+    def _new_name(self) -> str:
+        """
+        :return: Unique name for a new list
+        """
+        return '{}-{}'.format(self._names_prefix, next(self._names_counter))
+
+    def seed(self, lists: int) -> None:
+        """
+        Create lists before the load, so the Get and Delete requests have lists to use from the start
+
+        :param lists: Number of lists to create
+        :return:
+        """
+        stub = self._stubs[0]
+        for batch_start in range(0, lists, _BATCH_SIZE):
+            names = [self._new_name() for _ in range(min(_BATCH_SIZE, lists - batch_start))]
+            reply = stub.BatchCreate(todolists_pb2.BatchCreateListsRequest(names=names))
+            self._list_ids.extend(_result.id for _result in reply.results if _result.created)
+
+    def cleanup(self) -> None:
+        """
+        Delete the lists created by the load generator that were not deleted by the load
+        :return:
+        """
+        stub = self._stubs[0]
+        with self._lock:
+            list_ids, self._list_ids = self._list_ids, []
+        for batch_start in range(0, len(list_ids), _BATCH_SIZE):
+            stub.BatchDelete(todolists_pb2.BatchDeleteListsRequest(ids=list_ids[batch_start:batch_start + _BATCH_SIZE]))
+
+    def _random_list_id(self, remove: bool) -> Optional[int]:
+        """
+        :param remove: Remove the id from the created lists ids
+        :return: Random id of a list created by the load generator, None if there are no lists
+        """
+        with self._lock:
+            if not self._list_ids:
+                return None
+            index = self._random.randrange(len(self._list_ids))
+            if not remove:
+                return self._list_ids[index]
+            # Swap with the last id, so the removal does not shift the list
+            self._list_ids[index], self._list_ids[-1] = self._list_ids[-1], self._list_ids[index]
+            return self._list_ids.pop()
+
+    def _record(self, operation: str, start: float, future: grpc.Future, list_id: Optional[int]) -> None:
+        """
+        Record the latency and status code of a finished request, and track the created and deleted lists
+
+        :param operation: Name of the operation
+        :param start: Time that the request was scheduled
+        :param future: Finished request
+        :param list_id: Id of the deleted list, for Delete requests
+        :return:
+        """
+        latency = (time.perf_counter() - start) * 1000
+        code = future.code()
+        with self._lock:
+            self._latencies.setdefault(operation, []).append(latency)
+            self._codes.setdefault(operation, Counter())[code.name] += 1
+            if operation == 'create' and code == grpc.StatusCode.OK:
+                self._list_ids.append(future.result().id)
+            elif operation == 'delete' and code not in (grpc.StatusCode.OK, grpc.StatusCode.NOT_FOUND):
+                # The list may still exist
+                self._list_ids.append(list_id)
+
+    def _send(self, stub: todolists_pb2_grpc.TodoListsStub, start: float, on_done: Callable[[], None]) -> None:
+        """
+        Send a request of a random operation of the mix
+
+        :param stub: Stub used to invoke the gRPC method
+        :param start: Time that the request was scheduled
+        :param on_done: Called when the request finishes
+        :return:
+        """
+        operation = self._random.choices(self._operations, cum_weights=self._cumulative_weights)[0]
+        list_id = None
+        if operation == 'delete':
+            list_id = self._random_list_id(remove=True)
+            operation = 'create' if list_id is None else operation
+        if operation == 'create':
+            future = stub.Create.future(todolists_pb2.CreateListRequest(name=self._new_name()))
+        elif operation == 'get':
+            future = stub.Get.future(todolists_pb2.GetListRequest(id=self._random_list_id(remove=False) or 0))
+        elif operation == 'delete':
+            future = stub.Delete.future(todolists_pb2.DeleteListRequest(id=list_id))
+        else:
+            future = stub.List.future(todolists_pb2.ListTodoListsRequest(page_size=_LIST_PAGE_SIZE, skip_count=True))
+
+        def _on_done(_future: grpc.Future) -> None:
+            self._record(operation, start, _future, list_id)
+            on_done()
+        future.add_done_callback(_on_done)
+
+    def run(self, duration: float, concurrency: int = _DEFAULT_CONCURRENCY, rate: float = None) -> Dict[str, Any]:
+        """
+        Send requests for `duration` seconds, and wait for the requests in flight
+
+        :param duration: Seconds that new requests are sent
+        :param concurrency: Requests kept in flight in closed loop, or max requests in flight at a fixed rate.
+         Default 16
+        :param rate: Requests per second, None runs the load in closed loop. Default None
+        :return: Elapsed seconds, results of each operation and of all of them, see `_summarize`
+        """
+        self._latencies, self._codes = {}, {}
+        in_flight = threading.Semaphore(concurrency)
+        stubs = itertools.cycle(self._stubs)
+        load_start = time.perf_counter()
+        load_end = load_start + duration
+        for request_number in itertools.count():
+            if rate:
+                start = load_start + request_number / rate
+                if start >= load_end:
+                    break
+                time.sleep(max(0.0, start - time.perf_counter()))
+                in_flight.acquire()
+            else:
+                in_flight.acquire()
+                start = time.perf_counter()
+                if start >= load_end:
+                    in_flight.release()
+                    break
+            self._send(next(stubs), start, in_flight.release)
+        # Wait for the requests still in flight
+        for _ in range(concurrency):
+            in_flight.acquire()
+        elapsed = time.perf_counter() - load_start
+
+        with self._lock:
+            results = {
+                'elapsed': elapsed,
+                'operations': {_operation: _summarize(self._latencies[_operation], self._codes[_operation], elapsed)
+                               for _operation in OPERATIONS if _operation in self._latencies},
+                'total': _summarize(list(itertools.chain.from_iterable(self._latencies.values())),
+                                    sum(self._codes.values(), Counter()), elapsed),
+            }
+        return results
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    """
+    Format the results of `LoadGenerator.run` as a table, with a row for each operation and for all of them
+
+    :param results: Results of the load
+    :return: Table with the requests, errors, error rate, throughput and latencies in milliseconds
+    """
+    rows = [_RESULT_ROW_TEMPLATE.format('op', 'requests', 'errors', 'error %', 'req/s',
+                                        'p50 ms', 'p90 ms', 'p99 ms', 'p999 ms', 'max ms')]
+    for name, summary in itertools.chain(results['operations'].items(), [('total', results['total'])]):
+        rows.append(_RESULT_ROW_TEMPLATE.format(
+            name, summary['requests'], summary['errors'], '{:.2f}'.format(summary['error_rate'] * 100),
+            '{:.1f}'.format(summary['throughput']),
+            *('{:.2f}'.format(summary[_key]) for _key in ('p50', 'p90', 'p99', 'p999', 'max'))))
+    return '\n'.join(rows)
+
+
+def _parse_arguments(arguments: Sequence[str]) -> argparse.Namespace:
+    """
+    :param arguments: Command line arguments, without the script name
+    :return: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description='Load generator for the todolists.TodoLists gRPC Service')
+    parser.add_argument('--target', default='localhost:{}'.format(GRPC_SERVER_PORT),
+                        help='Address of the server. Default localhost:GRPC_SERVER_PORT')
+    parser.add_argument('--duration', type=float, default=_DEFAULT_DURATION,
+                        help='Seconds that new requests are sent. Default %(default)s')
+    parser.add_argument('--concurrency', type=int, default=_DEFAULT_CONCURRENCY,
+                        help='Requests kept in flight, or max requests in flight with --rate. Default %(default)s')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='Requests per second, if it is not set the load runs in closed loop')
+    parser.add_argument('--channels', type=int, default=1, help='Number of channels. Default %(default)s')
+    parser.add_argument('--mix', type=parse_mix, default=_DEFAULT_MIX,
+                        help='Weights of the operations {}. Default %(default)s'.format(', '.join(OPERATIONS)))
+    parser.add_argument('--seed-lists', type=int, default=_DEFAULT_SEED_LISTS,
+                        help='Lists created before the load. Default %(default)s')
+    parser.add_argument('--json', default=None, help='Write the results to this JSON file')
+    return parser.parse_args(arguments)
+
+
+def main():
+    """
+    Main when executed as script
+    :return:
+    """
+    arguments = _parse_arguments(sys.argv[1:])
+    with contextlib.ExitStack() as stack:
+        # Each channel of the pool has its own connection
+        channel_pool = ChannelPool(size=arguments.channels)
+        stack.callback(channel_pool.close)
+        channels = [channel_pool.get_channel(arguments.target) for _ in range(arguments.channels)]
+        load_generator = LoadGenerator(channels, arguments.mix)
+        load_generator.seed(arguments.seed_lists)
+        print('Running {} load for {}s against {} with {} channels'.format(
+            '{} req/s'.format(arguments.rate) if arguments.rate else '{} concurrent requests'.format(
+                arguments.concurrency), arguments.duration, arguments.target, arguments.channels))
+        try:
+            results = load_generator.run(arguments.duration, arguments.concurrency, arguments.rate)
+        finally:
+            load_generator.cleanup()
+    print(format_results(results))
+    if arguments.json:
+        results['config'] = {'target': arguments.target, 'duration': arguments.duration,
+                             'concurrency': arguments.concurrency, 'rate': arguments.rate,
+                             'channels': arguments.channels, 'mix': arguments.mix}
+        with open(arguments.json, 'w', encoding='utf-8') as json_file:
+            json.dump(results, json_file, indent=2)
+        print('Results written to {}'.format(arguments.json))
+
+
+if __name__ == '__main__':
+    main()
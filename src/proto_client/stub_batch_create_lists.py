@@ -0,0 +1,80 @@
+"""
+This module is used to invoke the gRPC todolists.TodoLists.BatchCreate Stub
+
+Examples:
+        This module can be executed as a script, this way it will execute the todolists.TodoLists.BatchCreate Stub,
+        it expects positional arguments to define the new Lists `names`.
+        If no argument is defined they will be requested by user input, separated by commas
+
+            $ python stub_batch_create_lists.py NewList1 NewList2 NewList3
+
+        The module can also be imported to call the `batch_create_lists` function and invoke the .BatchCreate Stub.
+
+            $ from proto_client.stub_batch_create_lists import batch_create_lists
+            $ batch_create_lists(['new_list_1', 'new_list_2'], grpc_channel)
+
+Attributes:
+    stub_batch_create_lists.batch_create_lists (function): Function use to invoke the gRPC to create many TodoLists
+"""
+import os
+import sys
+from typing import List
+from grpc._channel import _InactiveRpcError, Channel
+from grpc import StatusCode
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import proto.v1.todolists_pb2 as todolists_pb2  # pylint: disable=wrong-import-position
+from config.config import GRPC_SERVER_PORT  # pylint: disable=wrong-import-position
+from proto_client.helpers import get_input, create_secured_client_channel, get_todo_lists_stub  # pylint: disable=wrong-import-position
+
+
+def batch_create_lists(names: List[str], channel: Channel) -> todolists_pb2.BatchCreateListsReply:
+    """
+    Invoke the TodoLists.BatchCreate gRPC to create many Lists in a single transaction
+
+    :param names: names for the new lists
+    :param channel: gRPC channel used to invoke the Stub
+
+    :return: BatchCreateListsReply of invoked stub, with a result for each name
+
+    :raise _InactiveRpcError:
+        If the gRPC server is UNAVAILABLE
+    """
+    print('Calling TodoLists.BatchCreate with {} names'.format(len(names)))
+    try:
+        stub = get_todo_lists_stub(channel)
+        response = stub.BatchCreate(todolists_pb2.BatchCreateListsRequest(names=names))
+        for result in response.results:
+            if result.created:
+                print('Created TodoList with id "{}" and name "{}"'.format(result.id, result.name))
+            else:
+                print('{}'.format(result.error))
+        return response
+    except _InactiveRpcError as ex:
+        exception_code = ex.args[0].code  # pylint: disable=no-member
+        exception_details = ex.args[0].details  # pylint: disable=no-member
+        if exception_code == StatusCode.UNAVAILABLE:
+            print('Seems that the gRPC Server is Unavailable. - {}'.format(exception_details))
+        elif exception_code == StatusCode.INVALID_ARGUMENT:
+            print('{}'.format(exception_details))
+        else:
+            print('Error creating TodoLists - {}'.format(exception_details))
+            raise ex
+
+
+def main():
+    """
+    Main when executed as script
+    :return:
+    """
+    # New lists names can be specified by positional arguments, if not they will be requested
+    list_names = sys.argv[1:]
+    if not list_names:
+        list_names = [_name.strip() for _name in get_input('Please insert the new lists names: ').split(',')]
+    with create_secured_client_channel('localhost:{}'.format(GRPC_SERVER_PORT)) as _channel:
+        batch_create_lists(list_names, _channel)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+This module is used to invoke the gRPC todolists.TodoLists.BatchGet Stub
+
+Examples:
+        This module can be executed as a script, this way it will execute the todolists.TodoLists.BatchGet Stub,
+        it expects positional arguments to define the Lists `ids` to get.
+        If no argument is defined they will be requested by user input, separated by commas
+
+            $ python stub_batch_get_lists.py 10 11 12
+
+        The module can also be imported to call the `batch_get_lists` function and invoke the .BatchGet Stub.
+
+            $ from proto_client.stub_batch_get_lists import batch_get_lists
+            $ batch_get_lists([10, 11, 12], grpc_channel)
+
+Attributes:
+    stub_batch_get_lists.batch_get_lists (function): Function use to invoke the gRPC to get many TodoLists by id
+"""
+import os
+import sys
+from typing import List
+from grpc._channel import _InactiveRpcError, Channel
+from grpc import StatusCode
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import proto.v1.todolists_pb2 as todolists_pb2  # pylint: disable=wrong-import-position
+from config.config import GRPC_SERVER_PORT  # pylint: disable=wrong-import-position
+from proto_client.helpers import get_input, create_secured_client_channel, get_todo_lists_stub  # pylint: disable=wrong-import-position
+
+
+def batch_get_lists(list_ids: List[int], channel: Channel) -> todolists_pb2.BatchGetListsReply:
+    """
+    Invoke the TodoLists.BatchGet gRPC to get many Lists by `id` in a single request
+
+    :param list_ids: `ids` of Lists to fetch
+    :param channel: gRPC channel used to invoke the Stub
+
+    :return: BatchGetListsReply of invoked stub, with the found lists and the missing ids
+
+    :raise _InactiveRpcError:
+        If the gRPC server is UNAVAILABLE
+    """
+    print('Calling TodoLists.BatchGet with {} ids'.format(len(list_ids)))
+    try:
+        stub = get_todo_lists_stub(channel)
+        response = stub.BatchGet(todolists_pb2.BatchGetListsRequest(ids=list_ids))
+        for todo_list in response.todo_lists:
+            print('TodoList fetched with id "{}" and name "{}"'.format(todo_list.id, todo_list.name))
+        for missing_id in response.missing_ids:
+            print('List with id "{}" not found.'.format(missing_id))
+        return response
+    except _InactiveRpcError as ex:
+        exception_code = ex.args[0].code  # pylint: disable=no-member
+        exception_details = ex.args[0].details  # pylint: disable=no-member
+        if exception_code == StatusCode.UNAVAILABLE:
+            print('Seems that the gRPC Server is Unavailable. - {}'.format(exception_details))
+        elif exception_code == StatusCode.INVALID_ARGUMENT:
+            print('{}'.format(exception_details))
+        else:
+            print('Error fetching TodoLists - {}'.format(exception_details))
+            raise ex
+
+
+def main():
+    """
+    Main when executed as script
+    :return:
+    """
+    # Lists `ids` can be specified by positional arguments, if not they will be requested
+    list_ids = sys.argv[1:]
+    if not list_ids:
+        list_ids = get_input('Please insert the TodoLists `ids` to get: ').split(',')
+    with create_secured_client_channel('localhost:{}'.format(GRPC_SERVER_PORT)) as _channel:
+        batch_get_lists([int(_list_id) for _list_id in list_ids], _channel)
+
+
+if __name__ == '__main__':
+    main()
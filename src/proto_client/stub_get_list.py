@@ -24,9 +24,8 @@ from grpc import StatusCode
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import proto.v1.todolists_pb2 as todolists_pb2  # pylint: disable=wrong-import-position
-import proto.v1.todolists_pb2_grpc as todolists_pb2_grpc  # pylint: disable=wrong-import-position
 from config.config import GRPC_SERVER_PORT  # pylint: disable=wrong-import-position
-from proto_client.helpers import get_input, create_secured_client_channel  # pylint: disable=wrong-import-position
+from proto_client.helpers import get_input, create_secured_client_channel, get_todo_lists_stub  # pylint: disable=wrong-import-position
 
 
 def get_list(list_id: id, channel: Channel) -> todolists_pb2.TodoList:
@@ -44,7 +43,7 @@ def get_list(list_id: id, channel: Channel) -> todolists_pb2.TodoList:
     """
     print('Calling TodoLists.Get with List id "{}"'.format(list_id))
     try:
-        stub = todolists_pb2_grpc.TodoListsStub(channel)
+        stub = get_todo_lists_stub(channel)
         response = stub.Get(todolists_pb2.GetListRequest(id=list_id))
         print('TodoList fetched with id "{}" and name "{}"'.format(response.id, response.name))
         return response
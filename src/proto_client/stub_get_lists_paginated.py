@@ -8,10 +8,16 @@ Examples:
 
             $ python stub_get_lists_paginated.py 1 10
 
+        An optional third positional argument can define the `page_token` returned as `next_page_token`
+        by a previous call, in that case the `page_number` is ignored.
+
+            $ python stub_get_lists_paginated.py 1 10 dG9kb2xpc3RzLXYxOjEw
+
         The module can also be imported to call the `get_lists_paginated` function and invoke the .List Stub.
 
             $ from proto_client.stub_get_lists_paginated import get_lists_paginated
             $ get_lists_paginated(page_number=1, page_size=10, grpc_channel)
+            $ get_lists_paginated(page_number=1, page_size=10, grpc_channel, page_token=next_page_token)
 
 Attributes:
     stub_get_lists_paginated.get_lists_paginated (function):
@@ -25,12 +31,15 @@ from grpc import StatusCode
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import proto.v1.todolists_pb2 as todolists_pb2  # pylint: disable=wrong-import-position
-import proto.v1.todolists_pb2_grpc as todolists_pb2_grpc  # pylint: disable=wrong-import-position
 from config.config import GRPC_SERVER_PORT  # pylint: disable=wrong-import-position
-from proto_client.helpers import get_input, create_secured_client_channel  # pylint: disable=wrong-import-position
+from proto_client.helpers import get_input, create_secured_client_channel, get_todo_lists_stub  # pylint: disable=wrong-import-position
 
 
-def get_lists_paginated(page_number: int, page_size: int, channel: Channel) -> todolists_pb2.ListTodoListsReply:
+def get_lists_paginated(page_number: int,
+                        page_size: int,
+                        channel: Channel,
+                        page_token: str = '',
+                        skip_count: bool = False) -> todolists_pb2.ListTodoListsReply:
     """
     Invoke the TodoLists.List gRPC to get the TodoLists paginated
 
@@ -38,28 +47,38 @@ def get_lists_paginated(page_number: int, page_size: int, channel: Channel) -> t
 
     If a negative `page_number` is send to the gRPC it will be set to 1.
 
+    If a `page_token` is send, the page after the token is returned and `page_number` is ignored.
+    Deep pages are faster to fetch by token than by number.
+
+    If `skip_count` is True, the server does not compute the count of TodoLists and the reply `count` is 0.
+
     :param page_number: desired page number
     :param page_size: desired page size
     :param channel: gRPC channel used to invoke the Stub
+    :param page_token: `next_page_token` of a previous reply. Default empty
+    :param skip_count: Do not count the TodoLists. Default False
 
     :return: ListTodoListsReply
 
     :raise _InactiveRpcError:
         If the gRPC server is UNAVAILABLE
     """
-    print('Calling TodoLists.List with `page_number={}` and `page_size={}`'.format(page_number, page_size))
+    print('Calling TodoLists.List with `page_number={}`, `page_size={}` and `page_token={}`'.format(
+        page_number, page_size, page_token))
     try:
-        stub = todolists_pb2_grpc.TodoListsStub(channel)
-        response = stub.List(todolists_pb2.ListTodoListsRequest(page_size=page_size, page_number=page_number))
-        print('Response: `next_page_number={}` - `count={}`\n`todo_lists={}`'.format(response.next_page_number,
-                                                                                     response.count,
-                                                                                     response.todo_lists))
+        stub = get_todo_lists_stub(channel)
+        response = stub.List(todolists_pb2.ListTodoListsRequest(page_size=page_size, page_number=page_number,
+                                                                page_token=page_token, skip_count=skip_count))
+        print('Response: `next_page_number={}` - `next_page_token={}` - `count={}`\n`todo_lists={}`'.format(
+            response.next_page_number, response.next_page_token, response.count, response.todo_lists))
         return response
     except _InactiveRpcError as ex:
         exception_code = ex.args[0].code  # pylint: disable=no-member
         exception_details = ex.args[0].details  # pylint: disable=no-member
         if exception_code == StatusCode.UNAVAILABLE:
             print('Seems that the gRPC Server is Unavailable. - {}'.format(exception_details))
+        elif exception_code == StatusCode.INVALID_ARGUMENT:
+            print('{}'.format(exception_details))
         else:
             print('Error getting TodoLists paginated - {}'.format(exception_details))
             raise ex
@@ -77,8 +96,11 @@ def main():
     except IndexError:
         _page_number = int(get_input('Please insert the desired page_number: ').strip())
         _page_size = int(get_input('Please insert the desired page_size: ').strip())
+    # Optional third positional argument, `page_token`
+    _page_token = sys.argv[3] if len(sys.argv) > 3 else ''
     with create_secured_client_channel('localhost:{}'.format(GRPC_SERVER_PORT)) as _channel:
-        get_lists_paginated(page_number=int(_page_number), page_size=int(_page_size), channel=_channel)
+        get_lists_paginated(page_number=int(_page_number), page_size=int(_page_size), channel=_channel,
+                            page_token=_page_token)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,132 @@
+"""
+This module is used to invoke the gRPC todolists.TodoLists.ImportLists Stub
+
+Examples:
+        This module can be executed as a script, this way it will execute the todolists.TodoLists.ImportLists Stub,
+        it expects a positional argument to define the path of the file with the new Lists names.
+        If no argument is defined it will be requested by user input
+
+        The file is a CSV file with a `name` column, if its extension is `.csv`, or a NDJSON file with a JSON object
+        with a `name` field per line. The file is read while it is streamed, it is never loaded into memory.
+
+            $ python stub_import_lists.py lists.ndjson
+
+        The module can also be imported to call the `import_lists` function and invoke the .ImportLists Stub.
+
+            $ from proto_client.stub_import_lists import import_lists, read_names
+            $ import_lists(read_names('lists.csv'), grpc_channel)
+
+Attributes:
+    stub_import_lists.read_names (function): Function use to read the Lists names of a CSV or NDJSON file
+    stub_import_lists.create_import_requests (function): Function use to group the names in ImportListsRequest
+    stub_import_lists.import_lists (function): Function use to invoke the gRPC to import the TodoLists
+"""
+import csv
+import itertools
+import json
+import os
+import sys
+from typing import Iterable, Iterator
+from grpc import RpcError, StatusCode, Channel
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import proto.v1.todolists_pb2 as todolists_pb2  # pylint: disable=wrong-import-position
+from config.config import GRPC_SERVER_PORT  # pylint: disable=wrong-import-position
+from proto_client.helpers import get_input, create_secured_client_channel, get_todo_lists_stub  # pylint: disable=wrong-import-position
+
+# Number of names sent in each message of the stream, fewer bigger messages are cheaper to send than a name per message
+_NAMES_PER_MESSAGE = 500
+_CSV_EXTENSION = '.csv'
+_NAME_FIELD = 'name'
+
+
+def read_names(file_path: str) -> Iterator[str]:
+    """
+    Read the Lists names of a file, line by line
+
+    If the file extension is `.csv` the names are read from the `name` column of the CSV file,
+    if not each line of the file is a JSON object with a `name` field. The empty lines are skipped.
+
+    :param file_path: Path of the CSV or NDJSON file
+    :return: Iterator of the names, in the order of the file
+
+    :raise KeyError: If a CSV file has no `name` column, or a JSON object has no `name` field
+    :raise ValueError: If a line of a NDJSON file is not valid JSON
+    """
+    with open(file_path, newline='', encoding='utf-8') as names_file:
+        if os.path.splitext(file_path)[1].lower() == _CSV_EXTENSION:
+            for row in csv.DictReader(names_file):
+                yield row[_NAME_FIELD]
+        else:
+            for line in names_file:
+                if line.strip():
+                    yield json.loads(line)[_NAME_FIELD]
+
+
+def create_import_requests(names: Iterable[str],
+                           names_per_message: int = _NAMES_PER_MESSAGE) -> Iterator[todolists_pb2.ImportListsRequest]:
+    """
+    Group the names in the messages of the ImportLists stream, the names are consumed as the messages are sent
+
+    :param names: Names of the Lists to import
+    :param names_per_message: Max number of names per message. Default `_NAMES_PER_MESSAGE`
+    :return: Iterator of ImportListsRequest
+    """
+    names = iter(names)
+    while True:
+        message_names = list(itertools.islice(names, names_per_message))
+        if not message_names:
+            return
+        yield todolists_pb2.ImportListsRequest(names=message_names)
+
+
+def import_lists(names: Iterable[str], channel: Channel) -> todolists_pb2.ImportListsReply:
+    """
+    Invoke the TodoLists.ImportLists gRPC to create a List for each name, streaming the names
+
+    The names that already exist, or are repeated, are not created, the summary shows them as duplicates.
+
+    :param names: Names of the Lists to import, e.g. `read_names('lists.csv')`
+    :param channel: gRPC channel used to invoke the Stub
+
+    :return: ImportListsReply with the summary of the import
+
+    :raise RpcError:
+        If the import fails for a reason different than the gRPC server being UNAVAILABLE
+    """
+    print('Calling TodoLists.ImportLists')
+    try:
+        stub = get_todo_lists_stub(channel)
+        response = stub.ImportLists(create_import_requests(names))
+        print('Imported {} TodoLists, {} duplicates'.format(response.inserted, response.duplicates))
+        for error in response.errors:
+            print('TodoList number {} with name "{}" not imported - {}'.format(error.index + 1, error.name,
+                                                                               error.error))
+        return response
+    except RpcError as ex:
+        exception_code = ex.code()  # pylint: disable=no-member
+        exception_details = ex.details()  # pylint: disable=no-member
+        if exception_code == StatusCode.UNAVAILABLE:
+            print('Seems that the gRPC Server is Unavailable. - {}'.format(exception_details))
+        else:
+            print('Error importing TodoLists - {}'.format(exception_details))
+            raise ex
+
+
+def main():
+    """
+    Main when executed as script
+    :return:
+    """
+    # File path can be specified by positional argument, if not it will be requested as input
+    try:
+        _file_path = sys.argv[1]
+    except IndexError:
+        _file_path = get_input('Please insert the path of the CSV or NDJSON file to import: ').strip()
+    with create_secured_client_channel('localhost:{}'.format(GRPC_SERVER_PORT)) as _channel:
+        import_lists(read_names(_file_path), _channel)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+This module is used to invoke the gRPC todolists.TodoLists.Session Stub
+
+Examples:
+        This module can be executed as a script, this way it will execute the todolists.TodoLists.Session Stub,
+        it expects positional arguments to define the operations, as `operation=argument`, where the operation is
+        `create` with the List name, `get` or `delete` with the List `id`, or `list` with the page number.
+        If no argument is defined they will be requested by user input, separated by commas
+
+            $ python stub_session.py create=NewList get=10 delete=10 list=1
+
+        The module can also be imported to call the `run_session` function and invoke the .Session Stub.
+
+            $ from proto_client.stub_session import run_session, create_session_request
+            $ requests = [create_session_request(1, 'create', 'NewList'), create_session_request(2, 'get', '10')]
+            $ for reply in run_session(requests, grpc_channel):
+            $   ...
+
+Attributes:
+    stub_session.create_session_request (function): Function use to create the SessionRequest of an operation
+    stub_session.format_session_reply (function): Function use to describe a SessionReply
+    stub_session.run_session (function): Function use to invoke the gRPC to run the operations in a Session
+"""
+import os
+import sys
+from typing import Iterable, Iterator
+from grpc import RpcError, StatusCode, Channel
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import proto.v1.todolists_pb2 as todolists_pb2  # pylint: disable=wrong-import-position
+from config.config import GRPC_SERVER_PORT  # pylint: disable=wrong-import-position
+from proto_client.helpers import get_input, create_secured_client_channel, get_todo_lists_stub  # pylint: disable=wrong-import-position
+
+
+def create_session_request(correlation_id: int, operation: str, argument: str) -> todolists_pb2.SessionRequest:
+    """
+    Create the SessionRequest of an operation
+
+    :param correlation_id: ID of the operation, returned in its reply
+    :param operation: `create`, `get`, `delete` or `list`
+    :param argument: List name for `create`, List `id` for `get` and `delete`, page number for `list`
+    :return: SessionRequest
+
+    :raise ValueError: If the operation is unknown, or the argument of `get`, `delete` or `list` is not a number
+    """
+    if operation == 'create':
+        return todolists_pb2.SessionRequest(correlation_id=correlation_id,
+                                            create=todolists_pb2.CreateListRequest(name=argument))
+    if operation == 'get':
+        return todolists_pb2.SessionRequest(correlation_id=correlation_id,
+                                            get=todolists_pb2.GetListRequest(id=int(argument)))
+    if operation == 'delete':
+        return todolists_pb2.SessionRequest(correlation_id=correlation_id,
+                                            delete=todolists_pb2.DeleteListRequest(id=int(argument)))
+    if operation == 'list':
+        return todolists_pb2.SessionRequest(correlation_id=correlation_id,
+                                            list=todolists_pb2.ListTodoListsRequest(page_number=int(argument)))
+    raise ValueError('Unknown Session operation "{}"'.format(operation))
+
+
+def format_session_reply(reply: todolists_pb2.SessionReply) -> str:
+    """
+    Describe the result of a Session operation
+
+    :param reply: SessionReply of the operation
+    :return: Description of the result
+    """
+    result = reply.WhichOneof('result')
+    if result == 'create':
+        description = 'Created TodoList with id "{}" and name "{}"'.format(reply.create.id, reply.create.name)
+    elif result == 'get':
+        description = 'TodoList fetched with id "{}" and name "{}"'.format(reply.get.id, reply.get.name)
+    elif result == 'delete':
+        description = 'TodoList deleted'
+    elif result == 'list':
+        description = 'TodoLists page with ids {}'.format([_list.id for _list in reply.list.todo_lists])
+    else:
+        description = 'Error - {}'.format(reply.error.message)
+    return 'Operation {}: {}'.format(reply.correlation_id, description)
+
+
+def run_session(requests: Iterable[todolists_pb2.SessionRequest],
+                channel: Channel) -> Iterator[todolists_pb2.SessionReply]:
+    """
+    Invoke the TodoLists.Session gRPC to run many operations in a single stream
+
+    The operations are pipelined by the server, the replies are yielded as they are received,
+    in the order that the operations complete. Use the `correlation_id` to match each reply with its request.
+
+    :param requests: Operations of the Session, they are sent as they are consumed
+    :param channel: gRPC channel used to invoke the Stub
+
+    :return: Iterator of the replies received
+
+    :raise RpcError:
+        If the stream fails for a reason different than the gRPC server being UNAVAILABLE
+    """
+    print('Calling TodoLists.Session')
+    received = 0
+    try:
+        stub = get_todo_lists_stub(channel)
+        for reply in stub.Session(iter(requests)):
+            received += 1
+            yield reply
+        print('Received {} Session replies'.format(received))
+    except RpcError as ex:
+        exception_code = ex.code()  # pylint: disable=no-member
+        exception_details = ex.details()  # pylint: disable=no-member
+        if exception_code == StatusCode.UNAVAILABLE:
+            print('Seems that the gRPC Server is Unavailable. - {}'.format(exception_details))
+        else:
+            print('Error in Session after receiving {} replies - {}'.format(received, exception_details))
+            raise ex
+
+
+def main():
+    """
+    Main when executed as script
+    :return:
+    """
+    # Operations can be specified by positional arguments, if not they will be requested
+    operations = sys.argv[1:]
+    if not operations:
+        operations = [_operation.strip() for _operation in get_input('Please insert the operations: ').split(',')]
+    requests = [create_session_request(_correlation_id, *_operation.split('=', 1))
+                for _correlation_id, _operation in enumerate(operations, 1)]
+    with create_secured_client_channel('localhost:{}'.format(GRPC_SERVER_PORT)) as _channel:
+        for reply in run_session(requests, _channel):
+            print(format_session_reply(reply))
+
+
+if __name__ == '__main__':
+    main()
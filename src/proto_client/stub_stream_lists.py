@@ -0,0 +1,77 @@
+"""
+This module is used to invoke the gRPC todolists.TodoLists.StreamLists Stub
+
+Examples:
+        This module can be executed as a script, this way it will execute the todolists.TodoLists.StreamLists Stub,
+        it expects an optional positional argument to define the `after_id`, only TodoLists with a bigger `id` will
+        be streamed. If no argument is defined all the TodoLists are streamed.
+
+            $ python stub_stream_lists.py 10
+
+        The module can also be imported to call the `stream_lists` function and invoke the .StreamLists Stub.
+
+            $ from proto_client.stub_stream_lists import stream_lists
+            $ for todo_list in stream_lists(0, grpc_channel):
+            $   ...
+
+Attributes:
+    stub_stream_lists.stream_lists (function): Function use to invoke the gRPC to stream the TodoLists
+"""
+import os
+import sys
+from typing import Iterator
+from grpc import RpcError, StatusCode, Channel
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import proto.v1.todolists_pb2 as todolists_pb2  # pylint: disable=wrong-import-position
+from config.config import GRPC_SERVER_PORT  # pylint: disable=wrong-import-position
+from proto_client.helpers import create_secured_client_channel, get_todo_lists_stub  # pylint: disable=wrong-import-position
+
+
+def stream_lists(after_id: int, channel: Channel) -> Iterator[todolists_pb2.TodoList]:
+    """
+    Invoke the TodoLists.StreamLists gRPC to stream the TodoLists ordered by `id`
+
+    The TodoLists are yielded as they are received, they are never kept in memory.
+
+    :param after_id: Only TodoLists with a bigger `id` are streamed, 0 to stream all of them
+    :param channel: gRPC channel used to invoke the Stub
+
+    :return: Iterator of the TodoLists received
+
+    :raise RpcError:
+        If the stream fails for a reason different than the gRPC server being UNAVAILABLE
+    """
+    print('Calling TodoLists.StreamLists after List id "{}"'.format(after_id))
+    received = 0
+    try:
+        stub = get_todo_lists_stub(channel)
+        for todo_list in stub.StreamLists(todolists_pb2.StreamListsRequest(after_id=after_id)):
+            received += 1
+            yield todo_list
+        print('Received {} TodoLists'.format(received))
+    except RpcError as ex:
+        exception_code = ex.code()  # pylint: disable=no-member
+        exception_details = ex.details()  # pylint: disable=no-member
+        if exception_code == StatusCode.UNAVAILABLE:
+            print('Seems that the gRPC Server is Unavailable. - {}'.format(exception_details))
+        else:
+            print('Error streaming TodoLists after receiving {} - {}'.format(received, exception_details))
+            raise ex
+
+
+def main():
+    """
+    Main when executed as script
+    :return:
+    """
+    # Optional positional argument `after_id`
+    _after_id = sys.argv[1] if len(sys.argv) > 1 else 0
+    with create_secured_client_channel('localhost:{}'.format(GRPC_SERVER_PORT)) as _channel:
+        for todo_list in stream_lists(int(_after_id), _channel):
+            print('TodoList with id "{}" and name "{}"'.format(todo_list.id, todo_list.name))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,4 +3,9 @@ Python package with the gRPC Services
 
 Modules:
     todolist_server: module to run the todolists gRPC Service
+    todolists_aio_server: module to run the todolists gRPC Service with an asyncio server
+    prefork_server: module to run the todolists gRPC Service in many processes listening to the same port
+    admission: module with the admission control interceptors that shed the load over the capacity of the server
+    rate_limit: module with the interceptors that limit the RPCs of each client with token buckets
+    compression: module with the interceptors that compress the responses with the compression policy
 """
@@ -0,0 +1,476 @@
+"""
+This module contains the admission control of the gRPC servers, it sheds the load that the server can not handle
+instead of queueing it without limit.
+
+The unary RPCs run up to a concurrency limit, the limit adapts to the latency of the RPCs with AIMD, additive increase
+and multiplicative decrease: it grows while the RPCs are faster than `ADMISSION_TARGET_LATENCY` and the limit is in
+use, and it is multiplied by `ADMISSION_BACKOFF_RATIO` when an RPC is slower. The RPCs over the limit wait in a queue of
+`ADMISSION_QUEUE_SIZE` RPCs, the next ones are rejected with `RESOURCE_EXHAUSTED` at once, so the clients can retry
+with another server or back off, and an RPC that waits too long is rejected too.
+
+The RPCs whose deadline expired before they started, e.g. while they were waiting for a worker thread, are rejected
+with `DEADLINE_EXCEEDED` without running them, the client already gave up on them.
+The streaming RPCs are only checked for their deadline, they have their own flow control. The operations of the
+`Session` streams are admitted by the servicer, with the controller of the interceptor. The thread pool servers can
+run them in their own thread pool, so the long-lived streams do not hold the worker threads of the unary RPCs.
+
+Examples:
+        Pass the interceptor when the server is created, after the metrics interceptor, so the metrics count the
+        rejected RPCs.
+
+            $ server = grpc.server(ThreadPoolExecutor(), interceptors=[MetricsInterceptor(), AdmissionInterceptor()])
+            $ aio_server = grpc.aio.server(interceptors=(AsyncMetricsInterceptor(), AsyncAdmissionInterceptor()))
+
+Classes:
+    AdmissionRejected(Exception): Raised when an RPC is not admitted
+    AimdLimit: Concurrency limit with additive increase and multiplicative decrease
+    AdmissionController: Concurrency limit and bounded queue of the thread pool servers
+    AsyncAdmissionController: Concurrency limit and bounded queue of the asyncio servers
+    AdmissionInterceptor(grpc.ServerInterceptor): Admission control of the thread pool servers
+    AsyncAdmissionInterceptor(grpc.aio.ServerInterceptor): Admission control of the asyncio servers
+
+Attributes:
+    admission.context_time_remaining (function): Seconds until the deadline of an RPC, of both server modes
+"""
+import asyncio
+import collections
+import functools
+import inspect
+import math
+import threading
+import time
+from concurrent import futures
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+import grpc
+from grpc import aio
+
+from config.config import (
+    ADMISSION_INITIAL_LIMIT, ADMISSION_MIN_LIMIT, ADMISSION_MAX_LIMIT, ADMISSION_TARGET_LATENCY,
+    ADMISSION_BACKOFF_RATIO, ADMISSION_QUEUE_SIZE, ADMISSION_MAX_QUEUE_WAIT
+)
+from metrics.admission_metrics import (
+    ADMISSION_LIMIT, ADMISSION_IN_FLIGHT, ADMISSION_QUEUE_DEPTH, ADMISSION_QUEUE_SECONDS, ADMISSION_SHED
+)
+from grpc_utils.interceptors import MethodHandlersCache, wrap_rpc_method_handler
+
+_QUEUE_FULL = 'queue_full'
+_QUEUE_TIMEOUT = 'queue_timeout'
+_DEADLINE_EXPIRED = 'deadline_expired'
+_OVERLOADED_DETAILS = 'Server overloaded, retry later'
+_DEADLINE_EXPIRED_DETAILS = 'Deadline expired before the request started'
+
+
+class AdmissionRejected(Exception):
+    """
+    Raised when an RPC is not admitted, the RPC must be aborted with its code and details
+    """
+
+    def __init__(self, code: grpc.StatusCode, reason: str, details: str):
+        """
+        :param code: Status code of the rejected RPC
+        :param reason: `reason` label of the `ADMISSION_SHED` metric
+        :param details: Error description
+        """
+        super().__init__(code, reason, details)
+        self.code = code
+        self.reason = reason
+        self.details = details
+
+
+class AimdLimit:  # pylint: disable=too-few-public-methods
+    """
+    Concurrency limit with additive increase and multiplicative decrease.
+
+    The limit is increased by 1 for each `limit` RPCs faster than the target latency, while at least half of the limit
+    is in use, and it is decreased at most once for each group of RPCs that were running at the same time,
+    a burst of slow RPCs caused by the same overload only decreases it once. It is not thread safe.
+    """
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 initial_limit: int = ADMISSION_INITIAL_LIMIT,
+                 min_limit: int = ADMISSION_MIN_LIMIT,
+                 max_limit: int = ADMISSION_MAX_LIMIT,
+                 target_latency: float = ADMISSION_TARGET_LATENCY,
+                 backoff_ratio: float = ADMISSION_BACKOFF_RATIO):
+        """
+        :param initial_limit: Limit when it is created. Default `ADMISSION_INITIAL_LIMIT`
+        :param min_limit: Min limit. Default `ADMISSION_MIN_LIMIT`
+        :param max_limit: Max limit. Default `ADMISSION_MAX_LIMIT`
+        :param target_latency: Seconds that an RPC is expected to take. Default `ADMISSION_TARGET_LATENCY`
+        :param backoff_ratio: Ratio by which the limit is multiplied when it is decreased. Default
+            `ADMISSION_BACKOFF_RATIO`
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.target_latency = target_latency
+        self.backoff_ratio = backoff_ratio
+        self._decreased_at = 0.0
+        ADMISSION_LIMIT.labels().set(self.limit)
+
+    def on_sample(self, start: float, latency: float, in_flight: int) -> None:
+        """
+        Update the limit with the latency of a finished RPC
+
+        :param start: `time.perf_counter()` when the RPC was admitted
+        :param latency: Seconds that the RPC took, without the time in the queue
+        :param in_flight: Number of RPCs running when the RPC finished, including it
+        :return:
+        """
+        if latency > self.target_latency:
+            # The RPCs admitted before the last decrease already saw the overload that caused it
+            if start >= self._decreased_at:
+                self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+                self._decreased_at = time.perf_counter()
+                ADMISSION_LIMIT.labels().set(self.limit)
+        elif in_flight * 2 >= self.limit and self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            ADMISSION_LIMIT.labels().set(self.limit)
+
+
+class AdmissionController:
+    """
+    Concurrency limit and bounded queue of the unary RPCs of a thread pool server, it can be used from many threads.
+
+    The RPCs queued wait in their worker thread, so the controller only queues RPCs while the limit is lower than
+    the number of worker threads. The RPCs that wait for a worker thread are not seen by the controller, the server
+    must bound them too, see `grpc.server(maximum_concurrent_rpcs=...)`.
+    """
+
+    def __init__(self, limit: AimdLimit = None, queue_size: int = ADMISSION_QUEUE_SIZE,
+                 max_queue_wait: float = ADMISSION_MAX_QUEUE_WAIT):
+        """
+        :param limit: Concurrency limit. Default an `AimdLimit` with the config values
+        :param queue_size: Max number of RPCs waiting for the limit. Default `ADMISSION_QUEUE_SIZE`
+        :param max_queue_wait: Max seconds that an RPC waits in the queue. Default `ADMISSION_MAX_QUEUE_WAIT`
+        """
+        self.limit = limit if limit is not None else AimdLimit()
+        self.queue_size = queue_size
+        self.max_queue_wait = max_queue_wait
+        self.in_flight = 0
+        self.queued = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, time_remaining: float) -> float:
+        """
+        Admit an RPC, waiting in the queue if the limit is reached
+
+        :param time_remaining: Seconds until the deadline of the RPC
+        :return: `time.perf_counter()` when the RPC was admitted, to pass to `release`
+        :raise AdmissionRejected: If the queue is full, or the RPC waited too long
+        """
+        with self._condition:
+            if self.queued or self.in_flight >= self.limit.limit:
+                self._wait(time_remaining)
+            self.in_flight += 1
+        ADMISSION_IN_FLIGHT.labels().inc()
+        return time.perf_counter()
+
+    def _wait(self, time_remaining: float) -> None:
+        """
+        Wait in the queue until the RPC is under the limit, must be called holding the condition lock
+
+        :param time_remaining: Seconds until the deadline of the RPC
+        :return:
+        :raise AdmissionRejected: If the queue is full, or the RPC waited too long
+        """
+        if self.queued >= self.queue_size:
+            ADMISSION_SHED.labels(_QUEUE_FULL).inc()
+            raise AdmissionRejected(grpc.StatusCode.RESOURCE_EXHAUSTED, _QUEUE_FULL, _OVERLOADED_DETAILS)
+        start = time.perf_counter()
+        wait_until = start + min(time_remaining, self.max_queue_wait)
+        self.queued += 1
+        ADMISSION_QUEUE_DEPTH.labels().inc()
+        try:
+            while self.in_flight >= self.limit.limit:
+                remaining_wait = wait_until - time.perf_counter()
+                if remaining_wait <= 0:
+                    ADMISSION_SHED.labels(_QUEUE_TIMEOUT).inc()
+                    raise AdmissionRejected(_queue_timeout_code(time_remaining, self.max_queue_wait),
+                                            _QUEUE_TIMEOUT, _OVERLOADED_DETAILS)
+                self._condition.wait(remaining_wait)
+        finally:
+            self.queued -= 1
+            ADMISSION_QUEUE_DEPTH.labels().dec()
+        ADMISSION_QUEUE_SECONDS.labels().observe(time.perf_counter() - start)
+
+    def release(self, start: float) -> None:
+        """
+        Finish an admitted RPC, update the limit and wake up the queued RPCs that fit in the limit
+
+        :param start: Value returned by `acquire`
+        :return:
+        """
+        latency = time.perf_counter() - start
+        with self._condition:
+            self.limit.on_sample(start, latency, self.in_flight)
+            self.in_flight -= 1
+            self._condition.notify(max(0, math.ceil(self.limit.limit) - self.in_flight))
+        ADMISSION_IN_FLIGHT.labels().dec()
+
+
+class AsyncAdmissionController:
+    """
+    Concurrency limit and bounded queue of the unary RPCs of an asyncio server, it must be used from the event loop
+    of the server. The queued RPCs are admitted in arrival order.
+    """
+
+    def __init__(self, limit: AimdLimit = None, queue_size: int = ADMISSION_QUEUE_SIZE,
+                 max_queue_wait: float = ADMISSION_MAX_QUEUE_WAIT):
+        """
+        :param limit: Concurrency limit. Default an `AimdLimit` with the config values
+        :param queue_size: Max number of RPCs waiting for the limit. Default `ADMISSION_QUEUE_SIZE`
+        :param max_queue_wait: Max seconds that an RPC waits in the queue. Default `ADMISSION_MAX_QUEUE_WAIT`
+        """
+        self.limit = limit if limit is not None else AimdLimit()
+        self.queue_size = queue_size
+        self.max_queue_wait = max_queue_wait
+        self.in_flight = 0
+        self._waiters = collections.deque()
+
+    @property
+    def queued(self) -> int:
+        """
+        :return: Number of RPCs waiting in the queue
+        """
+        return len(self._waiters)
+
+    async def acquire(self, time_remaining: float) -> float:
+        """
+        Admit an RPC, waiting in the queue if the limit is reached
+
+        :param time_remaining: Seconds until the deadline of the RPC
+        :return: `time.perf_counter()` when the RPC was admitted, to pass to `release`
+        :raise AdmissionRejected: If the queue is full, or the RPC waited too long
+        """
+        if not self._waiters and self.in_flight < self.limit.limit:
+            self.in_flight += 1
+            ADMISSION_IN_FLIGHT.labels().inc()
+            return time.perf_counter()
+        if len(self._waiters) >= self.queue_size:
+            ADMISSION_SHED.labels(_QUEUE_FULL).inc()
+            raise AdmissionRejected(grpc.StatusCode.RESOURCE_EXHAUSTED, _QUEUE_FULL, _OVERLOADED_DETAILS)
+
+        start = time.perf_counter()
+        waiter = asyncio.get_event_loop().create_future()
+        self._waiters.append(waiter)
+        ADMISSION_QUEUE_DEPTH.labels().inc()
+        try:
+            await asyncio.wait((waiter,), timeout=min(time_remaining, self.max_queue_wait))
+        except asyncio.CancelledError:
+            self._leave_queue(waiter)
+            raise
+        if not waiter.done():
+            self._leave_queue(waiter)
+            ADMISSION_SHED.labels(_QUEUE_TIMEOUT).inc()
+            raise AdmissionRejected(_queue_timeout_code(time_remaining, self.max_queue_wait),
+                                    _QUEUE_TIMEOUT, _OVERLOADED_DETAILS)
+        ADMISSION_QUEUE_SECONDS.labels().observe(time.perf_counter() - start)
+        return time.perf_counter()
+
+    def _leave_queue(self, waiter: asyncio.Future) -> None:
+        """
+        Remove a waiter that gave up, if it was admitted at the same time its slot is handed to the next waiter
+
+        :param waiter: Future of the queued RPC
+        :return:
+        """
+        if waiter.done():
+            self._finish()
+        else:
+            waiter.cancel()
+            self._waiters.remove(waiter)
+            ADMISSION_QUEUE_DEPTH.labels().dec()
+
+    def release(self, start: float) -> None:
+        """
+        Finish an admitted RPC, update the limit and admit the queued RPCs that fit in the limit
+
+        :param start: Value returned by `acquire`
+        :return:
+        """
+        self.limit.on_sample(start, time.perf_counter() - start, self.in_flight)
+        self._finish()
+
+    def _finish(self) -> None:
+        """
+        Free the slot of an RPC, and hand the free slots to the queued RPCs in arrival order
+        :return:
+        """
+        self.in_flight -= 1
+        ADMISSION_IN_FLIGHT.labels().dec()
+        while self._waiters and self.in_flight < self.limit.limit:
+            waiter = self._waiters.popleft()
+            ADMISSION_QUEUE_DEPTH.labels().dec()
+            waiter.set_result(None)
+            self.in_flight += 1
+            ADMISSION_IN_FLIGHT.labels().inc()
+
+
+def _queue_timeout_code(time_remaining: float, max_queue_wait: float) -> grpc.StatusCode:
+    """
+    :param time_remaining: Seconds until the deadline of the RPC when it was queued
+    :param max_queue_wait: Max seconds that an RPC waits in the queue
+    :return: `DEADLINE_EXCEEDED` if the RPC waited until its deadline, `RESOURCE_EXHAUSTED` if not
+    """
+    return grpc.StatusCode.DEADLINE_EXCEEDED if time_remaining <= max_queue_wait else grpc.StatusCode.RESOURCE_EXHAUSTED
+
+
+def context_time_remaining(context: grpc.ServicerContext) -> float:
+    """
+    :param context: Servicer context of the RPC
+    :return: Seconds until the deadline of the RPC, infinite if the context does not expose the deadline,
+        as the grpc.aio servicer contexts of grpcio < 1.34
+    """
+    time_remaining = getattr(context, 'time_remaining', None)
+    return time_remaining() if time_remaining is not None else math.inf
+
+
+def _check_deadline(context: grpc.ServicerContext) -> Optional[AdmissionRejected]:
+    """
+    :param context: Servicer context of the RPC
+    :return: The rejection of the RPC if its deadline expired, None if not
+    """
+    if context_time_remaining(context) <= 0:
+        ADMISSION_SHED.labels(_DEADLINE_EXPIRED).inc()
+        return AdmissionRejected(grpc.StatusCode.DEADLINE_EXCEEDED, _DEADLINE_EXPIRED, _DEADLINE_EXPIRED_DETAILS)
+    return None
+
+
+def _wrap_behavior(behavior: Callable, controller: AdmissionController, limited: bool,
+                   stream_thread_pool: Optional[futures.ThreadPoolExecutor] = None) -> Callable:
+    """
+    :param behavior: Servicer method of a thread pool server
+    :param controller: Admission controller of the server
+    :param limited: If the RPCs of the method run under the concurrency limit, the unary RPCs
+    :param stream_thread_pool: Thread pool of the streaming RPCs, the thread pool of the server if None.
+        Default None
+    :return: Servicer method that only runs the admitted RPCs
+    """
+    if not limited:
+        def _checked_behavior(request_or_iterator: Any, context: grpc.ServicerContext) -> Any:
+            rejected = _check_deadline(context)
+            if rejected is not None:
+                context.abort(rejected.code, rejected.details)
+            return behavior(request_or_iterator, context)
+        if stream_thread_pool is not None:
+            _checked_behavior.experimental_thread_pool = stream_thread_pool
+        return _checked_behavior
+
+    def _limited_behavior(request_or_iterator: Any, context: grpc.ServicerContext) -> Any:
+        rejected = _check_deadline(context)
+        if rejected is None:
+            try:
+                start = controller.acquire(context_time_remaining(context))
+            except AdmissionRejected as ex:
+                rejected = ex
+        if rejected is not None:
+            context.abort(rejected.code, rejected.details)
+        try:
+            return behavior(request_or_iterator, context)
+        finally:
+            controller.release(start)
+    return _limited_behavior
+
+
+def _wrap_async_behavior(behavior: Callable, controller: AsyncAdmissionController, limited: bool,
+                         _stream_thread_pool: Optional[futures.ThreadPoolExecutor] = None) -> Callable:
+    """
+    :param behavior: Servicer method of an asyncio server, a coroutine or async generator function
+    :param controller: Admission controller of the server
+    :param limited: If the RPCs of the method run under the concurrency limit, the unary RPCs
+    :param _stream_thread_pool: Not used, the asyncio servers run the streams in their event loop
+    :return: Servicer method that only runs the admitted RPCs
+    """
+    if inspect.isasyncgenfunction(behavior):
+        async def _stream_behavior(request_or_iterator: Any, context: aio.ServicerContext) -> AsyncIterator[Any]:
+            rejected = _check_deadline(context)
+            if rejected is not None:
+                await context.abort(rejected.code, rejected.details)
+            async for response in behavior(request_or_iterator, context):
+                yield response
+        return _stream_behavior
+
+    async def _coroutine_behavior(request_or_iterator: Any, context: aio.ServicerContext) -> Any:
+        rejected = _check_deadline(context)
+        if rejected is None and not limited:
+            return await behavior(request_or_iterator, context)
+        if rejected is None:
+            try:
+                start = await controller.acquire(context_time_remaining(context))
+            except AdmissionRejected as ex:
+                rejected = ex
+        if rejected is not None:
+            await context.abort(rejected.code, rejected.details)
+        try:
+            return await behavior(request_or_iterator, context)
+        finally:
+            controller.release(start)
+    return _coroutine_behavior
+
+
+def _wrap_handler(wrap_behavior: Callable, controller: Any, stream_thread_pool: Optional[futures.ThreadPoolExecutor],
+                  handler: grpc.RpcMethodHandler, _full_method: str) -> grpc.RpcMethodHandler:
+    """
+    :param wrap_behavior: `_wrap_behavior` or `_wrap_async_behavior`
+    :param controller: `AdmissionController` or `AsyncAdmissionController`
+    :param stream_thread_pool: Thread pool of the streaming RPCs, None to run them as the unary RPCs
+    :param handler: Method handler of the RPC
+    :param _full_method: gRPC method name, all the methods have the same admission control
+    :return: Method handler that only runs the admitted RPCs
+    """
+    limited = not handler.request_streaming and not handler.response_streaming
+    return wrap_rpc_method_handler(handler, lambda behavior: wrap_behavior(behavior, controller, limited,
+                                                                           stream_thread_pool))
+
+
+class AdmissionInterceptor(grpc.ServerInterceptor):  # pylint: disable=too-few-public-methods
+    """
+    Server interceptor with the admission control of a thread pool gRPC server
+    """
+
+    def __init__(self, controller: AdmissionController = None,  # pylint: disable=super-init-not-called
+                 stream_thread_pool: futures.ThreadPoolExecutor = None):
+        """
+        :param controller: Admission controller. Default an `AdmissionController` with the config values
+        :param stream_thread_pool: Thread pool where the streaming RPCs run, so they do not hold the worker threads
+            of the unary RPCs. Default None, they run in the thread pool of the server
+        """
+        self.controller = controller if controller is not None else AdmissionController()
+        self.stream_thread_pool = stream_thread_pool
+        self._handlers = MethodHandlersCache(functools.partial(_wrap_handler, _wrap_behavior, self.controller,
+                                                               stream_thread_pool))
+
+    def intercept_service(self, continuation: Callable[[grpc.HandlerCallDetails], grpc.RpcMethodHandler],
+                          handler_call_details: grpc.HandlerCallDetails) -> grpc.RpcMethodHandler:
+        """
+        :param continuation: Function that returns the method handler of the RPC
+        :param handler_call_details: Method name and metadata of the RPC
+        :return: Method handler that only runs the admitted RPCs
+        """
+        return self._handlers.wrap(continuation(handler_call_details), handler_call_details.method)
+
+
+class AsyncAdmissionInterceptor(aio.ServerInterceptor):  # pylint: disable=too-few-public-methods
+    """
+    Server interceptor with the admission control of an asyncio gRPC server
+    """
+
+    def __init__(self, controller: AsyncAdmissionController = None):
+        """
+        :param controller: Admission controller. Default an `AsyncAdmissionController` with the config values
+        """
+        self.controller = controller if controller is not None else AsyncAdmissionController()
+        self._handlers = MethodHandlersCache(functools.partial(_wrap_handler, _wrap_async_behavior, self.controller,
+                                                               None))
+
+    async def intercept_service(self,
+                                continuation: Callable[[grpc.HandlerCallDetails], Awaitable[grpc.RpcMethodHandler]],
+                                handler_call_details: grpc.HandlerCallDetails) -> grpc.RpcMethodHandler:
+        """
+        :param continuation: Coroutine function that returns the method handler of the RPC
+        :param handler_call_details: Method name and metadata of the RPC
+        :return: Method handler that only runs the admitted RPCs
+        """
+        return self._handlers.wrap(await continuation(handler_call_details), handler_call_details.method)
@@ -0,0 +1,140 @@
+"""
+This module contains the gRPC server interceptors that compress the responses with the compression policy of
+`config.compression`.
+
+Each compressed gRPC method sets the algorithm of its RPCs, and the responses smaller than the min size of the policy
+are sent uncompressed.
+
+Examples:
+        Pass the interceptor when the server is created.
+
+            $ server = grpc.server(ThreadPoolExecutor(), interceptors=[CompressionInterceptor()])
+            $ aio_server = grpc.aio.server(interceptors=(AsyncCompressionInterceptor(),))
+
+Classes:
+    CompressionInterceptor(grpc.ServerInterceptor): Compress the responses of the thread pool servers
+    AsyncCompressionInterceptor(grpc.aio.ServerInterceptor): Compress the responses of the asyncio servers
+"""
+import functools
+import inspect
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
+
+import grpc
+from grpc import aio
+
+from config.compression import COMPRESSION_POLICY, CompressionPolicy
+from grpc_utils.interceptors import MethodHandlersCache, wrap_rpc_method_handler
+
+
+def _wrap_behavior(behavior: Callable, compression: grpc.Compression, policy: CompressionPolicy,
+                   response_streaming: bool) -> Callable:
+    """
+    :param behavior: Servicer method of a thread pool server
+    :param compression: Compression algorithm of the method
+    :param policy: Compression policy
+    :param response_streaming: If the RPC sends a stream of messages
+    :return: Servicer method that compresses its responses
+    """
+    if response_streaming:
+        def _stream_behavior(request_or_iterator: Any, context: grpc.ServicerContext) -> Iterator[Any]:
+            context.set_compression(compression)
+            for response in behavior(request_or_iterator, context):
+                if not policy.compress_message(response):
+                    context.disable_next_message_compression()
+                yield response
+        return _stream_behavior
+
+    def _unary_behavior(request_or_iterator: Any, context: grpc.ServicerContext) -> Any:
+        context.set_compression(compression)
+        response = behavior(request_or_iterator, context)
+        if response is not None and not policy.compress_message(response):
+            context.disable_next_message_compression()
+        return response
+    return _unary_behavior
+
+
+def _wrap_async_behavior(behavior: Callable, compression: grpc.Compression, policy: CompressionPolicy,
+                         response_streaming: bool) -> Callable:
+    """
+    :param behavior: Servicer method of an asyncio server, a coroutine or async generator function
+    :param compression: Compression algorithm of the method
+    :param policy: Compression policy
+    :param response_streaming: If the RPC sends a stream of messages
+    :return: Servicer method that compresses its responses
+    """
+    if response_streaming and inspect.isasyncgenfunction(behavior):
+        async def _stream_behavior(request_or_iterator: Any, context: aio.ServicerContext) -> AsyncIterator[Any]:
+            context.set_compression(compression)
+            async for response in behavior(request_or_iterator, context):
+                if not policy.compress_message(response):
+                    context.disable_next_message_compression()
+                yield response
+        return _stream_behavior
+
+    async def _coroutine_behavior(request_or_iterator: Any, context: aio.ServicerContext) -> Any:
+        context.set_compression(compression)
+        response = await behavior(request_or_iterator, context)
+        # The response streaming coroutines write the responses with `context.write`, all of them are compressed
+        if not response_streaming and response is not None and not policy.compress_message(response):
+            context.disable_next_message_compression()
+        return response
+    return _coroutine_behavior
+
+
+def _wrap_handler(wrap_behavior: Callable, policy: CompressionPolicy, handler: grpc.RpcMethodHandler,
+                  full_method: str) -> grpc.RpcMethodHandler:
+    """
+    :param wrap_behavior: `_wrap_behavior` or `_wrap_async_behavior`
+    :param policy: Compression policy
+    :param handler: Method handler of the RPC
+    :param full_method: gRPC method name
+    :return: Method handler that compresses the responses, the same handler if the method is not compressed
+    """
+    compression = policy.method_compression(full_method)
+    if compression == grpc.Compression.NoCompression:
+        return handler
+    return wrap_rpc_method_handler(handler, lambda behavior: wrap_behavior(
+        behavior, compression, policy, handler.response_streaming))
+
+
+class CompressionInterceptor(grpc.ServerInterceptor):  # pylint: disable=too-few-public-methods
+    """
+    Server interceptor that compresses the responses of a thread pool gRPC server
+    """
+
+    def __init__(self, policy: CompressionPolicy = COMPRESSION_POLICY):  # pylint: disable=super-init-not-called
+        """
+        :param policy: Compression policy. Default `COMPRESSION_POLICY`
+        """
+        self._handlers = MethodHandlersCache(functools.partial(_wrap_handler, _wrap_behavior, policy))
+
+    def intercept_service(self, continuation: Callable[[grpc.HandlerCallDetails], grpc.RpcMethodHandler],
+                          handler_call_details: grpc.HandlerCallDetails) -> grpc.RpcMethodHandler:
+        """
+        :param continuation: Function that returns the method handler of the RPC
+        :param handler_call_details: Method name and metadata of the RPC
+        :return: Method handler that compresses the responses of the RPC
+        """
+        return self._handlers.wrap(continuation(handler_call_details), handler_call_details.method)
+
+
+class AsyncCompressionInterceptor(aio.ServerInterceptor):  # pylint: disable=too-few-public-methods
+    """
+    Server interceptor that compresses the responses of an asyncio gRPC server
+    """
+
+    def __init__(self, policy: CompressionPolicy = COMPRESSION_POLICY):
+        """
+        :param policy: Compression policy. Default `COMPRESSION_POLICY`
+        """
+        self._handlers = MethodHandlersCache(functools.partial(_wrap_handler, _wrap_async_behavior, policy))
+
+    async def intercept_service(self,
+                                continuation: Callable[[grpc.HandlerCallDetails], Awaitable[grpc.RpcMethodHandler]],
+                                handler_call_details: grpc.HandlerCallDetails) -> grpc.RpcMethodHandler:
+        """
+        :param continuation: Coroutine function that returns the method handler of the RPC
+        :param handler_call_details: Method name and metadata of the RPC
+        :return: Method handler that compresses the responses of the RPC
+        """
+        return self._handlers.wrap(await continuation(handler_call_details), handler_call_details.method)
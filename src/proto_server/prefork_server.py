@@ -0,0 +1,217 @@
+"""
+Module with the pre-fork mode of the gRPC todolists.TodoLists Service.
+
+A parent process starts `GRPC_SERVER_WORKER_PROCESSES` worker processes, each one runs its own gRPC server,
+in the `GRPC_SERVER_MODE` mode, listening to the same port with SO_REUSEPORT, so the kernel balances
+the connections between them and the service is not limited to the single core that a GIL bound process can use.
+
+The parent process does not serve RPCs, it restarts the workers that exit, and stops all of them gracefully
+when it receives SIGTERM or SIGINT. The workers share the SQLite database, WAL journal mode and a busy timeout
+let them read and write it concurrently, see `database.config`.
+
+The workers are started with the `spawn` method, so they do not inherit any gRPC or DB state from the parent.
+Each worker has its own metrics, served on its own port, `METRICS_PORT + 1` for the first worker and so on,
+the parent process does not serve metrics.
+SO_REUSEPORT is only available on Linux and some BSDs.
+
+Examples:
+        This module provides the function to start the pre-fork gRPC Server for the todolists.TodoLists Service.
+
+            $ import proto_server.prefork_server as prefork_server
+            $ prefork_server.serve(50051)
+
+Classes:
+    PreforkSupervisor: Start, restart and stop the worker processes
+
+Attributes:
+    prefork_server.serve (function): Run the worker processes and supervise them until SIGTERM or SIGINT
+    prefork_server.logger (logging.Logger): Logger of the module
+"""
+import asyncio
+import logging
+import multiprocessing
+import multiprocessing.connection
+import signal
+import threading
+from typing import List
+
+from config.config import (
+    GRPC_SERVER_MODE, ASYNCIO_SERVER_MODE, GRPC_SERVER_WORKER_PROCESSES, GRPC_SERVER_GRACE_PERIOD, METRICS_PORT
+)
+from config.logs import setup_logging
+from database.backends import create_storage_backend
+from database.database import Database
+from metrics.exporter import start_metrics_server
+import proto_server.todolists_server as todolists_server
+import proto_server.todolists_aio_server as todolists_aio_server
+
+# Let all the worker processes bind the same port
+_WORKER_SERVER_OPTIONS = [('grpc.so_reuseport', 1)]
+_SUPERVISE_INTERVAL = 0.5
+_RESTART_DELAY = 1
+# Seconds that the parent waits for a stopping worker after its grace period, before killing it
+_STOP_TIMEOUT_MARGIN = 5
+
+logger = logging.getLogger(__name__)
+
+
+async def _serve_aio_worker(server_port: int) -> None:
+    """
+    Run the asyncio gRPC server of a worker process until it receives SIGTERM, then stop it gracefully
+
+    :param server_port: Port to listen to
+    :return:
+    """
+    server = todolists_aio_server.create_secured_server(server_port, _WORKER_SERVER_OPTIONS)
+    stopping = asyncio.Event()
+    asyncio.get_event_loop().add_signal_handler(signal.SIGTERM, stopping.set)
+    await server.start()
+    await stopping.wait()
+    await server.stop(GRPC_SERVER_GRACE_PERIOD)
+
+
+def _serve_worker(server_port: int) -> None:
+    """
+    Run the thread pool gRPC server of a worker process until it receives SIGTERM, then stop it gracefully
+
+    :param server_port: Port to listen to
+    :return:
+    """
+    server = todolists_server.create_secured_server(server_port, _WORKER_SERVER_OPTIONS)
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda _signum, _frame: stopping.set())
+    server.start()
+    stopping.wait()
+    server.stop(GRPC_SERVER_GRACE_PERIOD).wait()
+
+
+def _run_worker(server_port: int, server_mode: str, metrics_port: int) -> None:
+    """
+    Entry point of the worker processes
+
+    :param server_port: Port to listen to
+    :param server_mode: `THREAD_POOL_SERVER_MODE` or `ASYNCIO_SERVER_MODE`
+    :param metrics_port: Port of the metrics HTTP server of the worker, 0 disables it
+    :return:
+    """
+    setup_logging()
+    # The parent process receives Ctrl+C too, and stops the workers with SIGTERM
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logger.info('Worker process serving on port %s in %s mode', server_port, server_mode)
+    if metrics_port:
+        start_metrics_server(metrics_port)
+    if server_mode == ASYNCIO_SERVER_MODE:
+        asyncio.get_event_loop().run_until_complete(_serve_aio_worker(server_port))
+    else:
+        _serve_worker(server_port)
+    logger.info('Worker process stopped')
+
+
+class PreforkSupervisor:
+    """
+    Start the worker processes, restart them if they exit, and stop them gracefully
+
+    Attributes:
+        PreforkSupervisor.workers (List[multiprocessing.Process]): Running worker processes
+        PreforkSupervisor.restarts (int): Number of worker processes restarted
+    """
+
+    def __init__(self, server_port: int, server_mode: str = GRPC_SERVER_MODE,
+                 worker_processes: int = GRPC_SERVER_WORKER_PROCESSES):
+        """
+        Constructor of the supervisor, the workers are not started until `start` is called
+
+        :param server_port: Port that all the workers listen to
+        :param server_mode: `THREAD_POOL_SERVER_MODE` or `ASYNCIO_SERVER_MODE`. Default `GRPC_SERVER_MODE`
+        :param worker_processes: Number of worker processes. Default `GRPC_SERVER_WORKER_PROCESSES`
+        """
+        self.server_port = server_port
+        self.server_mode = server_mode
+        self.worker_processes = worker_processes
+        self.workers: List[multiprocessing.Process] = []
+        self.restarts = 0
+        self._stopping = threading.Event()
+        self._context = multiprocessing.get_context('spawn')
+
+    def _start_worker(self, index: int) -> multiprocessing.Process:
+        """
+        Start a worker process
+
+        :param index: Position of the worker in `workers`, a restarted worker keeps the index of the exited one
+        :return: Started process
+        """
+        metrics_port = METRICS_PORT + 1 + index if METRICS_PORT else 0
+        worker = self._context.Process(target=_run_worker, args=(self.server_port, self.server_mode, metrics_port),
+                                       name='todolists-worker')
+        worker.start()
+        logger.info('Started worker process %s', worker.pid)
+        return worker
+
+    def start(self) -> None:
+        """
+        Set up the storage, so the workers do not race to create the DB tables, and start the worker processes
+        :return:
+        """
+        create_storage_backend().setup()
+        Database.db_engine.dispose()
+        self.workers = [self._start_worker(_index) for _index in range(self.worker_processes)]
+
+    def supervise(self) -> None:
+        """
+        Restart the worker processes that exit, until `stop` is called, then stop the workers.
+        :return:
+        """
+        while not self._stopping.is_set():
+            multiprocessing.connection.wait([_worker.sentinel for _worker in self.workers],
+                                            timeout=_SUPERVISE_INTERVAL)
+            for index, worker in enumerate(self.workers):
+                if worker.exitcode is None:
+                    continue
+                logger.warning('Worker process %s exited with code %s', worker.pid, worker.exitcode)
+                # Avoid a busy loop if the workers fail as soon as they start
+                if self._stopping.wait(_RESTART_DELAY):
+                    break
+                self.workers[index] = self._start_worker(index)
+                self.restarts += 1
+        self._stop_workers()
+
+    def stop(self) -> None:
+        """
+        Ask `supervise` to stop the workers, it can be called from a signal handler or another thread
+        :return:
+        """
+        self._stopping.set()
+
+    def _stop_workers(self) -> None:
+        """
+        Send SIGTERM to the workers, so they stop accepting RPCs and finish the in-flight ones,
+        and kill the workers that do not exit after the grace period
+        :return:
+        """
+        logger.info('Stopping %s worker processes', len(self.workers))
+        for worker in self.workers:
+            if worker.is_alive():
+                worker.terminate()
+        for worker in self.workers:
+            worker.join(GRPC_SERVER_GRACE_PERIOD + _STOP_TIMEOUT_MARGIN)
+            if worker.is_alive():
+                logger.warning('Worker process %s did not stop, killing it', worker.pid)
+                worker.kill()
+                worker.join()
+
+
+def serve(server_port: int):
+    """
+    Start the worker processes of the todolists.TodoLists gRPC Service and supervise them
+    until the process receives SIGTERM or SIGINT.
+
+    :param server_port: Port to listen to
+    :return:
+    """
+    supervisor = PreforkSupervisor(server_port)
+    signal.signal(signal.SIGTERM, lambda _signum, _frame: supervisor.stop())
+    signal.signal(signal.SIGINT, lambda _signum, _frame: supervisor.stop())
+    logger.info('Running TodoLists pre-fork gRPC server on port %s with %s worker processes',
+                server_port, supervisor.worker_processes)
+    supervisor.start()
+    supervisor.supervise()
@@ -0,0 +1,425 @@
+"""
+This module contains the per-client rate limits of the gRPC servers, so a single client, e.g. a batch job,
+can not use all the capacity of the server.
+
+Each client has two token buckets, the read budget, used by `READ_METHODS`, and the write budget, used by
+`WRITE_METHODS`. A bucket holds up to `burst` tokens and is refilled with `rate` tokens per second. The RPCs are
+charged by the work that they do, the cost of their method, 1 token by default or the `RATE_LIMIT_METHOD_COSTS` pairs,
+for each item:
+
+    - The unary RPCs take their tokens when they start, for each name or ID of the batch methods, see `ITEMS_FIELDS`.
+    - The request streaming RPCs, `ImportLists` and `Session`, take the tokens of each message when it is received,
+      for each name of an `ImportLists` message. Each `Session` operation takes the tokens of the unary method
+      that runs it, from its budget, see `SESSION_OPERATION_METHODS`, so the reads of a Session use the read budget.
+    - The response streaming RPCs, `StreamLists`, take the tokens of each message before it is sent.
+
+A batch bigger than the burst is taken when the bucket is full, and the client pays the rest before its next RPC.
+An RPC of a client without enough tokens is rejected with `RESOURCE_EXHAUSTED`, and the `RETRY_AFTER_METADATA_KEY`
+trailing metadata with the seconds until the bucket has enough tokens. A stream is aborted with the same status
+at the first message without enough tokens.
+
+The clients are identified by the `RATE_LIMIT_CLIENT_METADATA` metadata key if it is configured, e.g. when the server
+runs behind a proxy that sets it, the clients can set any value, so it must only be trusted from a proxy.
+Otherwise they are identified by the identity of their TLS certificate, and without a certificate by their address.
+
+The buckets are refilled lazily, when the client sends an RPC, there is no timer, and the check of an RPC only takes
+a lock and a few arithmetic operations.
+
+Examples:
+        Pass the interceptor when the server is created, after the metrics interceptor, so the metrics count the
+        rejected RPCs, and before the admission control, so the rejected RPCs do not wait in its queue.
+
+            $ server = grpc.server(ThreadPoolExecutor(), interceptors=[MetricsInterceptor(), RateLimitInterceptor()])
+            $ aio_server = grpc.aio.server(interceptors=(AsyncMetricsInterceptor(), AsyncRateLimitInterceptor()))
+
+Classes:
+    ClientTokenBuckets: Token bucket of each client for one budget
+    RateLimiter: Read and write budgets of the clients, and tokens of each gRPC method
+    RateLimitInterceptor(grpc.ServerInterceptor): Per-client rate limits of the thread pool servers
+    AsyncRateLimitInterceptor(grpc.aio.ServerInterceptor): Per-client rate limits of the asyncio servers
+
+Attributes:
+    READ_BUDGET (str): Name of the budget of the methods that read the TodoLists
+    WRITE_BUDGET (str): Name of the budget of the methods that change the TodoLists
+    READ_METHODS (Tuple[str]): gRPC methods that use the read budget
+    WRITE_METHODS (Tuple[str]): gRPC methods that use the write budget
+    SESSION_METHOD (str): gRPC method whose operations use the budget of their unary method
+    SESSION_OPERATION_METHODS (Dict[str, str]): Unary gRPC method of each Session operation, the requests without
+     operation are charged as `Get`
+    ITEMS_FIELDS (Dict[str, str]): Repeated field with the items of the request messages of the methods that do the
+     work of many RPCs, the other messages are 1 item
+    RETRY_AFTER_METADATA_KEY (str): Trailing metadata key of the seconds that a rejected client should wait
+    rate_limit.parse_method_costs (function): Parse the per-method costs
+"""
+import collections
+import functools
+import inspect
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+import grpc
+from grpc import aio
+
+from config.config import (
+    RATE_LIMIT_READ_RATE, RATE_LIMIT_READ_BURST, RATE_LIMIT_WRITE_RATE, RATE_LIMIT_WRITE_BURST,
+    RATE_LIMIT_METHOD_COSTS, RATE_LIMIT_CLIENT_METADATA, RATE_LIMIT_MAX_CLIENTS
+)
+from metrics.rate_limit_metrics import RATE_LIMITED, RATE_LIMIT_CLIENTS
+from grpc_utils.interceptors import MethodHandlersCache, wrap_rpc_method_handler
+
+READ_BUDGET = 'read'
+WRITE_BUDGET = 'write'
+READ_METHODS = ('Get', 'List', 'StreamLists', 'BatchGet')
+WRITE_METHODS = ('Create', 'Delete', 'BatchCreate', 'BatchDelete', 'ImportLists')
+SESSION_METHOD = 'Session'
+SESSION_OPERATION_METHODS = {'create': 'Create', 'get': 'Get', 'delete': 'Delete', 'list': 'List'}
+ITEMS_FIELDS = {'BatchGet': 'ids', 'BatchCreate': 'names', 'BatchDelete': 'ids', 'ImportLists': 'names'}
+RETRY_AFTER_METADATA_KEY = 'retry-after'
+
+_RATE_LIMITED_DETAILS_TEMPLATE = 'Rate limit exceeded, retry after {:.3f} seconds'
+
+
+def parse_method_costs(method_costs: str) -> Dict[str, float]:
+    """
+    Parse the per-method costs, `method=tokens` pairs separated by commas
+
+        $ parse_method_costs('BatchCreate=20,Get=1')
+
+    :param method_costs: Per-method costs
+    :return: Tokens of each item of each gRPC method name
+    :raise ValueError: If a pair does not have a method name and a positive number of tokens
+    """
+    costs = {}
+    for pair in filter(None, (_pair.strip() for _pair in method_costs.split(','))):
+        method, _, tokens = pair.partition('=')
+        try:
+            cost = float(tokens)
+        except ValueError:
+            cost = 0
+        if not method.strip() or cost <= 0:
+            raise ValueError('Invalid method cost "{}", expected `method=tokens`'.format(pair))
+        costs[method.strip()] = cost
+    return costs
+
+
+class ClientTokenBuckets:  # pylint: disable=too-few-public-methods
+    """
+    Token bucket of each client for one budget.
+
+    The bucket of a client is created full, with `burst` tokens, the first time that the client sends an RPC.
+    When there are `max_clients` buckets, the bucket of the client that has not sent an RPC for the longest time
+    is forgotten, if its client sends another RPC it gets a full bucket again.
+    """
+
+    def __init__(self, budget: str, rate: float, burst: float, max_clients: int = RATE_LIMIT_MAX_CLIENTS):
+        """
+        :param budget: `READ_BUDGET` or `WRITE_BUDGET`, label of the metrics
+        :param rate: Tokens per second added to each bucket
+        :param burst: Max tokens of each bucket
+        :param max_clients: Max number of buckets. Default `RATE_LIMIT_MAX_CLIENTS`
+        :raise ValueError: If the rate or the burst are not positive
+        """
+        if rate <= 0 or burst <= 0:
+            raise ValueError('The rate and the burst of the "{}" budget must be positive'.format(budget))
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        # Tokens and `time.monotonic` time of their last refill, by client, the least recently used client first
+        self._buckets: Dict[str, List[float]] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._clients = RATE_LIMIT_CLIENTS.labels(budget)
+        self._rejected = RATE_LIMITED.labels(budget)
+
+    def take(self, client: str, tokens: float) -> float:
+        """
+        Take tokens from the bucket of a client, if it has enough of them.
+        More tokens than `burst` are taken from a full bucket, that is left with negative tokens
+
+        :param client: Identity of the client
+        :param tokens: Tokens of the RPC or message
+        :return: 0 if the tokens were taken, or the seconds until the bucket has enough tokens
+        """
+        now = time.monotonic()
+        needed = min(tokens, self.burst)
+        with self._lock:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                if len(self._buckets) >= self.max_clients:
+                    self._buckets.popitem(last=False)
+                else:
+                    self._clients.inc()
+                bucket = self._buckets[client] = [self.burst, now]
+            else:
+                self._buckets.move_to_end(client)
+            available = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if available >= needed:
+                bucket[0] = available - tokens
+                return 0
+            bucket[0] = available
+        self._rejected.inc()
+        return (needed - available) / self.rate
+
+
+class RateLimiter:
+    """
+    Read and write budgets of the clients, and tokens of each item of each gRPC method
+
+    Attributes:
+        RateLimiter.read_buckets (ClientTokenBuckets): Read budget of each client
+        RateLimiter.write_buckets (ClientTokenBuckets): Write budget of each client
+        RateLimiter.client_metadata (str): Metadata key that identifies the clients, empty to identify them
+         by their TLS certificate or address
+    """
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 read_rate: float = RATE_LIMIT_READ_RATE,
+                 read_burst: float = RATE_LIMIT_READ_BURST,
+                 write_rate: float = RATE_LIMIT_WRITE_RATE,
+                 write_burst: float = RATE_LIMIT_WRITE_BURST,
+                 method_costs: str = RATE_LIMIT_METHOD_COSTS,
+                 client_metadata: str = RATE_LIMIT_CLIENT_METADATA,
+                 max_clients: int = RATE_LIMIT_MAX_CLIENTS):
+        """
+        :param read_rate: Tokens per second of the read budgets. Default `RATE_LIMIT_READ_RATE`
+        :param read_burst: Max tokens of the read budgets. Default `RATE_LIMIT_READ_BURST`
+        :param write_rate: Tokens per second of the write budgets. Default `RATE_LIMIT_WRITE_RATE`
+        :param write_burst: Max tokens of the write budgets. Default `RATE_LIMIT_WRITE_BURST`
+        :param method_costs: Per-method costs of each item, the other methods take 1 token for each item,
+            see `parse_method_costs`. Default `RATE_LIMIT_METHOD_COSTS`
+        :param client_metadata: Metadata key that identifies the clients. Default `RATE_LIMIT_CLIENT_METADATA`
+        :param max_clients: Max number of clients of each budget. Default `RATE_LIMIT_MAX_CLIENTS`
+        :raise ValueError: If a method cost is not valid, or a rate or a burst are not positive
+        """
+        self.read_buckets = ClientTokenBuckets(READ_BUDGET, read_rate, read_burst, max_clients)
+        self.write_buckets = ClientTokenBuckets(WRITE_BUDGET, write_rate, write_burst, max_clients)
+        # gRPC metadata keys are lowercase
+        self.client_metadata = client_metadata.lower()
+        costs = parse_method_costs(method_costs)
+        self._methods: Dict[str, Tuple[ClientTokenBuckets, float]] = {}
+        for methods, buckets in ((READ_METHODS, self.read_buckets), (WRITE_METHODS, self.write_buckets)):
+            self._methods.update((_method, (buckets, costs.get(_method, 1))) for _method in methods)
+
+    def method_limit(self, method: str) -> Optional[Tuple[ClientTokenBuckets, float]]:
+        """
+        :param method: gRPC method name, e.g. `Get` or `/todolists.TodoLists/Get`
+        :return: Budget of the method and tokens of each item, None if the method is not limited
+        """
+        return self._methods.get(method.rpartition('/')[2])
+
+    def message_limit(self, method: str) -> Optional[Callable[[Any], Tuple[ClientTokenBuckets, float]]]:
+        """
+        :param method: gRPC method name, e.g. `BatchGet` or `/todolists.TodoLists/BatchGet`
+        :return: Function that returns the budget and the tokens of a message of the method, the tokens of 1 item
+            for a None message, or None if the method is not limited
+        """
+        method = method.rpartition('/')[2]
+        if method != SESSION_METHOD:
+            return self._items_limit(method)
+        operation_limits = {_operation: self._items_limit(_method)
+                            for _operation, _method in SESSION_OPERATION_METHODS.items()}
+        default_limit = operation_limits['get']
+
+        def _operation_limit(request: Any) -> Tuple[ClientTokenBuckets, float]:
+            operation = request.WhichOneof('operation') if request is not None else None
+            return operation_limits.get(operation, default_limit)(request)
+        return _operation_limit
+
+    def _items_limit(self, method: str) -> Optional[Callable[[Any], Tuple[ClientTokenBuckets, float]]]:
+        """
+        :param method: gRPC method name, without the service
+        :return: Function that returns the budget and the tokens of the items of a message of the method,
+            or None if the method is not limited
+        """
+        method_limit = self._methods.get(method)
+        if method_limit is None:
+            return None
+        buckets, cost = method_limit
+        items_field = ITEMS_FIELDS.get(method)
+        if items_field is None:
+            return lambda _message: method_limit
+
+        def _message_limit(message: Any) -> Tuple[ClientTokenBuckets, float]:
+            # The tokens of 1 item for an empty batch
+            items = len(getattr(message, items_field)) if message is not None else 1
+            return buckets, cost * max(1, items)
+        return _message_limit
+
+    def client_key(self, context: grpc.ServicerContext) -> str:
+        """
+        :param context: Servicer context of the RPC
+        :return: Identity of the client, from the `client_metadata` key, its TLS certificate, or its address
+        """
+        if self.client_metadata:
+            for key, value in context.invocation_metadata():
+                if key == self.client_metadata:
+                    return 'metadata:{}'.format(value)
+        identities = context.peer_identities()
+        if identities:
+            return 'tls:{}'.format(identities[0].decode())
+        # e.g. `ipv4:127.0.0.1:50000`, the port is different for each connection of the client
+        return context.peer().rpartition(':')[0]
+
+
+def _rejected_metadata(retry_after: float) -> Tuple[Tuple[str, str]]:
+    """
+    :param retry_after: Seconds until the client has enough tokens
+    :return: Trailing metadata of a rejected RPC
+    """
+    return ((RETRY_AFTER_METADATA_KEY, '{:.3f}'.format(retry_after)),)
+
+
+def _wrap_behavior(behavior: Callable, limiter: RateLimiter,
+                   message_limit: Callable[[Any], Tuple[ClientTokenBuckets, float]], request_streaming: bool,
+                   response_streaming: bool) -> Callable:
+    """
+    :param behavior: Servicer method of a thread pool server
+    :param limiter: Rate limiter of the server
+    :param message_limit: Function that returns the budget and the tokens of a message, see
+        `RateLimiter.message_limit`
+    :param request_streaming: If the RPC receives a stream of messages
+    :param response_streaming: If the RPC sends a stream of messages
+    :return: Servicer method that only runs the RPCs, and handles the messages, of the clients under their limit
+    """
+    def _check_limit(client: str, context: grpc.ServicerContext, message: Any) -> None:
+        buckets, tokens = message_limit(message)
+        retry_after = buckets.take(client, tokens)
+        if retry_after:
+            context.set_trailing_metadata(_rejected_metadata(retry_after))
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, _RATE_LIMITED_DETAILS_TEMPLATE.format(retry_after))
+
+    def _limited_requests(request_iterator: Iterator[Any], client: str,
+                          context: grpc.ServicerContext) -> Iterator[Any]:
+        for request in request_iterator:
+            _check_limit(client, context, request)
+            yield request
+
+    def _limited_responses(request: Any, client: str, context: grpc.ServicerContext) -> Iterator[Any]:
+        for response in behavior(request, context):
+            _check_limit(client, context, response)
+            yield response
+
+    def _limited_behavior(request_or_iterator: Any, context: grpc.ServicerContext) -> Any:
+        client = limiter.client_key(context)
+        if request_streaming:
+            return behavior(_limited_requests(request_or_iterator, client, context), context)
+        if response_streaming:
+            return _limited_responses(request_or_iterator, client, context)
+        _check_limit(client, context, request_or_iterator)
+        return behavior(request_or_iterator, context)
+    return _limited_behavior
+
+
+def _wrap_async_behavior(behavior: Callable, limiter: RateLimiter,
+                         message_limit: Callable[[Any], Tuple[ClientTokenBuckets, float]], request_streaming: bool,
+                         response_streaming: bool) -> Callable:
+    """
+    :param behavior: Servicer method of an asyncio server, a coroutine or async generator function
+    :param limiter: Rate limiter of the server
+    :param message_limit: Function that returns the budget and the tokens of a message, see
+        `RateLimiter.message_limit`
+    :param request_streaming: If the RPC receives a stream of messages
+    :param response_streaming: If the RPC sends a stream of messages
+    :return: Servicer method that only runs the RPCs, and handles the messages, of the clients under their limit
+    """
+    async def _check_limit(client: str, context: aio.ServicerContext, message: Any) -> None:
+        buckets, tokens = message_limit(message)
+        retry_after = buckets.take(client, tokens)
+        if retry_after:
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, _RATE_LIMITED_DETAILS_TEMPLATE.format(retry_after),
+                                _rejected_metadata(retry_after))
+
+    async def _limited_requests(request_iterator: AsyncIterator[Any], client: str,
+                                context: aio.ServicerContext) -> AsyncIterator[Any]:
+        async for request in request_iterator:
+            await _check_limit(client, context, request)
+            yield request
+
+    async def _requests(request_or_iterator: Any, client: str, context: aio.ServicerContext) -> Any:
+        if not request_streaming:
+            await _check_limit(client, context, request_or_iterator)
+        elif request_or_iterator is not None:
+            return _limited_requests(request_or_iterator, client, context)
+        else:
+            # The servicers that read the requests with `context.read` take the tokens of one item when they start
+            await _check_limit(client, context, None)
+        return request_or_iterator
+
+    if response_streaming and inspect.isasyncgenfunction(behavior):
+        async def _stream_behavior(request_or_iterator: Any, context: aio.ServicerContext) -> AsyncIterator[Any]:
+            client = limiter.client_key(context)
+            if request_streaming:
+                request_or_iterator = await _requests(request_or_iterator, client, context)
+            async for response in behavior(request_or_iterator, context):
+                if not request_streaming:
+                    await _check_limit(client, context, response)
+                yield response
+        return _stream_behavior
+
+    async def _coroutine_behavior(request_or_iterator: Any, context: aio.ServicerContext) -> Any:
+        # The response streaming coroutines write the responses with `context.write`, they take their tokens once
+        return await behavior(await _requests(request_or_iterator, limiter.client_key(context), context), context)
+    return _coroutine_behavior
+
+
+def _wrap_handler(wrap_behavior: Callable, limiter: RateLimiter, handler: grpc.RpcMethodHandler,
+                  full_method: str) -> grpc.RpcMethodHandler:
+    """
+    :param wrap_behavior: `_wrap_behavior` or `_wrap_async_behavior`
+    :param limiter: Rate limiter of the server
+    :param handler: Method handler of the RPC
+    :param full_method: gRPC method name
+    :return: Method handler that only runs the RPCs of the clients under their limit,
+        the same handler if the method is not limited
+    """
+    message_limit = limiter.message_limit(full_method)
+    if message_limit is None:
+        return handler
+    return wrap_rpc_method_handler(handler, lambda behavior: wrap_behavior(
+        behavior, limiter, message_limit, handler.request_streaming, handler.response_streaming))
+
+
+class RateLimitInterceptor(grpc.ServerInterceptor):  # pylint: disable=too-few-public-methods
+    """
+    Server interceptor with the per-client rate limits of a thread pool gRPC server
+    """
+
+    def __init__(self, limiter: RateLimiter = None):  # pylint: disable=super-init-not-called
+        """
+        :param limiter: Rate limiter. Default a `RateLimiter` with the config values
+        """
+        self.limiter = limiter if limiter is not None else RateLimiter()
+        self._handlers = MethodHandlersCache(functools.partial(_wrap_handler, _wrap_behavior, self.limiter))
+
+    def intercept_service(self, continuation: Callable[[grpc.HandlerCallDetails], grpc.RpcMethodHandler],
+                          handler_call_details: grpc.HandlerCallDetails) -> grpc.RpcMethodHandler:
+        """
+        :param continuation: Function that returns the method handler of the RPC
+        :param handler_call_details: Method name and metadata of the RPC
+        :return: Method handler that only runs the RPCs of the clients under their limit
+        """
+        return self._handlers.wrap(continuation(handler_call_details), handler_call_details.method)
+
+
+class AsyncRateLimitInterceptor(aio.ServerInterceptor):  # pylint: disable=too-few-public-methods
+    """
+    Server interceptor with the per-client rate limits of an asyncio gRPC server
+    """
+
+    def __init__(self, limiter: RateLimiter = None):
+        """
+        :param limiter: Rate limiter. Default a `RateLimiter` with the config values
+        """
+        self.limiter = limiter if limiter is not None else RateLimiter()
+        self._handlers = MethodHandlersCache(functools.partial(_wrap_handler, _wrap_async_behavior, self.limiter))
+
+    async def intercept_service(self,
+                                continuation: Callable[[grpc.HandlerCallDetails], Awaitable[grpc.RpcMethodHandler]],
+                                handler_call_details: grpc.HandlerCallDetails) -> grpc.RpcMethodHandler:
+        """
+        :param continuation: Coroutine function that returns the method handler of the RPC
+        :param handler_call_details: Method name and metadata of the RPC
+        :return: Method handler that only runs the RPCs of the clients under their limit
+        """
+        return self._handlers.wrap(await continuation(handler_call_details), handler_call_details.method)
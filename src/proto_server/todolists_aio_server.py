@@ -0,0 +1,482 @@
+"""
+Module with the asyncio Implementation of the gRPC todolists.TodoLists Service.
+
+The gRPC methods are coroutines executed by a grpc.aio server, a single event loop can handle thousands of
+concurrent RPCs because no thread is pinned while an RPC waits for the database.
+
+Examples:
+        This module provides the function to start the asyncio gRPC Server for the todolists.TodoLists Service.
+
+            $ import proto_server.todolists_aio_server as todolists_aio_server
+            $ todolists_aio_server.serve()
+
+Classes:
+    AsyncSessionOperationContext: Context of the asyncio gRPC methods run by the Session operations
+    AsyncTodoLists(todolists_pb2_grpc.TodoListsServicer): Definition of the asyncio gRPC Servicer methods
+
+Attributes:
+    todolists_aio_server.abort_with_status (function): Abort an asyncio RPC with a google.rpc.Status
+    todolists_aio_server.create_secured_server (function): Create the asyncio gRPC server and add SSL credentials
+    todolists_aio_server.serve (function): Run the asyncio gRPC server and wait for stubs connections
+    todolists_aio_server.logger (logging.Logger): Logger of the module
+    todolists_aio_server.request_logger (logging.Logger): Logger of the per-request logs, written at DEBUG level
+"""
+import asyncio
+import logging
+import math
+import time
+from typing import Any, AsyncIterator, Sequence, Tuple
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import NoResultFound
+from grpc_status import rpc_status
+from google.rpc import status_pb2, code_pb2
+from grpc import aio
+import grpc
+
+from config.config import (
+    STREAM_LISTS_CHUNK_SIZE, IMPORT_LISTS_CHUNK_SIZE, SESSION_MAX_IN_FLIGHT, ADMISSION_CONTROL, RATE_LIMIT
+)
+from config.compression import COMPRESSION_POLICY, CompressionPolicy
+from config.logs import get_request_logger
+from database.backends import create_storage_backend
+from database.async_todo_lists_db_handler import AsyncTodoListDBHandler
+from database.query_guard import QueryAborted, QueryGuard, guarded_queries
+from database.storage import StorageBackend
+from metrics.interceptors import AsyncMetricsInterceptor
+from metrics.session_metrics import observe_session_operation
+from proto_server.admission import (
+    AdmissionRejected, AsyncAdmissionController, AsyncAdmissionInterceptor, context_time_remaining
+)
+from proto_server.compression import AsyncCompressionInterceptor
+from proto_server.rate_limit import AsyncRateLimitInterceptor
+from proto_server.todolists_server import (
+    TodoLists, SessionOperationAborted, create_server_credentials, _LISTEN_ADDRESS_TEMPLATE, _SESSION_OPERATIONS
+)
+import proto.v1.todolists_pb2 as todolists_pb2
+import proto.v1.todolists_pb2_grpc as todolists_pb2_grpc
+
+logger = logging.getLogger(__name__)
+request_logger = get_request_logger(__name__)
+
+
+async def abort_with_status(context: aio.ServicerContext, status: status_pb2.Status) -> None:
+    """
+    Abort the RPC with a google.rpc.Status, same as `grpc.ServicerContext.abort_with_status` for the sync servers
+
+    :param context: grpc.aio ServicerContext
+    :param status: Error status
+    :raise AbortError: Always, to finish the RPC
+    """
+    grpc_status = rpc_status.to_status(status)
+    await context.abort(grpc_status.code, grpc_status.details, grpc_status.trailing_metadata)
+
+
+class AsyncSessionOperationContext:  # pylint: disable=too-few-public-methods
+    """
+    Context of the asyncio unary gRPC methods run by the Session operations.
+    An abort raises `SessionOperationAborted` instead of finishing the Session stream.
+    """
+
+    @staticmethod
+    async def abort(code: grpc.StatusCode, details: str = '', _trailing_metadata: Any = ()) -> None:
+        """
+        :param code: Status code of the abort
+        :param details: Description of the error. Default empty
+        :param _trailing_metadata: Not used, the Session replies have no metadata
+        :raise SessionOperationAborted: Always
+        """
+        raise SessionOperationAborted(code, details)
+
+
+class AsyncTodoLists(todolists_pb2_grpc.TodoListsServicer):
+    """
+    Asyncio implementation of gRPC methods for todolists.TodoLists service
+    """
+    # The generated Servicer declares the methods as non-async, grpc.aio servers expect coroutines
+    # pylint: disable=invalid-overridden-method
+
+    def __init__(self, storage: StorageBackend = None, admission_controller: AsyncAdmissionController = None):
+        """
+        Constructor of AsyncTodoLists gRPC service, when executed set up the storage that the Service will use,
+        e.g. create the database tables if were not already created.
+
+        :param storage: Storage backend of the TodoLists. Default the backend selected by `STORAGE_BACKEND`
+        :param admission_controller: Admission controller of the unary RPCs of the server, that also admits
+            the Session operations. Default None, the Session operations are not limited
+        """
+        storage = storage if storage is not None else create_storage_backend()
+        storage.setup()
+        self.db_handler = AsyncTodoListDBHandler(storage)
+        self.admission_controller = admission_controller
+
+    async def Create(self,
+                     request: todolists_pb2.CreateListRequest,
+                     context: aio.ServicerContext) -> todolists_pb2.CreateListReply:
+        """
+        Create New TodoList gRPC method, see `TodoLists.Create`
+
+        :param request: Request send by the client
+        :param context: grpc.aio ServicerContext
+        :return: CreateListReply
+        """
+        try:
+            request_logger.debug('Creating TodoList with name "%s"', request.name)
+            new_entry_id = await self.db_handler.new_todo_list_entry(name=request.name)
+            request_logger.debug('TodoList created with id "%s"', new_entry_id)
+            return todolists_pb2.CreateListReply(id=new_entry_id, name=request.name)
+        except IntegrityError:
+            await abort_with_status(context, TodoLists.create_grpc_error_status(
+                'List name must be unique, list with name "{}" already exist.'.format(request.name),
+                code_pb2.INVALID_ARGUMENT
+            ))
+
+    async def Get(self, request: todolists_pb2.GetListRequest, context: aio.ServicerContext) -> todolists_pb2.TodoList:
+        """
+        Get a TodoList gRPC method, see `TodoLists.Get`
+
+        :param request: Request send by the client
+        :param context: grpc.aio ServicerContext
+        :return: TodoList
+        """
+        try:
+            request_logger.debug('Get TodoList with id "%s"', request.id)
+            with guarded_queries(QueryGuard.for_rpc(context)):
+                todo_list = await self.db_handler.get_todo_list(list_id=request.id)
+            return todolists_pb2.TodoList(id=todo_list.id, name=todo_list.name)
+        except NoResultFound:
+            await abort_with_status(context, TodoLists.create_grpc_error_status(
+                'List with id "{}" not found.'.format(request.id),
+                code_pb2.NOT_FOUND
+            ))
+        except QueryAborted as ex:
+            await abort_with_status(context, TodoLists.create_query_aborted_status(ex))
+
+    async def Delete(self,
+                     request: todolists_pb2.DeleteListRequest,
+                     context: aio.ServicerContext) -> todolists_pb2.Empty:
+        """
+        Delete a TodoList gRPC method, see `TodoLists.Delete`
+
+        :param request: Request send by the client
+        :param context: grpc.aio ServicerContext
+        :return: Empty
+        """
+        try:
+            request_logger.debug('Delete TodoList with id "%s"', request.id)
+            await self.db_handler.delete_todo_list(list_id=request.id)
+            return todolists_pb2.Empty()
+        except NoResultFound:
+            await abort_with_status(context, TodoLists.create_grpc_error_status(
+                'List with id "{}" not found.'.format(request.id),
+                code_pb2.NOT_FOUND
+            ))
+
+    async def List(self,
+                   request: todolists_pb2.ListTodoListsRequest,
+                   context: aio.ServicerContext) -> todolists_pb2.ListTodoListsReply:
+        """
+        List TodoLists gRPC method, see `TodoLists.List`
+
+        The page and the count, unless `request.skip_count` is set, are fetched concurrently.
+
+        :param request: Send by the client
+        :param context: grpc.aio ServicerContext
+        :return: ListTodoListsReply
+        """
+        request_logger.debug('List TodoLists. `page_size=%s`, `page_number=%s`, `page_token=%s`',
+                             request.page_size, request.page_number, request.page_token)
+        page_number = request.page_number if request.page_number > 0 else 1
+        page_size = TodoLists.normalize_page_size(request.page_size)
+
+        if request.page_token:
+            try:
+                last_id = TodoLists.decode_page_token(request.page_token)
+            except ValueError:
+                await abort_with_status(context, TodoLists.create_grpc_error_status(
+                    'Invalid page_token "{}".'.format(request.page_token),
+                    code_pb2.INVALID_ARGUMENT
+                ))
+            get_page = self.db_handler.get_lists_after(last_id=last_id, limit=page_size + 1)
+        else:
+            get_page = self.db_handler.get_lists_paginated(page_number=page_number, page_size=page_size,
+                                                           include_next=True)
+        try:
+            with guarded_queries(QueryGuard.for_rpc(context)):
+                if request.skip_count:
+                    db_lists, count = await get_page, 0
+                else:
+                    db_lists, count = await asyncio.gather(get_page, self.db_handler.get_lists_db_count())
+        except QueryAborted as ex:
+            await abort_with_status(context, TodoLists.create_query_aborted_status(ex))
+        # One extra entry is fetched to know if there is a next page
+        has_next_page = len(db_lists) > page_size
+        db_lists = db_lists[:page_size]
+        next_page_number = str(page_number + 1) if has_next_page and not request.page_token else ''
+        next_page_token = TodoLists.encode_page_token(db_lists[-1].id) if has_next_page else ''
+
+        return todolists_pb2.ListTodoListsReply(next_page_number=next_page_number, count=count,
+                                                todo_lists=TodoLists.create_todo_list_messages(db_lists),
+                                                next_page_token=next_page_token)
+
+    async def StreamLists(self,
+                          request: todolists_pb2.StreamListsRequest,
+                          context: aio.ServicerContext) -> AsyncIterator[todolists_pb2.TodoList]:
+        """
+        Stream TodoLists gRPC method, see `TodoLists.StreamLists`
+
+        While a chunk of TodoLists is being sent, the next chunk is already being read from the DB.
+        At most two chunks are kept in memory.
+
+        :param request: Send by the client
+        :param context: grpc.aio ServicerContext
+        :return: Async iterator of TodoList
+        """
+        request_logger.debug('Stream TodoLists after id "%s"', request.after_id)
+        guard = QueryGuard.for_rpc(context)
+        # The tasks that read the chunks copy the context where they are created, with the guard of the reads
+        with guarded_queries(guard):
+            next_chunk = asyncio.ensure_future(self.db_handler.get_lists_after(last_id=request.after_id,
+                                                                               limit=STREAM_LISTS_CHUNK_SIZE))
+        try:
+            while next_chunk is not None:
+                try:
+                    chunk = await next_chunk
+                except QueryAborted as ex:
+                    await abort_with_status(context, TodoLists.create_query_aborted_status(ex))
+                next_chunk = None
+                if len(chunk) == STREAM_LISTS_CHUNK_SIZE:
+                    with guarded_queries(guard):
+                        next_chunk = asyncio.ensure_future(self.db_handler.get_lists_after(
+                            last_id=chunk[-1].id, limit=STREAM_LISTS_CHUNK_SIZE))
+                for todo_list in chunk:
+                    yield todolists_pb2.TodoList(id=todo_list.id, name=todo_list.name)
+        finally:
+            # A chunk is only pending here if the client cancelled the RPC
+            if next_chunk is not None:
+                next_chunk.cancel()
+
+    async def BatchCreate(self,
+                          request: todolists_pb2.BatchCreateListsRequest,
+                          context: aio.ServicerContext) -> todolists_pb2.BatchCreateListsReply:
+        """
+        Create many TodoLists gRPC method, see `TodoLists.BatchCreate`
+
+        :param request: Request send by the client
+        :param context: grpc.aio ServicerContext
+        :return: BatchCreateListsReply
+        """
+        request_logger.debug('Creating %s TodoLists', len(request.names))
+        error_status = TodoLists.create_batch_size_status(len(request.names))
+        if error_status is not None:
+            await abort_with_status(context, error_status)
+        new_ids = await self.db_handler.new_todo_list_entries(names=list(request.names))
+        request_logger.debug('%s TodoLists created', len(new_ids) - new_ids.count(None))
+        return TodoLists.create_batch_create_reply(request.names, new_ids)
+
+    async def BatchGet(self,
+                       request: todolists_pb2.BatchGetListsRequest,
+                       context: aio.ServicerContext) -> todolists_pb2.BatchGetListsReply:
+        """
+        Get many TodoLists gRPC method, see `TodoLists.BatchGet`
+
+        :param request: Request send by the client
+        :param context: grpc.aio ServicerContext
+        :return: BatchGetListsReply
+        """
+        request_logger.debug('Get %s TodoLists', len(request.ids))
+        error_status = TodoLists.create_batch_size_status(len(request.ids))
+        if error_status is not None:
+            await abort_with_status(context, error_status)
+        try:
+            with guarded_queries(QueryGuard.for_rpc(context)):
+                todo_lists = await self.db_handler.get_todo_lists(list_ids=list(request.ids))
+        except QueryAborted as ex:
+            await abort_with_status(context, TodoLists.create_query_aborted_status(ex))
+        return TodoLists.create_batch_get_reply(request.ids, todo_lists)
+
+    async def BatchDelete(self,
+                          request: todolists_pb2.BatchDeleteListsRequest,
+                          context: aio.ServicerContext) -> todolists_pb2.BatchDeleteListsReply:
+        """
+        Delete many TodoLists gRPC method, see `TodoLists.BatchDelete`
+
+        :param request: Request send by the client
+        :param context: grpc.aio ServicerContext
+        :return: BatchDeleteListsReply
+        """
+        request_logger.debug('Delete %s TodoLists', len(request.ids))
+        error_status = TodoLists.create_batch_size_status(len(request.ids))
+        if error_status is not None:
+            await abort_with_status(context, error_status)
+        deleted_ids = await self.db_handler.delete_todo_lists(list_ids=list(request.ids))
+        request_logger.debug('%s TodoLists deleted', len(deleted_ids))
+        return TodoLists.create_batch_delete_reply(request.ids, deleted_ids)
+
+    async def ImportLists(self,
+                          request_iterator: AsyncIterator[todolists_pb2.ImportListsRequest],
+                          context: aio.ServicerContext) -> todolists_pb2.ImportListsReply:
+        """
+        Import TodoLists gRPC method, see `TodoLists.ImportLists`
+
+        :param request_iterator: Stream of requests send by the client
+        :param context: grpc.aio ServicerContext
+        :return: ImportListsReply
+        """
+        reply = todolists_pb2.ImportListsReply()
+        names = []
+        async for request in request_iterator:
+            names.extend(request.names)
+            while len(names) >= IMPORT_LISTS_CHUNK_SIZE:
+                chunk, names = names[:IMPORT_LISTS_CHUNK_SIZE], names[IMPORT_LISTS_CHUNK_SIZE:]
+                TodoLists.add_imported_chunk(reply, chunk, await self.db_handler.new_todo_list_entries(names=chunk))
+        if names:
+            TodoLists.add_imported_chunk(reply, names, await self.db_handler.new_todo_list_entries(names=names))
+        request_logger.debug('Imported %s TodoLists, %s duplicates',
+                             reply.inserted, reply.duplicates)  # pylint: disable=no-member
+        return reply
+
+    async def run_session_operation(self, request: todolists_pb2.SessionRequest,
+                                    time_remaining: float = math.inf) -> todolists_pb2.SessionReply:
+        """
+        Run a Session operation with the asyncio unary gRPC method of the operation,
+        see `TodoLists.run_session_operation`
+
+        :param request: Operation of the Session
+        :param time_remaining: Seconds until the deadline of the Session stream, the max wait for the admission.
+            Default infinite
+        :return: SessionReply with the reply of the gRPC method, or the error if the method aborted
+            or the operation was not admitted
+        """
+        operation = request.WhichOneof('operation')
+        if operation is None:
+            return TodoLists.create_session_error_reply(request.correlation_id, code_pb2.INVALID_ARGUMENT,
+                                                        'Session request without operation.')
+        start = time.perf_counter()
+        try:
+            admitted = await self.admission_controller.acquire(time_remaining) if self.admission_controller else None
+            try:
+                result = await getattr(self, _SESSION_OPERATIONS[operation])(getattr(request, operation),
+                                                                             AsyncSessionOperationContext())
+            finally:
+                if admitted is not None:
+                    self.admission_controller.release(admitted)
+        except (SessionOperationAborted, AdmissionRejected) as ex:
+            observe_session_operation(operation, ex.code, start)
+            return TodoLists.create_session_error_reply(request.correlation_id, ex.code.value[0], ex.details)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Error running Session operation "%s"', operation)
+            observe_session_operation(operation, grpc.StatusCode.UNKNOWN, start)
+            return TodoLists.create_session_error_reply(request.correlation_id, code_pb2.UNKNOWN,
+                                                        'Error running Session operation "{}".'.format(operation))
+        observe_session_operation(operation, grpc.StatusCode.OK, start)
+        return todolists_pb2.SessionReply(correlation_id=request.correlation_id, **{operation: result})
+
+    async def Session(self,
+                      request_iterator: AsyncIterator[todolists_pb2.SessionRequest],
+                      context: aio.ServicerContext) -> AsyncIterator[todolists_pb2.SessionReply]:
+        """
+        Session gRPC method, see `TodoLists.Session`
+
+        The requests are read by a task of the stream, and each operation runs in its own task,
+        so the operations of the stream run concurrently in the event loop, without a thread per operation.
+
+        :param request_iterator: Stream of requests send by the client
+        :param context: grpc.aio ServicerContext
+        :return: Async iterator of SessionReply
+        """
+        replies = asyncio.Queue()
+        in_flight = asyncio.Semaphore(SESSION_MAX_IN_FLIGHT)
+        operations = set()
+
+        async def run_operation(request: todolists_pb2.SessionRequest) -> None:
+            await replies.put(await self.run_session_operation(request, context_time_remaining(context)))
+
+        async def read_requests() -> None:
+            try:
+                async for request in request_iterator:
+                    await in_flight.acquire()
+                    operation = asyncio.ensure_future(run_operation(request))
+                    operations.add(operation)
+                    operation.add_done_callback(operations.discard)
+                # Wait until all the replies are sent
+                for _ in range(SESSION_MAX_IN_FLIGHT):
+                    await in_flight.acquire()
+            finally:
+                await replies.put(None)
+
+        reader = asyncio.ensure_future(read_requests())
+        try:
+            while True:
+                reply = await replies.get()
+                if reply is None:
+                    # Raise the error of the reader, if any
+                    await reader
+                    return
+                yield reply
+                in_flight.release()
+        finally:
+            # The stream was cancelled, or finished
+            reader.cancel()
+            for operation in list(operations):
+                operation.cancel()
+
+
+def create_secured_server(server_port: int, options: Sequence[Tuple[str, Any]] = None,
+                          storage: StorageBackend = None,
+                          compression_policy: CompressionPolicy = COMPRESSION_POLICY) -> aio.Server:
+    """
+    Create an asyncio gRPC Server that handles todolists.TodoLists gRPC Service
+    The channel will be secured with the same SSL credentials as the thread pool server
+
+    Must be called from a coroutine or with the event loop that will run the server set as current loop.
+    The metrics of the gRPC methods are recorded by `AsyncMetricsInterceptor`, the RPCs are admitted by
+    `AsyncAdmissionInterceptor` if `ADMISSION_CONTROL` is set, and the Session operations by the servicer,
+    the RPCs of each client are limited by `AsyncRateLimitInterceptor` if `RATE_LIMIT` is set,
+    and the responses are compressed by `AsyncCompressionInterceptor` as defined by the compression policy.
+
+    :param server_port: Port to listen to
+    :param options: gRPC channel arguments of the server, e.g. `[('grpc.so_reuseport', 1)]`. Default None
+    :param storage: Storage backend of the TodoLists. Default the backend selected by `STORAGE_BACKEND`
+    :param compression_policy: Compression of the responses. Default `COMPRESSION_POLICY`
+    :return: grpc.aio Server
+    """
+    interceptors = (AsyncMetricsInterceptor(), AsyncCompressionInterceptor(compression_policy))
+    admission_controller = None
+    if ADMISSION_CONTROL:
+        # The Session operations are admitted by the servicer with the same controller
+        admission_controller = AsyncAdmissionController()
+        interceptors = interceptors[:1] + (AsyncAdmissionInterceptor(admission_controller),) + interceptors[1:]
+    if RATE_LIMIT:
+        interceptors = interceptors[:1] + (AsyncRateLimitInterceptor(),) + interceptors[1:]
+    server = aio.server(interceptors=interceptors, options=options)
+    todolists_pb2_grpc.add_TodoListsServicer_to_server(AsyncTodoLists(storage, admission_controller), server)
+
+    # Pass down credentials
+    server.add_secure_port(_LISTEN_ADDRESS_TEMPLATE.format(server_port),
+                           create_server_credentials())
+    return server
+
+
+async def _serve(server_port: int):
+    """
+    Start the asyncio gRPC Server and wait until its termination.
+
+    :param server_port: Port to listen to
+    :return:
+    """
+    server = create_secured_server(server_port)
+    await server.start()
+    await server.wait_for_termination()
+
+
+def serve(server_port: int):
+    """
+    Create the asyncio gRPC Server that handles todolists.TodoLists gRPC Service
+
+    Start it and wait for connections until its termination.
+
+    :param server_port: Port to listen to
+    :return:
+    """
+    logger.info('Running TodoLists asyncio gRPC server on port %s', server_port)
+    asyncio.get_event_loop().run_until_complete(_serve(server_port))
@@ -8,13 +8,26 @@ Examples:
             $ todolists_server.serve()
 
 Classes:
+    SessionOperationAborted(Exception): Raised when a gRPC method run by a Session operation aborts
+    SessionOperationContext: Context of the gRPC methods run by the Session operations
     TodoLists(todolists_pb2_grpc.TodoListsServicer): Definition of the gRPC Servicer methods
 
 Attributes:
+    todolists_server.create_server_credentials (function): Create the SSL credentials used by the gRPC servers
     todolists_server.create_secured_server (function): Create the gRPC server and add SSL credentials
     todolists_server.serve (function): Run the gRPC server and wait for stubs connections
+    todolists_server.logger (logging.Logger): Logger of the module
+    todolists_server.request_logger (logging.Logger): Logger of the per-request logs, written at DEBUG level
 """
+import base64
+import binascii
+import logging
+import math
+import queue
+import threading
+import time
 from concurrent import futures
+from typing import Any, Iterable, Iterator, Optional, Sequence, Tuple
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.exc import NoResultFound
 from grpc_status import rpc_status
@@ -22,28 +35,90 @@ from grpc._server import _Context, _Server
 from google.rpc import code_pb2, status_pb2
 import grpc
 
-from config.config import MAX_PAGE_SIZE
-from database.database import Database
-from database.todo_lists_db_handler import TodoListDBHandler
+from config.config import (
+    MAX_PAGE_SIZE, MAX_BATCH_SIZE, GRPC_SERVER_MAX_WORKERS, STREAM_LISTS_CHUNK_SIZE, IMPORT_LISTS_CHUNK_SIZE,
+    IMPORT_LISTS_MAX_ERRORS, SESSION_MAX_IN_FLIGHT, ADMISSION_CONTROL, ADMISSION_QUEUE_SIZE,
+    GRPC_SERVER_MAX_STREAM_WORKERS, RATE_LIMIT
+)
+from config.compression import COMPRESSION_POLICY, CompressionPolicy
+from config.logs import get_request_logger
+from database.backends import create_storage_backend
+from database.query_guard import QueryAborted, QueryGuard, guarded_queries, DEADLINE_EXCEEDED_REASON
+from database.storage import StorageBackend, TodoListRecord
+from metrics.interceptors import MetricsInterceptor
+from metrics.session_metrics import observe_session_operation
+from proto_server.admission import AdmissionController, AdmissionInterceptor, AdmissionRejected, context_time_remaining
+from proto_server.compression import CompressionInterceptor
+from proto_server.rate_limit import RateLimitInterceptor
 import config.credentials as credentials
 import proto.v1.todolists_pb2 as todolists_pb2
 import proto.v1.todolists_pb2_grpc as todolists_pb2_grpc
 
 
 _LISTEN_ADDRESS_TEMPLATE = 'localhost:{}'
+_DEFAULT_PAGE_SIZE = 10
+_PAGE_TOKEN_PREFIX = 'todolists-v1'
+_DUPLICATE_NAME_ERROR_TEMPLATE = 'List name must be unique, list with name "{}" already exist.'
+_BATCH_TOO_BIG_ERROR_TEMPLATE = 'Batch of {} items is bigger than the max batch size, {} items.'
+# gRPC method run by each Session operation, by the name of the `SessionRequest.operation` field
+_SESSION_OPERATIONS = {'create': 'Create', 'get': 'Get', 'delete': 'Delete', 'list': 'List'}
+_DEADLINE_EXCEEDED_MESSAGE = 'Deadline exceeded while reading the lists.'
+_CANCELLED_MESSAGE = 'RPC cancelled while reading the lists.'
 
+logger = logging.getLogger(__name__)
+request_logger = get_request_logger(__name__)
 
-class TodoLists(todolists_pb2_grpc.TodoListsServicer):
+
+class SessionOperationAborted(Exception):
+    """
+    Raised when a gRPC method run by a Session operation aborts, the error is returned in the reply of the operation
+    """
+
+    def __init__(self, code: grpc.StatusCode, details: str):
+        """
+        :param code: Status code of the abort
+        :param details: Description of the error
+        """
+        super().__init__(code, details)
+        self.code = code
+        self.details = details
+
+
+class SessionOperationContext:  # pylint: disable=too-few-public-methods
+    """
+    Context of the unary gRPC methods run by the Session operations.
+    An abort raises `SessionOperationAborted` instead of finishing the Session stream.
+    """
+
+    @staticmethod
+    def abort_with_status(status: grpc.Status) -> None:
+        """
+        :param status: Error status
+        :raise SessionOperationAborted: Always
+        """
+        raise SessionOperationAborted(status.code, status.details)
+
+
+class TodoLists(todolists_pb2_grpc.TodoListsServicer):  # pylint: disable=too-many-public-methods
     """
     Implementation of gRPC methods for todolists.TodoLists service
     """
 
-    def __init__(self):
+    def __init__(self, storage: StorageBackend = None, admission_controller: AdmissionController = None):
         """
-        Constructor of TodoLists gRPC service, when executed create the database tables that the Service will use,
-        if were not already created.
+        Constructor of TodoLists gRPC service, when executed set up the storage that the Service will use,
+        e.g. create the database tables if were not already created.
+
+        :param storage: Storage backend of the TodoLists. Default the backend selected by `STORAGE_BACKEND`
+        :param admission_controller: Admission controller of the unary RPCs of the server, that also admits
+            the Session operations. Default None, the Session operations are not limited
         """
-        Database.create_db_tables()
+        self.storage = storage if storage is not None else create_storage_backend()
+        self.storage.setup()
+        self.admission_controller = admission_controller
+        # Runs the operations of all the Session streams, the threads are started when they are needed
+        self.session_executor = futures.ThreadPoolExecutor(max_workers=GRPC_SERVER_MAX_WORKERS,
+                                                           thread_name_prefix='session')
 
     @staticmethod
     def create_grpc_error_status(message: str, error_code: int) -> status_pb2.Status:
@@ -59,6 +134,171 @@ class TodoLists(todolists_pb2_grpc.TodoListsServicer):
             message=message,
         )
 
+    @classmethod
+    def create_batch_size_status(cls, batch_size: int) -> Optional[status_pb2.Status]:
+        """
+        Validate the number of items of a Batch request
+
+        :param batch_size: Number of names or ids of the request
+        :return: INVALID_ARGUMENT error status if the batch has more than `MAX_BATCH_SIZE` items, None if not
+        """
+        if batch_size <= MAX_BATCH_SIZE:
+            return None
+        return cls.create_grpc_error_status(_BATCH_TOO_BIG_ERROR_TEMPLATE.format(batch_size, MAX_BATCH_SIZE),
+                                            code_pb2.INVALID_ARGUMENT)
+
+    @classmethod
+    def create_query_aborted_status(cls, aborted: QueryAborted) -> status_pb2.Status:
+        """
+        Create the error status of an RPC whose DB reads were stopped, see `database.query_guard`
+
+        :param aborted: Error raised by the stopped read
+        :return: DEADLINE_EXCEEDED or CANCELLED error status
+        """
+        if aborted.reason == DEADLINE_EXCEEDED_REASON:
+            return cls.create_grpc_error_status(_DEADLINE_EXCEEDED_MESSAGE, code_pb2.DEADLINE_EXCEEDED)
+        return cls.create_grpc_error_status(_CANCELLED_MESSAGE, code_pb2.CANCELLED)
+
+    @staticmethod
+    def create_todo_list_messages(todo_lists: Iterable[TodoListRecord]) -> Sequence[todolists_pb2.TodoList]:
+        """
+        Convert the `(id, name)` records returned by the storage straight into TodoList messages
+
+        :param todo_lists: TodoLists entries
+        :return: TodoList messages, in the same order
+        """
+        return [todolists_pb2.TodoList(id=_id, name=_name) for _id, _name in todo_lists]
+
+    @staticmethod
+    def create_batch_create_reply(names: Sequence[str],
+                                  new_ids: Sequence[Optional[int]]) -> todolists_pb2.BatchCreateListsReply:
+        """
+        Create the reply of the BatchCreate gRPC method
+
+        :param names: Names requested by the client
+        :param new_ids: New list ID for each name, None if the list was not created because the name already exist
+        :return: BatchCreateListsReply with one result per name
+        """
+        results = []
+        for name, new_id in zip(names, new_ids):
+            if new_id is None:
+                results.append(todolists_pb2.BatchCreateListResult(
+                    name=name, created=False, error=_DUPLICATE_NAME_ERROR_TEMPLATE.format(name)))
+            else:
+                results.append(todolists_pb2.BatchCreateListResult(id=new_id, name=name, created=True))
+        return todolists_pb2.BatchCreateListsReply(results=results)
+
+    @staticmethod
+    def add_imported_chunk(reply: todolists_pb2.ImportListsReply,
+                           names: Sequence[str],
+                           new_ids: Sequence[Optional[int]]) -> None:
+        """
+        Add the results of a chunk of imported names to the summary of the ImportLists gRPC method
+
+        Only the first `IMPORT_LISTS_MAX_ERRORS` errors are kept, the index of each name is its position
+        in the whole stream, the number of names imported before the chunk plus its position in the chunk.
+
+        :param reply: ImportListsReply of the names imported before the chunk, updated in place
+        :param names: Names of the chunk
+        :param new_ids: New list ID for each name, None if the list was not created because the name already exist
+        :return:
+        """
+        first_index = reply.inserted + reply.duplicates
+        duplicates = sum(_new_id is None for _new_id in new_ids)
+        reply.inserted += len(new_ids) - duplicates
+        reply.duplicates += duplicates
+        if not duplicates or len(reply.errors) >= IMPORT_LISTS_MAX_ERRORS:
+            return
+        for index, (name, new_id) in enumerate(zip(names, new_ids), first_index):
+            if new_id is None:
+                reply.errors.add(index=index, name=name, error=_DUPLICATE_NAME_ERROR_TEMPLATE.format(name))
+                if len(reply.errors) >= IMPORT_LISTS_MAX_ERRORS:
+                    return
+
+    @staticmethod
+    def create_batch_get_reply(list_ids: Sequence[int],
+                               todo_lists: Sequence[Optional[TodoListRecord]]) -> todolists_pb2.BatchGetListsReply:
+        """
+        Create the reply of the BatchGet gRPC method
+
+        :param list_ids: IDs requested by the client
+        :param todo_lists: TodoList for each ID, None if the list with that ID does not exist
+        :return: BatchGetListsReply with the found lists and the missing IDs in the requested order
+        """
+        found_lists = TodoLists.create_todo_list_messages(_list for _list in todo_lists if _list is not None)
+        missing_ids = [_id for _id, _list in zip(list_ids, todo_lists) if _list is None]
+        return todolists_pb2.BatchGetListsReply(todo_lists=found_lists, missing_ids=missing_ids)
+
+    @staticmethod
+    def create_batch_delete_reply(list_ids: Sequence[int],
+                                  deleted_ids: Sequence[int]) -> todolists_pb2.BatchDeleteListsReply:
+        """
+        Create the reply of the BatchDelete gRPC method
+
+        :param list_ids: IDs requested by the client
+        :param deleted_ids: IDs of the deleted lists
+        :return: BatchDeleteListsReply with the deleted and not found IDs in the requested order
+        """
+        deleted_ids = set(deleted_ids)
+        # dict keeps the insertion order, and removes the repeated IDs
+        unique_ids = list(dict.fromkeys(list_ids))
+        return todolists_pb2.BatchDeleteListsReply(
+            deleted_ids=[_id for _id in unique_ids if _id in deleted_ids],
+            not_found_ids=[_id for _id in unique_ids if _id not in deleted_ids])
+
+    @staticmethod
+    def create_session_error_reply(correlation_id: int, code: int, message: str) -> todolists_pb2.SessionReply:
+        """
+        Create the reply of a Session operation that failed
+
+        :param correlation_id: Correlation ID of the operation
+        :param code: Int that represent the error, codes from code_pb2 module
+        :param message: Description of the error
+        :return: SessionReply with the error
+        """
+        return todolists_pb2.SessionReply(correlation_id=correlation_id,
+                                          error=todolists_pb2.SessionError(code=code, message=message))
+
+    @staticmethod
+    def normalize_page_size(page_size: int) -> int:
+        """
+        Get the page size to use for a requested `page_size`
+
+        :param page_size: Requested page size
+        :return: 10 if `page_size` is lower than 1, MAX_PAGE_SIZE if it is bigger than the max allowed
+        """
+        if page_size < 1:
+            return _DEFAULT_PAGE_SIZE
+        return page_size if page_size < MAX_PAGE_SIZE else MAX_PAGE_SIZE
+
+    @staticmethod
+    def encode_page_token(last_id: int) -> str:
+        """
+        Create the opaque token that points to the page after the TodoList with id `last_id`
+
+        :param last_id: Last TodoList id of the current page
+        :return: Page token
+        """
+        return base64.urlsafe_b64encode('{}:{}'.format(_PAGE_TOKEN_PREFIX, last_id).encode()).decode()
+
+    @staticmethod
+    def decode_page_token(page_token: str) -> int:
+        """
+        Get the last TodoList id of the previous page from a token created by `encode_page_token`
+
+        :param page_token: Page token received from the client
+        :return: Last TodoList id of the previous page
+        :raise ValueError: If the token is not valid
+        """
+        try:
+            decoded_token = base64.urlsafe_b64decode(page_token.encode()).decode()
+        except (binascii.Error, UnicodeError) as ex:
+            raise ValueError('Invalid page token') from ex
+        prefix, _, last_id = decoded_token.partition(':')
+        if prefix != _PAGE_TOKEN_PREFIX:
+            raise ValueError('Invalid page token')
+        return int(last_id)
+
     def Create(self,
                request: todolists_pb2.CreateListRequest,
                context: _Context) -> todolists_pb2.CreateListReply:
@@ -75,10 +315,10 @@ class TodoLists(todolists_pb2_grpc.TodoListsServicer):
         :return: CreateListReply
         """
         try:
-            print('Creating TodoList with name "{}"'.format(request.name))
+            request_logger.debug('Creating TodoList with name "%s"', request.name)
             # Insert a new entry in the TodoList table
-            new_entry_id = TodoListDBHandler.new_todo_list_entry(name=request.name)
-            print('TodoList created with id "{}"'.format(new_entry_id))
+            new_entry_id = self.storage.new_todo_list_entry(name=request.name)
+            request_logger.debug('TodoList created with id "%s"', new_entry_id)
             return todolists_pb2.CreateListReply(id=new_entry_id, name=request.name)
         except IntegrityError:
             context.abort_with_status(rpc_status.to_status(self.create_grpc_error_status(
@@ -95,19 +335,25 @@ class TodoLists(todolists_pb2_grpc.TodoListsServicer):
 
         If a list with that `id` do not exist the gRPC will finish with an error code for NOT_FOUND
 
+        If the RPC is cancelled, or its deadline expires, while the list is read from the DB,
+        the read is stopped and the gRPC will finish with an error code for CANCELLED or DEADLINE_EXCEEDED
+
         :param request: Request send by the client
         :param context: grpc _Context
         :return: TodoList
         """
         try:
-            print('Get TodoList with id "{}"'.format(request.id))
-            todo_list = TodoListDBHandler.get_todo_list(list_id=request.id)
+            request_logger.debug('Get TodoList with id "%s"', request.id)
+            with guarded_queries(QueryGuard.for_rpc(context)):
+                todo_list = self.storage.get_todo_list(list_id=request.id)
             return todolists_pb2.TodoList(id=todo_list.id, name=todo_list.name)
         except NoResultFound:
             context.abort_with_status(rpc_status.to_status(self.create_grpc_error_status(
                 'List with id "{}" not found.'.format(request.id),
                 code_pb2.NOT_FOUND
             )))
+        except QueryAborted as ex:
+            context.abort_with_status(rpc_status.to_status(self.create_query_aborted_status(ex)))
 
     def Delete(self, request: todolists_pb2.DeleteListRequest, context: _Context) -> todolists_pb2.Empty:
         """
@@ -123,8 +369,8 @@ class TodoLists(todolists_pb2_grpc.TodoListsServicer):
         :return: Empty
         """
         try:
-            print('Delete TodoList with id "{}"'.format(request.id))
-            TodoListDBHandler.delete_todo_list(list_id=request.id)
+            request_logger.debug('Delete TodoList with id "%s"', request.id)
+            self.storage.delete_todo_list(list_id=request.id)
             return todolists_pb2.Empty()
         except NoResultFound:
             context.abort_with_status(rpc_status.to_status(self.create_grpc_error_status(
@@ -145,48 +391,372 @@ class TodoLists(todolists_pb2_grpc.TodoListsServicer):
             If the field `request.page_number` the client define the desired page number.
                 If `page_number` is lower than 1, it will be set to the first page, 1.
 
+            In the field `request.page_token` the client can send the `next_page_token` of a previous reply,
+             to get the next page with keyset pagination. When it is set `page_number` is ignored.
+                If the token is not valid the gRPC will finish with an error code for INVALID_ARGUMENT
+
+            If the field `request.skip_count` is set, the count of TodoLists is not computed.
+
+        If the RPC is cancelled, or its deadline expires, while the page is read from the DB,
+        the read is stopped and the gRPC will finish with an error code for CANCELLED or DEADLINE_EXCEEDED
+
         Reply fields:
             ListTodoListsReply.todo_lists: List[TodoList] = TodoLists in the requested page.
             ListTodoListsReply.next_page_number: str = Next page number,
+             if there are not elements in the next page, or the page was requested by token, empty string is returned.
+            ListTodoListsReply.count: int = Total number of TodoLists in the DB, 0 if `request.skip_count` is set
+            ListTodoListsReply.next_page_token: str = Token to request the next page,
              if there are not elements in the next page, empty string is returned.
-            ListTodoListsReply.count: int = Total number of TodoLists in the DB
 
         :param request: Send by the client
         :param context: gRPC _Context
         :return:
         """
-        print('List TodoLists. `page_size={}`, `page_number={}`'.format(request.page_size, request.page_number))
+        request_logger.debug('List TodoLists. `page_size=%s`, `page_number=%s`, `page_token=%s`',
+                             request.page_size, request.page_number, request.page_token)
         page_number = request.page_number if request.page_number > 0 else 1
-        page_size = request.page_size if request.page_size < MAX_PAGE_SIZE else MAX_PAGE_SIZE
+        page_size = self.normalize_page_size(request.page_size)
+
+        if request.page_token:
+            try:
+                last_id = self.decode_page_token(request.page_token)
+            except ValueError:
+                context.abort_with_status(rpc_status.to_status(self.create_grpc_error_status(
+                    'Invalid page_token "{}".'.format(request.page_token),
+                    code_pb2.INVALID_ARGUMENT
+                )))
+        try:
+            with guarded_queries(QueryGuard.for_rpc(context)):
+                if request.page_token:
+                    db_lists = self.storage.get_lists_after(last_id=last_id, limit=page_size + 1)
+                else:
+                    db_lists = self.storage.get_lists_paginated(page_number=page_number, page_size=page_size,
+                                                                include_next=True)
+        except QueryAborted as ex:
+            context.abort_with_status(rpc_status.to_status(self.create_query_aborted_status(ex)))
+        # One extra entry is fetched to know if there is a next page
+        has_next_page = len(db_lists) > page_size
+        db_lists = db_lists[:page_size]
+        count = 0 if request.skip_count else self.storage.get_lists_db_count()
+        next_page_number = str(page_number + 1) if has_next_page and not request.page_token else ''
+        next_page_token = self.encode_page_token(db_lists[-1].id) if has_next_page else ''
+
+        return todolists_pb2.ListTodoListsReply(next_page_number=next_page_number, count=count,
+                                                todo_lists=self.create_todo_list_messages(db_lists),
+                                                next_page_token=next_page_token)
+
+    def StreamLists(self,
+                    request: todolists_pb2.StreamListsRequest,
+                    context: _Context) -> Iterator[todolists_pb2.TodoList]:
+        """
+        Stream TodoLists gRPC method.
+
+        All the TodoLists with an id bigger than `request.after_id` are streamed ordered by id.
+        The TodoLists are read from the DB in chunks of STREAM_LISTS_CHUNK_SIZE entries, and the next
+        TodoList is only read when the previous one was sent, following gRPC flow control,
+        so the memory used does not depend on the number of TodoLists.
+
+        If the client cancels the RPC, the stream stops reading from the DB, a chunk that is being read is interrupted.
+        If the deadline expires while a chunk is read, the gRPC will finish with an error code for DEADLINE_EXCEEDED
+
+        :param request: Send by the client
+        :param context: gRPC _Context
+        :return: Iterator of TodoList
+        """
+        request_logger.debug('Stream TodoLists after id "%s"', request.after_id)
+        guard = QueryGuard.for_rpc(context)
+        todo_lists = self.storage.iter_lists(after_id=request.after_id, chunk_size=STREAM_LISTS_CHUNK_SIZE)
+        while True:
+            # The guard is only set while the next entry is read, it is not kept while the entry is sent
+            try:
+                with guarded_queries(guard):
+                    todo_list = next(todo_lists, None)
+            except QueryAborted as ex:
+                context.abort_with_status(rpc_status.to_status(self.create_query_aborted_status(ex)))
+            if todo_list is None:
+                return
+            if not context.is_active():
+                request_logger.debug('Stream TodoLists cancelled by the client')
+                return
+            yield todolists_pb2.TodoList(id=todo_list.id, name=todo_list.name)
+
+    def BatchCreate(self,
+                    request: todolists_pb2.BatchCreateListsRequest,
+                    context: _Context) -> todolists_pb2.BatchCreateListsReply:
+        """
+        Create many TodoLists gRPC method.
+        The request will contain a todolist.BatchCreateListsRequest
+
+        In the field request.names will be the names of the lists that the client wants to create.
+        All the lists are inserted in a single DB transaction.
+
+        If a list with one of the names already exists in the DB, or the name is repeated in the request,
+        that list is not created, but the other lists are. The reply has one result per name, in the same order,
+        with the new list `id` or the error.
+
+        If the request has more than `MAX_BATCH_SIZE` names the gRPC will finish with an error code for
+        INVALID_ARGUMENT, without creating any list.
+
+        :param request: Request send by the client
+        :param context: grpc _Context
+        :return: BatchCreateListsReply
+        """
+        request_logger.debug('Creating %s TodoLists', len(request.names))
+        error_status = self.create_batch_size_status(len(request.names))
+        if error_status is not None:
+            context.abort_with_status(rpc_status.to_status(error_status))
+        new_ids = self.storage.new_todo_list_entries(names=list(request.names))
+        request_logger.debug('%s TodoLists created', len(new_ids) - new_ids.count(None))
+        return self.create_batch_create_reply(request.names, new_ids)
+
+    def BatchGet(self,
+                 request: todolists_pb2.BatchGetListsRequest,
+                 context: _Context) -> todolists_pb2.BatchGetListsReply:
+        """
+        Get many TodoLists gRPC method.
+        The request will contain a todolist.BatchGetListsRequest
+
+        In the field request.ids will be the ids of the lists that the client wants to fetch.
+        All the lists are read with `WHERE id IN (...)` queries, instead of one query per id.
+
+        The ids that do not exist do not fail the gRPC, they are returned in the reply `missing_ids`.
+        Both the found lists and the missing ids keep the requested order.
+
+        If the RPC is cancelled, or its deadline expires, while the lists are read from the DB,
+        the reads are stopped and the gRPC will finish with an error code for CANCELLED or DEADLINE_EXCEEDED.
+        If the request has more than `MAX_BATCH_SIZE` ids the gRPC will finish with an error code for INVALID_ARGUMENT
+
+        :param request: Request send by the client
+        :param context: grpc _Context
+        :return: BatchGetListsReply
+        """
+        request_logger.debug('Get %s TodoLists', len(request.ids))
+        error_status = self.create_batch_size_status(len(request.ids))
+        if error_status is not None:
+            context.abort_with_status(rpc_status.to_status(error_status))
+        try:
+            with guarded_queries(QueryGuard.for_rpc(context)):
+                todo_lists = self.storage.get_todo_lists(list_ids=list(request.ids))
+        except QueryAborted as ex:
+            context.abort_with_status(rpc_status.to_status(self.create_query_aborted_status(ex)))
+        return self.create_batch_get_reply(request.ids, todo_lists)
+
+    def BatchDelete(self,
+                    request: todolists_pb2.BatchDeleteListsRequest,
+                    context: _Context) -> todolists_pb2.BatchDeleteListsReply:
+        """
+        Delete many TodoLists gRPC method.
+        The request will contain a todolist.BatchDeleteListsRequest
+
+        In the field request.ids will be the ids of the lists to delete.
+        All the lists are deleted in a single DB transaction, with one commit.
+
+        The ids that do not exist do not fail the gRPC, they are returned in the reply `not_found_ids`.
+        Both the deleted and the not found ids keep the requested order, without repeated ids.
+
+        If the request has more than `MAX_BATCH_SIZE` ids the gRPC will finish with an error code for
+        INVALID_ARGUMENT, without deleting any list.
+
+        :param request: Request send by the client
+        :param context: grpc _Context
+        :return: BatchDeleteListsReply
+        """
+        request_logger.debug('Delete %s TodoLists', len(request.ids))
+        error_status = self.create_batch_size_status(len(request.ids))
+        if error_status is not None:
+            context.abort_with_status(rpc_status.to_status(error_status))
+        deleted_ids = self.storage.delete_todo_lists(list_ids=list(request.ids))
+        request_logger.debug('%s TodoLists deleted', len(deleted_ids))
+        return self.create_batch_delete_reply(request.ids, deleted_ids)
+
+    def ImportLists(self,
+                    request_iterator: Iterator[todolists_pb2.ImportListsRequest],
+                    context: _Context) -> todolists_pb2.ImportListsReply:
+        """
+        Import TodoLists gRPC method, the client streams the names of the lists to create.
+        Each todolist.ImportListsRequest of the stream has one or more names.
+
+        The stream is consumed as it arrives, the names are inserted in chunks of `IMPORT_LISTS_CHUNK_SIZE` names,
+        each chunk in a single DB transaction, so the memory used does not depend on the number of names.
+        The chunks are committed as they are inserted, if the stream fails the chunks inserted before stay,
+        importing the same names again reports them as duplicates.
+
+        The names that already exist in the DB, or are repeated in the stream, are not created, but the other lists are.
+        The reply is a summary with the number of lists inserted, the duplicates, and the first errors.
+
+        :param request_iterator: Stream of requests send by the client
+        :param context: grpc _Context
+        :return: ImportListsReply
+        """
+        reply = todolists_pb2.ImportListsReply()
+        names = []
+        for request in request_iterator:
+            names.extend(request.names)
+            while len(names) >= IMPORT_LISTS_CHUNK_SIZE:
+                chunk, names = names[:IMPORT_LISTS_CHUNK_SIZE], names[IMPORT_LISTS_CHUNK_SIZE:]
+                self.add_imported_chunk(reply, chunk, self.storage.new_todo_list_entries(names=chunk))
+        if names:
+            self.add_imported_chunk(reply, names, self.storage.new_todo_list_entries(names=names))
+        request_logger.debug('Imported %s TodoLists, %s duplicates',
+                             reply.inserted, reply.duplicates)  # pylint: disable=no-member
+        return reply
+
+    def run_session_operation(self, request: todolists_pb2.SessionRequest,
+                              time_remaining: float = math.inf) -> todolists_pb2.SessionReply:
+        """
+        Run a Session operation with the unary gRPC method of the operation, e.g. `create` with `Create`.
+
+        The operations are not RPCs, the server interceptors do not see them: they are admitted by the
+        `admission_controller`, as the unary RPCs, and their metrics are recorded in `metrics.session_metrics`.
+
+        :param request: Operation of the Session
+        :param time_remaining: Seconds until the deadline of the Session stream, the max wait for the admission.
+            Default infinite
+        :return: SessionReply with the reply of the gRPC method, or the error if the method aborted
+            or the operation was not admitted
+        """
+        operation = request.WhichOneof('operation')
+        if operation is None:
+            return self.create_session_error_reply(request.correlation_id, code_pb2.INVALID_ARGUMENT,
+                                                   'Session request without operation.')
+        start = time.perf_counter()
+        try:
+            admitted = self.admission_controller.acquire(time_remaining) if self.admission_controller else None
+            try:
+                result = getattr(self, _SESSION_OPERATIONS[operation])(getattr(request, operation),
+                                                                       SessionOperationContext())
+            finally:
+                if admitted is not None:
+                    self.admission_controller.release(admitted)
+        except (SessionOperationAborted, AdmissionRejected) as ex:
+            observe_session_operation(operation, ex.code, start)
+            return self.create_session_error_reply(request.correlation_id, ex.code.value[0], ex.details)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Error running Session operation "%s"', operation)
+            observe_session_operation(operation, grpc.StatusCode.UNKNOWN, start)
+            return self.create_session_error_reply(request.correlation_id, code_pb2.UNKNOWN,
+                                                   'Error running Session operation "{}".'.format(operation))
+        observe_session_operation(operation, grpc.StatusCode.OK, start)
+        return todolists_pb2.SessionReply(correlation_id=request.correlation_id, **{operation: result})
+
+    def Session(self,
+                request_iterator: Iterator[todolists_pb2.SessionRequest],
+                context: _Context) -> Iterator[todolists_pb2.SessionReply]:
+        """
+        Session gRPC method, the client streams Create, Get, Delete and List operations
+        and the server streams their results.
 
-        db_lists = TodoListDBHandler.get_lists_paginated(page_number=request.page_number, page_size=request.page_size)
-        count = TodoListDBHandler.get_lists_db_count()
-        next_page_number = str(request.page_number + 1) if count > (page_number * page_size) else ''
+        Each todolist.SessionRequest has a client assigned `correlation_id` and one operation, that is run
+        by the unary gRPC method of the operation, with the same replies and errors. The operations are pipelined,
+        the requests are read by a thread of the stream while the operations run in the `session_executor`,
+        and each SessionReply, with the `correlation_id` of its request, is sent as soon as the operation completes,
+        so the replies can be in a different order than the requests. The operations are admitted and recorded
+        in the metrics by `run_session_operation`, the server interceptors only see the whole stream.
 
-        todo_lists = [todolists_pb2.TodoList(id=_list.id, name=_list.name) for _list in db_lists]
-        return todolists_pb2.ListTodoListsReply(next_page_number=next_page_number, count=count, todo_lists=todo_lists)
+        Up to `SESSION_MAX_IN_FLIGHT` operations of a stream can be running or waiting to be sent, the next requests
+        are not read until one of their replies is sent, so a client that sends faster than the server replies,
+        or that does not read the replies, is slowed down by the gRPC flow control.
 
+        :param request_iterator: Stream of requests send by the client
+        :param context: grpc _Context
+        :return: Iterator of SessionReply
+        """
+        replies = queue.Queue()
+        in_flight = threading.Semaphore(SESSION_MAX_IN_FLIGHT)
+
+        def release_all() -> None:
+            # When the RPC finishes, unblock the thread that reads the requests
+            for _ in range(SESSION_MAX_IN_FLIGHT):
+                in_flight.release()
+
+        def run_operation(request: todolists_pb2.SessionRequest) -> None:
+            replies.put(self.run_session_operation(request, context_time_remaining(context)))
+
+        def read_requests() -> None:
+            try:
+                for request in request_iterator:
+                    in_flight.acquire()
+                    if not context.is_active():
+                        return
+                    self.session_executor.submit(run_operation, request)
+                # Wait until all the replies are sent
+                for _ in range(SESSION_MAX_IN_FLIGHT):
+                    in_flight.acquire()
+            except grpc.RpcError:
+                request_logger.debug('Session cancelled by the client')
+            except Exception:  # pylint: disable=broad-except
+                # e.g. the stream was aborted by the rate limit of the requests, with its status already set
+                request_logger.debug('Session aborted while reading the requests', exc_info=True)
+            finally:
+                replies.put(None)
+
+        context.add_callback(release_all)
+        threading.Thread(target=read_requests, name='session-reader', daemon=True).start()
+        while True:
+            reply = replies.get()
+            if reply is None:
+                return
+            yield reply
+            in_flight.release()
+
+
+def create_server_credentials() -> grpc.ServerCredentials:
+    """
+    Load the SSL server certificate and key to secure the server ports
 
-def create_secured_server(server_port: int) -> [_Server, int]:
+    :return: gRPC ServerCredentials
+    """
+    return grpc.ssl_server_credentials(((
+        credentials.SERVER_CERTIFICATE_KEY,
+        credentials.SERVER_CERTIFICATE,
+    ),))
+
+
+def create_secured_server(server_port: int, options: Sequence[Tuple[str, Any]] = None,
+                          storage: StorageBackend = None,
+                          compression_policy: CompressionPolicy = COMPRESSION_POLICY) -> [_Server, int]:
     """
     Create a gRPC Server that handles todolists.TodoLists gRPC Service
     The channel will be secured with SSL credentials
 
+    The gRPC methods are executed in a thread pool of `GRPC_SERVER_MAX_WORKERS` threads,
+    and their metrics are recorded by `MetricsInterceptor`.
+    If `ADMISSION_CONTROL` is set, the RPCs are admitted by `AdmissionInterceptor`, and the Session operations by the
+    servicer with the same controller, the streaming RPCs run in their own thread pool of
+    `GRPC_SERVER_MAX_STREAM_WORKERS` threads, and the RPCs over
+    `GRPC_SERVER_MAX_WORKERS + ADMISSION_QUEUE_SIZE + GRPC_SERVER_MAX_STREAM_WORKERS` are rejected by gRPC with
+    `RESOURCE_EXHAUSTED`.
+    If `RATE_LIMIT` is set, the RPCs of each client are limited by `RateLimitInterceptor`, before the admission control.
+    The responses are compressed by `CompressionInterceptor` as defined by the compression policy
+
     :param server_port: Port to listen to
+    :param options: gRPC channel arguments of the server, e.g. `[('grpc.so_reuseport', 1)]`. Default None
+    :param storage: Storage backend of the TodoLists. Default the backend selected by `STORAGE_BACKEND`
+    :param compression_policy: Compression of the responses. Default `COMPRESSION_POLICY`
     :return: gRPC _Server
     """
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10),)
-    todolists_pb2_grpc.add_TodoListsServicer_to_server(TodoLists(), server)
-
-    # Loading credentials
-    server_credentials = grpc.ssl_server_credentials(((
-        credentials.SERVER_CERTIFICATE_KEY,
-        credentials.SERVER_CERTIFICATE,
-    ),))
+    interceptors = (MetricsInterceptor(), CompressionInterceptor(compression_policy))
+    maximum_concurrent_rpcs = None
+    admission_controller = None
+    if ADMISSION_CONTROL:
+        # The Session operations are admitted by the servicer with the same controller
+        admission_controller = AdmissionController()
+        # The long-lived streams do not hold the worker threads of the unary RPCs
+        admission = AdmissionInterceptor(admission_controller, stream_thread_pool=futures.ThreadPoolExecutor(
+            max_workers=GRPC_SERVER_MAX_STREAM_WORKERS, thread_name_prefix='grpc-stream'))
+        interceptors = interceptors[:1] + (admission,) + interceptors[1:]
+        # The RPCs waiting for a worker thread are not seen by the interceptors, gRPC bounds them.
+        # It also counts the streams, they have their own threads on top of the unary RPCs
+        maximum_concurrent_rpcs = GRPC_SERVER_MAX_WORKERS + ADMISSION_QUEUE_SIZE + GRPC_SERVER_MAX_STREAM_WORKERS
+    if RATE_LIMIT:
+        interceptors = interceptors[:1] + (RateLimitInterceptor(),) + interceptors[1:]
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=GRPC_SERVER_MAX_WORKERS),
+                         interceptors=interceptors, options=options, maximum_concurrent_rpcs=maximum_concurrent_rpcs)
+    todolists_pb2_grpc.add_TodoListsServicer_to_server(TodoLists(storage, admission_controller), server)
 
     # Pass down credentials
     server.add_secure_port(_LISTEN_ADDRESS_TEMPLATE.format(server_port),
-                           server_credentials)
+                           create_server_credentials())
     return server
 
 
@@ -199,7 +769,7 @@ def serve(server_port: int):
     :param server_port: Port to listen to
     :return:
     """
-    print('Running TodoLists gRCP server')
+    logger.info('Running TodoLists gRPC server on port %s', server_port)
     server = create_secured_server(server_port)
     server.start()
     server.wait_for_termination()
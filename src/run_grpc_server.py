@@ -6,10 +6,46 @@ Examples:
         stubs connections listening to an insecure port.
 
             $ python run_grpc_server.py
+
+        The server mode is selected with the `GRPC_SERVER_MODE` environment variable,
+        `thread_pool` (default) or `asyncio`.
+
+            $ GRPC_SERVER_MODE=asyncio python run_grpc_server.py
+
+        The logs are written to stdout by a background thread, the log level is selected with the `LOG_LEVEL`
+        environment variable, the per-request logs are only written at `DEBUG` level.
+
+            $ LOG_LEVEL=DEBUG python run_grpc_server.py
+
+        With `GRPC_SERVER_PREFORK` set, `GRPC_SERVER_WORKER_PROCESSES` server processes listen to the same port,
+        supervised by this process, see `proto_server.prefork_server`.
+
+            $ GRPC_SERVER_PREFORK=true GRPC_SERVER_WORKER_PROCESSES=4 python run_grpc_server.py
+
+        The metrics of the server are served in the Prometheus text format at `http://localhost:<METRICS_PORT>/metrics`,
+        `METRICS_PORT=0` disables them.
+
+            $ METRICS_PORT=9095 python run_grpc_server.py
 """
 import proto_server.todolists_server as todolists_server
-from config.config import GRPC_SERVER_PORT
+import proto_server.todolists_aio_server as todolists_aio_server
+import proto_server.prefork_server as prefork_server
+from config.config import (
+    GRPC_SERVER_PORT, GRPC_SERVER_MODE, ASYNCIO_SERVER_MODE, GRPC_SERVER_PREFORK, METRICS_PORT
+)
+from config.logs import setup_logging
+from metrics.exporter import start_metrics_server
 
 
 if __name__ == '__main__':
-    todolists_server.serve(GRPC_SERVER_PORT)
+    setup_logging()
+    if GRPC_SERVER_PREFORK:
+        # Each worker process serves its own metrics
+        prefork_server.serve(GRPC_SERVER_PORT)
+    else:
+        if METRICS_PORT:
+            start_metrics_server(METRICS_PORT)
+        if GRPC_SERVER_MODE == ASYNCIO_SERVER_MODE:
+            todolists_aio_server.serve(GRPC_SERVER_PORT)
+        else:
+            todolists_server.serve(GRPC_SERVER_PORT)
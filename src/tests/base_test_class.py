@@ -3,10 +3,15 @@ Base test class used to init test database and test gRPC Server
 
 Classes:
     BaseTestClass(unittest.TestCase)
+    BaseAioTestClass(unittest.TestCase)
 """
+import asyncio
+import threading
 import unittest
 import database.database as db
+from database.todo_lists_db_handler import TodoListDBHandler
 from proto_server.todolists_server import create_secured_server
+from proto_server import todolists_aio_server
 from proto_client.helpers import create_secured_client_channel
 from config.config import GRPC_SERVER_PORT
 
@@ -23,13 +28,15 @@ class BaseTestClass(unittest.TestCase):
 
     def setUp(self) -> None:
         """
-        Set up test environment assigning test DB path, dropping database and then creating it again.
+        Set up test environment assigning test DB path, dropping database and then creating it again,
+        and clearing the TodoLists cache.
         Create the test grpc_server, and the grpc_insecure_channel to be used to invoke the stubs.
         :return:
         """
         # Drop Database, and create it again
         db.Database.drop_all()
         db.Database.create_db_tables()
+        TodoListDBHandler.cache.clear()
         self.grpc_server = create_secured_server(GRPC_SERVER_PORT)
         self.grpc_server.start()
         with create_secured_client_channel('localhost:{}'.format(GRPC_SERVER_PORT)) as _channel:
@@ -44,3 +51,79 @@ class BaseTestClass(unittest.TestCase):
         db.Database.drop_all()
         self.grpc_secured_channel.close()
         self.grpc_server.stop(None)
+
+
+class BaseAioTestClass(unittest.TestCase):
+    """
+    Attributes:
+        grpc_secured_channel: grpc.Channel used to invoke the gRPC methods from the stubs
+        grpc_server: asyncio gRPC server used to execute the gRPC methods
+        loop: Event loop running the asyncio gRPC server in a background thread
+
+    The event loop is shared by all the tests of the class.
+    Database will be dropped and created in setUp
+    The gRPC Channel and Server will be created on setUp and stopped on tearDown
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Start the event loop in a background thread
+        :return:
+        """
+        cls.loop = asyncio.new_event_loop()
+        cls.loop_thread = threading.Thread(target=cls.loop.run_forever, daemon=True)
+        cls.loop_thread.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """
+        Stop the background event loop
+        :return:
+        """
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.loop_thread.join()
+        cls.loop.close()
+
+    def run_in_loop(self, coroutine):
+        """
+        Run a coroutine in the background event loop and wait for its result
+
+        :param coroutine: Coroutine to run
+        :return: Coroutine result
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    @staticmethod
+    async def _start_server():
+        """
+        Create and start the asyncio gRPC server inside the event loop
+
+        :return: Started server
+        """
+        server = todolists_aio_server.create_secured_server(GRPC_SERVER_PORT)
+        await server.start()
+        return server
+
+    def setUp(self) -> None:
+        """
+        Drop the database and create it again, and clear the TodoLists cache.
+        Start the asyncio grpc_server, and create the grpc_secured_channel to be used to invoke the stubs.
+        :return:
+        """
+        db.Database.drop_all()
+        db.Database.create_db_tables()
+        TodoListDBHandler.cache.clear()
+        self.grpc_server = self.run_in_loop(self._start_server())
+        with create_secured_client_channel('localhost:{}'.format(GRPC_SERVER_PORT)) as _channel:
+            self.grpc_secured_channel = _channel
+
+    def tearDown(self) -> None:
+        """
+        Clean the test environment.
+        Drop database, close grpc_secured_channel and stop the grpc_server
+        :return:
+        """
+        db.Database.drop_all()
+        self.grpc_secured_channel.close()
+        self.run_in_loop(self.grpc_server.stop(None))
@@ -0,0 +1,377 @@
+"""
+Module with the tests for the admission control of the gRPC servers
+
+Classes:
+    TestAimdLimit(unittest.TestCase)
+    TestAdmissionController(unittest.TestCase)
+    TestAsyncAdmissionController(unittest.TestCase)
+    TestAdmissionInterceptor(unittest.TestCase)
+    TestSaturatedServer(unittest.TestCase)
+    TestSessionOperations(unittest.TestCase)
+"""
+import asyncio
+import math
+import threading
+import time
+import unittest
+from concurrent import futures
+from unittest.mock import MagicMock, patch
+
+import grpc
+
+from config.config import GRPC_SERVER_PORT
+from database.memory_storage import MemoryStorage
+from metrics.admission_metrics import ADMISSION_SHED
+from metrics.interceptors import MetricsInterceptor, GRPC_SERVER_HANDLED
+from metrics.session_metrics import SESSION_OPERATIONS_HANDLED
+from proto_server.admission import (
+    AdmissionController, AdmissionInterceptor, AdmissionRejected, AimdLimit, AsyncAdmissionController
+)
+from proto_server.todolists_aio_server import AsyncTodoLists
+from proto_server.todolists_server import TodoLists, create_secured_server
+from proto_client.helpers import create_secured_client_channel
+import proto.v1.todolists_pb2 as todolists_pb2
+import proto.v1.todolists_pb2_grpc as todolists_pb2_grpc
+
+
+class TestAimdLimit(unittest.TestCase):
+    """
+    AimdLimit Tests
+    """
+
+    def test_increase_and_decrease(self):
+        """
+        The limit should grow with the fast RPCs while it is in use, and a burst of slow RPCs
+        should only decrease it once
+
+        :return:
+        """
+        # Data
+        limit = AimdLimit(initial_limit=4, min_limit=2, max_limit=5, target_latency=0.1, backoff_ratio=0.5)
+        start = time.perf_counter()
+
+        # When
+        limit.on_sample(start, 0.01, in_flight=1)
+        unused_limit = limit.limit
+        for _ in range(20):
+            limit.on_sample(start, 0.01, in_flight=4)
+        increased_limit = limit.limit
+        for _ in range(3):
+            limit.on_sample(start, 0.5, in_flight=4)
+        decreased_limit = limit.limit
+        limit.on_sample(time.perf_counter(), 0.5, in_flight=4)
+
+        # Then
+        self.assertEqual(unused_limit, 4)
+        self.assertEqual(increased_limit, 5)
+        self.assertEqual(decreased_limit, 2.5)
+        self.assertEqual(limit.limit, 2)
+
+
+class TestAdmissionController(unittest.TestCase):
+    """
+    AdmissionController Tests
+    """
+
+    def test_queue_and_reject(self):
+        """
+        The RPCs over the limit should wait in the queue until a slot is free, and be rejected when the queue is full
+
+        :return:
+        """
+        # Data
+        controller = AdmissionController(AimdLimit(initial_limit=1, min_limit=1), queue_size=1, max_queue_wait=5)
+        queue_full_before = ADMISSION_SHED.labels('queue_full').value
+        first_start = controller.acquire(math.inf)
+        admitted = threading.Event()
+        waiter = threading.Thread(target=lambda: (controller.acquire(math.inf), admitted.set()))
+
+        # When
+        waiter.start()
+        while not controller.queued:
+            time.sleep(0.001)
+        with self.assertRaises(AdmissionRejected) as rejected:
+            controller.acquire(math.inf)
+        queued_admitted = admitted.is_set()
+        controller.release(first_start)
+        waiter.join(5)
+
+        # Then
+        self.assertEqual(rejected.exception.code, grpc.StatusCode.RESOURCE_EXHAUSTED)
+        self.assertEqual(ADMISSION_SHED.labels('queue_full').value, queue_full_before + 1)
+        self.assertFalse(queued_admitted)
+        self.assertTrue(admitted.is_set())
+        self.assertEqual((controller.in_flight, controller.queued), (1, 0))
+
+    def test_queue_timeout(self):
+        """
+        An RPC that waits until its deadline should be rejected with DEADLINE_EXCEEDED,
+        and one that waits the max queue wait with RESOURCE_EXHAUSTED
+
+        :return:
+        """
+        # Data
+        controller = AdmissionController(AimdLimit(initial_limit=1, min_limit=1), queue_size=5, max_queue_wait=0.05)
+        controller.acquire(math.inf)
+
+        # When
+        with self.assertRaises(AdmissionRejected) as deadline_rejected:
+            controller.acquire(0.01)
+        with self.assertRaises(AdmissionRejected) as wait_rejected:
+            controller.acquire(math.inf)
+
+        # Then
+        self.assertEqual(deadline_rejected.exception.code, grpc.StatusCode.DEADLINE_EXCEEDED)
+        self.assertEqual(wait_rejected.exception.code, grpc.StatusCode.RESOURCE_EXHAUSTED)
+        self.assertEqual(wait_rejected.exception.reason, 'queue_timeout')
+        self.assertEqual((controller.in_flight, controller.queued), (1, 0))
+
+
+class TestAsyncAdmissionController(unittest.TestCase):
+    """
+    AsyncAdmissionController Tests
+    """
+
+    def test_queue_in_arrival_order(self):
+        """
+        The queued RPCs should be admitted in arrival order, and a cancelled RPC should leave the queue
+
+        :return:
+        """
+        # Data
+        controller = AsyncAdmissionController(AimdLimit(initial_limit=1, min_limit=1), queue_size=2,
+                                              max_queue_wait=5)
+        admitted = []
+
+        async def acquire(name: str) -> None:
+            await controller.acquire(math.inf)
+            admitted.append(name)
+
+        async def run() -> None:
+            first_start = await controller.acquire(math.inf)
+            cancelled = asyncio.ensure_future(acquire('cancelled'))
+            second = asyncio.ensure_future(acquire('second'))
+            await asyncio.sleep(0)
+            with self.assertRaises(AdmissionRejected):
+                await controller.acquire(math.inf)
+            cancelled.cancel()
+            await asyncio.sleep(0)
+            controller.release(first_start)
+            await second
+
+        # When
+        asyncio.run(run())
+
+        # Then
+        self.assertEqual(admitted, ['second'])
+        self.assertEqual((controller.in_flight, controller.queued), (1, 0))
+
+
+class TestAdmissionInterceptor(unittest.TestCase):
+    """
+    AdmissionInterceptor Tests, with a running gRPC server
+    """
+
+    def setUp(self) -> None:
+        """
+        Start a gRPC server with a concurrency limit of 1 and no queue
+        :return:
+        """
+        self.controller = AdmissionController(AimdLimit(initial_limit=1, min_limit=1, max_limit=1), queue_size=0)
+        self.interceptor = AdmissionInterceptor(self.controller)
+        self.grpc_server = grpc.server(futures.ThreadPoolExecutor(max_workers=2),
+                                       interceptors=(MetricsInterceptor(), self.interceptor))
+        self.storage = MemoryStorage()
+        todolists_pb2_grpc.add_TodoListsServicer_to_server(TodoLists(self.storage), self.grpc_server)
+        port = self.grpc_server.add_insecure_port('localhost:0')
+        self.grpc_server.start()
+        self.channel = grpc.insecure_channel('localhost:{}'.format(port))
+        self.stub = todolists_pb2_grpc.TodoListsStub(self.channel)
+
+    def tearDown(self) -> None:
+        """
+        Close the channel and stop the gRPC server
+        :return:
+        """
+        self.channel.close()
+        self.grpc_server.stop(None)
+
+    def test_reject_over_limit(self):
+        """
+        The RPCs should be rejected with RESOURCE_EXHAUSTED while the limit is in use, and admitted after
+
+        :return:
+        """
+        # Data
+        list_id = self.storage.new_todo_list_entry('admitted')
+        rejected_before = GRPC_SERVER_HANDLED.labels('todolists.TodoLists', 'Get', 'RESOURCE_EXHAUSTED').value
+        start = self.controller.acquire(math.inf)
+
+        # When
+        with self.assertRaises(grpc.RpcError) as rejected:
+            self.stub.Get(todolists_pb2.GetListRequest(id=list_id))
+        self.controller.release(start)
+        todo_list = self.stub.Get(todolists_pb2.GetListRequest(id=list_id))
+
+        # Then
+        self.assertEqual(rejected.exception.code(), grpc.StatusCode.RESOURCE_EXHAUSTED)  # pylint: disable=no-member
+        self.assertEqual(GRPC_SERVER_HANDLED.labels('todolists.TodoLists', 'Get', 'RESOURCE_EXHAUSTED').value,
+                         rejected_before + 1)
+        self.assertEqual(todo_list.name, 'admitted')
+        self.assertEqual(self.controller.in_flight, 0)
+
+    def test_reject_expired_deadline(self):
+        """
+        The RPCs whose deadline expired before they started should be aborted with DEADLINE_EXCEEDED
+        without running them
+
+        :return:
+        """
+        # Data
+        behavior = MagicMock()
+        handler = grpc.unary_unary_rpc_method_handler(behavior)
+        context = MagicMock()
+        context.time_remaining.return_value = 0
+        context.abort.side_effect = Exception()
+
+        # When
+        wrapped = self.interceptor.intercept_service(lambda details: handler,
+                                                     MagicMock(method='/todolists.TodoLists/Get'))
+        with self.assertRaises(Exception):
+            wrapped.unary_unary(None, context)
+
+        # Then
+        context.abort.assert_called_once()
+        self.assertEqual(context.abort.call_args[0][0], grpc.StatusCode.DEADLINE_EXCEEDED)
+        behavior.assert_not_called()
+        self.assertEqual(self.controller.in_flight, 0)
+
+
+class TestSaturatedServer(unittest.TestCase):
+    """
+    Admission control Tests, with a running thread pool gRPC server of 1 worker thread, 1 stream thread and no queue
+    """
+
+    def setUp(self) -> None:
+        """
+        Start the gRPC server with admission control and an in memory storage whose `get_todo_list` waits
+        until the test unblocks it
+        :return:
+        """
+        self.storage = MemoryStorage()
+        self.started = threading.Semaphore(0)
+        self.unblocked = threading.Event()
+        get_todo_list = self.storage.get_todo_list
+
+        def blocking_get_todo_list(list_id: int):
+            self.started.release()
+            self.unblocked.wait(5)
+            return get_todo_list(list_id)
+        self.storage.get_todo_list = blocking_get_todo_list
+        with patch.multiple('proto_server.todolists_server', ADMISSION_CONTROL=True, GRPC_SERVER_MAX_WORKERS=1,
+                            ADMISSION_QUEUE_SIZE=0, GRPC_SERVER_MAX_STREAM_WORKERS=1):
+            self.grpc_server = create_secured_server(GRPC_SERVER_PORT, storage=self.storage)
+        self.grpc_server.start()
+        with create_secured_client_channel('localhost:{}'.format(GRPC_SERVER_PORT)) as _channel:
+            self.channel = _channel
+        self.stub = todolists_pb2_grpc.TodoListsStub(self.channel)
+
+    def tearDown(self) -> None:
+        """
+        Unblock the RPCs, close the channel and stop the gRPC server
+        :return:
+        """
+        self.unblocked.set()
+        self.channel.close()
+        self.grpc_server.stop(None)
+
+    def test_reject_saturated_server(self):
+        """
+        The streams should run while the worker thread is in use, and the RPCs over the worker thread, the queue
+        and the stream thread should be rejected with RESOURCE_EXHAUSTED
+
+        :return:
+        """
+        # Data
+        request = todolists_pb2.GetListRequest(id=self.storage.new_todo_list_entry('blocked'))
+
+        # When
+        running = self.stub.Get.future(request, timeout=5)
+        self.assertTrue(self.started.acquire(timeout=5))
+        streamed = list(self.stub.StreamLists(todolists_pb2.StreamListsRequest(), timeout=5))
+        queued = self.stub.Get.future(request, timeout=5)
+        time.sleep(0.1)
+        with self.assertRaises(grpc.RpcError) as rejected:
+            self.stub.Get(request, timeout=5)
+        self.unblocked.set()
+
+        # Then
+        self.assertEqual(rejected.exception.code(), grpc.StatusCode.RESOURCE_EXHAUSTED)  # pylint: disable=no-member
+        self.assertEqual([_list.name for _list in streamed], ['blocked'])
+        self.assertEqual(running.result().name, 'blocked')
+        self.assertEqual(queued.result().name, 'blocked')
+
+
+class TestSessionOperations(unittest.TestCase):
+    """
+    Admission control and metrics Tests of the Session operations, without a gRPC server
+    """
+
+    def test_admit_operations(self):
+        """
+        The Session operations should be rejected with RESOURCE_EXHAUSTED in their reply while the limit is in use,
+        run after, and be counted by status code
+
+        :return:
+        """
+        # Data
+        controller = AdmissionController(AimdLimit(initial_limit=1, min_limit=1, max_limit=1), queue_size=0)
+        servicer = TodoLists(MemoryStorage(), controller)
+        request = todolists_pb2.SessionRequest(correlation_id=1,
+                                               create=todolists_pb2.CreateListRequest(name='admitted'))
+        rejected_before = SESSION_OPERATIONS_HANDLED.labels('create', 'RESOURCE_EXHAUSTED').value
+        handled_before = SESSION_OPERATIONS_HANDLED.labels('create', 'OK').value
+        start = controller.acquire(math.inf)
+
+        # When
+        rejected = servicer.run_session_operation(request)
+        controller.release(start)
+        admitted = servicer.run_session_operation(request, time_remaining=5)
+
+        # Then
+        self.assertEqual(rejected.error.code, grpc.StatusCode.RESOURCE_EXHAUSTED.value[0])
+        self.assertEqual(admitted.create.name, 'admitted')
+        self.assertEqual(SESSION_OPERATIONS_HANDLED.labels('create', 'RESOURCE_EXHAUSTED').value, rejected_before + 1)
+        self.assertEqual(SESSION_OPERATIONS_HANDLED.labels('create', 'OK').value, handled_before + 1)
+        self.assertEqual(controller.in_flight, 0)
+
+    def test_admit_async_operations(self):
+        """
+        The operations of the asyncio Session streams should be rejected while the limit is in use, and run after
+
+        :return:
+        """
+        # Data
+        controller = AsyncAdmissionController(AimdLimit(initial_limit=1, min_limit=1, max_limit=1), queue_size=0)
+        servicer = AsyncTodoLists(MemoryStorage(), controller)
+        request = todolists_pb2.SessionRequest(correlation_id=1,
+                                               create=todolists_pb2.CreateListRequest(name='admitted'))
+        replies = []
+
+        async def run() -> None:
+            start = await controller.acquire(math.inf)
+            replies.append(await servicer.run_session_operation(request))
+            controller.release(start)
+            replies.append(await servicer.run_session_operation(request))
+
+        # When
+        asyncio.run(run())
+
+        # Then
+        self.assertEqual(replies[0].error.code, grpc.StatusCode.RESOURCE_EXHAUSTED.value[0])
+        self.assertEqual(replies[1].create.name, 'admitted')
+        self.assertEqual(controller.in_flight, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Module with the tests for the asyncio client of the todolists.TodoLists Service
+
+Classes:
+    TestAsyncTodoListsClient(BaseAioTestClass)
+"""
+import unittest
+
+import grpc
+
+from config.config import GRPC_SERVER_PORT
+from database.todo_lists_db_handler import TodoListDBHandler
+from proto_client.aio_client import AsyncTodoListsClient
+from tests.base_test_class import BaseAioTestClass
+
+
+class TestAsyncTodoListsClient(BaseAioTestClass):
+    """
+    AsyncTodoListsClient Tests, the client runs in the event loop of the asyncio gRPC server
+    """
+
+    def setUp(self) -> None:
+        """
+        Start the gRPC server, and create a client of 2 channels with up to 4 RPCs in flight per bulk operation
+        :return:
+        """
+        super().setUp()
+        self.client = AsyncTodoListsClient('localhost:{}'.format(GRPC_SERVER_PORT), channels=2, max_concurrency=4)
+
+    def tearDown(self) -> None:
+        """
+        Close the client, and stop the gRPC server
+        :return:
+        """
+        self.run_in_loop(self.client.close())
+        super().tearDown()
+
+    def test_single_operations(self):
+        """
+        The single operations should return the replies, and raise the errors of the RPCs
+
+        :return:
+        """
+        # Data
+        async def operations():
+            created = await self.client.create_list('TestList')
+            fetched = await self.client.get_list(created.id)
+            page = await self.client.get_lists_paginated(1, 10)
+            await self.client.delete_list(created.id)
+            return created, fetched, page
+
+        # When
+        created, fetched, page = self.run_in_loop(operations())
+
+        # Then
+        self.assertEqual(fetched.name, 'TestList')
+        self.assertEqual([_list.id for _list in page.todo_lists], [created.id])
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 0)
+        with self.assertRaises(grpc.RpcError) as context:
+            self.run_in_loop(self.client.get_list(created.id))
+        self.assertEqual(context.exception.code(), grpc.StatusCode.NOT_FOUND)
+
+    def test_bulk_operations(self):
+        """
+        The bulk operations should return the reply of each item in order, and the errors by the item index
+
+        :return:
+        """
+        # Data
+        names = ['list-{}'.format(i) for i in range(20)] + ['list-0']
+
+        # When
+        created = self.run_in_loop(self.client.create_many(names))
+        new_ids = [_reply.id for _reply in created.results if _reply is not None]
+        fetched = self.run_in_loop(self.client.get_many(new_ids + [0]))
+        deleted = self.run_in_loop(self.client.delete_many(new_ids[:10]))
+
+        # Then
+        failed_index, = created.errors
+        self.assertIsNone(created.results[failed_index])
+        self.assertEqual(names[failed_index], 'list-0')
+        self.assertEqual(created.errors[failed_index].code(), grpc.StatusCode.INVALID_ARGUMENT)
+        self.assertEqual(sorted(_list.name for _list in fetched.results[:-1]), sorted(set(names)))
+        self.assertEqual(list(fetched.errors), [20])
+        self.assertEqual(deleted.errors, {})
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Module with the tests for the LruTtlCache used in front of the DB reads
+
+Classes:
+    TestLruTtlCache(unittest.TestCase)
+"""
+import unittest
+
+from database.cache import LruTtlCache
+
+
+class TestLruTtlCache(unittest.TestCase):
+    """
+    LruTtlCache Tests, the time is controlled with a fake clock
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a cache of 2 entries valid for 10 seconds
+        :return:
+        """
+        self.now = 0.0
+        self.cache = LruTtlCache(max_size=2, ttl=10, clock=lambda: self.now)
+
+    def test_get_hits_and_misses(self):
+        """
+        Get should count the hits and misses, `None` values are hits
+
+        :return:
+        """
+        # Data
+        self.cache.put(1, 'TestList')
+        self.cache.put(2, None)
+
+        # When
+        values = [self.cache.get(1, 'missing'), self.cache.get(2, 'missing'), self.cache.get(3, 'missing')]
+
+        # Then
+        self.assertEqual(values, ['TestList', None, 'missing'])
+        self.assertEqual(self.cache.stats(), {'hits': 2, 'misses': 1, 'size': 2})
+
+    def test_evict_least_recently_used(self):
+        """
+        When the cache is full the least recently used entry should be evicted
+
+        :return:
+        """
+        # Data
+        self.cache.put(1, 'TestList1')
+        self.cache.put(2, 'TestList2')
+        self.cache.get(1)
+
+        # When
+        self.cache.put(3, 'TestList3')
+
+        # Then
+        self.assertEqual(self.cache.get(1), 'TestList1')
+        self.assertEqual(self.cache.get(2, 'missing'), 'missing')
+        self.assertEqual(self.cache.get(3), 'TestList3')
+
+    def test_entries_expire(self):
+        """
+        The entries should not be returned after `ttl` seconds
+
+        :return:
+        """
+        # Data
+        self.cache.put(1, 'TestList')
+
+        # When
+        self.now = 10.0
+
+        # Then
+        self.assertEqual(self.cache.get(1, 'missing'), 'missing')
+        self.assertEqual(self.cache.stats()['size'], 0)
+
+    def test_put_skipped_after_invalidation(self):
+        """
+        A value read before an invalidation should not be stored
+
+        :return:
+        """
+        # Data
+        token = self.cache.token()
+        self.cache.invalidate(1)
+
+        # When
+        self.cache.put(1, None, token)
+
+        # Then
+        self.assertEqual(self.cache.get(1, 'missing'), 'missing')
+
+
+if __name__ == '__main__':
+    unittest.main()
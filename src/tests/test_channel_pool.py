@@ -0,0 +1,96 @@
+"""
+Module with the tests for the client channel pool and the stubs cache
+
+Classes:
+    TestChannelPool(BaseTestClass)
+"""
+import unittest
+from concurrent import futures
+
+from config.config import GRPC_SERVER_PORT
+from proto_client import helpers
+from proto_client.helpers import ChannelPool, get_todo_lists_stub
+from tests.base_test_class import BaseTestClass
+import proto.v1.todolists_pb2 as todolists_pb2
+
+
+class TestChannelPool(BaseTestClass):
+    """
+    ChannelPool Tests, with a running gRPC server
+    """
+
+    def setUp(self) -> None:
+        """
+        Start the gRPC server, and create a pool of 2 channels per address
+        :return:
+        """
+        super().setUp()
+        self.address = 'localhost:{}'.format(GRPC_SERVER_PORT)
+        self.pool = ChannelPool(size=2)
+
+    def tearDown(self) -> None:
+        """
+        Close the pool, and stop the gRPC server
+        :return:
+        """
+        self.pool.close()
+        super().tearDown()
+
+    def test_round_robin_channels_and_cached_stubs(self):
+        """
+        The channels of an address should be handed out round robin, each one with its cached stub
+
+        :return:
+        """
+        # When
+        channels = [self.pool.get_channel(self.address) for _ in range(4)]
+        stubs = [self.pool.get_stub(self.address) for _ in range(2)]
+
+        # Then
+        self.assertIsNot(channels[0], channels[1])
+        self.assertEqual(channels[:2], channels[2:])
+        self.assertIsNot(stubs[0], stubs[1])
+        self.assertIs(get_todo_lists_stub(channels[0]), get_todo_lists_stub(channels[0]))
+
+    def test_concurrent_calls(self):
+        """
+        The stubs of the pool should be usable from many threads
+
+        :return:
+        """
+        # Data
+        def create(index: int) -> int:
+            return self.pool.get_stub(self.address).Create(todolists_pb2.CreateListRequest(name=str(index))).id
+
+        # When
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            new_ids = list(executor.map(create, range(20)))
+
+        # Then
+        self.assertEqual(len(set(new_ids)), 20)
+
+    def test_close_and_fork_reset(self):
+        """
+        A closed pool, or a pool of a forked child process, should open new channels
+
+        :return:
+        """
+        # Data
+        channel = self.pool.get_channel(self.address)
+
+        # When
+        self.pool.close()
+        after_close = self.pool.get_channel(self.address)
+        helpers._reset_pools_after_fork()  # pylint: disable=protected-access
+        after_fork = self.pool.get_channel(self.address)
+
+        # Then
+        self.assertIsNot(after_close, channel)
+        self.assertIsNot(after_fork, after_close)
+        new_id = self.pool.get_stub(self.address).Create(todolists_pb2.CreateListRequest(name='after fork')).id
+        self.assertEqual(self.pool.get_stub(self.address).Get(todolists_pb2.GetListRequest(id=new_id)).name,
+                         'after fork')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Module with the tests for the compression policy of the gRPC messages
+
+Classes:
+    TestCompressionPolicy(unittest.TestCase)
+    TestCompressedRpcs(BaseTestClass)
+"""
+import unittest
+from unittest.mock import MagicMock
+
+import grpc
+
+from config.compression import CompressionPolicy, parse_compression, parse_method_compressions
+from config.config import GRPC_SERVER_PORT
+from database.memory_storage import MemoryStorage
+from proto_client.compression import CompressionClientInterceptor
+from proto_client.helpers import create_secured_client_channel, get_todo_lists_stub
+from proto_server.compression import CompressionInterceptor
+from proto_server.todolists_server import create_secured_server
+from tests.base_test_class import BaseTestClass
+import proto.v1.todolists_pb2 as todolists_pb2
+
+
+class TestCompressionPolicy(unittest.TestCase):
+    """
+    CompressionPolicy and interceptors Tests, without a gRPC server
+    """
+
+    def test_parse_compressions(self):
+        """
+        Parse the compression names and the per-method settings, unknown names should raise ValueError
+
+        :return:
+        """
+        # When
+        compressions = parse_method_compressions(' Get=GZIP, StreamLists=none,')
+
+        # Then
+        self.assertEqual(parse_compression('deflate'), grpc.Compression.Deflate)
+        self.assertEqual(compressions, {'Get': grpc.Compression.Gzip, 'StreamLists': grpc.Compression.NoCompression})
+        with self.assertRaises(ValueError):
+            parse_compression('brotli')
+        with self.assertRaises(ValueError):
+            parse_method_compressions('Get')
+
+    def test_method_and_message_compression(self):
+        """
+        Only the big messages of the compressed methods should be compressed, the per-method settings
+        should override the defaults
+
+        :return:
+        """
+        # Data
+        policy = CompressionPolicy(compression='gzip', min_size=100, method_compressions='Get=deflate,List=none')
+        small_request = todolists_pb2.BatchCreateListsRequest(names=['list'])
+        big_request = todolists_pb2.BatchCreateListsRequest(names=['list-{}'.format(i) for i in range(50)])
+
+        # Then
+        self.assertEqual(policy.method_compression('/todolists.TodoLists/BatchCreate'), grpc.Compression.Gzip)
+        self.assertEqual(policy.method_compression('Get'), grpc.Compression.Deflate)
+        self.assertEqual(policy.method_compression('List'), grpc.Compression.NoCompression)
+        self.assertEqual(policy.method_compression('Create'), grpc.Compression.NoCompression)
+        self.assertEqual(policy.message_compression('BatchCreate', small_request), grpc.Compression.NoCompression)
+        self.assertEqual(policy.message_compression('BatchCreate', big_request), grpc.Compression.Gzip)
+        self.assertEqual(policy.message_compression('Create', big_request), grpc.Compression.NoCompression)
+
+    def test_server_interceptor(self):
+        """
+        The server interceptor should set the compression of the compressed methods, disable it for the small
+        responses, and not wrap the handlers of the uncompressed methods
+
+        :return:
+        """
+        # Data
+        interceptor = CompressionInterceptor(CompressionPolicy(compression='gzip', min_size=100))
+        small_reply = todolists_pb2.TodoList(id=1, name='list')
+        big_reply = todolists_pb2.TodoList(id=2, name='list' * 50)
+        handler = grpc.unary_stream_rpc_method_handler(lambda request, context: iter([small_reply, big_reply]))
+        create_handler = grpc.unary_unary_rpc_method_handler(lambda request, context: small_reply)
+        context = MagicMock()
+
+        # When
+        wrapped = interceptor.intercept_service(lambda details: handler,
+                                                MagicMock(method='/todolists.TodoLists/StreamLists'))
+        replies = wrapped.unary_stream(None, context)
+        first_reply = next(replies)
+        disabled_after_first = context.disable_next_message_compression.call_count
+        list(replies)
+
+        # Then
+        self.assertIs(interceptor.intercept_service(lambda details: create_handler,
+                                                    MagicMock(method='/todolists.TodoLists/Create')), create_handler)
+        self.assertIs(first_reply, small_reply)
+        context.set_compression.assert_called_once_with(grpc.Compression.Gzip)
+        self.assertEqual(disabled_after_first, 1)
+        self.assertEqual(context.disable_next_message_compression.call_count, 1)
+
+    def test_client_interceptor(self):
+        """
+        The client interceptor should set the compression of the big requests, and keep the compression of the caller
+
+        :return:
+        """
+        # Data
+        interceptor = CompressionClientInterceptor(CompressionPolicy(compression='gzip', min_size=100))
+        details = MagicMock(method='/todolists.TodoLists/BatchCreate', compression=None)
+        caller_details = MagicMock(method='/todolists.TodoLists/BatchCreate', compression=grpc.Compression.Deflate)
+        request = todolists_pb2.BatchCreateListsRequest(names=['list-{}'.format(i) for i in range(50)])
+
+        # When
+        sent_details = interceptor.intercept_unary_unary(lambda _details, _request: _details, details, request)
+        sent_caller_details = interceptor.intercept_unary_unary(lambda _details, _request: _details,
+                                                                caller_details, request)
+
+        # Then
+        self.assertEqual(sent_details.compression, grpc.Compression.Gzip)
+        self.assertEqual(sent_details.method, details.method)
+        self.assertIs(sent_caller_details, caller_details)
+
+
+class TestCompressedRpcs(BaseTestClass):
+    """
+    RPCs Tests with a gRPC server and a channel that compress all the messages
+    """
+
+    def setUp(self) -> None:
+        """
+        Start a gRPC server, with an in memory storage, and a channel that compress all the messages of all the methods
+        :return:
+        """
+        policy = CompressionPolicy(compression='gzip', min_size=0,
+                                   method_compressions='Create=deflate,Get=gzip,StreamLists=gzip')
+        self.grpc_server = create_secured_server(GRPC_SERVER_PORT, storage=MemoryStorage(), compression_policy=policy)
+        self.grpc_server.start()
+        with create_secured_client_channel('localhost:{}'.format(GRPC_SERVER_PORT),
+                                           compression_policy=policy) as _channel:
+            self.grpc_secured_channel = _channel
+        self.stub = get_todo_lists_stub(self.grpc_secured_channel)
+
+    def tearDown(self) -> None:
+        """
+        Close the channel and stop the gRPC server
+        :return:
+        """
+        self.grpc_secured_channel.close()
+        self.grpc_server.stop(None)
+
+    def test_compressed_rpcs(self):
+        """
+        The compressed requests and replies should be received as they were sent
+
+        :return:
+        """
+        # Data
+        names = ['compressed list {}'.format(i) * 10 for i in range(30)]
+
+        # When
+        batch_reply = self.stub.BatchCreate(todolists_pb2.BatchCreateListsRequest(names=names))
+        created = self.stub.Create(todolists_pb2.CreateListRequest(name='compressed list'))
+        fetched = self.stub.Get(todolists_pb2.GetListRequest(id=created.id))
+        page = self.stub.List(todolists_pb2.ListTodoListsRequest(page_number=1, page_size=50))
+        streamed = list(self.stub.StreamLists(todolists_pb2.StreamListsRequest()))
+
+        # Then
+        self.assertTrue(all(_result.created for _result in batch_reply.results))
+        self.assertEqual(fetched.name, 'compressed list')
+        self.assertEqual([_list.name for _list in page.todo_lists], names + ['compressed list'])
+        self.assertEqual([_list.name for _list in streamed], names + ['compressed list'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Module with the tests for the Database engine configuration
+
+Classes:
+    TestDatabaseEngine(unittest.TestCase)
+"""
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy.pool import NullPool, QueuePool
+
+import database.config as config
+from database.database import Database, create_db_engine
+
+
+class TestDatabaseEngine(unittest.TestCase):
+    """
+    Database engine pragmas and connections pool Tests
+    """
+
+    def test_pragmas_applied(self):
+        """
+        The configured pragmas should be applied to the DB connections
+
+        :return:
+        """
+        # When
+        with Database.db_engine.connect() as connection:
+            pragmas = {_pragma: connection.execute('PRAGMA {}'.format(_pragma)).scalar()
+                       for _pragma in ('journal_mode', 'synchronous', 'cache_size', 'busy_timeout', 'temp_store')}
+
+        # Then
+        self.assertEqual(pragmas, {
+            'journal_mode': 'wal',
+            'synchronous': 1,  # NORMAL
+            'cache_size': int(config.SQLITE_CACHE_SIZE),
+            'busy_timeout': int(config.SQLITE_BUSY_TIMEOUT),
+            'temp_store': 2,  # MEMORY
+        })
+
+    def test_connections_pool(self):
+        """
+        The pool should keep `DB_POOL_SIZE` connections, and not keep connections if it is 0
+
+        :return:
+        """
+        # When
+        pooled_engine = create_db_engine()
+        with patch.object(config, 'DB_POOL_SIZE', 0):
+            not_pooled_engine = create_db_engine()
+
+        # Then
+        self.assertIsInstance(pooled_engine.pool, QueuePool)
+        self.assertEqual(pooled_engine.pool.size(), config.DB_POOL_SIZE)
+        self.assertIsInstance(not_pooled_engine.pool, NullPool)
+
+    def test_invalid_pragma_value(self):
+        """
+        Pragma values that are not a word or a number should raise ValueError
+
+        :return:
+        """
+        # Then
+        with patch.object(config, 'SQLITE_PRAGMAS', [('journal_mode', 'WAL; DROP TABLE x')]):
+            with self.assertRaises(ValueError):
+                create_db_engine()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,15 +8,30 @@ import io
 import unittest
 from unittest.mock import patch, MagicMock
 
+from google.rpc import code_pb2
+
 from proto_client.stub_create_list import create_list
+from proto_client.stub_batch_create_lists import batch_create_lists
 from proto_client.stub_get_list import get_list
+from proto_client.stub_batch_get_lists import batch_get_lists
 from proto_client.stub_delete_list import delete_list
+from proto_client.stub_batch_delete_lists import batch_delete_lists
 from proto_client.stub_get_lists_paginated import get_lists_paginated
+from proto_client.stub_stream_lists import stream_lists
+from proto_client.stub_import_lists import import_lists
+from proto_client.stub_session import run_session, create_session_request
+from database.database import Database
+from database.tables.todo_lists_count import TodoListsCount
+from database.storage import TodoListRecord
 from database.todo_lists_db_handler import TodoListDBHandler
+from proto_server.todolists_server import TodoLists
 from tests.base_test_class import BaseTestClass
+import database.todo_lists_db_handler as todo_lists_db_handler
+import proto_server.todolists_server as todolists_server
+import proto.v1.todolists_pb2 as todolists_pb2
 
 
-class TestGrpcTodoLists(BaseTestClass):
+class TestGrpcTodoLists(BaseTestClass):  # pylint: disable=too-many-public-methods
     """
     gRPC Service todolists.TodoLists Tests
     """
@@ -80,6 +95,86 @@ class TestGrpcTodoLists(BaseTestClass):
         self.assertEqual(len(db_entries), 0, 'Error DB should have 0 entries')
         self.assertIn('failed to connect to all addresses', print_mock.getvalue())
 
+    def test_batch_create_lists(self):
+        """
+        Invoke the batch create lists stub and validate that the lists are stored in the database
+
+        :return:
+        """
+        # Data
+        new_lists_names = ['TestList1', 'TestList2', 'TestList3']
+
+        # When
+        response = batch_create_lists(new_lists_names, self.grpc_secured_channel)
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        self.assertEqual([_result.name for _result in response.results], new_lists_names)
+        self.assertTrue(all(_result.created for _result in response.results))
+        self.assertEqual([_result.id for _result in response.results], [_entry.id for _entry in db_entries])
+        self.assertEqual([_entry.name for _entry in db_entries], new_lists_names)
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 3)
+
+    def test_batch_create_lists_unique_names(self):
+        """
+        Invoke the batch create lists stub with names that already exist, or are repeated,
+        should create only the other lists
+
+        :return:
+        """
+        # Data
+        existing_list_id = TodoListDBHandler.new_todo_list_entry('TestList1')
+        new_lists_names = ['TestList1', 'TestList2', 'TestList2', 'TestList3']
+
+        # When
+        response = batch_create_lists(new_lists_names, self.grpc_secured_channel)
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        self.assertEqual([_result.created for _result in response.results], [False, True, False, True])
+        self.assertIn('List name must be unique', response.results[0].error)
+        self.assertIn('List name must be unique', response.results[2].error)
+        self.assertEqual([_entry.id for _entry in db_entries],
+                         [existing_list_id, response.results[1].id, response.results[3].id])
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 3)
+
+    def test_batch_create_lists_many(self):
+        """
+        Invoke the batch create lists stub with more names than the SQL parameters chunk size
+
+        :return:
+        """
+        # Data
+        TodoListDBHandler.new_todo_list_entry('1100')
+        new_lists_names = [str(i) for i in range(1200)]
+
+        # When
+        response = batch_create_lists(new_lists_names, self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual(len(response.results), 1200)
+        self.assertEqual(sum(_result.created for _result in response.results), 1199)
+        self.assertFalse(response.results[1100].created)
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 1200)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_batch_create_lists_fail_too_big(self, print_mock: MagicMock):
+        """
+        Invoke the batch create lists stub with more names than `MAX_BATCH_SIZE` should fail without creating
+        any list
+
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # When
+        with patch.object(todolists_server, 'MAX_BATCH_SIZE', 2):
+            response = batch_create_lists(['TestList1', 'TestList2', 'TestList3'], self.grpc_secured_channel)
+
+        # Then
+        self.assertIsNone(response)
+        self.assertIn('Batch of 3 items is bigger than the max batch size, 2 items.', print_mock.getvalue())
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 0)
+
     def test_get_list(self):
         """
         Invoke the get list stub
@@ -114,6 +209,83 @@ class TestGrpcTodoLists(BaseTestClass):
         # Then
         self.assertIn('List with id "{}" not found.'.format(invalid_id), print_mock.getvalue())
 
+    def test_get_list_cached(self):
+        """
+        Invoke the get list stub many times, only the first one should read the DB
+
+        :return:
+        """
+        # Data
+        test_list_id = TodoListDBHandler.new_todo_list_entry('TestList')
+
+        # When
+        responses = [get_list(test_list_id, self.grpc_secured_channel) for _ in range(3)]
+
+        # Then
+        self.assertEqual([_response.name for _response in responses], ['TestList'] * 3)
+        self.assertEqual(TodoListDBHandler.cache.misses, 1)
+        self.assertEqual(TodoListDBHandler.cache.hits, 2)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_get_list_cache_invalidated(self, print_mock: MagicMock):
+        """
+        A list cached as not found should be found after being created, and not found after being deleted
+
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        get_list(1, self.grpc_secured_channel)
+
+        # When
+        test_list_id = TodoListDBHandler.new_todo_list_entry('TestList')
+        response = get_list(test_list_id, self.grpc_secured_channel)
+        delete_list(test_list_id, self.grpc_secured_channel)
+        get_list(test_list_id, self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual(test_list_id, 1)
+        self.assertEqual(response.name, 'TestList')
+        self.assertEqual(print_mock.getvalue().count('List with id "1" not found.'), 2)
+
+    def test_batch_get_lists(self):
+        """
+        Invoke the batch get lists stub with existing and missing ids, the reply should keep the requested order
+
+        :return:
+        """
+        # Data
+        test_lists_ids = [TodoListDBHandler.new_todo_list_entry('TestList{}'.format(i)) for i in range(3)]
+        missing_ids = [665, 666]
+        requested_ids = [test_lists_ids[2], missing_ids[1], test_lists_ids[0], missing_ids[0], test_lists_ids[1]]
+
+        # When
+        response = batch_get_lists(requested_ids, self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual([_list.id for _list in response.todo_lists],
+                         [test_lists_ids[2], test_lists_ids[0], test_lists_ids[1]])
+        self.assertEqual([_list.name for _list in response.todo_lists], ['TestList2', 'TestList0', 'TestList1'])
+        self.assertEqual(list(response.missing_ids), [666, 665])
+
+    def test_batch_get_lists_many(self):
+        """
+        Invoke the batch get lists stub with more ids than the SQL parameters chunk size
+
+        :return:
+        """
+        # Data
+        TodoListDBHandler.new_todo_list_entries([str(i) for i in range(1200)])
+        db_ids = [_entry.id for _entry in TodoListDBHandler.iter_lists()]
+        requested_ids = list(reversed(db_ids)) + [5000]
+
+        # When
+        response = batch_get_lists(requested_ids, self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual([_list.id for _list in response.todo_lists], requested_ids[:-1])
+        self.assertEqual(list(response.missing_ids), [5000])
+
     def test_delete_list(self):
         """
         Invoke the delete list stub
@@ -147,6 +319,64 @@ class TestGrpcTodoLists(BaseTestClass):
         # Then
         self.assertIn('List with id "{}" not found.'.format(invalid_id), print_mock.getvalue())
 
+    def test_batch_delete_lists(self):
+        """
+        Invoke the batch delete lists stub with existing, missing and repeated ids
+
+        :return:
+        """
+        # Data
+        test_lists_ids = [TodoListDBHandler.new_todo_list_entry('TestList{}'.format(i)) for i in range(3)]
+        requested_ids = [test_lists_ids[2], 666, test_lists_ids[0], test_lists_ids[2], 665]
+
+        # When
+        response = batch_delete_lists(requested_ids, self.grpc_secured_channel)
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        self.assertEqual(list(response.deleted_ids), [test_lists_ids[2], test_lists_ids[0]])
+        self.assertEqual(list(response.not_found_ids), [666, 665])
+        self.assertEqual([_entry.id for _entry in db_entries], [test_lists_ids[1]])
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 1)
+
+    def test_batch_delete_lists_many(self):
+        """
+        Invoke the batch delete lists stub with more ids than the SQL parameters chunk size
+
+        :return:
+        """
+        # Data
+        new_ids = TodoListDBHandler.new_todo_list_entries([str(i) for i in range(1200)])
+
+        # When
+        response = batch_delete_lists(new_ids[:1100], self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual(list(response.deleted_ids), new_ids[:1100])
+        self.assertEqual(len(response.not_found_ids), 0)
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 100)
+        self.assertEqual([_entry.id for _entry in TodoListDBHandler.iter_lists()], new_ids[1100:])
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_batch_delete_lists_fail_too_big(self, print_mock: MagicMock):
+        """
+        Invoke the batch delete lists stub with more ids than `MAX_BATCH_SIZE` should fail without deleting any list
+
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        test_list_ids = TodoListDBHandler.new_todo_list_entries(['TestList1', 'TestList2', 'TestList3'])
+
+        # When
+        with patch.object(todolists_server, 'MAX_BATCH_SIZE', 2):
+            response = batch_delete_lists(test_list_ids, self.grpc_secured_channel)
+
+        # Then
+        self.assertIsNone(response)
+        self.assertIn('Batch of 3 items is bigger than the max batch size, 2 items.', print_mock.getvalue())
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 3)
+
     def test_get_lists_paginated(self):
         """
         Invoke the get lists paginated stub
@@ -186,6 +416,131 @@ class TestGrpcTodoLists(BaseTestClass):
         self.assertEqual(response.todo_lists[0].id, db_entries[4].id)
         self.assertEqual(response.todo_lists[0].id, db_entries[4].id)
 
+    def test_get_lists_paginated_by_token(self):
+        """
+        Invoke the get lists paginated stub following the `next_page_token` until the last page
+
+        :return:
+        """
+        # Data
+        [TodoListDBHandler.new_todo_list_entry(str(i)) for i in range(5)]  # pylint: disable=expression-not-assigned
+
+        # When
+        first_page = get_lists_paginated(1, 2, self.grpc_secured_channel)
+        second_page = get_lists_paginated(1, 2, self.grpc_secured_channel, page_token=first_page.next_page_token)
+        last_page = get_lists_paginated(1, 2, self.grpc_secured_channel, page_token=second_page.next_page_token)
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        fetched_ids = [_list.id for page in (first_page, second_page, last_page) for _list in page.todo_lists]
+        self.assertEqual(fetched_ids, [_entry.id for _entry in db_entries])
+        self.assertEqual(second_page.count, 5)
+        self.assertEqual(second_page.next_page_number, '')
+        self.assertNotEqual(second_page.next_page_token, '')
+        self.assertEqual(last_page.next_page_token, '')
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_get_lists_paginated_fail_invalid_token(self, print_mock: MagicMock):
+        """
+        Invoke the get lists paginated stub should fail when the `page_token` is not valid
+
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        invalid_token = 'not-a-token'
+
+        # When
+        get_lists_paginated(1, 2, self.grpc_secured_channel, page_token=invalid_token)
+
+        # Then
+        self.assertIn('Invalid page_token "{}".'.format(invalid_token), print_mock.getvalue())
+
+    def test_get_lists_paginated_default_page_size(self):
+        """
+        Invoke the get lists paginated stub with `page_size` 0 should return pages of 10 lists
+
+        :return:
+        """
+        # Data
+        [TodoListDBHandler.new_todo_list_entry(str(i)) for i in range(12)]  # pylint: disable=expression-not-assigned
+
+        # When
+        response = get_lists_paginated(1, 0, self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual(len(response.todo_lists), 10)
+        self.assertEqual(response.next_page_number, '2')
+
+    def test_get_lists_paginated_last_full_page(self):
+        """
+        Invoke the get lists paginated stub for a last page that is full should not return a next page
+
+        :return:
+        """
+        # Data
+        [TodoListDBHandler.new_todo_list_entry(str(i)) for i in range(4)]  # pylint: disable=expression-not-assigned
+
+        # When
+        response = get_lists_paginated(2, 2, self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual(len(response.todo_lists), 2)
+        self.assertEqual(response.next_page_number, '')
+        self.assertEqual(response.next_page_token, '')
+        self.assertEqual(response.count, 4)
+
+    def test_get_lists_paginated_skip_count(self):
+        """
+        Invoke the get lists paginated stub with `skip_count` should not return the count
+
+        :return:
+        """
+        # Data
+        [TodoListDBHandler.new_todo_list_entry(str(i)) for i in range(3)]  # pylint: disable=expression-not-assigned
+
+        # When
+        response = get_lists_paginated(1, 2, self.grpc_secured_channel, skip_count=True)
+
+        # Then
+        self.assertEqual(response.count, 0)
+        self.assertEqual(len(response.todo_lists), 2)
+        self.assertEqual(response.next_page_number, '2')
+
+    def test_lists_count_maintained(self):
+        """
+        The TodoLists count should be updated when lists are created and deleted
+
+        :return:
+        """
+        # Data
+        list_ids = [TodoListDBHandler.new_todo_list_entry(str(i)) for i in range(3)]
+
+        # When
+        delete_list(list_ids[0], self.grpc_secured_channel)
+        create_list('NewList', self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 3)
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), len(TodoListDBHandler.get_lists_paginated()))
+
+    def test_lists_count_initialized_from_existing_lists(self):
+        """
+        When the count table is created on a DB with TodoLists, the count should be initialized with them
+
+        :return:
+        """
+        # Data
+        [TodoListDBHandler.new_todo_list_entry(str(i)) for i in range(3)]  # pylint: disable=expression-not-assigned
+        TodoListsCount.__table__.drop(Database.db_engine)  # pylint: disable=no-member
+
+        # When
+        Database.create_db_tables()
+        TodoListDBHandler.new_todo_list_entry('NewList')
+
+        # Then
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 4)
+
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_get_lists_paginated_fail_server_unavailable(self, print_mock: MagicMock):
         """
@@ -203,6 +558,166 @@ class TestGrpcTodoLists(BaseTestClass):
         # Then
         self.assertIn('failed to connect to all addresses', print_mock.getvalue())
 
+    @patch('proto_server.todolists_server.STREAM_LISTS_CHUNK_SIZE', 2)
+    def test_stream_lists(self):
+        """
+        Invoke the stream lists stub should receive all the lists, read from the DB in chunks
+
+        :return:
+        """
+        # Data
+        [TodoListDBHandler.new_todo_list_entry(str(i)) for i in range(5)]  # pylint: disable=expression-not-assigned
+
+        # When
+        streamed_lists = list(stream_lists(0, self.grpc_secured_channel))
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        self.assertEqual([_list.id for _list in streamed_lists], [_entry.id for _entry in db_entries])
+        self.assertEqual([_list.name for _list in streamed_lists], [_entry.name for _entry in db_entries])
+
+    @patch('proto_server.todolists_server.STREAM_LISTS_CHUNK_SIZE', 2)
+    def test_stream_lists_after_id(self):
+        """
+        Invoke the stream lists stub should receive only the lists after `after_id`
+
+        :return:
+        """
+        # Data
+        list_ids = [TodoListDBHandler.new_todo_list_entry(str(i)) for i in range(5)]
+
+        # When
+        streamed_lists = list(stream_lists(list_ids[1], self.grpc_secured_channel))
+
+        # Then
+        self.assertEqual([_list.id for _list in streamed_lists], list_ids[2:])
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_stream_lists_fail_server_unavailable(self, print_mock: MagicMock):
+        """
+        Invoke stub should fail when the server is UNAVAILABLE.
+
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        self.grpc_server.stop(None)
+
+        # When
+        streamed_lists = list(stream_lists(0, self.grpc_secured_channel))
+
+        # Then
+        self.assertEqual(streamed_lists, [])
+        self.assertIn('failed to connect to all addresses', print_mock.getvalue())
+
+    @patch('proto_server.todolists_server.IMPORT_LISTS_CHUNK_SIZE', 2)
+    @patch('proto_server.todolists_server.IMPORT_LISTS_MAX_ERRORS', 2)
+    def test_import_lists(self):
+        """
+        Invoke the import lists stub should insert the new names in chunks, and return the first errors
+
+        :return:
+        """
+        # Data
+        TodoListDBHandler.new_todo_list_entry('existing')
+        names = ['a', 'existing', 'b', 'c', 'a', 'b', 'd']
+
+        # When
+        response = import_lists(iter(names), self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual((response.inserted, response.duplicates), (4, 3))
+        self.assertEqual([(_error.index, _error.name) for _error in response.errors], [(1, 'existing'), (4, 'a')])
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 5)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_import_lists_fail_server_unavailable(self, print_mock: MagicMock):
+        """
+        Invoke stub should fail when the server is UNAVAILABLE.
+
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        self.grpc_server.stop(None)
+
+        # When
+        import_lists(iter(['a']), self.grpc_secured_channel)
+
+        # Then
+        self.assertIn('failed to connect to all addresses', print_mock.getvalue())
+
+    @patch('proto_server.todolists_server.SESSION_MAX_IN_FLIGHT', 2)
+    def test_session(self):
+        """
+        Invoke the session stub should return the result of each operation with its correlation id
+
+        :return:
+        """
+        # Data
+        existing_id = TodoListDBHandler.new_todo_list_entry('existing')
+        operations = [('create', 'TestList'), ('create', 'existing'), ('get', str(existing_id)), ('get', '666'),
+                      ('delete', str(existing_id)), ('list', '1')]
+        requests = [create_session_request(_correlation_id, *_operation)
+                    for _correlation_id, _operation in enumerate(operations)]
+        requests.append(todolists_pb2.SessionRequest(correlation_id=len(operations)))
+
+        # When
+        replies = {_reply.correlation_id: _reply for _reply in run_session(requests, self.grpc_secured_channel)}
+
+        # Then
+        self.assertEqual(sorted(replies), list(range(len(requests))))
+        self.assertEqual(replies[0].create.name, 'TestList')
+        self.assertEqual(replies[1].error.code, code_pb2.INVALID_ARGUMENT)
+        self.assertEqual(replies[2].get.name, 'existing')
+        self.assertEqual(replies[3].error.code, code_pb2.NOT_FOUND)
+        self.assertEqual(replies[4].WhichOneof('result'), 'delete')
+        self.assertIn(replies[0].create.id, [_list.id for _list in replies[5].list.todo_lists])
+        self.assertEqual(replies[6].error.code, code_pb2.INVALID_ARGUMENT)
+
+    @patch('proto_server.todolists_server.SESSION_MAX_IN_FLIGHT', 1)
+    def test_session_many_operations(self):
+        """
+        Invoke the session stub with more operations than the in-flight limit should run all of them
+
+        :return:
+        """
+        # Data
+        requests = (create_session_request(_correlation_id, 'create', str(_correlation_id))
+                    for _correlation_id in range(50))
+
+        # When
+        replies = list(run_session(requests, self.grpc_secured_channel))
+
+        # Then
+        self.assertEqual(sorted(_reply.correlation_id for _reply in replies), list(range(50)))
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 50)
+
+    def test_db_reads_return_records_with_compiled_statements(self):
+        """
+        The DB reads should return `(id, name)` records, and reuse the compiled statements
+
+        :return:
+        """
+        # Data
+        list_ids = TodoListDBHandler.new_todo_list_entries(['a', 'b', 'c'])
+        compiled_statements = todo_lists_db_handler._COMPILED_STATEMENTS_CACHE  # pylint: disable=protected-access
+        compiled_statements.clear()
+
+        # When
+        TodoListDBHandler.get_lists_paginated()
+        page = TodoListDBHandler.get_lists_paginated(page_number=1, page_size=2, include_next=True)
+        todo_lists = TodoListDBHandler.get_todo_lists([list_ids[2], 100])
+        messages = TodoLists.create_todo_list_messages(page[:1])
+
+        # Then
+        self.assertEqual(page, [TodoListRecord(list_ids[0], 'a'), TodoListRecord(list_ids[1], 'b'),
+                                TodoListRecord(list_ids[2], 'c')])
+        self.assertEqual(todo_lists, [TodoListRecord(list_ids[2], 'c'), None])
+        self.assertEqual(messages, [todolists_pb2.TodoList(id=list_ids[0], name='a')])
+        # The page statement was compiled once for both pages
+        self.assertEqual(len(compiled_statements), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,307 @@
+"""
+Module with the tests for the asyncio gRPC Service todolists.TodoLists
+
+Classes:
+    TestGrpcAioTodoLists(BaseAioTestClass)
+"""
+import asyncio
+import io
+import unittest
+from unittest.mock import patch, MagicMock
+
+from google.rpc import code_pb2
+
+from proto_client.stub_create_list import create_list
+from proto_client.stub_batch_create_lists import batch_create_lists
+from proto_client.stub_get_list import get_list
+from proto_client.stub_batch_get_lists import batch_get_lists
+from proto_client.stub_delete_list import delete_list
+from proto_client.stub_batch_delete_lists import batch_delete_lists
+from proto_client.stub_get_lists_paginated import get_lists_paginated
+from proto_client.stub_stream_lists import stream_lists
+from proto_client.stub_import_lists import import_lists
+from proto_client.stub_session import run_session, create_session_request
+from database.todo_lists_db_handler import TodoListDBHandler
+from database.async_todo_lists_db_handler import AsyncTodoListDBHandler
+from tests.base_test_class import BaseAioTestClass
+import proto_server.todolists_server as todolists_server
+
+
+class TestGrpcAioTodoLists(BaseAioTestClass):
+    """
+    asyncio gRPC Service todolists.TodoLists Tests
+    """
+
+    def test_create_lists(self):
+        """
+        Invoke the create list stub and validate that the list is stored in the database
+
+        :return:
+        """
+        # Data
+        new_list_name = 'TestList'
+
+        # When
+        response = create_list(new_list_name, self.grpc_secured_channel)
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        self.assertEqual(len(db_entries), 1, 'Error DB should have only 1 entry')
+        self.assertEqual(response.id, db_entries[0].id)
+        self.assertEqual(response.name, new_list_name)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_create_list_fail_unique_name(self, print_mock: MagicMock):
+        """
+        Invoke create list stub should fail when list with that name already exist in the database
+
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        test_list_name = 'TestList'
+        TodoListDBHandler.new_todo_list_entry(test_list_name)
+
+        # When
+        create_list(test_list_name, self.grpc_secured_channel)
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        self.assertEqual(len(db_entries), 1, 'Error DB should have only 1 entry')
+        self.assertIn('List name must be unique', print_mock.getvalue())
+
+    def test_batch_create_lists(self):
+        """
+        Invoke the batch create lists stub with a name that already exist should create only the other lists
+
+        :return:
+        """
+        # Data
+        TodoListDBHandler.new_todo_list_entry('TestList1')
+
+        # When
+        response = batch_create_lists(['TestList1', 'TestList2'], self.grpc_secured_channel)
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        self.assertEqual([_result.created for _result in response.results], [False, True])
+        self.assertEqual(response.results[1].id, db_entries[1].id)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_batch_get_lists_fail_too_big(self, print_mock: MagicMock):
+        """
+        Invoke the batch get lists stub with more ids than `MAX_BATCH_SIZE` should fail
+
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # When
+        with patch.object(todolists_server, 'MAX_BATCH_SIZE', 2):
+            response = batch_get_lists([1, 2, 3], self.grpc_secured_channel)
+
+        # Then
+        self.assertIsNone(response)
+        self.assertIn('Batch of 3 items is bigger than the max batch size, 2 items.', print_mock.getvalue())
+
+    def test_get_list(self):
+        """
+        Invoke the get list stub
+
+        :return:
+        """
+        # Data
+        test_list_id = TodoListDBHandler.new_todo_list_entry('TestList')
+
+        # When
+        response = get_list(test_list_id, self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual(response.id, test_list_id)
+        self.assertEqual(response.name, 'TestList')
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_get_list_fail_not_found(self, print_mock: MagicMock):
+        """
+        Invoke get list stub should fail when list is not found
+
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        invalid_id = 666
+
+        # When
+        get_list(invalid_id, self.grpc_secured_channel)
+
+        # Then
+        self.assertIn('List with id "{}" not found.'.format(invalid_id), print_mock.getvalue())
+
+    def test_batch_get_lists(self):
+        """
+        Invoke the batch get lists stub with existing and missing ids
+
+        :return:
+        """
+        # Data
+        test_list_id = TodoListDBHandler.new_todo_list_entry('TestList')
+
+        # When
+        response = batch_get_lists([666, test_list_id], self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual([_list.id for _list in response.todo_lists], [test_list_id])
+        self.assertEqual(list(response.missing_ids), [666])
+
+    def test_delete_list(self):
+        """
+        Invoke the delete list stub
+
+        :return:
+        """
+        # Data
+        test_list_id = TodoListDBHandler.new_todo_list_entry('TestList')
+
+        # When
+        delete_list(test_list_id, self.grpc_secured_channel)
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        self.assertEqual(len(db_entries), 0)
+
+    def test_batch_delete_lists(self):
+        """
+        Invoke the batch delete lists stub with existing and missing ids
+
+        :return:
+        """
+        # Data
+        test_list_id = TodoListDBHandler.new_todo_list_entry('TestList')
+
+        # When
+        response = batch_delete_lists([666, test_list_id], self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual(list(response.deleted_ids), [test_list_id])
+        self.assertEqual(list(response.not_found_ids), [666])
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 0)
+
+    def test_get_lists_paginated(self):
+        """
+        Invoke the get lists paginated stub
+
+        :return:
+        """
+        # Data
+        [TodoListDBHandler.new_todo_list_entry(str(i)) for i in range(5)]  # pylint: disable=expression-not-assigned
+
+        # When
+        response = get_lists_paginated(2, 2, self.grpc_secured_channel)
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        self.assertEqual(response.next_page_number, '3')
+        self.assertEqual(response.count, 5)
+        self.assertEqual(len(response.todo_lists), 2)
+        self.assertEqual(response.todo_lists[0].id, db_entries[2].id)
+        self.assertEqual(response.todo_lists[1].id, db_entries[3].id)
+
+    def test_get_lists_paginated_by_token(self):
+        """
+        Invoke the get lists paginated stub following the `next_page_token`
+
+        :return:
+        """
+        # Data
+        [TodoListDBHandler.new_todo_list_entry(str(i)) for i in range(3)]  # pylint: disable=expression-not-assigned
+
+        # When
+        first_page = get_lists_paginated(1, 2, self.grpc_secured_channel)
+        last_page = get_lists_paginated(1, 2, self.grpc_secured_channel, page_token=first_page.next_page_token)
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        self.assertEqual(len(first_page.todo_lists), 2)
+        self.assertEqual(len(last_page.todo_lists), 1)
+        self.assertEqual(last_page.todo_lists[0].id, db_entries[2].id)
+        self.assertEqual(last_page.next_page_token, '')
+
+    @patch('proto_server.todolists_aio_server.STREAM_LISTS_CHUNK_SIZE', 2)
+    def test_stream_lists(self):
+        """
+        Invoke the stream lists stub should receive all the lists, read from the DB in chunks
+
+        :return:
+        """
+        # Data
+        list_ids = [TodoListDBHandler.new_todo_list_entry(str(i)) for i in range(5)]
+
+        # When
+        streamed_lists = list(stream_lists(0, self.grpc_secured_channel))
+
+        # Then
+        self.assertEqual([_list.id for _list in streamed_lists], list_ids)
+
+    @patch('proto_server.todolists_aio_server.IMPORT_LISTS_CHUNK_SIZE', 2)
+    def test_import_lists(self):
+        """
+        Invoke the import lists stub should insert the new names in chunks, and skip the repeated ones
+
+        :return:
+        """
+        # Data
+        names = ['a', 'b', 'c', 'a', 'd']
+
+        # When
+        response = import_lists(iter(names), self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual((response.inserted, response.duplicates), (4, 1))
+        self.assertEqual(response.errors[0].index, 3)
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 4)
+
+    @patch('proto_server.todolists_aio_server.SESSION_MAX_IN_FLIGHT', 2)
+    def test_session(self):
+        """
+        Invoke the session stub should return the result of each operation with its correlation id
+
+        :return:
+        """
+        # Data
+        existing_id = TodoListDBHandler.new_todo_list_entry('existing')
+        operations = [('create', 'existing'), ('get', str(existing_id)), ('delete', '666'), ('list', '1')]
+        operations += [('create', str(i)) for i in range(20)]
+        requests = [create_session_request(_correlation_id, *_operation)
+                    for _correlation_id, _operation in enumerate(operations)]
+
+        # When
+        replies = {_reply.correlation_id: _reply for _reply in run_session(requests, self.grpc_secured_channel)}
+
+        # Then
+        self.assertEqual(sorted(replies), list(range(len(requests))))
+        self.assertEqual(replies[0].error.code, code_pb2.INVALID_ARGUMENT)
+        self.assertEqual(replies[1].get.name, 'existing')
+        self.assertEqual(replies[2].error.code, code_pb2.NOT_FOUND)
+        self.assertEqual(replies[3].list.todo_lists[0].id, existing_id)
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 21)
+
+    def test_async_db_handler_concurrent_creates(self):
+        """
+        Concurrent creates awaited from the event loop should all be stored
+
+        :return:
+        """
+        # Data
+        async def create_many():
+            db_handler = AsyncTodoListDBHandler()
+            return await asyncio.gather(*[db_handler.new_todo_list_entry(str(i)) for i in range(20)])
+
+        # When
+        new_ids = self.run_in_loop(create_many())
+
+        # Then
+        self.assertEqual(len(set(new_ids)), 20)
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Module with the tests for the helpers shared by the gRPC server interceptors, in grpc_utils.interceptors
+
+Classes:
+    TestMethodHandlersCache(unittest.TestCase)
+"""
+import unittest
+from unittest.mock import MagicMock
+
+import grpc
+
+from grpc_utils.interceptors import MethodHandlersCache, wrap_rpc_method_handler
+
+
+class TestMethodHandlersCache(unittest.TestCase):
+    """
+    MethodHandlersCache and wrap_rpc_method_handler Tests
+    """
+
+    def test_wrap_handlers(self):
+        """
+        The wrapped handler should keep the streaming type and serializers of the handler, and be created once
+        per gRPC method, until the servicer returns another handler
+
+        :return:
+        """
+        # Data
+        def upper(request, _context):
+            return [request.upper()]
+
+        def repeat(behavior):
+            return lambda request, context: behavior(request, context) * 2
+
+        def wrap_handler(handler: grpc.RpcMethodHandler, full_method: str) -> grpc.RpcMethodHandler:
+            wrapped_methods.append(full_method)
+            return wrap_rpc_method_handler(handler, repeat)
+        wrapped_methods = []
+        handlers = MethodHandlersCache(wrap_handler)
+        handler = grpc.unary_stream_rpc_method_handler(upper, request_deserializer=bytes.decode,
+                                                       response_serializer=str.encode)
+        new_handler = grpc.unary_stream_rpc_method_handler(upper)
+
+        # When
+        wrapped = handlers.wrap(handler, '/todolists.TodoLists/Upper')
+        cached = handlers.wrap(handler, '/todolists.TodoLists/Upper')
+        replaced = handlers.wrap(new_handler, '/todolists.TodoLists/Upper')
+
+        # Then
+        self.assertIs(cached, wrapped)
+        self.assertIsNot(replaced, wrapped)
+        self.assertEqual(wrapped_methods, ['/todolists.TodoLists/Upper'] * 2)
+        self.assertEqual((wrapped.request_streaming, wrapped.response_streaming), (False, True))
+        self.assertIs(wrapped.request_deserializer, bytes.decode)
+        self.assertIs(wrapped.response_serializer, str.encode)
+        self.assertEqual(wrapped.unary_stream('a', MagicMock()), ['A', 'A'])
+        self.assertIsNone(handlers.wrap(None, '/todolists.TodoLists/Missing'))
+
+    def test_keep_thread_pool(self):
+        """
+        The wrapped servicer method should keep the thread pool of the servicer method, unless it sets its own
+
+        :return:
+        """
+        # Data
+        def stream(request, _context):
+            return [request]
+        stream.experimental_thread_pool = thread_pool = MagicMock()
+        other_thread_pool = MagicMock()
+
+        def keep_thread_pool(behavior):
+            def _wrapped(request, context):
+                return behavior(request, context)
+            return _wrapped
+
+        def set_thread_pool(behavior):
+            def _wrapped(request, context):
+                return behavior(request, context)
+            _wrapped.experimental_thread_pool = other_thread_pool
+            return _wrapped
+        handler = grpc.unary_stream_rpc_method_handler(stream)
+
+        # When
+        wrapped = wrap_rpc_method_handler(handler, keep_thread_pool)
+        replaced = wrap_rpc_method_handler(handler, set_thread_pool)
+
+        # Then
+        self.assertIs(wrapped.unary_stream.experimental_thread_pool, thread_pool)
+        self.assertIs(replaced.unary_stream.experimental_thread_pool, other_thread_pool)
+        self.assertEqual(wrapped.unary_stream('a', MagicMock()), ['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Module with the tests for the load generator of the gRPC Service todolists.TodoLists
+
+Classes:
+    TestLoadGenerator(BaseTestClass)
+"""
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+from database.todo_lists_db_handler import TodoListDBHandler
+from proto_client.load_generator import LoadGenerator, parse_mix, main as main_load_generator
+from tests.base_test_class import BaseTestClass
+
+
+class TestLoadGenerator(BaseTestClass):
+    """
+    Load generator Tests
+    """
+
+    def test_parse_mix(self):
+        """
+        Parse mix should return the weight of each operation, and fail with unknown operations
+
+        :return:
+        """
+        # When
+        mix = parse_mix('get=8, create=1,delete, list=0')
+
+        # Then
+        self.assertEqual(mix, {'get': 8.0, 'create': 1.0, 'delete': 1.0})
+        with self.assertRaises(ValueError):
+            parse_mix('get=8,update=1')
+        with self.assertRaises(ValueError):
+            parse_mix('get=0')
+
+    def test_closed_loop_load(self):
+        """
+        The closed loop load should invoke all the operations of the mix,
+        and the cleanup should delete the lists created by the load generator
+
+        :return:
+        """
+        # Data
+        load_generator = LoadGenerator([self.grpc_secured_channel], parse_mix('create=1,get=2,delete=1,list=1'),
+                                       random_seed=1)
+        load_generator.seed(20)
+
+        # When
+        results = load_generator.run(duration=0.5, concurrency=4)
+        load_generator.cleanup()
+
+        # Then
+        self.assertEqual(set(results['operations']), {'create', 'get', 'delete', 'list'})
+        self.assertEqual(results['total']['requests'],
+                         sum(_summary['requests'] for _summary in results['operations'].values()))
+        self.assertEqual(results['operations']['list']['errors'], 0)
+        self.assertEqual(results['operations']['create']['errors'], 0)
+        self.assertLessEqual(results['total']['p50'], results['total']['p999'])
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 0)
+
+    def test_fixed_rate_load(self):
+        """
+        The fixed rate load should send `rate` requests per second
+
+        :return:
+        """
+        # Data
+        load_generator = LoadGenerator([self.grpc_secured_channel], parse_mix('get'))
+        load_generator.seed(5)
+
+        # When
+        results = load_generator.run(duration=0.5, concurrency=10, rate=100)
+        load_generator.cleanup()
+
+        # Then
+        self.assertEqual(results['total']['requests'], 50)
+        self.assertEqual(results['total']['codes'], {'OK': 50})
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_load_generator_script(self, print_mock: MagicMock):
+        """
+        Run the load generator script with many channels and write its results to a JSON file
+
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        results_path = os.path.join(tempfile.mkdtemp(), 'results.json')
+        self.addCleanup(os.remove, results_path)
+        arguments = ['load_generator.py', '--duration', '0.3', '--channels', '2', '--seed-lists', '10',
+                     '--json', results_path]
+
+        # When
+        with patch('sys.argv', arguments):
+            main_load_generator()
+
+        # Then
+        with open(results_path, encoding='utf-8') as results_file:
+            results = json.load(results_file)
+        self.assertIn('p999 ms', print_mock.getvalue())
+        self.assertGreater(results['total']['requests'], 0)
+        self.assertEqual(results['config']['channels'], 2)
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Module with the tests for the logging configuration of the gRPC server
+
+Classes:
+    TestLogs(unittest.TestCase)
+"""
+import io
+import json
+import logging
+import unittest
+from unittest.mock import patch
+
+from config.config import JSON_LOG_FORMAT
+from config.logs import SamplingFilter, parse_log_levels, setup_logging
+
+
+class TestLogs(unittest.TestCase):
+    """
+    Logging configuration Tests
+    """
+
+    def setUp(self) -> None:
+        """
+        Save the root logger configuration, changed by `setup_logging`
+        :return:
+        """
+        root_logger = logging.getLogger()
+        self.root_handlers = root_logger.handlers
+        self.root_level = root_logger.level
+
+    def tearDown(self) -> None:
+        """
+        Restore the root logger configuration
+        :return:
+        """
+        root_logger = logging.getLogger()
+        root_logger.handlers = self.root_handlers
+        root_logger.setLevel(self.root_level)
+        logging.getLogger('tests.database').setLevel(logging.NOTSET)
+
+    def test_parse_log_levels(self):
+        """
+        Parse per-module log levels, invalid pairs should raise ValueError
+
+        :return:
+        """
+        # When
+        levels = parse_log_levels(' database=warning, proto_server.todolists_server=DEBUG,')
+
+        # Then
+        self.assertEqual(levels, {'database': 'WARNING', 'proto_server.todolists_server': 'DEBUG'})
+        with self.assertRaises(ValueError):
+            parse_log_levels('database')
+
+    def test_sampling_filter(self):
+        """
+        The sampling filter should let pass all the records with rate 1, and none with rate 0
+
+        :return:
+        """
+        # Data
+        record = logging.makeLogRecord({'msg': 'Get TodoList'})
+
+        # Then
+        self.assertTrue(all(SamplingFilter(1).filter(record) for _ in range(100)))
+        self.assertFalse(any(SamplingFilter(0).filter(record) for _ in range(100)))
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_setup_logging(self, stdout_mock: io.StringIO):
+        """
+        The records should be written to stdout by the listener thread, filtered by the per-module levels
+
+        :param stdout_mock: Mock to inspect stdout writes
+        :return:
+        """
+        # Data
+        listener = setup_logging('INFO', 'tests.database=WARNING', JSON_LOG_FORMAT)
+
+        # When
+        logging.getLogger('tests.server').info('Running server on port %s', 50051)
+        logging.getLogger('tests.server.requests').debug('Get TodoList with id "%s"', 1)
+        logging.getLogger('tests.database').info('Creating DB tables')
+        listener.stop()
+
+        # Then
+        entries = [json.loads(_line) for _line in stdout_mock.getvalue().splitlines()]
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]['message'], 'Running server on port 50051')
+        self.assertEqual(entries[0]['level'], 'INFO')
+        self.assertEqual(entries[0]['logger'], 'tests.server')
+
+
+if __name__ == '__main__':
+    unittest.main()
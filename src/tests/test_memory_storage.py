@@ -0,0 +1,219 @@
+"""
+Module with the tests for the in-memory storage backend
+
+Classes:
+    TestMemoryStorage(unittest.TestCase)
+    TestGrpcMemoryStorage(unittest.TestCase)
+"""
+import threading
+import unittest
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import NoResultFound
+
+from config.config import GRPC_SERVER_PORT
+from database.backends import create_storage_backend
+from database.memory_storage import MemoryStorage
+from database.todo_lists_db_handler import TodoListDBHandler
+from proto_client.helpers import create_secured_client_channel
+from proto_client.stub_create_list import create_list
+from proto_client.stub_get_list import get_list
+from proto_client.stub_get_lists_paginated import get_lists_paginated
+from metrics.db_metrics import DB_QUERY_SECONDS
+from proto_server.todolists_server import create_secured_server
+
+
+class TestMemoryStorage(unittest.TestCase):
+    """
+    MemoryStorage Tests
+    """
+
+    def setUp(self) -> None:
+        """
+        Create an empty storage with 4 lock stripes
+        :return:
+        """
+        self.storage = MemoryStorage(lock_stripes=4)
+
+    def test_create_and_get_list(self):
+        """
+        A created list should be returned by its ID, and a repeated name should raise IntegrityError
+
+        :return:
+        """
+        # Data
+        new_id = self.storage.new_todo_list_entry('TestList')
+
+        # When
+        todo_list = self.storage.get_todo_list(new_id)
+
+        # Then
+        self.assertEqual((todo_list.id, todo_list.name), (new_id, 'TestList'))
+        with self.assertRaises(IntegrityError):
+            self.storage.new_todo_list_entry('TestList')
+        with self.assertRaises(NoResultFound):
+            self.storage.get_todo_list(new_id + 1)
+
+    def test_timed_as_memory_backend(self):
+        """
+        The time of the operations should be recorded with the `memory` backend label, not as SQLite time
+
+        :return:
+        """
+        # Data
+        sqlite_before = sum(DB_QUERY_SECONDS.labels('sqlite', 'get_lists_after').bucket_counts)
+        memory_before = sum(DB_QUERY_SECONDS.labels('memory', 'get_lists_after').bucket_counts)
+
+        # When
+        self.storage.get_lists_after(last_id=0, limit=10)
+
+        # Then
+        self.assertEqual(sum(DB_QUERY_SECONDS.labels('sqlite', 'get_lists_after').bucket_counts), sqlite_before)
+        self.assertEqual(sum(DB_QUERY_SECONDS.labels('memory', 'get_lists_after').bucket_counts), memory_before + 1)
+
+    def test_batch_create_get_and_delete(self):
+        """
+        The batch methods should skip the repeated names and the IDs that do not exist
+
+        :return:
+        """
+        # Data
+        new_ids = self.storage.new_todo_list_entries(['a', 'b', 'a', 'c'])
+
+        # When
+        deleted_ids = self.storage.delete_todo_lists([new_ids[1], new_ids[1], 100])
+
+        # Then
+        self.assertIsNone(new_ids[2])
+        self.assertEqual(deleted_ids, [new_ids[1]])
+        self.assertEqual([_list and _list.name for _list in self.storage.get_todo_lists(new_ids[:2] + [new_ids[3]])],
+                         ['a', None, 'c'])
+        self.assertEqual(self.storage.get_lists_db_count(), 2)
+        # The name of the deleted list can be used again
+        self.assertIsNotNone(self.storage.new_todo_list_entry('b'))
+
+    def test_delete_list(self):
+        """
+        A deleted list should not be returned, and deleting it again should raise NoResultFound
+
+        :return:
+        """
+        # Data
+        new_id = self.storage.new_todo_list_entry('TestList')
+
+        # When
+        self.storage.delete_todo_list(new_id)
+
+        # Then
+        self.assertEqual(self.storage.get_lists_db_count(), 0)
+        with self.assertRaises(NoResultFound):
+            self.storage.delete_todo_list(new_id)
+
+    def test_pagination(self):
+        """
+        The pages should be ordered by ID, and the keyset pages should skip the deleted lists
+
+        :return:
+        """
+        # Data
+        new_ids = self.storage.new_todo_list_entries([str(i) for i in range(10)])
+        self.storage.delete_todo_lists(new_ids[2:4])
+
+        # When
+        page = self.storage.get_lists_paginated(page_number=2, page_size=3, include_next=True)
+        after = self.storage.get_lists_after(last_id=new_ids[1], limit=3)
+
+        # Then
+        self.assertEqual([_list.id for _list in page], new_ids[5:9])
+        self.assertEqual([_list.id for _list in after], new_ids[4:7])
+        self.assertEqual([_list.id for _list in self.storage.iter_lists(chunk_size=3)], new_ids[:2] + new_ids[4:])
+
+    def test_concurrent_creates_same_name(self):
+        """
+        Only one of the concurrent creates of the same name should succeed
+
+        :return:
+        """
+        # Data
+        results = []
+
+        def create():
+            try:
+                results.append(self.storage.new_todo_list_entry('TestList'))
+            except IntegrityError:
+                results.append(None)
+
+        threads = [threading.Thread(target=create) for _ in range(8)]
+
+        # When
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Then
+        self.assertEqual(len([_id for _id in results if _id is not None]), 1)
+        self.assertEqual(self.storage.get_lists_db_count(), 1)
+
+    def test_create_storage_backend(self):
+        """
+        The backends should be selected by their name
+
+        :return:
+        """
+        # When
+        memory_storage = create_storage_backend('memory')
+        sqlite_storage = create_storage_backend('sqlite')
+
+        # Then
+        self.assertIsInstance(memory_storage, MemoryStorage)
+        self.assertIsInstance(sqlite_storage, TodoListDBHandler)
+        with self.assertRaises(ValueError):
+            create_storage_backend('unknown')
+
+
+class TestGrpcMemoryStorage(unittest.TestCase):
+    """
+    gRPC Service todolists.TodoLists Tests with the in-memory storage
+    """
+
+    def setUp(self) -> None:
+        """
+        Create the test grpc_server with an in-memory storage, and the grpc_secured_channel to invoke the stubs
+        :return:
+        """
+        self.storage = MemoryStorage()
+        self.grpc_server = create_secured_server(GRPC_SERVER_PORT, storage=self.storage)
+        self.grpc_server.start()
+        with create_secured_client_channel('localhost:{}'.format(GRPC_SERVER_PORT)) as _channel:
+            self.grpc_secured_channel = _channel
+
+    def tearDown(self) -> None:
+        """
+        Close the grpc_secured_channel and stop the grpc_server
+        :return:
+        """
+        self.grpc_secured_channel.close()
+        self.grpc_server.stop(None)
+
+    def test_create_get_and_paginate(self):
+        """
+        The lists created with the stubs should be stored in the in-memory storage, and not in the DB
+
+        :return:
+        """
+        # Data
+        response = create_list('TestList', self.grpc_secured_channel)
+
+        # When
+        get_response = get_list(response.id, self.grpc_secured_channel)
+        page = get_lists_paginated(1, 10, self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual(get_response.name, 'TestList')
+        self.assertEqual([_list.name for _list in page.todo_lists], ['TestList'])
+        self.assertEqual(self.storage.get_lists_db_count(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
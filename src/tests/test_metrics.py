@@ -0,0 +1,242 @@
+"""
+Module with the tests for the metrics of the gRPC server
+
+Classes:
+    TestRegistry(unittest.TestCase)
+    TestMetricsInterceptor(BaseTestClass)
+    TestAsyncMetricsInterceptor(BaseAioTestClass)
+"""
+import io
+import unittest
+import urllib.request
+from unittest.mock import patch
+
+from database.todo_lists_db_handler import TodoListDBHandler
+from metrics.db_metrics import DB_QUERY_SECONDS
+from metrics.exporter import start_metrics_server
+from metrics.interceptors import GRPC_SERVER_HANDLED, GRPC_SERVER_IN_FLIGHT, GRPC_SERVER_MSG_SENT_BYTES
+from metrics.registry import Counter, Gauge, Histogram, Registry, REGISTRY
+from proto_client.stub_get_list import get_list
+from proto_client.stub_stream_lists import stream_lists
+from tests.base_test_class import BaseTestClass, BaseAioTestClass
+
+_SERVICE = 'todolists.TodoLists'
+
+
+def _handled(method: str, code: str) -> int:
+    """
+    :param method: gRPC method name
+    :param code: Status code name
+    :return: Number of RPCs of the method completed with the status code
+    """
+    return GRPC_SERVER_HANDLED.labels(_SERVICE, method, code).value
+
+
+class TestRegistry(unittest.TestCase):
+    """
+    Metric types and Registry Tests
+    """
+
+    def test_render_metrics(self):
+        """
+        The registry should render its metrics in the Prometheus text format, with cumulative histogram buckets
+
+        :return:
+        """
+        # Data
+        registry = Registry()
+        requests = Counter('test_requests_total', 'Requests.', ['method'], registry=registry)
+        in_flight = Gauge('test_in_flight', 'In flight.', registry=registry)
+        latency = Histogram('test_latency_seconds', 'Latency.', ['method'], buckets=[0.1, 1], registry=registry)
+
+        # When
+        requests.labels('Get').inc()
+        requests.labels('Get').inc(2)
+        in_flight.labels().inc()
+        for value in (0.05, 0.5, 4.25):
+            latency.labels('Get').observe(value)
+        rendered = registry.render()
+
+        # Then
+        self.assertEqual(rendered.splitlines(), [
+            '# HELP test_requests_total Requests.',
+            '# TYPE test_requests_total counter',
+            'test_requests_total{method="Get"} 3',
+            '# HELP test_in_flight In flight.',
+            '# TYPE test_in_flight gauge',
+            'test_in_flight 1',
+            '# HELP test_latency_seconds Latency.',
+            '# TYPE test_latency_seconds histogram',
+            'test_latency_seconds_bucket{method="Get",le="0.1"} 1',
+            'test_latency_seconds_bucket{method="Get",le="1.0"} 2',
+            'test_latency_seconds_bucket{method="Get",le="+Inf"} 3',
+            'test_latency_seconds_sum{method="Get"} 4.8',
+            'test_latency_seconds_count{method="Get"} 3',
+        ])
+
+    def test_labels_validation(self):
+        """
+        The metrics should reject label values that do not match the label names,
+        and the registry should reject repeated metric names
+
+        :return:
+        """
+        # Data
+        registry = Registry()
+        requests = Counter('test_requests_total', 'Requests.', ['method'], registry=registry)
+
+        # When / Then
+        with self.assertRaises(ValueError):
+            requests.labels('Get', 'OK')
+        with self.assertRaises(ValueError):
+            Counter('test_requests_total', 'Requests.', registry=registry)
+
+    def test_function_values(self):
+        """
+        The value of a metric with a function should be read from the function when it is rendered
+
+        :return:
+        """
+        # Data
+        registry = Registry()
+        hits = Counter('test_hits_total', 'Hits.', ['cache'], registry=registry)
+        values = {'hits': 1}
+
+        # When
+        hits.set_function(lambda: values['hits'], 'lists')
+        values['hits'] = 5
+        rendered = registry.render()
+
+        # Then
+        self.assertIn('test_hits_total{cache="lists"} 5', rendered.splitlines())
+        with self.assertRaises(ValueError):
+            hits.set_function(lambda: 0)
+
+
+class TestMetricsInterceptor(BaseTestClass):
+    """
+    Metrics of the thread pool gRPC server Tests
+    """
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_count_rpcs_by_status_code(self, _print_mock):
+        """
+        The interceptor should count the RPCs by status code, and record the DB time of the reads
+
+        :param _print_mock: Mock to hide the stub prints
+        :return:
+        """
+        # Data
+        list_id = TodoListDBHandler.new_todo_list_entry('TestList')
+        ok_before = _handled('Get', 'OK')
+        not_found_before = _handled('Get', 'NOT_FOUND')
+        db_reads_before = sum(DB_QUERY_SECONDS.labels('sqlite', 'get_todo_list').bucket_counts)
+
+        # When
+        get_list(list_id, self.grpc_secured_channel)
+        get_list(list_id + 1, self.grpc_secured_channel)
+
+        # Then
+        self.assertEqual(_handled('Get', 'OK'), ok_before + 1)
+        self.assertEqual(_handled('Get', 'NOT_FOUND'), not_found_before + 1)
+        self.assertEqual(GRPC_SERVER_IN_FLIGHT.labels(_SERVICE, 'Get').value, 0)
+        self.assertEqual(sum(DB_QUERY_SECONDS.labels('sqlite', 'get_todo_list').bucket_counts), db_reads_before + 2)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_cache_metrics(self, _print_mock):
+        """
+        The hits and misses of the TodoLists cache should be exported
+
+        :param _print_mock: Mock to hide the stub prints
+        :return:
+        """
+        # Data
+        list_id = TodoListDBHandler.new_todo_list_entry('TestList')
+
+        # When
+        get_list(list_id, self.grpc_secured_channel)
+        get_list(list_id, self.grpc_secured_channel)
+        rendered = REGISTRY.render().splitlines()
+
+        # Then
+        self.assertIn('todolists_cache_hits_total 1', rendered)
+        self.assertIn('todolists_cache_misses_total 1', rendered)
+        self.assertIn('todolists_cache_size 1', rendered)
+
+    def test_stream_messages_sizes(self):
+        """
+        The interceptor should record the size of each streamed message
+
+        :return:
+        """
+        # Data
+        TodoListDBHandler.new_todo_list_entries(['TestList1', 'TestList2', 'TestList3'])
+        sent_before = sum(GRPC_SERVER_MSG_SENT_BYTES.labels(_SERVICE, 'StreamLists').bucket_counts)
+        ok_before = _handled('StreamLists', 'OK')
+
+        # When
+        todo_lists = list(stream_lists(0, self.grpc_secured_channel))
+
+        # Then
+        self.assertEqual(len(todo_lists), 3)
+        self.assertEqual(sum(GRPC_SERVER_MSG_SENT_BYTES.labels(_SERVICE, 'StreamLists').bucket_counts),
+                         sent_before + 3)
+        self.assertEqual(_handled('StreamLists', 'OK'), ok_before + 1)
+
+    def test_metrics_http_server(self):
+        """
+        The metrics HTTP server should serve the metrics of the RPCs at /metrics
+
+        :return:
+        """
+        # Data
+        metrics_server = start_metrics_server(0)
+        self.addCleanup(metrics_server.server_close)
+        self.addCleanup(metrics_server.shutdown)
+        TodoListDBHandler.new_todo_list_entry('TestList')
+        list(stream_lists(0, self.grpc_secured_channel))
+
+        # When
+        url = 'http://localhost:{}/metrics'.format(metrics_server.server_port)
+        with urllib.request.urlopen(url) as response:
+            content_type = response.headers['Content-Type']
+            body = response.read().decode('utf-8')
+
+        # Then
+        self.assertTrue(content_type.startswith('text/plain; version=0.0.4'))
+        self.assertIn('grpc_server_handled_total{grpc_service="todolists.TodoLists",grpc_method="StreamLists",'
+                      'grpc_code="OK"}', body)
+        self.assertIn('# TYPE grpc_server_handling_seconds histogram', body)
+        self.assertIn('todolists_db_query_seconds_count{backend="sqlite",operation="get_lists_after"}', body)
+
+
+class TestAsyncMetricsInterceptor(BaseAioTestClass):
+    """
+    Metrics of the asyncio gRPC server Tests
+    """
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_count_rpcs_by_status_code(self, _print_mock):
+        """
+        The interceptor should count the RPCs by status code
+
+        :param _print_mock: Mock to hide the stub prints
+        :return:
+        """
+        # Data
+        list_id = TodoListDBHandler.new_todo_list_entry('TestList')
+        ok_before = _handled('Get', 'OK')
+        not_found_before = _handled('Get', 'NOT_FOUND')
+        stream_ok_before = _handled('StreamLists', 'OK')
+
+        # When
+        get_list(list_id, self.grpc_secured_channel)
+        get_list(list_id + 1, self.grpc_secured_channel)
+        todo_lists = list(stream_lists(0, self.grpc_secured_channel))
+
+        # Then
+        self.assertEqual(len(todo_lists), 1)
+        self.assertEqual(_handled('Get', 'OK'), ok_before + 1)
+        self.assertEqual(_handled('Get', 'NOT_FOUND'), not_found_before + 1)
+        self.assertEqual(_handled('StreamLists', 'OK'), stream_ok_before + 1)
+        self.assertEqual(GRPC_SERVER_IN_FLIGHT.labels(_SERVICE, 'Get').value, 0)
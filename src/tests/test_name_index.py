@@ -0,0 +1,182 @@
+"""
+Module with the tests for the in-memory indexes of the TodoLists names
+
+Classes:
+    TestNameIndexes(unittest.TestCase)
+    TestTodoListDBHandlerNameIndex(unittest.TestCase)
+"""
+import unittest
+
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+
+import database.database as db
+from database.name_index import NameSetIndex, BloomNameIndex, create_name_index
+from database.todo_lists_db_handler import TodoListDBHandler
+from metrics.db_metrics import NAME_INDEX_LOOKUPS
+
+
+class TestNameIndexes(unittest.TestCase):
+    """
+    NameSetIndex and BloomNameIndex Tests
+    """
+
+    def test_set_index(self):
+        """
+        The set should contain the loaded and added names, until they are discarded
+
+        :return:
+        """
+        # Data
+        index = NameSetIndex()
+
+        # When
+        index.load(['a', 'b'])
+        index.add('c')
+        index.discard('a')
+
+        # Then
+        self.assertEqual([_name in index for _name in ('a', 'b', 'c', 'd')], [False, True, True, False])
+
+    def test_bloom_index(self):
+        """
+        The Bloom filter should find all the loaded names, and few of the names that were not added
+
+        :return:
+        """
+        # Data
+        index = BloomNameIndex(capacity=1000, error_rate=0.01)
+        names = ['list-{}'.format(i) for i in range(1000)]
+
+        # When
+        index.load(iter(names), len(names))
+        index.discard(names[0])
+
+        # Then
+        self.assertTrue(all(_name in index for _name in names))
+        false_positives = sum('other-{}'.format(i) in index for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+    def test_create_name_index(self):
+        """
+        The indexes should be selected by their name, and an empty name should not use an index
+
+        :return:
+        """
+        # Then
+        self.assertIsInstance(create_name_index('set'), NameSetIndex)
+        self.assertIsInstance(create_name_index('bloom'), BloomNameIndex)
+        self.assertIsNone(create_name_index(''))
+        with self.assertRaises(ValueError):
+            create_name_index('unknown')
+
+
+class TestTodoListDBHandlerNameIndex(unittest.TestCase):
+    """
+    Tests of the names index of the SQLite storage
+    """
+
+    def setUp(self) -> None:
+        """
+        Drop the database and create it again, with a list created before the index is loaded
+        :return:
+        """
+        db.Database.drop_all()
+        db.Database.create_db_tables()
+        TodoListDBHandler.cache.clear()
+        self.existing_id = TodoListDBHandler.new_todo_list_entry('existing')
+        TodoListDBHandler.name_index = NameSetIndex()
+        TodoListDBHandler.setup()
+
+    def tearDown(self) -> None:
+        """
+        Drop the database
+        :return:
+        """
+        db.Database.drop_all()
+
+    def test_reject_duplicate_from_index(self):
+        """
+        A name loaded in the index should be rejected, confirmed with a DB read
+
+        :return:
+        """
+        # Data
+        duplicates = NAME_INDEX_LOOKUPS.labels('duplicate').value
+
+        # When
+        with self.assertRaises(IntegrityError):
+            TodoListDBHandler.new_todo_list_entry('existing')
+
+        # Then
+        self.assertEqual(NAME_INDEX_LOOKUPS.labels('duplicate').value, duplicates + 1)
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 1)
+
+    def test_stale_name_is_created(self):
+        """
+        A name in the index that does not exist in the DB, e.g. deleted by another process, should be created
+
+        :return:
+        """
+        # Data
+        TodoListDBHandler.name_index.add('deleted')
+        stale_lookups = NAME_INDEX_LOOKUPS.labels('stale').value
+
+        # When
+        new_id = TodoListDBHandler.new_todo_list_entry('deleted')
+
+        # Then
+        self.assertEqual(TodoListDBHandler.get_todo_list(new_id).name, 'deleted')
+        self.assertEqual(NAME_INDEX_LOOKUPS.labels('stale').value, stale_lookups + 1)
+
+    def test_index_updated_on_create_and_delete(self):
+        """
+        The created names should be added to the index, and the deleted names removed
+
+        :return:
+        """
+        # Data
+        new_ids = TodoListDBHandler.new_todo_list_entries(['a', 'b'])
+
+        # When
+        TodoListDBHandler.delete_todo_list(self.existing_id)
+        TodoListDBHandler.delete_todo_lists(new_ids[:1])
+
+        # Then
+        self.assertEqual([_name in TodoListDBHandler.name_index for _name in ('existing', 'a', 'b')],
+                         [False, False, True])
+        self.assertIsNotNone(TodoListDBHandler.new_todo_list_entry('existing'))
+
+    def test_delete_statements(self):
+        """
+        A delete should read the deleted row once with the index, and only run the DELETE without the index
+
+        :return:
+        """
+        # Data
+        new_id = TodoListDBHandler.new_todo_list_entry('without-index')
+        statements = []
+
+        def count_statement(_connection, _cursor, statement, *_args):
+            statements.append(statement.split(maxsplit=1)[0])
+
+        # When
+        event.listen(db.Database.db_engine, 'before_cursor_execute', count_statement)
+        try:
+            TodoListDBHandler.delete_todo_list(self.existing_id)
+            with_index = list(statements)
+            statements.clear()
+            TodoListDBHandler.name_index = None
+            TodoListDBHandler.delete_todo_list(new_id)
+        finally:
+            event.remove(db.Database.db_engine, 'before_cursor_execute', count_statement)
+            TodoListDBHandler.name_index = NameSetIndex()
+
+        # Then
+        self.assertEqual(with_index, ['SELECT', 'DELETE'])
+        self.assertEqual(statements, ['DELETE'])
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Module with the tests for the pre-fork mode of the gRPC Service todolists.TodoLists
+
+Classes:
+    TestPreforkServer(unittest.TestCase)
+"""
+import os
+import signal
+import threading
+import time
+import unittest
+
+import grpc
+
+import database.database as db
+from config.config import GRPC_SERVER_PORT, THREAD_POOL_SERVER_MODE
+from proto_client.helpers import create_secured_client_channel
+from proto_client.stub_create_list import create_list
+from proto_server.prefork_server import PreforkSupervisor
+
+_PREFORK_SERVER_PORT = GRPC_SERVER_PORT + 1
+_TIMEOUT = 30
+
+
+class TestPreforkServer(unittest.TestCase):
+    """
+    Pre-fork server Tests, the supervisor runs in a background thread
+    """
+
+    def setUp(self) -> None:
+        """
+        Drop the database and start the supervisor with 2 worker processes
+        :return:
+        """
+        db.Database.drop_all()
+        self.supervisor = PreforkSupervisor(_PREFORK_SERVER_PORT, THREAD_POOL_SERVER_MODE, worker_processes=2)
+        self.supervisor.start()
+        self.supervisor_thread = threading.Thread(target=self.supervisor.supervise, daemon=True)
+        self.supervisor_thread.start()
+
+    def tearDown(self) -> None:
+        """
+        Stop the supervisor if the test did not, and drop the database
+        :return:
+        """
+        self.supervisor.stop()
+        self.supervisor_thread.join(_TIMEOUT)
+        db.Database.drop_all()
+
+    def wait_until(self, condition) -> None:
+        """
+        Wait until `condition` returns True, fail the test after `_TIMEOUT` seconds
+
+        :param condition: Function to check
+        :return:
+        """
+        deadline = time.monotonic() + _TIMEOUT
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, 'Timeout waiting for the condition')
+            time.sleep(0.1)
+
+    def test_restart_and_stop_workers(self):
+        """
+        The workers should serve RPCs, be restarted if they die, and stop gracefully
+
+        :return:
+        """
+        with create_secured_client_channel('localhost:{}'.format(_PREFORK_SERVER_PORT)) as _channel:
+            grpc.channel_ready_future(_channel).result(timeout=_TIMEOUT)
+            self.assertEqual(create_list('TestList1', _channel).name, 'TestList1')
+
+            # When
+            killed_worker = self.supervisor.workers[0]
+            os.kill(killed_worker.pid, signal.SIGKILL)
+            self.wait_until(lambda: self.supervisor.restarts == 1)
+            self.assertEqual(create_list('TestList2', _channel).name, 'TestList2')
+
+        self.supervisor.stop()
+        self.supervisor_thread.join(_TIMEOUT)
+
+        # Then
+        restarted_worker, running_worker = self.supervisor.workers
+        self.assertEqual(killed_worker.exitcode, -signal.SIGKILL)
+        self.assertNotEqual(restarted_worker.pid, killed_worker.pid)
+        # The restarted worker could still be starting when it was stopped, only the other one had to serve
+        self.assertFalse(restarted_worker.is_alive())
+        self.assertEqual(running_worker.exitcode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
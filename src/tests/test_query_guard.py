@@ -0,0 +1,206 @@
+"""
+Module with the tests for the guard of the DB reads of the cancelled RPCs and of the RPCs whose deadline expired
+
+Classes:
+    TestQueryGuard(unittest.TestCase)
+    TestGuardedReads(unittest.TestCase)
+    TestAsyncGuardedReads(unittest.TestCase)
+"""
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from google.rpc import code_pb2
+
+import database.database as db
+from database.async_todo_lists_db_handler import AsyncTodoListDBHandler
+from database.query_guard import (
+    QueryAborted, QueryGuard, guarded_queries, current_query_guard, CANCELLED_REASON, DEADLINE_EXCEEDED_REASON
+)
+from database.todo_lists_db_handler import TodoListDBHandler
+from metrics.db_metrics import DB_QUERIES_ABORTED
+from proto_server.todolists_server import TodoLists
+import proto.v1.todolists_pb2 as todolists_pb2
+
+
+class TestQueryGuard(unittest.TestCase):
+    """
+    QueryGuard Tests
+    """
+
+    def test_abort_reason(self):
+        """
+        The guard should stop the reads when it is cancelled, when the RPC is not active, or when the deadline expired
+
+        :return:
+        """
+        # Data
+        cancelled = QueryGuard()
+        cancelled.cancel()
+        context = MagicMock()
+        context.time_remaining.return_value = 0
+        context.is_active.return_value = True
+
+        # Then
+        self.assertIsNone(QueryGuard().abort_reason())
+        self.assertIsNone(QueryGuard.for_rpc(MagicMock(spec=[])).abort_reason())
+        self.assertEqual(cancelled.abort_reason(), CANCELLED_REASON)
+        self.assertEqual(QueryGuard(is_active=lambda: False).abort_reason(), CANCELLED_REASON)
+        self.assertEqual(QueryGuard.for_rpc(context).abort_reason(), DEADLINE_EXCEEDED_REASON)
+        with self.assertRaises(QueryAborted) as aborted:
+            cancelled.check()
+        self.assertEqual(aborted.exception.reason, CANCELLED_REASON)
+
+    def test_guarded_queries(self):
+        """
+        The guard should only be set inside the `with` block
+
+        :return:
+        """
+        # Data
+        guard = QueryGuard()
+
+        # When
+        with guarded_queries(guard):
+            current_guard = current_query_guard()
+
+        # Then
+        self.assertIs(current_guard, guard)
+        self.assertIsNone(current_query_guard())
+
+
+class TestGuardedReads(unittest.TestCase):
+    """
+    Guarded reads of the SQLite storage Tests
+    """
+
+    def setUp(self) -> None:
+        """
+        Drop the database and create it again with 3000 lists, and clear the TodoLists cache
+        :return:
+        """
+        db.Database.drop_all()
+        db.Database.create_db_tables()
+        TodoListDBHandler.cache.clear()
+        TodoListDBHandler.new_todo_list_entries(['list-{}'.format(i) for i in range(3000)])
+
+    def tearDown(self) -> None:
+        """
+        Drop the database
+        :return:
+        """
+        db.Database.drop_all()
+
+    def test_expired_deadline(self):
+        """
+        A read whose deadline expired should not be started
+
+        :return:
+        """
+        # Data
+        aborted_before = DB_QUERIES_ABORTED.labels(DEADLINE_EXCEEDED_REASON).value
+
+        # When
+        with guarded_queries(QueryGuard(time_remaining=0)):
+            with self.assertRaises(QueryAborted) as aborted:
+                TodoListDBHandler.get_lists_after(last_id=0, limit=10)
+
+        # Then
+        self.assertEqual(aborted.exception.reason, DEADLINE_EXCEEDED_REASON)
+        self.assertEqual(DB_QUERIES_ABORTED.labels(DEADLINE_EXCEEDED_REASON).value, aborted_before + 1)
+
+    def test_interrupt_running_read(self):
+        """
+        A read whose RPC is cancelled while it runs should be interrupted, and the connection should be reusable
+
+        :return:
+        """
+        # Data
+        checks = []
+
+        def is_active() -> bool:
+            checks.append(True)
+            # Active for the check before the read, cancelled while the read runs
+            return len(checks) == 1
+        aborted_before = DB_QUERIES_ABORTED.labels(CANCELLED_REASON).value
+
+        # When
+        with guarded_queries(QueryGuard(is_active=is_active)):
+            with self.assertRaises(QueryAborted) as aborted:
+                TodoListDBHandler.get_lists_after(last_id=0, limit=3000)
+        with guarded_queries(QueryGuard(is_active=lambda: True)):
+            guarded_page = TodoListDBHandler.get_lists_after(last_id=0, limit=3000)
+        page = TodoListDBHandler.get_lists_after(last_id=0, limit=3000)
+
+        # Then
+        self.assertEqual(aborted.exception.reason, CANCELLED_REASON)
+        self.assertGreater(len(checks), 1)
+        self.assertEqual(DB_QUERIES_ABORTED.labels(CANCELLED_REASON).value, aborted_before + 1)
+        self.assertEqual(len(guarded_page), 3000)
+        self.assertEqual(len(page), 3000)
+
+    def test_servicer_abort(self):
+        """
+        A gRPC method whose deadline expired should be aborted with DEADLINE_EXCEEDED without reading the DB
+
+        :return:
+        """
+        # Data
+        servicer = TodoLists(TodoListDBHandler())
+        context = MagicMock()
+        context.time_remaining.return_value = 0
+        context.abort_with_status.side_effect = Exception()
+
+        # When
+        with self.assertRaises(Exception):
+            servicer.BatchGet(todolists_pb2.BatchGetListsRequest(ids=[1, 2]), context)
+        servicer.session_executor.shutdown()
+
+        # Then
+        context.abort_with_status.assert_called_once()
+        self.assertEqual(context.abort_with_status.call_args[0][0].code.value[0], code_pb2.DEADLINE_EXCEEDED)
+
+
+class TestAsyncGuardedReads(unittest.TestCase):
+    """
+    AsyncTodoListDBHandler guarded reads Tests
+    """
+
+    def test_cancel_running_read(self):
+        """
+        When the coroutine that waits for a storage call is cancelled, the guard of the call should be cancelled
+
+        :return:
+        """
+        # Data
+        started = threading.Event()
+        guards = []
+
+        def read() -> None:
+            guard = current_query_guard()
+            guards.append(guard)
+            started.set()
+            while guard.abort_reason() is None:
+                started.wait(0.001)
+            guard.check()
+
+        handler = AsyncTodoListDBHandler(MagicMock(blocking=True))
+
+        async def run() -> None:
+            task = asyncio.ensure_future(handler._run_in_executor(read))  # pylint: disable=protected-access
+            while not started.is_set():
+                await asyncio.sleep(0.001)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        # When
+        asyncio.run(run())
+
+        # Then
+        self.assertEqual(guards[0].abort_reason(), CANCELLED_REASON)
+
+
+if __name__ == '__main__':
+    unittest.main()
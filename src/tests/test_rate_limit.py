@@ -0,0 +1,366 @@
+"""
+Module with the tests for the per-client rate limits of the gRPC servers
+
+Classes:
+    TestClientTokenBuckets(unittest.TestCase)
+    TestRateLimiter(unittest.TestCase)
+    TestRateLimitInterceptor(unittest.TestCase)
+    TestAsyncRateLimitInterceptor(unittest.TestCase)
+"""
+import asyncio
+import time
+import unittest
+from concurrent import futures
+from unittest.mock import MagicMock
+
+import grpc
+
+from database.memory_storage import MemoryStorage
+from metrics.interceptors import MetricsInterceptor, GRPC_SERVER_HANDLED
+from metrics.rate_limit_metrics import RATE_LIMITED
+from proto_server.rate_limit import (
+    AsyncRateLimitInterceptor, ClientTokenBuckets, RateLimiter, RateLimitInterceptor, parse_method_costs,
+    READ_BUDGET, WRITE_BUDGET, RETRY_AFTER_METADATA_KEY
+)
+from proto_server.todolists_server import TodoLists
+import proto.v1.todolists_pb2 as todolists_pb2
+import proto.v1.todolists_pb2_grpc as todolists_pb2_grpc
+
+
+class TestClientTokenBuckets(unittest.TestCase):
+    """
+    ClientTokenBuckets Tests
+    """
+
+    def test_take_and_refill(self):
+        """
+        A client should take up to `burst` tokens at once, be rejected with the seconds until it has enough tokens,
+        and take tokens again when they are refilled. The other clients have their own buckets
+
+        :return:
+        """
+        # Data
+        buckets = ClientTokenBuckets(WRITE_BUDGET, rate=100, burst=2)
+        rejected_before = RATE_LIMITED.labels(WRITE_BUDGET).value
+
+        # When
+        taken = [buckets.take('client', 1), buckets.take('client', 1)]
+        retry_after = buckets.take('client', 1)
+        other_client = buckets.take('other-client', 2)
+        time.sleep(retry_after)
+        refilled = buckets.take('client', 1)
+        big_batch = buckets.take('batch-client', 4)
+        after_big_batch = buckets.take('batch-client', 1)
+
+        # Then
+        self.assertEqual(taken, [0, 0])
+        self.assertGreater(retry_after, 0)
+        self.assertLessEqual(retry_after, 0.01)
+        self.assertEqual(other_client, 0)
+        self.assertEqual(refilled, 0)
+        self.assertEqual(big_batch, 0)
+        self.assertGreater(after_big_batch, 0.02)
+        self.assertEqual(RATE_LIMITED.labels(WRITE_BUDGET).value, rejected_before + 2)
+
+    def test_forget_least_recent_client(self):
+        """
+        When there are `max_clients` buckets, the bucket of the client that did not send an RPC for the longest time
+        should be forgotten
+
+        :return:
+        """
+        # Data
+        buckets = ClientTokenBuckets(READ_BUDGET, rate=0.001, burst=1, max_clients=2)
+
+        # When
+        buckets.take('first', 1)
+        buckets.take('second', 1)
+        buckets.take('first', 1)
+        buckets.take('third', 1)
+
+        # Then
+        self.assertEqual(buckets.take('second', 1), 0)
+        self.assertGreater(buckets.take('third', 1), 0)
+        with self.assertRaises(ValueError):
+            ClientTokenBuckets(READ_BUDGET, rate=0, burst=1)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """
+    RateLimiter Tests
+    """
+
+    def test_method_limits(self):
+        """
+        Each method should use its budget, with the default or configured tokens of each item,
+        and each Session operation the budget and the tokens of its unary method
+
+        :return:
+        """
+        # Data
+        limiter = RateLimiter(read_burst=5, write_burst=100, method_costs='BatchGet=20, Create=3')
+
+        # When
+        batch_get_limit = limiter.message_limit('/todolists.TodoLists/BatchGet')
+        session_limit = limiter.message_limit('/todolists.TodoLists/Session')
+
+        # Then
+        self.assertEqual(parse_method_costs(' Get=2,BatchCreate=0.5,'), {'Get': 2, 'BatchCreate': 0.5})
+        with self.assertRaises(ValueError):
+            parse_method_costs('Get=0')
+        with self.assertRaises(ValueError):
+            parse_method_costs('Get')
+        self.assertEqual(limiter.method_limit('/todolists.TodoLists/Get'), (limiter.read_buckets, 1))
+        self.assertEqual(limiter.method_limit('BatchGet'), (limiter.read_buckets, 20))
+        self.assertEqual(limiter.method_limit('Create'), (limiter.write_buckets, 3))
+        self.assertEqual(limiter.method_limit('BatchCreate'), (limiter.write_buckets, 1))
+        self.assertIsNone(limiter.method_limit('/grpc.health.v1.Health/Check'))
+        self.assertIsNone(limiter.method_limit('Session'))
+        self.assertEqual(batch_get_limit(todolists_pb2.BatchGetListsRequest(ids=[1, 2, 3])), (limiter.read_buckets, 60))
+        self.assertEqual(batch_get_limit(todolists_pb2.BatchGetListsRequest()), (limiter.read_buckets, 20))
+        self.assertEqual(session_limit(todolists_pb2.SessionRequest(get=todolists_pb2.GetListRequest(id=1))),
+                         (limiter.read_buckets, 1))
+        self.assertEqual(session_limit(todolists_pb2.SessionRequest(create=todolists_pb2.CreateListRequest(name='a'))),
+                         (limiter.write_buckets, 3))
+        self.assertEqual(session_limit(None), (limiter.read_buckets, 1))
+        self.assertIsNone(limiter.message_limit('/grpc.health.v1.Health/Check'))
+
+    def test_client_key(self):
+        """
+        The clients should be identified by the metadata key, then by their TLS identity, then by their address
+
+        :return:
+        """
+        # Data
+        limiter = RateLimiter(client_metadata='X-Client-Id')
+        context = MagicMock()
+        context.invocation_metadata.return_value = (('user-agent', 'grpc'), ('x-client-id', 'batch-job'))
+        context.peer_identities.return_value = [b'client.example.com']
+        context.peer.return_value = 'ipv4:127.0.0.1:50000'
+        tls_context = MagicMock()
+        tls_context.invocation_metadata.return_value = ()
+        tls_context.peer_identities.return_value = [b'client.example.com']
+        address_context = MagicMock()
+        address_context.invocation_metadata.return_value = ()
+        address_context.peer_identities.return_value = None
+        address_context.peer.return_value = 'ipv6:[::1]:50000'
+
+        # Then
+        self.assertEqual(limiter.client_key(context), 'metadata:batch-job')
+        self.assertEqual(limiter.client_key(tls_context), 'tls:client.example.com')
+        self.assertEqual(limiter.client_key(address_context), 'ipv6:[::1]')
+
+
+class TestRateLimitInterceptor(unittest.TestCase):
+    """
+    RateLimitInterceptor Tests, with a running gRPC server
+    """
+
+    def setUp(self) -> None:
+        """
+        Start a gRPC server with a write budget of 2 tokens per client, refilled every 100 seconds,
+        the clients are identified by the `x-client-id` metadata key
+        :return:
+        """
+        self.limiter = RateLimiter(write_rate=0.01, write_burst=2, client_metadata='x-client-id')
+        self.grpc_server = grpc.server(futures.ThreadPoolExecutor(max_workers=2),
+                                       interceptors=(MetricsInterceptor(), RateLimitInterceptor(self.limiter)))
+        todolists_pb2_grpc.add_TodoListsServicer_to_server(TodoLists(MemoryStorage()), self.grpc_server)
+        port = self.grpc_server.add_insecure_port('localhost:0')
+        self.grpc_server.start()
+        self.channel = grpc.insecure_channel('localhost:{}'.format(port))
+        self.stub = todolists_pb2_grpc.TodoListsStub(self.channel)
+
+    def tearDown(self) -> None:
+        """
+        Close the channel and stop the gRPC server
+        :return:
+        """
+        self.channel.close()
+        self.grpc_server.stop(None)
+
+    def test_reject_over_limit(self):
+        """
+        The RPCs of a client over its write budget should be rejected with RESOURCE_EXHAUSTED and the retry-after
+        metadata, its reads and the RPCs of the other clients should not be limited
+
+        :return:
+        """
+        # Data
+        metadata = (('x-client-id', 'batch-job'),)
+        rejected_before = GRPC_SERVER_HANDLED.labels('todolists.TodoLists', 'Create', 'RESOURCE_EXHAUSTED').value
+
+        # When
+        created = [self.stub.Create(todolists_pb2.CreateListRequest(name='list-{}'.format(i)), metadata=metadata)
+                   for i in range(2)]
+        with self.assertRaises(grpc.RpcError) as rejected:
+            self.stub.Create(todolists_pb2.CreateListRequest(name='list-2'), metadata=metadata)
+        fetched = self.stub.Get(todolists_pb2.GetListRequest(id=created[0].id), metadata=metadata)
+        other_client = self.stub.Create(todolists_pb2.CreateListRequest(name='list-3'),
+                                        metadata=(('x-client-id', 'other-job'),))
+
+        # Then
+        self.assertEqual(rejected.exception.code(), grpc.StatusCode.RESOURCE_EXHAUSTED)  # pylint: disable=no-member
+        retry_after = dict(rejected.exception.trailing_metadata())[RETRY_AFTER_METADATA_KEY]  # pylint: disable=no-member
+        self.assertGreater(float(retry_after), 90)
+        self.assertEqual(GRPC_SERVER_HANDLED.labels('todolists.TodoLists', 'Create', 'RESOURCE_EXHAUSTED').value,
+                         rejected_before + 1)
+        self.assertEqual(fetched.name, 'list-0')
+        self.assertEqual(other_client.name, 'list-3')
+
+    def test_session_operation_budgets(self):
+        """
+        The read operations of a Session should use the read budget, they should run when the client is over its
+        write budget, and its write operations should be rejected
+
+        :return:
+        """
+        # Data
+        metadata = (('x-client-id', 'session-job'),)
+        created = [self.stub.Create(todolists_pb2.CreateListRequest(name='list-{}'.format(i)), metadata=metadata)
+                   for i in range(2)]
+        reads = [todolists_pb2.SessionRequest(correlation_id=i, get=todolists_pb2.GetListRequest(id=todo_list.id))
+                 for i, todo_list in enumerate(created)]
+        reads.append(todolists_pb2.SessionRequest(correlation_id=2, list=todolists_pb2.ListTodoListsRequest()))
+        writes = [todolists_pb2.SessionRequest(correlation_id=3, create=todolists_pb2.CreateListRequest(name='list-2'))]
+
+        # When
+        read_replies = list(self.stub.Session(iter(reads), metadata=metadata))
+        with self.assertRaises(grpc.RpcError) as rejected:
+            list(self.stub.Session(iter(writes), metadata=metadata))
+
+        # Then
+        self.assertEqual(len(read_replies), 3)
+        self.assertEqual(rejected.exception.code(), grpc.StatusCode.RESOURCE_EXHAUSTED)  # pylint: disable=no-member
+
+    def test_charge_items(self):
+        """
+        A batch should take the tokens of each name, a batch bigger than the burst is taken from a full bucket,
+        and the streams should be aborted at the first message without enough tokens
+
+        :return:
+        """
+        # Data
+        metadata = (('x-client-id', 'batch-job'),)
+        import_metadata = (('x-client-id', 'import-job'),)
+        session_metadata = (('x-client-id', 'session-job'),)
+        imports = (todolists_pb2.ImportListsRequest(names=['import-{}-{}'.format(i, j) for j in range(2)])
+                   for i in range(2))
+        operations = (todolists_pb2.SessionRequest(correlation_id=i, create=todolists_pb2.CreateListRequest(
+            name='session-{}'.format(i))) for i in range(3))
+
+        # When
+        batch = self.stub.BatchCreate(todolists_pb2.BatchCreateListsRequest(names=['a', 'b', 'c']), metadata=metadata)
+        with self.assertRaises(grpc.RpcError) as after_batch:
+            self.stub.Create(todolists_pb2.CreateListRequest(name='d'), metadata=metadata)
+        with self.assertRaises(grpc.RpcError) as aborted_import:
+            self.stub.ImportLists(imports, metadata=import_metadata)
+        session = self.stub.Session(operations, metadata=session_metadata)
+        replies = []
+        with self.assertRaises(grpc.RpcError) as aborted_session:
+            for reply in session:
+                replies.append(reply)
+
+        # Then
+        self.assertEqual(len(batch.results), 3)  # pylint: disable=no-member
+        for rejected in (after_batch, aborted_import, aborted_session):
+            self.assertEqual(rejected.exception.code(), grpc.StatusCode.RESOURCE_EXHAUSTED)  # pylint: disable=no-member
+            self.assertIn(RETRY_AFTER_METADATA_KEY,
+                          dict(rejected.exception.trailing_metadata()))  # pylint: disable=no-member
+        self.assertLessEqual(len(replies), 2)
+
+
+class TestAsyncRateLimitInterceptor(unittest.TestCase):
+    """
+    AsyncRateLimitInterceptor Tests, without a gRPC server
+    """
+
+    def test_async_interceptor(self):
+        """
+        The asyncio interceptor should abort the RPCs of a client over its limit, with the retry-after metadata
+
+        :return:
+        """
+        # Data
+        interceptor = AsyncRateLimitInterceptor(RateLimiter(read_rate=0.01, read_burst=1))
+        context = MagicMock()
+        context.invocation_metadata.return_value = ()
+        context.peer_identities.return_value = None
+        context.peer.return_value = 'ipv4:127.0.0.1:50000'
+        aborts = []
+
+        async def abort(code, details, trailing_metadata):
+            aborts.append((code, dict(trailing_metadata)))
+            raise RuntimeError(details)
+
+        async def get(request, _context):
+            return request
+
+        context.abort.side_effect = abort
+        handler = grpc.unary_unary_rpc_method_handler(get)
+
+        async def continuation(_details):
+            return handler
+
+        async def run() -> list:
+            wrapped = await interceptor.intercept_service(continuation, MagicMock(method='/todolists.TodoLists/Get'))
+            results = [await wrapped.unary_unary('first', context)]
+            with self.assertRaises(RuntimeError):
+                await wrapped.unary_unary('second', context)
+            return results
+
+        # When
+        results = asyncio.run(run())
+
+        # Then
+        self.assertEqual(results, ['first'])
+        self.assertEqual(aborts[0][0], grpc.StatusCode.RESOURCE_EXHAUSTED)
+        self.assertIn(RETRY_AFTER_METADATA_KEY, aborts[0][1])
+
+    def test_async_request_stream(self):
+        """
+        The asyncio interceptor should take the tokens of each name of the stream of requests when it is received,
+        and abort the stream at the first message without enough tokens
+
+        :return:
+        """
+        # Data
+        interceptor = AsyncRateLimitInterceptor(RateLimiter(write_rate=0.01, write_burst=3))
+        context = MagicMock()
+        context.invocation_metadata.return_value = ()
+        context.peer_identities.return_value = None
+        context.peer.return_value = 'ipv4:127.0.0.1:50000'
+        imported = []
+
+        async def abort(_code, details, _trailing_metadata):
+            raise RuntimeError(details)
+
+        async def import_lists(request_iterator, _context):
+            async for request in request_iterator:
+                imported.extend(request.names)
+
+        async def requests():
+            for i in range(3):
+                yield todolists_pb2.ImportListsRequest(names=['list-{}-{}'.format(i, j) for j in range(2)])
+
+        context.abort.side_effect = abort
+        handler = grpc.stream_unary_rpc_method_handler(import_lists)
+
+        async def continuation(_details):
+            return handler
+
+        async def run() -> None:
+            wrapped = await interceptor.intercept_service(continuation,
+                                                          MagicMock(method='/todolists.TodoLists/ImportLists'))
+            with self.assertRaises(RuntimeError):
+                await wrapped.stream_unary(requests(), context)
+
+        # When
+        asyncio.run(run())
+
+        # Then
+        self.assertEqual(imported, ['list-0-0', 'list-0-1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
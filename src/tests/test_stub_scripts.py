@@ -5,6 +5,8 @@ Classes:
     TestStubsTodoLists(BaseTestClass)
 """
 import io
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -13,6 +15,12 @@ from proto_client.stub_get_lists_paginated import main as main_stub_get_lists_pa
 from proto_client.stub_get_list import main as main_stub_get_list
 from proto_client.stub_create_list import main as main_stub_create_list
 from proto_client.stub_delete_list import main as main_stub_delete_list
+from proto_client.stub_stream_lists import main as main_stub_stream_lists
+from proto_client.stub_batch_create_lists import main as main_stub_batch_create_lists
+from proto_client.stub_batch_get_lists import main as main_stub_batch_get_lists
+from proto_client.stub_batch_delete_lists import main as main_stub_batch_delete_lists
+from proto_client.stub_import_lists import main as main_stub_import_lists
+from proto_client.stub_session import main as main_stub_session
 from tests.base_test_class import BaseTestClass
 
 
@@ -109,6 +117,156 @@ class TestStubsTodoLists(BaseTestClass):
         self.assertIn('id "{}" deleted'.format(test_list_id), print_mock.getvalue())
         self.assertEqual(len(db_entries), 0)
 
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.argv', ['stub_stream_lists.py'])
+    def test_stub_stream_lists_script(self, print_mock: MagicMock):
+        """
+        Invoke the stream lists stub script
+
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        [TodoListDBHandler.new_todo_list_entry(str(i)) for i in range(3)]  # pylint: disable=expression-not-assigned
+
+        # When
+        main_stub_stream_lists()
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        for db_entry in db_entries:
+            self.assertIn('id "{}" and name "{}"'.format(db_entry.id, db_entry.name), print_mock.getvalue())
+        self.assertIn('Received 3 TodoLists', print_mock.getvalue())
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.argv', ['stub_batch_create_lists.py'])
+    @patch('proto_client.stub_batch_create_lists.get_input')
+    def test_stub_batch_create_lists_script(self, input_mock: MagicMock, print_mock: MagicMock):
+        """
+        Invoke the batch create lists stub script
+
+        :param input_mock: Mock to input function
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        input_mock.return_value = 'TestList1, TestList2'
+
+        # When
+        main_stub_batch_create_lists()
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        self.assertEqual(len(db_entries), 2)
+        for db_entry in db_entries:
+            self.assertIn('id "{}" and name "{}"'.format(db_entry.id, db_entry.name), print_mock.getvalue())
+
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.argv', ['stub_batch_get_lists.py'])
+    @patch('proto_client.stub_batch_get_lists.get_input')
+    def test_stub_batch_get_lists_script(self, input_mock: MagicMock, print_mock: MagicMock):
+        """
+        Invoke the batch get lists stub script
+
+        :param input_mock: Mock to input function
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        test_list_id = TodoListDBHandler.new_todo_list_entry('TestList')
+        input_mock.return_value = '{}, 666'.format(test_list_id)
+
+        # When
+        main_stub_batch_get_lists()
+
+        # Then
+        self.assertIn('id "{}" and name "TestList"'.format(test_list_id), print_mock.getvalue())
+        self.assertIn('List with id "666" not found.', print_mock.getvalue())
+
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.argv', ['stub_batch_delete_lists.py'])
+    @patch('proto_client.stub_batch_delete_lists.get_input')
+    def test_stub_batch_delete_lists_script(self, input_mock: MagicMock, print_mock: MagicMock):
+        """
+        Invoke the batch delete lists stub script
+
+        :param input_mock: Mock to input function
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        test_list_id = TodoListDBHandler.new_todo_list_entry('TestList')
+        input_mock.return_value = '{}, 666'.format(test_list_id)
+
+        # When
+        main_stub_batch_delete_lists()
+
+        # Then
+        self.assertEqual(len(TodoListDBHandler.get_lists_paginated()), 0)
+        self.assertIn('TodoList with id "{}" deleted'.format(test_list_id), print_mock.getvalue())
+        self.assertIn('List with id "666" not found.', print_mock.getvalue())
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.argv', ['stub_import_lists.py'])
+    @patch('proto_client.stub_import_lists.get_input')
+    def test_stub_import_lists_script(self, input_mock: MagicMock, print_mock: MagicMock):
+        """
+        Invoke the import lists stub script with a CSV file and then with a NDJSON file
+
+        :param input_mock: Mock to input function
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, 'lists.csv')
+            ndjson_path = os.path.join(directory, 'lists.ndjson')
+            with open(csv_path, 'w', encoding='utf-8') as csv_file:
+                csv_file.write('name,owner\nTestList1,me\n"Test, List2",me\n')
+            with open(ndjson_path, 'w', encoding='utf-8') as ndjson_file:
+                ndjson_file.write('{"name": "TestList1"}\n\n{"name": "TestList3"}\n')
+            input_mock.return_value = csv_path
+
+            # When
+            main_stub_import_lists()
+            with patch('sys.argv', ['stub_import_lists.py', ndjson_path]):
+                main_stub_import_lists()
+
+        # Then
+        db_entries = TodoListDBHandler.get_lists_paginated()
+        self.assertEqual([_entry.name for _entry in db_entries], ['TestList1', 'Test, List2', 'TestList3'])
+        self.assertIn('Imported 2 TodoLists, 0 duplicates', print_mock.getvalue())
+        self.assertIn('Imported 1 TodoLists, 1 duplicates', print_mock.getvalue())
+        self.assertIn('TodoList number 1 with name "TestList1" not imported', print_mock.getvalue())
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.argv', ['stub_session.py'])
+    @patch('proto_client.stub_session.get_input')
+    def test_stub_session_script(self, input_mock: MagicMock, print_mock: MagicMock):
+        """
+        Invoke the session stub script
+
+        :param input_mock: Mock to input function
+        :param print_mock: Mock to inspect print calls
+        :return:
+        """
+        # Data
+        test_list_id = TodoListDBHandler.new_todo_list_entry('TestList')
+        input_mock.return_value = 'create=NewList, get={}, delete=666'.format(test_list_id)
+
+        # When
+        main_stub_session()
+
+        # Then
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 2)
+        self.assertIn('Operation 1: Created TodoList with id', print_mock.getvalue())
+        self.assertIn('Operation 2: TodoList fetched with id "{}" and name "TestList"'.format(test_list_id),
+                      print_mock.getvalue())
+        self.assertIn('Operation 3: Error - List with id "666" not found.', print_mock.getvalue())
+        self.assertIn('Received 3 Session replies', print_mock.getvalue())
+
 
 if __name__ == '__main__':
     unittest.main()
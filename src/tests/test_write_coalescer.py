@@ -0,0 +1,147 @@
+"""
+Module with the tests for the write coalescer, and the SQLite storage that commits the writes in batches
+
+Classes:
+    TestWriteCoalescer(unittest.TestCase)
+    TestGroupCommitTodoListDBHandler(unittest.TestCase)
+"""
+import threading
+import unittest
+from concurrent import futures
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import NoResultFound
+
+import database.database as db
+from database.todo_lists_db_handler import TodoListDBHandler, GroupCommitTodoListDBHandler
+from database.write_coalescer import WriteCoalescer, CREATE_OPERATION, DELETE_OPERATION
+
+
+class TestWriteCoalescer(unittest.TestCase):
+    """
+    WriteCoalescer Tests, the batches are executed by a function that records them
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a coalescer of batches of up to 3 writes, the writer thread waits until `self.release` is set
+        :return:
+        """
+        self.batches = []
+        self.release = threading.Event()
+        self.coalescer = WriteCoalescer(self.execute_batch, window=0.05, max_batch_size=3)
+
+    def tearDown(self) -> None:
+        """
+        Stop the writer thread
+        :return:
+        """
+        self.release.set()
+        self.coalescer.close()
+
+    def execute_batch(self, operations):
+        """
+        Record the batch, and return the argument of each write, or an exception for the negative ones
+
+        :param operations: `(operation, argument)` of each write
+        :return: Result of each write
+        """
+        self.release.wait()
+        self.batches.append(list(operations))
+        return [ValueError(_argument) if _argument < 0 else _argument for _, _argument in operations]
+
+    def test_writes_in_batches(self):
+        """
+        The queued writes should be executed in batches of up to `max_batch_size` writes,
+        and each future completed with its own result
+
+        :return:
+        """
+        # Data
+        first_future = self.coalescer.submit(CREATE_OPERATION, 0)
+        writes = [self.coalescer.submit(CREATE_OPERATION, _argument) for _argument in (1, -2, 3)]
+
+        # When
+        self.release.set()
+        futures.wait([first_future] + writes)
+
+        # Then
+        self.assertEqual(first_future.result(), 0)
+        self.assertEqual([_future.result() for _future in writes[::2]], [1, 3])
+        with self.assertRaises(ValueError):
+            writes[1].result()
+        self.assertEqual(sum(len(_batch) for _batch in self.batches), 4)
+        self.assertLessEqual(max(len(_batch) for _batch in self.batches), 3)
+        self.assertEqual(self.coalescer.stats()['writes'], 4)
+        self.assertEqual(self.coalescer.stats()['batches'], len(self.batches))
+
+    def test_failed_batch(self):
+        """
+        When the batch function raises, all the writes of the batch should fail with that exception
+
+        :return:
+        """
+        # Data
+        self.coalescer = WriteCoalescer(lambda _operations: 1 / 0, window=0.05)
+
+        # When
+        writes = [self.coalescer.submit(DELETE_OPERATION, _argument) for _argument in range(2)]
+
+        # Then
+        for future in writes:
+            with self.assertRaises(ZeroDivisionError):
+                future.result(timeout=5)
+
+
+class TestGroupCommitTodoListDBHandler(unittest.TestCase):
+    """
+    GroupCommitTodoListDBHandler Tests
+    """
+
+    def setUp(self) -> None:
+        """
+        Drop the database and create it again, and clear the TodoLists cache
+        :return:
+        """
+        db.Database.drop_all()
+        db.Database.create_db_tables()
+        TodoListDBHandler.cache.clear()
+
+    def tearDown(self) -> None:
+        """
+        Drop the database
+        :return:
+        """
+        db.Database.drop_all()
+
+    def test_concurrent_creates_and_deletes(self):
+        """
+        The concurrent writes should be committed, a repeated name should raise IntegrityError,
+        and the delete of an ID that does not exist should raise NoResultFound
+
+        :return:
+        """
+        # Data
+        names = [str(i) for i in range(20)] + ['0']
+        existing_id = TodoListDBHandler.new_todo_list_entry('existing')
+
+        # When
+        with futures.ThreadPoolExecutor(max_workers=len(names)) as executor:
+            creates = [executor.submit(GroupCommitTodoListDBHandler.new_todo_list_entry, _name) for _name in names]
+            delete = executor.submit(GroupCommitTodoListDBHandler.delete_todo_list, existing_id)
+            missing_delete = executor.submit(GroupCommitTodoListDBHandler.delete_todo_list, existing_id + 1000)
+            futures.wait(creates + [delete, missing_delete])
+
+        # Then
+        failed_creates = [_future for _future in creates if _future.exception() is not None]
+        self.assertEqual(len(failed_creates), 1)
+        self.assertIsInstance(failed_creates[0].exception(), IntegrityError)
+        self.assertIsNone(delete.result())
+        self.assertIsInstance(missing_delete.exception(), NoResultFound)
+        self.assertEqual(TodoListDBHandler.get_lists_db_count(), 20)
+        new_id = next(_future.result() for _future in creates if _future.exception() is None)
+        self.assertIsNotNone(TodoListDBHandler.get_todo_list(new_id))
+
+
+if __name__ == '__main__':
+    unittest.main()